@@ -72,10 +72,10 @@ class ActionDecisionWidget(QWidget):
 
             # Add terrain icon
             location_icon = ""
-            from models.terrain_model import get_terrain_icon
+            from components.glyph_cache import get_terrain_glyph
 
             try:
-                location_icon = get_terrain_icon(location)
+                location_icon = get_terrain_glyph(location)
             except (KeyError, AttributeError):
                 location_icon = ""
             if not location_icon:
@@ -0,0 +1,230 @@
+"""
+List model and card delegate for the per-player unit areas (DUA, BUA, reserves, summoning pool).
+
+Each area shows its contents grouped by player: a header row per player followed by one card
+row per unit or dragon. Rows live in an AreaListModel and are painted by an AreaItemDelegate,
+so no widget is created per unit. Updates are diffed against the current rows and applied as
+row inserts and removals, so a refresh only touches the rows that actually changed.
+"""
+
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QPersistentModelIndex, QRectF, QSize, Qt
+from PySide6.QtGui import QColor, QFont, QLinearGradient, QPainter, QPen
+from PySide6.QtWidgets import QAbstractItemView, QListView, QStyle, QStyledItemDelegate, QStyleOptionViewItem
+
+from utils import strict_get
+
+# Unit and dragon element icons
+ELEMENT_ICONS = {
+    "air": "💨",
+    "death": "💀",
+    "earth": "🌍",
+    "fire": "🔥",
+    "water": "💧",
+    "ivory": "🤍",
+    "white": "⚪",
+}
+
+HEADER_HEIGHT = 26
+
+
+def element_icon(element: str) -> str:
+    """Icon for a unit or dragon element."""
+    return strict_get(ELEMENT_ICONS, element.lower())
+
+
+@dataclass(frozen=True)
+class CardLine:
+    """One line of text on a card."""
+
+    text: str
+    color: str
+    pixel_size: int
+    bold: bool = False
+
+
+# Text lines for each of a card's columns, left to right
+CardText = Tuple[List[CardLine], ...]
+
+
+@dataclass(frozen=True)
+class CardStyle:
+    """Colors and height of an area's cards."""
+
+    gradient: Tuple[str, str]
+    hover_gradient: Tuple[str, str]
+    border: str
+    hover_border: str
+    height: int
+    radius: int = 6
+
+
+@dataclass
+class _AreaRow:
+    key: Tuple[Any, ...]
+    player_name: str
+    data: Optional[Dict[str, Any]]  # None for player header rows
+    text: CardText
+
+
+class AreaListModel(QAbstractListModel):
+    """Rows for one area: a header per player followed by that player's items."""
+
+    ItemDataRole = Qt.ItemDataRole.UserRole  # The unit/dragon dict (None for headers)
+    IsHeaderRole = Qt.ItemDataRole.UserRole + 1
+    CardTextRole = Qt.ItemDataRole.UserRole + 2
+    PlayerRole = Qt.ItemDataRole.UserRole + 3
+
+    def __init__(self, format_item: Callable[[Dict[str, Any]], CardText], parent=None):
+        super().__init__(parent)
+        self._format_item = format_item
+        self._rows: List[_AreaRow] = []
+
+    def rowCount(self, parent=QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._rows):
+            return None
+        row = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            if row.data is None:
+                return f"👤 {row.player_name}"
+            return " | ".join(line.text for column in row.text for line in column)
+        if role == self.ItemDataRole:
+            return row.data
+        if role == self.IsHeaderRole:
+            return row.data is None
+        if role == self.CardTextRole:
+            return row.text
+        if role == self.PlayerRole:
+            return row.player_name
+        return None
+
+    def flags(self, index):
+        if index.isValid() and self._rows[index.row()].data is None:
+            return Qt.ItemFlag.ItemIsEnabled
+        return super().flags(index)
+
+    def set_grouped_data(self, grouped_data: Dict[str, List[Dict[str, Any]]]) -> int:
+        """
+        Show new contents (player name -> items), changing only rows whose contents changed.
+
+        Returns:
+            Number of item (non-header) rows
+        """
+        new_rows = []
+        for player_name, items in grouped_data.items():
+            if not items:
+                continue
+            new_rows.append(_AreaRow(("header", player_name), player_name, None, ()))
+            for item in items:
+                new_rows.append(_AreaRow(self._item_key(player_name, item), player_name, item, self._format_item(item)))
+
+        old_keys = [row.key for row in self._rows]
+        new_keys = [row.key for row in new_rows]
+        opcodes = SequenceMatcher(None, old_keys, new_keys, autojunk=False).get_opcodes()
+
+        # Apply from the end so earlier row numbers stay valid
+        for tag, i1, i2, j1, j2 in reversed(opcodes):
+            if tag == "equal":
+                # Same contents: keep the rows but refer to the latest dicts
+                for offset in range(i2 - i1):
+                    self._rows[i1 + offset].data = new_rows[j1 + offset].data
+                continue
+            if i2 > i1:
+                self.beginRemoveRows(QModelIndex(), i1, i2 - 1)
+                del self._rows[i1:i2]
+                self.endRemoveRows()
+            if j2 > j1:
+                self.beginInsertRows(QModelIndex(), i1, i1 + (j2 - j1) - 1)
+                self._rows[i1:i1] = new_rows[j1:j2]
+                self.endInsertRows()
+
+        return self.item_count()
+
+    def item_count(self, player_name: Optional[str] = None) -> int:
+        """Number of unit/dragon rows (player headers excluded), optionally for one player."""
+        return sum(
+            1 for row in self._rows if row.data is not None and (player_name is None or row.player_name == player_name)
+        )
+
+    def _item_key(self, player_name: str, item: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Row identity: the owning player and the item's contents."""
+        return ("item", player_name, tuple(sorted((key, repr(value)) for key, value in item.items())))
+
+
+class AreaItemDelegate(QStyledItemDelegate):
+    """Paints player header rows and item cards in an area's card style."""
+
+    def __init__(self, card_style: CardStyle, parent=None):
+        super().__init__(parent)
+        self.card_style = card_style
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex | QPersistentModelIndex) -> QSize:  # noqa: N802
+        height = HEADER_HEIGHT if index.data(AreaListModel.IsHeaderRole) else self.card_style.height
+        return QSize(option.rect.width(), height)
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex | QPersistentModelIndex):
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        rect = QRectF(option.rect).adjusted(1, 1, -1, -1)
+
+        if index.data(AreaListModel.IsHeaderRole):
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(0, 0, 0, 100))
+            painter.drawRoundedRect(rect, 3, 3)
+            header = CardLine(index.data(Qt.ItemDataRole.DisplayRole), "#ffd700", 12, bold=True)
+            self._draw_lines(painter, rect.adjusted(6, 0, -6, 0), [header])
+        else:
+            highlighted = bool(option.state & (QStyle.StateFlag.State_MouseOver | QStyle.StateFlag.State_Selected))
+            start, stop = self.card_style.hover_gradient if highlighted else self.card_style.gradient
+            gradient = QLinearGradient(rect.topLeft(), rect.bottomRight())
+            gradient.setColorAt(0, QColor(start))
+            gradient.setColorAt(1, QColor(stop))
+            border = self.card_style.hover_border if highlighted else self.card_style.border
+            painter.setPen(QPen(QColor(border), 2))
+            painter.setBrush(gradient)
+            painter.drawRoundedRect(rect, self.card_style.radius, self.card_style.radius)
+
+            columns = index.data(AreaListModel.CardTextRole)
+            content = rect.adjusted(8, 4, -8, -4)
+            column_width = content.width() / max(len(columns), 1)
+            for column_number, lines in enumerate(columns):
+                column_left = content.left() + column_number * column_width
+                self._draw_lines(painter, QRectF(column_left, content.top(), column_width, content.height()), lines)
+
+        painter.restore()
+
+    def _draw_lines(self, painter: QPainter, rect: QRectF, lines: List[CardLine]):
+        """Draw lines stacked evenly in rect."""
+        if not lines:
+            return
+        line_height = rect.height() / len(lines)
+        for line_number, line in enumerate(lines):
+            font = QFont(painter.font())
+            font.setPixelSize(line.pixel_size)
+            font.setBold(line.bold)
+            painter.setFont(font)
+            painter.setPen(QColor(line.color))
+            line_rect = QRectF(rect.left(), rect.top() + line_number * line_height, rect.width(), line_height)
+            painter.drawText(line_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, line.text)
+
+
+def create_area_list_view(model: AreaListModel, delegate: AreaItemDelegate, stylesheet: str = "") -> QListView:
+    """List view showing an area's rows with its card delegate."""
+    view = QListView()
+    view.setModel(model)
+    view.setItemDelegate(delegate)
+    view.setMouseTracking(True)  # Hover highlight
+    view.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+    view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+    view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+    view.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+    view.setSpacing(1)
+    view.setStyleSheet(stylesheet)
+    delegate.setParent(view)
+    return view
@@ -9,6 +9,8 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from components.glyph_cache import get_face_summary_glyph
+from models.die_face_analyzer import EIGHTH_FACE_KEYS, STANDARD_FACE_KEYS, FaceCountTable
 from models.unit_model import UnitModel
 from models.unit_roster_model import UnitRosterModel
 from utils import strict_get
@@ -23,6 +25,7 @@ class ArmyDieFaceSummaryWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.unit_roster: Optional[UnitRosterModel] = None
+        self._face_totals = FaceCountTable(self._unit_face_totals)
         self._setup_ui()
 
     def _setup_ui(self):
@@ -67,29 +70,7 @@ class ArmyDieFaceSummaryWidget(QWidget):
 
     def _get_icon_for_face(self, face_type: str) -> str:
         """Get display icon for a die face type."""
-        # Import DieFaceModel to get proper face type icons
-        from models.die_face_model import DieFaceModel
-
-        # Map face names to face types for icon lookup
-        face_type_map = {
-            "Melee": "MELEE",
-            "Missile": "MISSILE",
-            "Magic": "MAGIC",
-            "Save": "SAVE",
-            "Move": "MOVE",
-            "SAI": "ID",
-            "ID": "ID",  # Add explicit mapping for ID faces
-        }
-
-        # Handle face names with numbers (e.g., "Melee_1", "Move_2")
-        base_face_type = face_type.split("_")[0] if "_" in face_type else face_type
-
-        # Get the standardized face type
-        standard_face_type = strict_get(face_type_map, base_face_type)
-
-        # Create a temporary DieFaceModel to get the correct icon
-        temp_face = DieFaceModel("temp", "Temp Face", face_type=standard_face_type)
-        return temp_face.get_face_icon()
+        return get_face_summary_glyph(face_type, 0).icon
 
     def _extract_face_type_and_value(self, face_name: str) -> Tuple[str, int]:
         """Extract the base face type and value from a face name like 'Save_1' or 'Melee_4'."""
@@ -109,65 +90,47 @@ class ArmyDieFaceSummaryWidget(QWidget):
         if not self.unit_roster or not units:
             return {}
 
+        return self._face_totals.army_totals(unit.unit_type for unit in units)
+
+    def _unit_face_totals(self, unit_type: str) -> Optional[Dict[str, int]]:
+        """Base face type -> summed value on one unit type's die (None if not in the roster)."""
+        unit_def = self.unit_roster.get_unit_definition(unit_type)
+        if not unit_def:
+            return None
+
+        die_faces = strict_get(unit_def, "die_faces")
         face_totals: Dict[str, int] = {}
 
-        for unit in units:
-            unit_def = self.unit_roster.get_unit_definition(unit.unit_type)
-            if not unit_def:
-                continue
-
-            die_faces = strict_get(unit_def, "die_faces")
-
-            # Handle both old dict format and new list of face objects
-            if isinstance(die_faces, dict):
-                # Old format: aggregate standard faces (face_1 through face_6)
-                for face_key in [
-                    "face_1",
-                    "face_2",
-                    "face_3",
-                    "face_4",
-                    "face_5",
-                    "face_6",
-                ]:
-                    face_type = die_faces.get(face_key)
-                    if face_type:  # Count all face types including ID
-                        # Extract base face type and value
-                        base_type, value = self._extract_face_type_and_value(face_type)
-                        if base_type not in face_totals:
-                            face_totals[base_type] = 0
-                        face_totals[base_type] += value
-            elif isinstance(die_faces, list):
-                # New format: face objects or face names
-                for face in die_faces:
-                    if hasattr(face, "name"):  # Face object
-                        face_name = face.name
-                        base_value = getattr(face, "base_value", 1)
-                    else:  # Face name string
-                        face_name = face
-                        base_value = 1  # Default value if not face object
-
-                    if face_name:  # Count all face types including ID
-                        # Extract base face type
-                        base_type, _ = self._extract_face_type_and_value(face_name)
-                        if base_type not in face_totals:
-                            face_totals[base_type] = 0
-                        face_totals[base_type] += base_value
-
-            # Count eighth faces (only for old dict format)
-            if isinstance(die_faces, dict):
-                for face_key in ["eighth_face_1", "eighth_face_2"]:
-                    face_type = die_faces.get(face_key)
-                    if face_type:  # Count all face types including ID
-                        # Extract base face type and value
-                        base_type, value = self._extract_face_type_and_value(face_type)
-                        if base_type not in face_totals:
-                            face_totals[base_type] = 0
-                        face_totals[base_type] += value
+        # Handle both old dict format and new list of face objects
+        if isinstance(die_faces, dict):
+            # Old format: standard faces (face_1 through face_6) and eighth faces
+            for face_key in STANDARD_FACE_KEYS + EIGHTH_FACE_KEYS:
+                face_type = die_faces.get(face_key)
+                if face_type:  # Count all face types including ID
+                    # Extract base face type and value
+                    base_type, value = self._extract_face_type_and_value(face_type)
+                    face_totals[base_type] = face_totals.get(base_type, 0) + value
+        elif isinstance(die_faces, list):
+            # New format: face objects or face names
+            for face in die_faces:
+                if hasattr(face, "name"):  # Face object
+                    face_name = face.name
+                    base_value = getattr(face, "base_value", 1)
+                else:  # Face name string
+                    face_name = face
+                    base_value = 1  # Default value if not face object
+
+                if face_name:  # Count all face types including ID
+                    # Extract base face type
+                    base_type, _ = self._extract_face_type_and_value(face_name)
+                    face_totals[base_type] = face_totals.get(base_type, 0) + base_value
 
         return face_totals
 
     def set_units_and_roster(self, units: List[UnitModel], unit_roster: UnitRosterModel):
         """Update the summary with new units and roster."""
+        if unit_roster is not self.unit_roster:
+            self._face_totals = FaceCountTable(self._unit_face_totals)
         self.unit_roster = unit_roster
 
         if not units:
@@ -203,17 +166,11 @@ class ArmyDieFaceSummaryWidget(QWidget):
         )
 
         for face_type, total_value in sorted_faces:
-            icon = self._get_icon_for_face(face_type)
-            face_label = QLabel(f"{icon}{total_value}")
-            face_label.setToolTip(f"{face_type}: {total_value} total value")
+            glyph = get_face_summary_glyph(face_type, total_value)
+            face_label = QLabel(glyph.text)
+            face_label.setToolTip(glyph.tooltip)
             face_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            face_label.setStyleSheet(
-                "padding: 2px 4px; "
-                "border: 1px solid #ddd; "
-                "border-radius: 3px; "
-                "background-color: #f8f8f8; "
-                "font-size: 10px;"
-            )
+            face_label.setStyleSheet(glyph.stylesheet)
             self.summary_layout.addWidget(face_label)
 
     def clear(self):
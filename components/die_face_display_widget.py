@@ -10,6 +10,8 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from components.glyph_cache import get_face_glyph
+
 
 class DieFaceDisplayWidget(QWidget):
     """
@@ -67,7 +69,9 @@ class DieFaceDisplayWidget(QWidget):
         self.face_labels.clear()
 
     def _create_face_labels(self, num_faces: int):
-        """Create face labels for the specified number of faces."""
+        """Create face labels for the specified number of faces (existing labels are kept if the count matches)."""
+        if len(self.face_labels) == num_faces:
+            return
         self._clear_faces_layout()
 
         # Determine grid layout based on face count
@@ -121,14 +125,11 @@ class DieFaceDisplayWidget(QWidget):
                         f"Face object must have 'get_display_info' method. "
                         f"Got {type(face).__name__} with attributes: {dir(face)}"
                     )
-                display_text, background_color, tooltip = face.get_display_info()
-
-                label.setText(display_text)
-                label.setStyleSheet(
-                    f"background-color: {background_color}; border: 1px solid #ccc; "
-                    f"font-size: 9px; text-align: center; padding: 3px; line-height: 1.2;"
-                )
-                label.setToolTip(tooltip)
+                glyph = get_face_glyph(face)
+
+                label.setText(glyph.text)
+                label.setStyleSheet(glyph.stylesheet)
+                label.setToolTip(glyph.tooltip)
 
     def clear(self):
         """Clear the die face display."""
@@ -0,0 +1,129 @@
+"""
+Process-wide cache of die-face, element and terrain glyphs.
+
+Face labels, army die summaries and terrain/element displays rebuild the same icons and
+stylesheets over and over (one per label, on every unit selection). Glyphs are looked up
+here instead: each is computed once per face, size and theme and kept in a bounded LRU
+cache shared by every widget and dialog.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, TypeVar
+
+from models.die_face_model import DieFaceModel
+from models.element_model import get_element_icon
+from models.terrain_model import get_terrain_icon
+from utils import strict_get
+
+T = TypeVar("T")
+
+DEFAULT_MAX_ENTRIES = 512
+
+# Stylesheet templates for face glyphs, by theme
+FACE_THEMES = {
+    "die_face": (
+        "background-color: {background}; border: 1px solid #ccc; "
+        "font-size: {size}px; text-align: center; padding: 3px; line-height: 1.2;"
+    ),
+    "summary": (
+        "padding: 2px 4px; border: 1px solid #ddd; border-radius: 3px; background-color: #f8f8f8; font-size: {size}px;"
+    ),
+}
+
+# Face name prefixes (e.g. "Melee" in "Melee_2") to face types, for summary icons
+SUMMARY_FACE_TYPES = {
+    "Melee": "MELEE",
+    "Missile": "MISSILE",
+    "Magic": "MAGIC",
+    "Save": "SAVE",
+    "Move": "MOVE",
+    "SAI": "ID",
+    "ID": "ID",
+}
+
+
+@dataclass(frozen=True)
+class Glyph:
+    """A rendered face: label text, tooltip and stylesheet fragment."""
+
+    icon: str
+    text: str
+    tooltip: str
+    stylesheet: str
+
+
+class GlyphCache:
+    """Bounded LRU cache of computed glyphs."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """Return the glyph for key, computing and storing it on a miss."""
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        self.misses += 1
+        value = compute()
+        self._entries[key] = value
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Drop all cached glyphs."""
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Hit/miss counters and the number of cached glyphs."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+
+_glyph_cache = GlyphCache()
+
+
+def get_glyph_cache() -> GlyphCache:
+    """The process-wide glyph cache."""
+    return _glyph_cache
+
+
+def get_face_glyph(face: DieFaceModel, size: int = 9, theme: str = "die_face") -> Glyph:
+    """Glyph for one die face as shown on a face label."""
+    key = ("face", face.name, face.display_name, face.face_type, face.base_value, face.description, size, theme)
+    return _glyph_cache.get(key, lambda: _render_face_glyph(face, size, theme))
+
+
+def get_face_summary_glyph(face_name: str, total_value: int, size: int = 10, theme: str = "summary") -> Glyph:
+    """Glyph for a face type's total in an army die summary (face_name like "Melee" or "Melee_2")."""
+    key = ("face_summary", face_name, total_value, size, theme)
+    return _glyph_cache.get(key, lambda: _render_face_summary_glyph(face_name, total_value, size, theme))
+
+
+def get_element_glyph(element_name: str) -> str:
+    """Element icon. Raises KeyError if element not found."""
+    return _glyph_cache.get(("element", element_name), lambda: get_element_icon(element_name))
+
+
+def get_terrain_glyph(terrain_name: str) -> str:
+    """Terrain icon (its element icons). Raises KeyError if terrain not found."""
+    return _glyph_cache.get(("terrain", terrain_name), lambda: get_terrain_icon(terrain_name))
+
+
+def _render_face_glyph(face: DieFaceModel, size: int, theme: str) -> Glyph:
+    display_text, background_color, tooltip = face.get_display_info()
+    stylesheet = strict_get(FACE_THEMES, theme).format(background=background_color, size=size)
+    return Glyph(face.get_face_icon(), display_text, tooltip, stylesheet)
+
+
+def _render_face_summary_glyph(face_name: str, total_value: int, size: int, theme: str) -> Glyph:
+    base_face_type = face_name.split("_")[0] if "_" in face_name else face_name
+    face_type = strict_get(SUMMARY_FACE_TYPES, base_face_type)
+    icon = DieFaceModel("temp", "Temp Face", face_type=face_type).get_face_icon()
+    stylesheet = strict_get(FACE_THEMES, theme).format(size=size)
+    return Glyph(icon, f"{icon}{total_value}", f"{face_name}: {total_value} total value", stylesheet)
@@ -19,7 +19,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from models.element_model import get_element_icon
+from components.glyph_cache import get_element_glyph
 from models.minor_terrain_model import MinorTerrain, get_all_minor_terrain_objects, get_minor_terrain
 from utils import strict_get
 
@@ -97,7 +97,7 @@ class MinorTerrainDisplayItem(QFrame):
         header_layout = QHBoxLayout()
 
         # Terrain name with element icons
-        elements_text = "".join(get_element_icon(elem) for elem in self.minor_terrain.elements)
+        elements_text = "".join(get_element_glyph(elem) for elem in self.minor_terrain.elements)
         name_label = QLabel(f"{elements_text} {self.minor_terrain.name}")
         name_label.setStyleSheet("color: white; font-weight: bold; font-size: 11px;")
         header_layout.addWidget(name_label)
@@ -261,7 +261,7 @@ class MinorTerrainPlacementDialog(QFrame):
         # Get all minor terrain options with nice display names
         minor_terrain_options = []
         for terrain in get_all_minor_terrain_objects():
-            elements_text = "".join(get_element_icon(elem) for elem in terrain.elements)
+            elements_text = "".join(get_element_glyph(elem) for elem in terrain.elements)
             display_name = f"{elements_text} {terrain.name}"
             # Create key from base name and eighth face
             terrain_base = terrain.get_terrain_base_name().upper()
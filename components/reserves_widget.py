@@ -8,125 +8,59 @@ Based on the design from assets/playmat.html.
 
 from typing import Any, Dict, List
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QModelIndex, Qt, Signal
 from PySide6.QtWidgets import (
-    QFrame,
     QGroupBox,
     QHBoxLayout,
     QLabel,
     QPushButton,
-    QScrollArea,
     QVBoxLayout,
-    QWidget,
 )
 
+from components.area_list_model import (
+    AreaItemDelegate,
+    AreaListModel,
+    CardLine,
+    CardStyle,
+    CardText,
+    create_area_list_view,
+    element_icon,
+)
+from models.unit_instance import to_unit_dict
 from utils import strict_get
 
+# Green gradient card styling from playmat
+RESERVE_CARD_STYLE = CardStyle(
+    ("#228b22", "#006400"), ("#32ab32", "#008400"), "#90ee90", "#b0ffb0", height=58, radius=8
+)
 
-class ReserveUnitItem(QFrame):
-    """Individual reserve unit display item."""
 
-    unit_selected = Signal(dict)  # Emit unit data when clicked
+def format_reserve_unit_item(unit_data: Dict[str, Any]) -> CardText:
+    """Card text for a reserve unit."""
+    name = strict_get(unit_data, "name")
+    species = strict_get(unit_data, "species")
+    unit_info = [
+        CardLine(f"⚔️ {name}", "white", 11, bold=True),
+        CardLine(f"🏛️ {species}", "#90ee90", 10),
+    ]
 
-    def __init__(self, unit_data: Dict[str, Any], parent=None):
-        super().__init__(parent)
-        self.unit_data = unit_data
-        self.setFrameStyle(QFrame.Shape.StyledPanel)
-        self.setLineWidth(1)
-        self.setMinimumHeight(50)
-        self.setMaximumHeight(70)
+    # Health and elements
+    health = strict_get(unit_data, "health")
+    max_health = strict_get(unit_data, "max_health")
+    stats = [CardLine(f"❤️ {health}/{max_health}", "#ff6b6b", 10, bold=True)]
+    elements = strict_get(unit_data, "elements")
+    if elements:
+        stats.append(CardLine(" ".join([element_icon(elem) for elem in elements]), "#ffd700", 12))
 
-        # Apply green gradient styling from playmat
-        self.setStyleSheet("""
-            ReserveUnitItem {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #228b22, stop:1 #006400);
-                border: 2px solid #90ee90;
-                border-radius: 8px;
-                margin: 2px;
-            }
-            ReserveUnitItem:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #32ab32, stop:1 #008400);
-                border-color: #b0ffb0;
-            }
-        """)
+    # Turns in reserves and owner
+    reserve_info = []
+    turns_in_reserves = unit_data.get("turns_in_reserves", 0)
+    if turns_in_reserves > 0:
+        reserve_info.append(CardLine(f"⏰ {turns_in_reserves}", "#ddd", 9))
+    owner = strict_get(unit_data, "owner")
+    reserve_info.append(CardLine(f"👤 {owner}", "#b0ffb0", 9))
 
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(8, 4, 8, 4)
-
-        # Unit info
-        unit_info = QVBoxLayout()
-
-        # Unit name and species
-        name = strict_get(unit_data, "name")
-        species = strict_get(unit_data, "species")
-        name_label = QLabel(f"⚔️ {name}")
-        name_label.setStyleSheet("color: white; font-weight: bold; font-size: 11px;")
-        unit_info.addWidget(name_label)
-
-        species_label = QLabel(f"🏛️ {species}")
-        species_label.setStyleSheet("color: #90ee90; font-size: 10px;")
-        unit_info.addWidget(species_label)
-
-        layout.addLayout(unit_info)
-
-        # Health and elements
-        stats_layout = QVBoxLayout()
-
-        # Health
-        health = strict_get(unit_data, "health")
-        max_health = strict_get(unit_data, "max_health")
-        health_label = QLabel(f"❤️ {health}/{max_health}")
-        health_label.setStyleSheet("color: #ff6b6b; font-weight: bold; font-size: 10px;")
-        stats_layout.addWidget(health_label)
-
-        # Elements
-        elements = strict_get(unit_data, "elements")
-        if elements:
-            elements_text = " ".join([self._get_element_icon(elem) for elem in elements])
-            elements_label = QLabel(elements_text)
-            elements_label.setStyleSheet("color: #ffd700; font-size: 12px;")
-            stats_layout.addWidget(elements_label)
-
-        layout.addLayout(stats_layout)
-
-        # Reserve info
-        reserve_info = QVBoxLayout()
-
-        # Turns in reserves
-        turns_in_reserves = unit_data.get("turns_in_reserves", 0)
-        if turns_in_reserves > 0:
-            turns_label = QLabel(f"⏰ {turns_in_reserves}")
-            turns_label.setStyleSheet("color: #ddd; font-size: 9px;")
-            reserve_info.addWidget(turns_label)
-
-        # Owner
-        owner = strict_get(unit_data, "owner")
-        owner_label = QLabel(f"👤 {owner}")
-        owner_label.setStyleSheet("color: #b0ffb0; font-size: 9px;")
-        reserve_info.addWidget(owner_label)
-
-        layout.addLayout(reserve_info)
-
-    def _get_element_icon(self, element: str) -> str:
-        """Get icon for unit element."""
-        icons = {
-            "air": "💨",
-            "death": "💀",
-            "earth": "🌍",
-            "fire": "🔥",
-            "water": "💧",
-            "ivory": "🤍",
-            "white": "⚪",
-        }
-        return strict_get(icons, element.lower())
-
-    def mousePressEvent(self, event):  # noqa: N802
-        """Handle mouse click to select unit."""
-        if event.button() == Qt.MouseButton.LeftButton:
-            self.unit_selected.emit(self.unit_data)
-        super().mousePressEvent(event)
+    return unit_info, stats, reserve_info
 
 
 class ReservesWidget(QGroupBox):
@@ -239,13 +173,13 @@ class ReservesWidget(QGroupBox):
 
         layout.addLayout(header_layout)
 
-        # Scrollable unit list
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
+        # Unit list: player headers and unit cards drawn by the reserve delegate
+        self.model = AreaListModel(format_reserve_unit_item, self)
+        self.list_view = create_area_list_view(
+            self.model,
+            AreaItemDelegate(RESERVE_CARD_STYLE),
+            """
+            QListView {
                 border: none;
                 background: transparent;
             }
@@ -262,96 +196,62 @@ class ReservesWidget(QGroupBox):
             QScrollBar::handle:vertical:hover {
                 background: #b0ffb0;
             }
-        """)
-
-        # Container for unit items
-        self.content_widget = QWidget()
-        self.content_layout = QVBoxLayout(self.content_widget)
-        self.content_layout.setContentsMargins(0, 0, 0, 0)
-        self.content_layout.setSpacing(4)
+        """,
+        )
+        self.list_view.pressed.connect(self._handle_unit_pressed)
+        self.list_view.setVisible(False)
+        layout.addWidget(self.list_view)
 
         # Empty state label
         self.empty_label = QLabel("No units in reserves")
-        self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignTop)
         self.empty_label.setStyleSheet("""
             color: #90ee90;
             font-style: italic;
             font-size: 12px;
             padding: 20px;
         """)
-        self.content_layout.addWidget(self.empty_label)
-
-        scroll_area.setWidget(self.content_widget)
-        layout.addWidget(scroll_area)
+        layout.addWidget(self.empty_label, 1)
 
         # Track selected unit
         self.selected_unit = None
 
     def update_reserves_data(self, reserves_data: Dict[str, List[Dict[str, Any]]]):
-        """Update the reserves display with new data.
+        """Update the reserves display with new data, changing only the rows that differ.
 
         Args:
             reserves_data: Dictionary mapping player names to their reserve unit lists
         """
-        # Clear existing content
-        while self.content_layout.count() > 0:
-            child = self.content_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-
-        total_units = 0
-
-        # Group units by player
-        for player_name, units in reserves_data.items():
-            if not units:
-                continue
-
-            # Player section header
-            player_header = QLabel(f"👤 {player_name}")
-            player_header.setStyleSheet("""
-                QLabel {
-                    color: #ffd700;
-                    font-weight: bold;
-                    font-size: 13px;
-                    padding: 4px 8px;
-                    background: rgba(0, 0, 0, 0.3);
-                    border-radius: 4px;
-                    margin: 4px 0px 2px 0px;
-                }
-            """)
-            self.content_layout.addWidget(player_header)
-
-            # Add units for this player
-            for unit_data in units:
-                unit_item = ReserveUnitItem(unit_data)
-                unit_item.unit_selected.connect(self._handle_unit_selected)
-                self.content_layout.addWidget(unit_item)
-                total_units += 1
+        total_units = self.model.set_grouped_data(reserves_data)
 
         # Update statistics
         self.stats_label.setText(f"Units in Reserves: {total_units}")
 
         # Show empty state if no units
-        if total_units == 0:
-            self.content_layout.addWidget(self.empty_label)
-
-        # Add stretch to push content to top
-        self.content_layout.addStretch()
+        self.list_view.setVisible(total_units > 0)
+        self.empty_label.setVisible(total_units == 0)
 
         # Reset selection
+        self.list_view.clearSelection()
         self.selected_unit = None
         self.deploy_btn.setEnabled(False)
 
+    def _handle_unit_pressed(self, index: QModelIndex):
+        """Handle a click on a list row; player headers are ignored."""
+        unit_data = index.data(AreaListModel.ItemDataRole)
+        if unit_data is not None:
+            self._handle_unit_selected(unit_data)
+
     def _handle_unit_selected(self, unit_data: Dict[str, Any]):
         """Handle unit selection."""
         self.selected_unit = unit_data
         self.deploy_btn.setEnabled(True)
-        self.unit_selected.emit(unit_data)
+        self.unit_selected.emit(to_unit_dict(unit_data))
 
     def _handle_deploy_clicked(self):
         """Handle deploy button click."""
         if self.selected_unit:
-            self.deploy_requested.emit(self.selected_unit)
+            self.deploy_requested.emit(to_unit_dict(self.selected_unit))
 
     def highlight_player_units(self, player_name: str):
         """Highlight units belonging to a specific player."""
@@ -361,15 +261,8 @@ class ReservesWidget(QGroupBox):
 
     def get_unit_count(self) -> int:
         """Get total number of units in reserves."""
-        count = 0
-        for i in range(self.content_layout.count()):
-            widget = self.content_layout.itemAt(i).widget()
-            if isinstance(widget, ReserveUnitItem):
-                count += 1
-        return count
+        return self.model.item_count()
 
     def get_player_unit_count(self, player_name: str) -> int:
         """Get number of units in reserves for a specific player."""
-        # This would need to track player ownership in the items
-        # For now, return 0 as placeholder
-        return 0
+        return self.model.item_count(player_name)
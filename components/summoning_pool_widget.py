@@ -8,115 +8,51 @@ Based on the design from assets/playmat.html.
 
 from typing import Any, Dict, List
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QModelIndex, Qt, Signal
 from PySide6.QtWidgets import (
-    QFrame,
     QGroupBox,
     QHBoxLayout,
     QLabel,
     QPushButton,
-    QScrollArea,
     QVBoxLayout,
-    QWidget,
 )
 
+from components.area_list_model import (
+    AreaItemDelegate,
+    AreaListModel,
+    CardLine,
+    CardStyle,
+    CardText,
+    create_area_list_view,
+    element_icon,
+)
 from utils import strict_get
 
+# Purple gradient card styling similar to playmat
+DRAGON_CARD_STYLE = CardStyle(("#4b0082", "#2a004a"), ("#6a00a2", "#4a006a"), "#dda0dd", "#ffa0ff", height=66, radius=8)
 
-class DragonDisplayItem(QFrame):
-    """Individual dragon display item with element icons and health."""
-
-    dragon_selected = Signal(dict)  # Emit dragon data when clicked
-
-    def __init__(self, dragon_data: Dict[str, Any], parent=None):
-        super().__init__(parent)
-        self.dragon_data = dragon_data
-        self.setFrameStyle(QFrame.Shape.StyledPanel)
-        self.setLineWidth(1)
-        self.setMinimumHeight(60)
-        self.setMaximumHeight(80)
-
-        # Apply styling similar to playmat
-        self.setStyleSheet("""
-            DragonDisplayItem {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #4b0082, stop:1 #2a004a);
-                border: 2px solid #dda0dd;
-                border-radius: 8px;
-                margin: 2px;
-            }
-            DragonDisplayItem:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #6a00a2, stop:1 #4a006a);
-                border-color: #ffa0ff;
-            }
-        """)
-
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(8, 4, 8, 4)
-
-        # Dragon type and form
-        dragon_info = QVBoxLayout()
-
-        # Dragon name/type
-        dragon_type = strict_get(dragon_data, "dragon_type")
-        dragon_form = strict_get(dragon_data, "dragon_form")
-        name_label = QLabel(f"🐲 {dragon_type} {dragon_form}")
-        name_label.setStyleSheet("color: white; font-weight: bold; font-size: 12px;")
-        dragon_info.addWidget(name_label)
 
-        # Elements display
-        elements = strict_get(dragon_data, "elements")
-        if elements:
-            elements_text = " ".join([self._get_element_icon(elem) for elem in elements])
-            elements_label = QLabel(elements_text)
-            elements_label.setStyleSheet("color: #dda0dd; font-size: 14px;")
-            dragon_info.addWidget(elements_label)
+def format_dragon_item(dragon_data: Dict[str, Any]) -> CardText:
+    """Card text for a dragon with element icons and health."""
+    dragon_type = strict_get(dragon_data, "dragon_type")
+    dragon_form = strict_get(dragon_data, "dragon_form")
+    dragon_info = [CardLine(f"🐲 {dragon_type} {dragon_form}", "white", 12, bold=True)]
+    elements = strict_get(dragon_data, "elements")
+    if elements:
+        dragon_info.append(CardLine(" ".join([element_icon(elem) for elem in elements]), "#dda0dd", 14))
 
-        layout.addLayout(dragon_info)
+    # Health, owner and location (if summoned)
+    health = strict_get(dragon_data, "health")
+    owner = strict_get(dragon_data, "owner")
+    info = [
+        CardLine(f"❤️ {health}", "#ff6b6b", 12, bold=True),
+        CardLine(f"👤 {owner}", "#90ee90", 10),
+    ]
+    location = dragon_data.get("location")
+    if location:
+        info.append(CardLine(f"📍 {location}", "#ffd700", 10))
 
-        # Health and owner info
-        info_layout = QVBoxLayout()
-
-        # Health
-        health = strict_get(dragon_data, "health")
-        health_label = QLabel(f"❤️ {health}")
-        health_label.setStyleSheet("color: #ff6b6b; font-weight: bold;")
-        info_layout.addWidget(health_label)
-
-        # Owner
-        owner = strict_get(dragon_data, "owner")
-        owner_label = QLabel(f"👤 {owner}")
-        owner_label.setStyleSheet("color: #90ee90; font-size: 10px;")
-        info_layout.addWidget(owner_label)
-
-        layout.addLayout(info_layout)
-
-        # Location (if summoned)
-        location = dragon_data.get("location")
-        if location:
-            location_label = QLabel(f"📍 {location}")
-            location_label.setStyleSheet("color: #ffd700; font-size: 10px;")
-            info_layout.addWidget(location_label)
-
-    def _get_element_icon(self, element: str) -> str:
-        """Get icon for dragon element."""
-        icons = {
-            "air": "💨",
-            "death": "💀",
-            "earth": "🌍",
-            "fire": "🔥",
-            "water": "💧",
-            "ivory": "🤍",
-            "white": "⚪",
-        }
-        return strict_get(icons, element.lower())
-
-    def mousePressEvent(self, event):  # noqa: N802
-        """Handle mouse click to select dragon."""
-        if event.button() == Qt.MouseButton.LeftButton:
-            self.dragon_selected.emit(self.dragon_data)
-        super().mousePressEvent(event)
+    return dragon_info, info
 
 
 class SummoningPoolWidget(QGroupBox):
@@ -201,13 +137,13 @@ class SummoningPoolWidget(QGroupBox):
 
         layout.addLayout(header_layout)
 
-        # Scrollable dragon list
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
+        # Dragon list: player headers and dragon cards drawn by the dragon delegate
+        self.model = AreaListModel(format_dragon_item, self)
+        self.list_view = create_area_list_view(
+            self.model,
+            AreaItemDelegate(DRAGON_CARD_STYLE),
+            """
+            QListView {
                 border: none;
                 background: transparent;
             }
@@ -224,78 +160,44 @@ class SummoningPoolWidget(QGroupBox):
             QScrollBar::handle:vertical:hover {
                 background: #ffa0ff;
             }
-        """)
-
-        # Container for dragon items
-        self.content_widget = QWidget()
-        self.content_layout = QVBoxLayout(self.content_widget)
-        self.content_layout.setContentsMargins(0, 0, 0, 0)
-        self.content_layout.setSpacing(4)
+        """,
+        )
+        self.list_view.pressed.connect(self._handle_dragon_pressed)
+        self.list_view.setVisible(False)
+        layout.addWidget(self.list_view)
 
         # Empty state label
         self.empty_label = QLabel("No dragons in summoning pool")
-        self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignTop)
         self.empty_label.setStyleSheet("""
             color: #dda0dd;
             font-style: italic;
             font-size: 12px;
             padding: 20px;
         """)
-        self.content_layout.addWidget(self.empty_label)
-
-        scroll_area.setWidget(self.content_widget)
-        layout.addWidget(scroll_area)
+        layout.addWidget(self.empty_label, 1)
 
     def update_pool_data(self, pool_data: Dict[str, List[Dict[str, Any]]]):
-        """Update the summoning pool display with new data.
+        """Update the summoning pool display with new data, changing only the rows that differ.
 
         Args:
             pool_data: Dictionary mapping player names to their dragon lists
         """
-        # Clear existing content
-        while self.content_layout.count() > 0:
-            child = self.content_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-
-        total_dragons = 0
-
-        # Group dragons by player
-        for player_name, dragons in pool_data.items():
-            if not dragons:
-                continue
-
-            # Player section header
-            player_header = QLabel(f"👤 {player_name}")
-            player_header.setStyleSheet("""
-                QLabel {
-                    color: #ffd700;
-                    font-weight: bold;
-                    font-size: 13px;
-                    padding: 4px 8px;
-                    background: rgba(0, 0, 0, 0.3);
-                    border-radius: 4px;
-                    margin: 4px 0px 2px 0px;
-                }
-            """)
-            self.content_layout.addWidget(player_header)
-
-            # Add dragons for this player
-            for dragon_data in dragons:
-                dragon_item = DragonDisplayItem(dragon_data)
-                dragon_item.dragon_selected.connect(self.dragon_selected.emit)
-                self.content_layout.addWidget(dragon_item)
-                total_dragons += 1
+        total_dragons = self.model.set_grouped_data(pool_data)
 
         # Update statistics
         self.stats_label.setText(f"Dragons Available: {total_dragons}")
 
         # Show empty state if no dragons
-        if total_dragons == 0:
-            self.content_layout.addWidget(self.empty_label)
+        self.list_view.setVisible(total_dragons > 0)
+        self.empty_label.setVisible(total_dragons == 0)
+        self.list_view.clearSelection()
 
-        # Add stretch to push content to top
-        self.content_layout.addStretch()
+    def _handle_dragon_pressed(self, index: QModelIndex):
+        """Handle a click on a list row; player headers are ignored."""
+        dragon_data = index.data(AreaListModel.ItemDataRole)
+        if dragon_data is not None:
+            self.dragon_selected.emit(dragon_data)
 
     def highlight_player_dragons(self, player_name: str):
         """Highlight dragons belonging to a specific player."""
@@ -305,9 +207,4 @@ class SummoningPoolWidget(QGroupBox):
 
     def get_dragon_count(self) -> int:
         """Get total number of dragons in the pool."""
-        count = 0
-        for i in range(self.content_layout.count()):
-            widget = self.content_layout.itemAt(i).widget()
-            if isinstance(widget, DragonDisplayItem):
-                count += 1
-        return count
+        return self.model.item_count()
@@ -0,0 +1,100 @@
+"""
+Tests for the diff-based area list model and the widgets built on it.
+"""
+
+from components.area_list_model import AreaListModel, CardLine
+from components.reserves_widget import ReservesWidget
+from components.unit_areas_widget import UnitAreasWidget
+
+
+def _unit(name, owner, health=1):
+    return {
+        "name": name,
+        "species": "Dwarf",
+        "health": health,
+        "max_health": 1,
+        "elements": ["FIRE"],
+        "owner": owner,
+        "death_cause": "combat",
+        "turn_died": 2,
+    }
+
+
+def _model():
+    model = AreaListModel(lambda unit: ([CardLine(unit["name"], "white", 10)],))
+    changes = []
+    model.rowsInserted.connect(lambda _parent, first, last: changes.append(("insert", first, last)))
+    model.rowsRemoved.connect(lambda _parent, first, last: changes.append(("remove", first, last)))
+    return model, changes
+
+
+class TestAreaListModel:
+    def test_update_only_touches_changed_rows(self, qtbot):
+        model, changes = _model()
+        model.set_grouped_data({"Player 1": [_unit("Guard", "Player 1"), _unit("Archer", "Player 1")]})
+        changes.clear()
+
+        count = model.set_grouped_data(
+            {
+                "Player 1": [_unit("Guard", "Player 1"), _unit("Archer", "Player 1"), _unit("Scout", "Player 1")],
+                "Player 2": [_unit("Elf", "Player 2")],
+            }
+        )
+
+        assert count == 4
+        assert changes == [("insert", 3, 5)]
+        assert [model.index(row).data() for row in range(model.rowCount())] == [
+            "👤 Player 1",
+            "Guard",
+            "Archer",
+            "Scout",
+            "👤 Player 2",
+            "Elf",
+        ]
+
+        changes.clear()
+        model.set_grouped_data({"Player 1": [_unit("Guard", "Player 1"), _unit("Scout", "Player 1")]})
+
+        assert sorted(changes) == [("remove", 2, 2), ("remove", 4, 5)]
+        assert model.item_count() == 2
+        assert model.item_count("Player 2") == 0
+
+    def test_changed_unit_replaces_only_its_row(self, qtbot):
+        model, changes = _model()
+        model.set_grouped_data({"Player 1": [_unit("Guard", "Player 1"), _unit("Archer", "Player 1")]})
+        changes.clear()
+
+        model.set_grouped_data({"Player 1": [_unit("Guard", "Player 1", health=2), _unit("Archer", "Player 1")]})
+
+        assert changes == [("remove", 1, 1), ("insert", 1, 1)]
+        assert model.index(1).data(AreaListModel.ItemDataRole)["health"] == 2
+        assert model.index(0).data(AreaListModel.IsHeaderRole)
+
+
+class TestAreaWidgets:
+    def test_reserves_selection_and_counts(self, qtbot):
+        widget = ReservesWidget()
+        qtbot.addWidget(widget)
+        selected = []
+        widget.unit_selected.connect(selected.append)
+
+        widget.update_reserves_data({"Player 1": [_unit("Guard", "Player 1")], "Player 2": [_unit("Elf", "Player 2")]})
+        widget._handle_unit_pressed(widget.model.index(0))  # Player header
+        widget._handle_unit_pressed(widget.model.index(3))
+
+        assert widget.get_unit_count() == 2
+        assert widget.get_player_unit_count("Player 2") == 1
+        assert widget.stats_label.text() == "Units in Reserves: 2"
+        assert [unit["name"] for unit in selected] == ["Elf"]
+        assert widget.deploy_btn.isEnabled()
+
+    def test_unit_areas_empty_state(self, qtbot):
+        widget = UnitAreasWidget()
+        qtbot.addWidget(widget)
+
+        widget.update_dua_data({"Player 1": [_unit("Guard", "Player 1")]})
+        widget.update_dua_data({"Player 1": []})
+
+        assert widget.get_dua_count() == 0
+        assert widget.dua_tab.list_view.isHidden()
+        assert not widget.dua_tab.empty_label.isHidden()
@@ -0,0 +1,59 @@
+"""
+Tests for the shared glyph cache and the face widgets using it.
+"""
+
+import pytest
+
+from components.die_face_display_widget import DieFaceDisplayWidget
+from components.glyph_cache import GlyphCache, get_element_glyph, get_face_glyph, get_terrain_glyph
+from models.die_face_model import DieFaceModel
+from models.element_model import get_element_icon
+from models.terrain_model import get_terrain_icon
+
+
+def _faces(count):
+    return [
+        DieFaceModel(f"Melee_{value}", "Melee", face_type="MELEE", base_value=value) for value in range(1, count + 1)
+    ]
+
+
+class TestGlyphCache:
+    def test_evicts_least_recently_used(self):
+        cache = GlyphCache(max_entries=2)
+        cache.get("a", lambda: 1)
+        cache.get("b", lambda: 2)
+        cache.get("a", lambda: 0)
+        cache.get("c", lambda: 3)
+
+        assert cache.get("a", lambda: 0) == 1
+        assert cache.get("b", lambda: 20) == 20
+        assert cache.get_stats() == {"hits": 2, "misses": 4, "entries": 2}
+
+    def test_glyphs_match_model_lookups(self):
+        face = DieFaceModel("Save_2", "Save", face_type="SAVE", base_value=2)
+
+        glyph = get_face_glyph(face)
+
+        assert glyph is get_face_glyph(face)
+        assert glyph.text == face.get_display_info()[0]
+        assert "font-size: 9px" in glyph.stylesheet
+        assert get_element_glyph("fire") == get_element_icon("fire")
+        assert get_terrain_glyph("Highland Castle") == get_terrain_icon("Highland Castle")
+        with pytest.raises(KeyError):
+            get_terrain_glyph("Nowhere")
+
+
+class TestDieFaceDisplayWidget:
+    def test_labels_are_reused_for_same_face_count(self, qtbot):
+        widget = DieFaceDisplayWidget()
+        qtbot.addWidget(widget)
+
+        widget.set_die_faces(_faces(6))
+        labels = list(widget.face_labels)
+        widget.set_die_faces(list(reversed(_faces(6))))
+
+        assert widget.face_labels == labels
+        assert labels[0].text() == get_face_glyph(_faces(6)[5]).text
+
+        widget.set_die_faces(_faces(10), is_monster=True)
+        assert len(widget.face_labels) == 10
@@ -6,115 +6,55 @@ for all players, showing units that have been killed or buried.
 Based on the design from assets/playmat.html.
 """
 
+from functools import partial
 from typing import Any, Dict, List
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QModelIndex, Qt, Signal
 from PySide6.QtWidgets import (
-    QFrame,
     QHBoxLayout,
     QLabel,
     QPushButton,
-    QScrollArea,
     QTabWidget,
     QVBoxLayout,
     QWidget,
 )
 
+from components.area_list_model import (
+    AreaItemDelegate,
+    AreaListModel,
+    CardLine,
+    CardStyle,
+    CardText,
+    create_area_list_view,
+)
+from models.unit_instance import to_unit_dict
 from utils import strict_get
 
-
-class UnitAreaItem(QFrame):
-    """Individual unit display item for DUA/BUA."""
-
-    unit_selected = Signal(dict)  # Emit unit data when clicked
-
-    def __init__(self, unit_data: Dict[str, Any], area_type: str = "DUA", parent=None):
-        super().__init__(parent)
-        self.unit_data = unit_data
-        self.area_type = area_type
-        self.setFrameStyle(QFrame.Shape.StyledPanel)
-        self.setLineWidth(1)
-        self.setMinimumHeight(45)
-        self.setMaximumHeight(65)
-
-        # Apply different styling based on area type
-        if area_type == "DUA":
-            # Dark red gradient for dead units
-            self.setStyleSheet("""
-                UnitAreaItem {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                        stop:0 #8b0000, stop:1 #4b0000);
-                    border: 2px solid #ff6b6b;
-                    border-radius: 6px;
-                    margin: 1px;
-                }
-                UnitAreaItem:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                        stop:0 #ab0000, stop:1 #6b0000);
-                    border-color: #ff8b8b;
-                }
-            """)
-        else:  # BUA
-            # Dark gray gradient for buried units
-            self.setStyleSheet("""
-                UnitAreaItem {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                        stop:0 #2f2f2f, stop:1 #1a1a1a);
-                    border: 2px solid #696969;
-                    border-radius: 6px;
-                    margin: 1px;
-                }
-                UnitAreaItem:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                        stop:0 #4f4f4f, stop:1 #3a3a3a);
-                    border-color: #898989;
-                }
-            """)
-
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(6, 3, 6, 3)
-
-        # Unit info
-        unit_info = QVBoxLayout()
-
-        # Unit name and species
-        name = strict_get(unit_data, "name")
-        species = strict_get(unit_data, "species")
-        name_label = QLabel(f"💀 {name}" if area_type == "DUA" else f"⚱️ {name}")
-        name_label.setStyleSheet("color: white; font-weight: bold; font-size: 10px;")
-        unit_info.addWidget(name_label)
-
-        species_label = QLabel(f"🏛️ {species}")
-        species_color = "#ff6b6b" if area_type == "DUA" else "#696969"
-        species_label.setStyleSheet(f"color: {species_color}; font-size: 9px;")
-        unit_info.addWidget(species_label)
-
-        layout.addLayout(unit_info)
-
-        # Death info
-        death_info = QVBoxLayout()
-
-        # Death cause/time
-        strict_get(unit_data, "death_cause")
-        turn_died = strict_get(unit_data, "turn_died")
-        death_label = QLabel(f"⚔️ T{turn_died}")
-        death_label.setStyleSheet("color: #ddd; font-size: 9px;")
-        death_info.addWidget(death_label)
-
-        # Owner
-        owner = strict_get(unit_data, "owner")
-        owner_label = QLabel(f"👤 {owner}")
-        owner_color = "#ff8b8b" if area_type == "DUA" else "#898989"
-        owner_label.setStyleSheet(f"color: {owner_color}; font-size: 8px;")
-        death_info.addWidget(owner_label)
-
-        layout.addLayout(death_info)
-
-    def mousePressEvent(self, event):  # noqa: N802
-        """Handle mouse click to select unit."""
-        if event.button() == Qt.MouseButton.LeftButton:
-            self.unit_selected.emit(self.unit_data)
-        super().mousePressEvent(event)
+# Card styles: dark red for dead units, dark gray for buried units
+AREA_CARD_STYLES = {
+    "DUA": CardStyle(("#8b0000", "#4b0000"), ("#ab0000", "#6b0000"), "#ff6b6b", "#ff8b8b", height=50),
+    "BUA": CardStyle(("#2f2f2f", "#1a1a1a"), ("#4f4f4f", "#3a3a3a"), "#696969", "#898989", height=50),
+}
+
+
+def format_unit_area_item(unit_data: Dict[str, Any], area_type: str = "DUA") -> CardText:
+    """Card text for a unit in the DUA/BUA."""
+    name = strict_get(unit_data, "name")
+    species = strict_get(unit_data, "species")
+    strict_get(unit_data, "death_cause")
+    turn_died = strict_get(unit_data, "turn_died")
+    owner = strict_get(unit_data, "owner")
+
+    is_dua = area_type == "DUA"
+    unit_info = [
+        CardLine(f"💀 {name}" if is_dua else f"⚱️ {name}", "white", 10, bold=True),
+        CardLine(f"🏛️ {species}", "#ff6b6b" if is_dua else "#696969", 9),
+    ]
+    death_info = [
+        CardLine(f"⚔️ T{turn_died}", "#ddd", 9),
+        CardLine(f"👤 {owner}", "#ff8b8b" if is_dua else "#898989", 8),
+    ]
+    return unit_info, death_info
 
 
 class UnitAreasWidget(QWidget):
@@ -250,13 +190,13 @@ class UnitAreasWidget(QWidget):
 
         tab_layout.addLayout(header_layout)
 
-        # Scrollable unit list
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll_area.setStyleSheet(f"""
-            QScrollArea {{
+        # Unit list: player headers and unit cards drawn by the area's delegate
+        model = AreaListModel(partial(format_unit_area_item, area_type=area_type), tab_widget)
+        list_view = create_area_list_view(
+            model,
+            AreaItemDelegate(AREA_CARD_STYLES[area_type]),
+            f"""
+            QListView {{
                 border: none;
                 background: transparent;
             }}
@@ -270,31 +210,27 @@ class UnitAreasWidget(QWidget):
                 border-radius: 5px;
                 min-height: 15px;
             }}
-        """)
-
-        # Container for unit items
-        content_widget = QWidget()
-        content_layout = QVBoxLayout(content_widget)
-        content_layout.setContentsMargins(0, 0, 0, 0)
-        content_layout.setSpacing(3)
+        """,
+        )
+        list_view.pressed.connect(lambda index, at=area_type, tw=tab_widget: self._handle_unit_pressed(index, at, tw))
+        list_view.setVisible(False)
+        tab_layout.addWidget(list_view)
 
         # Empty state label
         empty_label = QLabel(f"No units in {area_type}")
-        empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignTop)
         empty_label.setStyleSheet(f"""
             color: {border_color};
             font-style: italic;
             font-size: 11px;
             padding: 15px;
         """)
-        content_layout.addWidget(empty_label)
-
-        scroll_area.setWidget(content_widget)
-        tab_layout.addWidget(scroll_area)
+        tab_layout.addWidget(empty_label, 1)
 
         # Store references for updates
         tab_widget.stats_label = stats_label
-        tab_widget.content_layout = content_layout
+        tab_widget.model = model
+        tab_widget.list_view = list_view
         tab_widget.empty_label = empty_label
         tab_widget.selected_unit = None
 
@@ -309,74 +245,41 @@ class UnitAreasWidget(QWidget):
         self._update_area_data(self.bua_tab, bua_data, "BUA")
 
     def _update_area_data(self, tab_widget: QWidget, data: Dict[str, List[Dict[str, Any]]], area_type: str):
-        """Update area display with new data."""
-        content_layout = tab_widget.content_layout
-        stats_label = tab_widget.stats_label
-        empty_label = tab_widget.empty_label
-
-        # Clear existing content
-        while content_layout.count() > 0:
-            child = content_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-
-        total_units = 0
-
-        # Group units by player
-        for player_name, units in data.items():
-            if not units:
-                continue
-
-            # Player section header
-            player_header = QLabel(f"👤 {player_name}")
-            player_header.setStyleSheet("""
-                QLabel {
-                    color: #ffd700;
-                    font-weight: bold;
-                    font-size: 12px;
-                    padding: 3px 6px;
-                    background: rgba(0, 0, 0, 0.4);
-                    border-radius: 3px;
-                    margin: 3px 0px 1px 0px;
-                }
-            """)
-            content_layout.addWidget(player_header)
-
-            # Add units for this player
-            for unit_data in units:
-                unit_item = UnitAreaItem(unit_data, area_type)
-                unit_item.unit_selected.connect(lambda ud, at=area_type: self._handle_unit_selected(ud, at, tab_widget))
-                content_layout.addWidget(unit_item)
-                total_units += 1
+        """Update area display with new data, changing only the rows that differ."""
+        total_units = tab_widget.model.set_grouped_data(data)
 
         # Update statistics
-        stats_label.setText(f"Units in {area_type}: {total_units}")
+        tab_widget.stats_label.setText(f"Units in {area_type}: {total_units}")
 
         # Show empty state if no units
-        if total_units == 0:
-            content_layout.addWidget(empty_label)
-
-        # Add stretch to push content to top
-        content_layout.addStretch()
+        tab_widget.list_view.setVisible(total_units > 0)
+        tab_widget.empty_label.setVisible(total_units == 0)
 
         # Reset selection
+        tab_widget.list_view.clearSelection()
         tab_widget.selected_unit = None
         if hasattr(tab_widget, "resurrect_btn"):
             tab_widget.resurrect_btn.setEnabled(False)
 
+    def _handle_unit_pressed(self, index: QModelIndex, area_type: str, tab_widget: QWidget):
+        """Handle a click on a list row; player headers are ignored."""
+        unit_data = index.data(AreaListModel.ItemDataRole)
+        if unit_data is not None:
+            self._handle_unit_selected(unit_data, area_type, tab_widget)
+
     def _handle_unit_selected(self, unit_data: Dict[str, Any], area_type: str, tab_widget: QWidget):
         """Handle unit selection."""
         tab_widget.selected_unit = unit_data
         if area_type == "DUA" and hasattr(tab_widget, "resurrect_btn"):
             tab_widget.resurrect_btn.setEnabled(True)
-        self.unit_selected.emit(unit_data, area_type)
+        self.unit_selected.emit(to_unit_dict(unit_data), area_type)
 
     def _handle_resurrect_clicked(self, area_type: str):
         """Handle resurrect button click."""
         if area_type == "DUA":
             selected_unit = getattr(self.dua_tab, "selected_unit", None)
             if selected_unit:
-                self.resurrect_requested.emit(selected_unit)
+                self.resurrect_requested.emit(to_unit_dict(selected_unit))
 
     def get_dua_count(self) -> int:
         """Get total number of units in DUA."""
@@ -388,10 +291,4 @@ class UnitAreasWidget(QWidget):
 
     def _get_area_count(self, tab_widget: QWidget) -> int:
         """Get number of units in an area."""
-        content_layout = tab_widget.content_layout
-        count = 0
-        for i in range(content_layout.count()):
-            widget = content_layout.itemAt(i).widget()
-            if isinstance(widget, UnitAreaItem):
-                count += 1
-        return count
+        return tab_widget.model.item_count()
@@ -1,4 +1,6 @@
 # config/paths.py
+import os
+import sys
 from pathlib import Path
 from typing import Optional
 
@@ -20,3 +22,25 @@ class ProjectPaths:
     @property
     def tests_dir(self) -> Path:
         return self.project_root / "tests"
+
+    @property
+    def user_cache_dir(self) -> Path:
+        """Per-user cache directory, overridable with DRAGON_DICE_CACHE_DIR."""
+        override = os.environ.get("DRAGON_DICE_CACHE_DIR")
+        if override:
+            return Path(override)
+        if sys.platform == "win32":
+            base = Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local"))
+        elif sys.platform == "darwin":
+            base = Path.home() / "Library" / "Caches"
+        else:
+            base = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+        return base / "dragon-dice"
+
+    @property
+    def validation_cache_file(self) -> Path:
+        return self.user_cache_dir / "catalog_validation.json"
+
+    @property
+    def odds_cache_file(self) -> Path:
+        return self.user_cache_dir / "odds_cache.json"
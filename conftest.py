@@ -0,0 +1,31 @@
+"""
+Test session setup shared by every test directory.
+
+Set here rather than through pytest's ini "env" option, which needs the pytest-env plugin.
+"""
+
+import os
+import shutil
+import tempfile
+
+# Keep the shared odds cache in memory, so tests never read or write a cache file
+os.environ.setdefault("DRAGON_DICE_ODDS_CACHE", "")
+
+_session_cache_dir = None
+
+
+def pytest_configure():
+    # Keep per-user caches (e.g. catalog validation results) in a fresh directory for each
+    # session, so every session validates the catalogs and never touches the developer's cache
+    global _session_cache_dir
+    if "DRAGON_DICE_CACHE_DIR" not in os.environ:
+        _session_cache_dir = tempfile.mkdtemp(prefix="dragon-dice-test-cache-")
+        os.environ["DRAGON_DICE_CACHE_DIR"] = _session_cache_dir
+
+
+def pytest_unconfigure():
+    global _session_cache_dir
+    if _session_cache_dir is not None:
+        os.environ.pop("DRAGON_DICE_CACHE_DIR", None)
+        shutil.rmtree(_session_cache_dir, ignore_errors=True)
+        _session_cache_dir = None
@@ -0,0 +1,175 @@
+"""
+Analysis Task Service for Dragon Dice.
+
+This service runs heavy analysis (odds calculations and the like) on a worker thread
+pool, so dialogs keep repainting while it computes. Results are delivered back on the UI
+thread through Qt signals and per-request callbacks.
+
+Requests are identified by a key (e.g. from utils.odds_cache.odds_key). Submitting a key
+that is already queued or running attaches to that task instead of starting another one.
+Requests belong to an owner, usually the dialog that made them; cancelling the owner
+when it closes drops its callbacks and takes tasks nobody else is waiting for off the
+queue.
+"""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+
+
+@dataclass
+class _Subscriber:
+    owner: Any
+    on_result: Optional[Callable[[Any], None]]
+    on_error: Optional[Callable[[str], None]]
+
+
+class _TaskSignals(QObject):
+    """Signals emitted from worker threads (queued to the service on the UI thread)."""
+
+    finished = Signal(str, object)  # key, result
+    failed = Signal(str, str)  # key, error message
+
+
+class _AnalysisRunnable(QRunnable):
+    def __init__(self, key: str, compute: Callable[[], Any], signals: _TaskSignals):
+        super().__init__()
+        self.key = key
+        self.compute = compute
+        self.signals = signals
+        # The task keeps the Python reference, so the pool must not delete it
+        self.setAutoDelete(False)
+
+    def run(self):
+        try:
+            result = self.compute()
+        except Exception as e:
+            self.signals.failed.emit(self.key, f"{type(e).__name__}: {e}")
+            return
+        self.signals.finished.emit(self.key, result)
+
+
+@dataclass
+class _AnalysisTask:
+    runnable: _AnalysisRunnable
+    subscribers: List[_Subscriber] = field(default_factory=list)
+
+
+class AnalysisTaskService(QObject):
+    """
+    Service running analysis tasks on a thread pool and delivering results on the UI thread.
+    """
+
+    task_completed = Signal(str, object)  # Emits key and result of every finished task
+    task_failed = Signal(str, str)  # Emits key and error message of every failed task
+
+    def __init__(self, thread_pool: Optional[QThreadPool] = None, parent=None):
+        super().__init__(parent)
+        if thread_pool is None:
+            # Leave a core for the UI thread
+            thread_pool = QThreadPool(self)
+            thread_pool.setMaxThreadCount(max(1, QThreadPool.globalInstance().maxThreadCount() - 1))
+        self.thread_pool = thread_pool
+        self._tasks: Dict[str, _AnalysisTask] = {}
+
+        self._signals = _TaskSignals(self)
+        self._signals.finished.connect(self._on_task_finished)
+        self._signals.failed.connect(self._on_task_failed)
+
+    def submit(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        on_result: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[str], None]] = None,
+        owner: Any = None,
+    ) -> bool:
+        """
+        Run compute() on the thread pool, or join the task already running for the key.
+
+        compute must not touch widgets; on_result and on_error are called on the UI thread.
+
+        Args:
+            key: Identifies the request; equal keys must give equal results
+            compute: Calculates the result
+            on_result: Receives the result
+            on_error: Receives an error message if compute raises
+            owner: Object the request belongs to, for cancel()
+
+        Returns:
+            True if a new task was started, False if the request joined an existing one
+        """
+        subscriber = _Subscriber(owner, on_result, on_error)
+        task = self._tasks.get(key)
+        if task is not None:
+            task.subscribers.append(subscriber)
+            return False
+
+        runnable = _AnalysisRunnable(key, compute, self._signals)
+        self._tasks[key] = _AnalysisTask(runnable, [subscriber])
+        self.thread_pool.start(runnable)
+        return True
+
+    def cancel(self, owner: Any) -> int:
+        """
+        Cancel every request made by an owner (e.g. when a dialog closes).
+
+        Queued tasks left without requests are taken off the queue; running ones finish in
+        the background and their results are discarded (or picked up by a new request for
+        the same key).
+
+        Returns:
+            Number of requests cancelled
+        """
+        cancelled = 0
+        for key, task in list(self._tasks.items()):
+            remaining = [subscriber for subscriber in task.subscribers if subscriber.owner is not owner]
+            cancelled += len(task.subscribers) - len(remaining)
+            task.subscribers = remaining
+            if not remaining and self.thread_pool.tryTake(task.runnable):
+                del self._tasks[key]
+        return cancelled
+
+    def is_pending(self, key: str) -> bool:
+        """Whether a task for the key is queued or running."""
+        return key in self._tasks
+
+    def wait_for_done(self, msecs: int = -1) -> bool:
+        """Block until the pool is idle (for tests and shutdown); False on timeout."""
+        return self.thread_pool.waitForDone(msecs)
+
+    @Slot(str, object)
+    def _on_task_finished(self, key: str, result: Any):
+        task = self._tasks.pop(key, None)
+        if task is None:
+            return
+        self.task_completed.emit(key, result)
+        for subscriber in task.subscribers:
+            if subscriber.on_result:
+                subscriber.on_result(result)
+
+    @Slot(str, str)
+    def _on_task_failed(self, key: str, error: str):
+        task = self._tasks.pop(key, None)
+        if task is None:
+            return
+        print(f"[AnalysisTaskService] Analysis task failed: {error}")
+        self.task_failed.emit(key, error)
+        for subscriber in task.subscribers:
+            if subscriber.on_error:
+                subscriber.on_error(error)
+
+
+_shared_service: Optional[AnalysisTaskService] = None
+_shared_service_lock = threading.Lock()
+
+
+def get_analysis_service() -> AnalysisTaskService:
+    """Analysis task service shared by the app's dialogs (create the QApplication first)."""
+    global _shared_service
+    with _shared_service_lock:
+        if _shared_service is None:
+            _shared_service = AnalysisTaskService()
+        return _shared_service
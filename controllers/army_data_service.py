@@ -11,6 +11,7 @@ from typing import Any, Dict, List
 from PySide6.QtCore import QObject, Signal
 
 from utils.field_access import strict_get, strict_get_optional, strict_get_with_fallback
+from utils.read_model_cache import ReadModelCache
 
 
 class ArmyDataService(QObject):
@@ -25,16 +26,34 @@ class ArmyDataService(QObject):
         super().__init__(parent)
         self.game_state_manager = game_state_manager
 
+        # Formatted army data memoized on the player's and their army locations' state versions
+        self.read_models = ReadModelCache()
+
     def get_formatted_army_data(self, player_name: str) -> Dict[str, Any]:
         """
         Get formatted army data for UI display.
 
+        The result is memoized until the player's state or a terrain their armies occupy changes,
+        and should be treated as read-only.
+
         Returns:
             Dictionary with formatted army information for UI consumption
         """
         player_data = self.game_state_manager.get_player_data(player_name)
         raw_armies = strict_get(player_data, "armies")
-
+        locations = sorted({strict_get_optional(army_data, "location", "") for army_data in raw_armies.values()})
+        versions = (
+            self.game_state_manager.get_player_version(player_name),
+            tuple(self.game_state_manager.get_terrain_version(location) for location in locations),
+        )
+        return self.read_models.get(
+            ("formatted_army_data", player_name),
+            versions,
+            lambda: self._build_formatted_army_data(player_name, raw_armies),
+        )
+
+    def _build_formatted_army_data(self, player_name: str, raw_armies: Dict[str, Any]) -> Dict[str, Any]:
+        """Compute the formatted army data returned by get_formatted_army_data."""
         formatted_armies = []
 
         for army_type, army_data in raw_armies.items():
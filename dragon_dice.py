@@ -1,5 +1,7 @@
 import sys
 
+from utils.startup_profiler import STARTUP_PROFILER  # isort: skip  (start the clock before the heavy imports)
+
 from PySide6.QtWidgets import QApplication
 
 from main_window import MainWindow
@@ -13,7 +15,23 @@ class DragonDiceApp(QApplication):
 
     def __init__(self, argv):
         super().__init__(argv)
-        self.main_window = MainWindow()
+        self.show_startup_report = "--startup-report" in argv
+        STARTUP_PROFILER.mark("QApplication created")
+        # The welcome view is shown before the catalogs load; they warm up in the background
+        # --revalidate ignores the cached catalog validation results
+        self.main_window = MainWindow(defer_catalogs=True, revalidate="--revalidate" in argv)
+        STARTUP_PROFILER.mark("main window constructed")
+        self.main_window.first_paint.connect(self.main_window.start_catalog_warmup)
+        self.main_window.data_model.catalogs_ready.connect(self._report_startup)
+
+    def _report_startup(self):
+        if self.show_startup_report:
+            print(STARTUP_PROFILER.format_report())
+        else:
+            first_paint_ms = STARTUP_PROFILER.elapsed_ms("first paint")
+            ready_ms = STARTUP_PROFILER.elapsed_ms("catalogs ready")
+            if first_paint_ms is not None and ready_ms is not None:
+                print(f"Startup: first paint in {first_paint_ms:.0f} ms, catalogs ready in {ready_ms:.0f} ms")
 
     def run(self):
         self.main_window.show()
@@ -24,6 +42,7 @@ def run_pyside_app():
     """
     Entry point for the PySide6 application.
     """
+    STARTUP_PROFILER.mark("modules imported")
     app = DragonDiceApp(sys.argv)
     sys.exit(app.run())
 
@@ -9,6 +9,7 @@ from typing import Any, Dict, List, Optional
 
 from models.unit_model import UnitModel
 from utils.field_access import strict_get, strict_get_optional, strict_get_with_fallback
+from utils.read_model_cache import ReadModelCache
 
 
 class CoreEngine:
@@ -36,6 +37,9 @@ class CoreEngine:
         self.species_ability_manager = managers["species_ability_manager"]
         self.spell_resolver = managers.get("spell_resolver")
 
+        # Memoized read models keyed on game state versions
+        self.read_models = ReadModelCache()
+
     # =============================================================================
     # RULE ENFORCEMENT & VALIDATION
     # =============================================================================
@@ -191,7 +195,12 @@ class CoreEngine:
     # =============================================================================
 
     def get_all_player_summary_data(self) -> Dict[str, Any]:
-        """Get comprehensive summary data for all players."""
+        """
+        Get comprehensive summary data for all players.
+
+        Army summaries are memoized per player version by the game state manager; DUA, BUA,
+        reserves, effects and promotion opportunities live in other managers and are read fresh.
+        """
         player_summaries = {}
 
         for player_name in self.turn_manager.get_all_players():
@@ -207,7 +216,15 @@ class CoreEngine:
         return player_summaries
 
     def get_relevant_terrains_info(self, player_names: List[str]) -> Dict[str, Any]:
-        """Get terrain information relevant to given players."""
+        """Get terrain information relevant to given players, memoized until any terrain changes."""
+        return self.read_models.get(
+            ("relevant_terrains", tuple(player_names)),
+            self.game_state_manager.get_terrain_versions(),
+            lambda: self._build_relevant_terrains_info(player_names),
+        )
+
+    def _build_relevant_terrains_info(self, player_names: List[str]) -> Dict[str, Any]:
+        """Compute the terrain information returned by get_relevant_terrains_info."""
         terrains_info = {}
         all_terrain_data = self.game_state_manager.get_all_terrain_data()
 
@@ -254,7 +271,7 @@ class CoreEngine:
         return available_units
 
     def get_player_armies_summary(self, player_name: str) -> Dict[str, Any]:
-        """Get summary of all armies for a player."""
+        """Get summary of all armies for a player (memoized by the game state manager)."""
         return self.game_state_manager.get_player_armies_summary(player_name)
 
     def get_units_as_dua_objects(self, units_data: List[Dict[str, Any]]) -> List[Any]:
@@ -325,6 +342,13 @@ class CoreEngine:
             "elements": strict_get_optional(reserve_unit, "elements", []),
         }
 
+    def get_read_model_stats(self) -> Dict[str, Dict[str, int]]:
+        """Hit/miss counters for the memoized read models."""
+        return {
+            "game_state": self.game_state_manager.read_models.get_stats(),
+            "core_engine": self.read_models.get_stats(),
+        }
+
     # =============================================================================
     # PURE GAME RULE PROCESSING
     # =============================================================================
@@ -11,6 +11,7 @@ from typing import Any, Dict, List, Optional
 
 from PySide6.QtCore import QObject, Signal
 
+from models.element_model import element_mask
 from utils.field_access import strict_get_optional
 
 
@@ -389,15 +390,11 @@ class DragonAttackManager(QObject):
 
     def _dragons_share_element(self, dragon1: Dict[str, Any], dragon2: Dict[str, Any]) -> bool:
         """Check if two dragons share at least one element."""
-        elements1 = set(dragon1.get("elements", []))
-        elements2 = set(dragon2.get("elements", []))
-        return bool(elements1.intersection(elements2))
+        return bool(element_mask(dragon1.get("elements", [])) & element_mask(dragon2.get("elements", [])))
 
     def _dragons_match_all_elements(self, dragon1: Dict[str, Any], dragon2: Dict[str, Any]) -> bool:
         """Check if two dragons have exactly the same elements."""
-        elements1 = set(dragon1.get("elements", []))
-        elements2 = set(dragon2.get("elements", []))
-        return elements1 == elements2
+        return element_mask(dragon1.get("elements", [])) == element_mask(dragon2.get("elements", []))
 
     def _execute_single_dragon_attack(
         self, dragon_data: Dict[str, Any], target: DragonAttackTarget, game_state_manager
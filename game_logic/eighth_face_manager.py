@@ -97,6 +97,10 @@ class EighthFaceManager(QObject):
         """
         Evaluate which player controls each terrain based on army presence.
 
+        Control is read from the game state's incremental terrain control tracker, so only
+        terrains whose armies or face changed since the last evaluation are recomputed
+        rather than scanning every army for every terrain.
+
         Returns:
             Dictionary mapping terrain_id to control information
         """
@@ -109,93 +113,34 @@ class EighthFaceManager(QObject):
         terrain_data = game_state["terrain_data"]
         all_players_data = strict_get(game_state, "all_players_data")
 
+        tracker = self.game_state_manager.terrain_control
+        # Armies and faces may have been changed directly on the state dicts
+        tracker.sync(all_players_data, terrain_data)
+        all_control = tracker.get_all_terrain_control()
+
         for terrain_id, terrain_info in terrain_data.items():
-            control_result = self._determine_terrain_controller(terrain_id, terrain_info, all_players_data)
+            control = all_control[terrain_id]
+            armies_present = [
+                {
+                    "player": player_name,
+                    "army_id": army_id,
+                    "strength": strength,
+                    "units": all_players_data[player_name]["armies"][army_id].get("units", []),
+                }
+                for (player_name, army_id), strength in tracker.armies_at(terrain_id).items()
+            ]
             terrain_control[terrain_id] = {
                 "terrain_name": strict_get(terrain_info, "name"),
                 "terrain_current_face": strict_get_with_fallback(terrain_info, "current_face", "face"),
                 "terrain_eighth_face": strict_get_with_fallback(terrain_info, "eighth_face", "type"),
-                "controller": control_result["controller"],
-                "control_strength": control_result["control_strength"],
-                "armies_present": control_result["armies_present"],
-                "at_eighth_face": control_result["at_eighth_face"],
+                "controller": control.controller,
+                "control_strength": control.control_strength,
+                "armies_present": armies_present,
+                "at_eighth_face": control.at_eighth_face,
             }
 
         return terrain_control
 
-    def _determine_terrain_controller(
-        self, terrain_id: str, terrain_info: Dict[str, Any], all_players_data: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """
-        Determine which player controls a specific terrain.
-
-        Args:
-            terrain_id: The terrain identifier
-            terrain_info: Terrain data from game state
-            all_players_data: All player data from game state
-
-        Returns:
-            Dictionary with controller information
-        """
-        armies_at_terrain = []
-
-        # Find all armies at this terrain
-        for player_name, player_data in all_players_data.items():
-            armies = player_data.get("armies", {})
-            for army_id, army_data in armies.items():
-                if army_data.get("location") == terrain_id:
-                    army_strength = len(army_data.get("units", []))
-                    armies_at_terrain.append(
-                        {
-                            "player": player_name,
-                            "army_id": army_id,
-                            "strength": army_strength,
-                            "units": army_data.get("units", []),
-                        }
-                    )
-
-        # Determine controller based on army presence
-        if not armies_at_terrain:
-            return {
-                "controller": None,
-                "control_strength": 0,
-                "armies_present": [],
-                "at_eighth_face": terrain_info.get("current_face", 1) == 8,
-            }
-
-        # Group by player and calculate total strength
-        player_strengths = {}
-        for army in armies_at_terrain:
-            player = army["player"]
-            if player not in player_strengths:
-                player_strengths[player] = 0
-            player_strengths[player] += army["strength"]
-
-        at_eighth_face = terrain_info.get("current_face", 1) == 8
-
-        # According to Dragon Dice rules, a terrain is only "controlled" when it's at eighth face
-        if not at_eighth_face:
-            controller = None
-            max_strength = 0
-        else:
-            # Find the player with the highest strength at eighth face terrain
-            max_strength = max(player_strengths.values()) if player_strengths else 0
-            controllers = [player for player, strength in player_strengths.items() if strength == max_strength]
-
-            # If there's a tie, no one controls the terrain
-            if len(controllers) > 1:
-                controller = None
-            else:
-                controller = controllers[0] if controllers else None
-
-        return {
-            "controller": controller,
-            "control_strength": max_strength,
-            "armies_present": armies_at_terrain,
-            "at_eighth_face": at_eighth_face,
-            "terrain_eighth_face": strict_get_with_fallback(terrain_info, "current_face", "face"),
-        }
-
     def _get_player_controlled_terrains(
         self, player_name: str, terrain_control: Dict[str, Dict[str, Any]]
     ) -> Dict[str, Dict[str, Any]]:
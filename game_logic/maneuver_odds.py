@@ -0,0 +1,335 @@
+"""
+Exact maneuver contest odds for Dragon Dice.
+
+A maneuver succeeds when the maneuvering army's maneuver results equal or exceed the
+total of the counter-maneuvering armies. Each unit rolls one die, so an army's result is
+the sum of independent per-unit distributions; this module convolves those distributions
+exactly (no sampling) so players can see the odds before deciding to counter-maneuver.
+
+Modelled contributions per face:
+- Move faces count their icons as maneuver results.
+- ID faces count as maneuver results equal to their icons (doubled when the army's
+  player controls the terrain's eighth face).
+- SAI faces that generate maneuver results during a maneuver roll (Fly, Hoof, Paw,
+  Trample, Rend, Vanish, Teleport, ...), read from the die face catalog descriptions.
+- Melee faces of Dwarves (Mountain Mastery) and Goblins (Swamp Mastery) at earth terrain.
+
+Optional re-rolls (such as Treefolk re-rolling counter-maneuvers) are not modelled.
+"""
+
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+from models.die_face_model import ALL_DIE_FACES, DieFaceModel
+from utils.field_access import strict_get, strict_get_optional
+from utils.odds_cache import OddsCache, odds_key
+
+# Bump when the calculation changes, so results cached by earlier versions are not reused
+MANEUVER_ODDS_VERSION = 1
+
+# Species that may count melee results as maneuver results at a terrain containing earth
+MELEE_AS_MANEUVER_SPECIES = {"Dwarf", "Dwarves", "Goblin", "Goblins"}
+
+_NUMBER_WORDS = {
+    "one": 1,
+    "two": 2,
+    "three": 3,
+    "four": 4,
+    "five": 5,
+    "six": 6,
+    "seven": 7,
+    "eight": 8,
+    "nine": 9,
+    "ten": 10,
+}
+
+# e.g. "During a maneuver roll, Rend generates three maneuver results."
+#      "During any roll, Fly generates two maneuver or two save results."
+#      "During any army roll, Create Fireminions generates four magic, maneuver, melee, ..."
+_SAI_MANEUVER_PATTERN = re.compile(
+    r"During (?:a maneuver roll|any roll|any army roll), [^,.]*? generates (\w+) (?:[a-z]+, )*maneuver",
+    re.IGNORECASE,
+)
+
+# Unit dict keys that may name the unit's definition in UNIT_DATA
+_UNIT_TYPE_KEYS = ("unit_type_id", "unit_type", "unit_id", "id")
+
+Distribution = Tuple[float, ...]  # Probability of each maneuver total, indexed by total
+
+# One flag for every counter-maneuvering army, or one flag per army
+CounterIdDoubled = Union[bool, Sequence[bool]]
+
+
+@lru_cache(maxsize=1)
+def _faces_by_name() -> Dict[str, DieFaceModel]:
+    """Die faces by catalog key and by face name (basic faces are named e.g. "SAVE_4", keyed "Save_4")."""
+    faces = {face.name: face for face in ALL_DIE_FACES.values()}
+    faces.update(ALL_DIE_FACES)
+    return faces
+
+
+@lru_cache(maxsize=None)
+def sai_maneuver_results(face_name: str) -> int:
+    """Maneuver results an SAI face generates during a maneuver roll (0 if none)."""
+    face = _faces_by_name().get(face_name)
+    if face is None:
+        return 0
+    match = _SAI_MANEUVER_PATTERN.search(face.description)
+    if not match:
+        return 0
+    amount = match.group(1).lower()
+    if amount.isdigit():
+        return int(amount)
+    return _NUMBER_WORDS.get(amount, 0)
+
+
+def maneuver_face_value(face: DieFaceModel, melee_counts_as_maneuver: bool, id_doubled: bool) -> int:
+    """Maneuver results one rolled face contributes to a maneuver roll."""
+    if face.face_type == "MOVE":
+        return face.base_value
+    if face.face_type == "ID":
+        return face.base_value * 2 if id_doubled else face.base_value
+    if face.face_type == "MELEE" and melee_counts_as_maneuver:
+        return face.base_value
+    if face.is_special_ability():
+        return sai_maneuver_results(face.name)
+    return 0
+
+
+def _face_name(face: Any) -> str:
+    """Name of a unit face given as a face dict, a DieFaceModel or a face name."""
+    if isinstance(face, Mapping):
+        return strict_get(face, "name")
+    if isinstance(face, DieFaceModel):
+        return face.name
+    return face
+
+
+def _per_army_flags(flags: CounterIdDoubled, army_count: int) -> List[bool]:
+    if isinstance(flags, bool):
+        return [flags] * army_count
+    flags = list(flags)
+    if len(flags) != army_count:
+        raise ValueError(f"Expected {army_count} counter_id_doubled flags, got {len(flags)}")
+    return flags
+
+
+@lru_cache(maxsize=1024)
+def _face_values_distribution(face_values: Tuple[int, ...]) -> Distribution:
+    """Distribution of a single die whose faces are equally likely."""
+    distribution = [0.0] * (max(face_values) + 1)
+    probability = 1.0 / len(face_values)
+    for value in face_values:
+        distribution[value] += probability
+    return tuple(distribution)
+
+
+def convolve(first: Sequence[float], second: Sequence[float]) -> Distribution:
+    """Distribution of the sum of two independent totals."""
+    combined = [0.0] * (len(first) + len(second) - 1)
+    for i, p in enumerate(first):
+        if p:
+            for j, q in enumerate(second):
+                combined[i + j] += p * q
+    return tuple(combined)
+
+
+@dataclass
+class ManeuverOdds:
+    """Result of a maneuver odds calculation."""
+
+    success_probability: float
+    maneuvering_distribution: Distribution
+    counter_distribution: Distribution
+    unresolved_units: List[str] = field(default_factory=list)  # Units whose die faces are unknown
+
+    @property
+    def maneuvering_expected(self) -> float:
+        return sum(total * p for total, p in enumerate(self.maneuvering_distribution))
+
+    @property
+    def counter_expected(self) -> float:
+        return sum(total * p for total, p in enumerate(self.counter_distribution))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain form for the odds cache (unresolved units are never cached)."""
+        return {
+            "success_probability": self.success_probability,
+            "maneuvering_distribution": list(self.maneuvering_distribution),
+            "counter_distribution": list(self.counter_distribution),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ManeuverOdds":
+        return cls(
+            success_probability=data["success_probability"],
+            maneuvering_distribution=tuple(data["maneuvering_distribution"]),
+            counter_distribution=tuple(data["counter_distribution"]),
+        )
+
+
+class ManeuverOddsCalculator:
+    """
+    Computes the exact probability that a maneuver succeeds against counter-maneuvering armies.
+
+    Units are the army units used by the game state and dialogs (UnitInstance objects or
+    UnitModel.to_dict() dicts). A unit's faces are taken from its "faces" list (face dicts
+    or die face names) when present, otherwise from its unit definition (looked up by unit
+    type id).
+
+    Given an OddsCache, results are looked up by army compositions and terrain state
+    before being calculated.
+    """
+
+    def __init__(self, terrain_elements: Optional[Iterable[str]] = None, cache: Optional[OddsCache] = None):
+        self.terrain_elements = {element.lower() for element in (terrain_elements or [])}
+        self.cache = cache
+
+    def unit_faces(self, unit: Mapping[str, Any]) -> Optional[List[DieFaceModel]]:
+        """Resolve a unit to its die faces, or None if the unit cannot be identified."""
+        unit_faces = unit.get("faces")
+        if unit_faces:
+            face_names = [_face_name(face) for face in unit_faces]
+            faces_by_name = _faces_by_name()
+            faces = [faces_by_name[name] for name in face_names if name in faces_by_name]
+            if len(faces) == len(face_names):
+                return faces
+
+        from models.unit_data import get_unit_by_id
+
+        for key in _UNIT_TYPE_KEYS:
+            unit_type_id = unit.get(key)
+            if unit_type_id:
+                unit_definition = get_unit_by_id(unit_type_id)
+                if unit_definition:
+                    return unit_definition.faces
+        return None
+
+    def _unit_species_name(self, unit: Mapping[str, Any]) -> str:
+        species = strict_get_optional(unit, "species", "")
+        if isinstance(species, Mapping):
+            return strict_get(species, "name")
+        if species and not isinstance(species, str):
+            return species.name
+        if species:
+            return species
+
+        from models.unit_data import get_unit_by_id
+
+        for key in _UNIT_TYPE_KEYS:
+            unit_definition = get_unit_by_id(unit.get(key) or "")
+            if unit_definition:
+                return unit_definition.species.name
+        return ""
+
+    def unit_distribution(self, unit: Mapping[str, Any], id_doubled: bool = False) -> Optional[Distribution]:
+        """Maneuver result distribution for one unit's roll, or None if its faces are unknown."""
+        faces = self.unit_faces(unit)
+        if not faces:
+            return None
+        melee_counts = "earth" in self.terrain_elements and self._unit_species_name(unit) in MELEE_AS_MANEUVER_SPECIES
+        face_values = tuple(maneuver_face_value(face, melee_counts, id_doubled) for face in faces)
+        return _face_values_distribution(face_values)
+
+    def army_distribution(
+        self,
+        units: Iterable[Mapping[str, Any]],
+        id_doubled: bool = False,
+        unresolved_units: Optional[List[str]] = None,
+    ) -> Distribution:
+        """Maneuver result distribution for a whole army's roll."""
+        distribution: Distribution = (1.0,)
+        for unit in units:
+            unit_distribution = self.unit_distribution(unit, id_doubled)
+            if unit_distribution is None:
+                if unresolved_units is not None:
+                    unresolved_units.append(strict_get_optional(unit, "name", "Unknown Unit"))
+                continue
+            distribution = convolve(distribution, unit_distribution)
+        return distribution
+
+    def calculate(
+        self,
+        maneuvering_units: Iterable[Mapping[str, Any]],
+        counter_armies_units: Iterable[Iterable[Mapping[str, Any]]],
+        maneuvering_id_doubled: bool = False,
+        counter_id_doubled: CounterIdDoubled = False,
+    ) -> ManeuverOdds:
+        """
+        Probability that the maneuvering army's results equal or exceed the combined
+        results of all counter-maneuvering armies.
+
+        ID results are doubled for the maneuvering army and/or the counter-maneuvering
+        armies (all of them, or per army given a list of flags) whose player controls the
+        terrain's eighth face.
+        """
+        if self.cache is None:
+            return self._calculate(maneuvering_units, counter_armies_units, maneuvering_id_doubled, counter_id_doubled)
+
+        maneuvering_units = list(maneuvering_units)
+        counter_armies_units = [list(army_units) for army_units in counter_armies_units]
+        key = self.cache_key(maneuvering_units, counter_armies_units, maneuvering_id_doubled, counter_id_doubled)
+        stored = self.cache.get(key)
+        if stored is not None:
+            return ManeuverOdds.from_dict(stored)
+
+        odds = self._calculate(maneuvering_units, counter_armies_units, maneuvering_id_doubled, counter_id_doubled)
+        # Unresolved units are reported by name, which is not part of the key
+        if not odds.unresolved_units:
+            self.cache.put(key, odds.to_dict())
+        return odds
+
+    def cache_key(
+        self,
+        maneuvering_units: Iterable[Mapping[str, Any]],
+        counter_armies_units: Iterable[Iterable[Mapping[str, Any]]],
+        maneuvering_id_doubled: bool = False,
+        counter_id_doubled: CounterIdDoubled = False,
+    ) -> str:
+        """Odds cache key of a calculation (see utils.odds_cache.odds_key)."""
+        counter_armies_units = list(counter_armies_units)
+        terrain_flags = {
+            "elements": sorted(self.terrain_elements),
+            "maneuvering_id_doubled": maneuvering_id_doubled,
+            "counter_id_doubled": _per_army_flags(counter_id_doubled, len(counter_armies_units)),
+        }
+        return odds_key(
+            "maneuver",
+            [maneuvering_units, *counter_armies_units],
+            "maneuver",
+            terrain_flags=terrain_flags,
+            version=MANEUVER_ODDS_VERSION,
+        )
+
+    def _calculate(
+        self,
+        maneuvering_units: Iterable[Mapping[str, Any]],
+        counter_armies_units: Iterable[Iterable[Mapping[str, Any]]],
+        maneuvering_id_doubled: bool,
+        counter_id_doubled: CounterIdDoubled,
+    ) -> ManeuverOdds:
+        unresolved_units: List[str] = []
+        maneuvering = self.army_distribution(maneuvering_units, maneuvering_id_doubled, unresolved_units)
+        counter_armies_units = list(counter_armies_units)
+        counter: Distribution = (1.0,)
+        for army_units, id_doubled in zip(
+            counter_armies_units, _per_army_flags(counter_id_doubled, len(counter_armies_units))
+        ):
+            counter = convolve(counter, self.army_distribution(army_units, id_doubled, unresolved_units))
+
+        # P(maneuvering >= counter) using the running cumulative of the counter distribution
+        success_probability = 0.0
+        counter_at_most = 0.0
+        for total, p in enumerate(maneuvering):
+            if total < len(counter):
+                counter_at_most += counter[total]
+            success_probability += p * counter_at_most
+
+        return ManeuverOdds(
+            success_probability=min(success_probability, 1.0),
+            maneuvering_distribution=maneuvering,
+            counter_distribution=counter,
+            unresolved_units=unresolved_units,
+        )
@@ -6,7 +6,7 @@ and promotion chain management according to Dragon Dice rules.
 """
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from PySide6.QtCore import QObject, Signal
 
@@ -100,18 +100,8 @@ class PromotionManager(QObject):
         if not self.dua_manager:
             return []
 
-        dua_units = self.dua_manager.get_player_dua(player_name)
-        candidates = []
-
-        for dua_unit in dua_units:
-            unit_data = dua_unit.unit_data
-            unit_species = strict_get(strict_get(unit_data, "species"), "name")
-            unit_health = strict_get(unit_data, "max_health")
-
-            if unit_species == species_name and unit_health == target_health:
-                candidates.append(unit_data)
-
-        return candidates
+        dua_units = self.dua_manager.get_promotion_candidates(player_name, species_name, target_health)
+        return [dua_unit.unit_data for dua_unit in dua_units]
 
     def _find_promotion_candidates_in_pool(
         self, player_name: str, species_name: str, target_health: int
@@ -172,7 +162,7 @@ class PromotionManager(QObject):
 
         for dua_unit in dua_units:
             if dua_unit.unit_data.get("unit_id") == unit_id:
-                return dua_unit.state == "DEAD"  # type: ignore[no-any-return]  # Only dead units can be used for promotion
+                return dua_unit.can_be_resurrected()  # Only dead units can be used for promotion
 
         return False
 
@@ -270,7 +260,7 @@ class PromotionManager(QObject):
         all_errors = []
 
         if promotion_type == "as_many_as_possible":
-            promotion_options = self.find_promotion_options(army_units, player_name)
+            promotion_options = self.plan_mass_promotion(army_units, player_name)
 
             for option in promotion_options:
                 result = self.execute_promotion(option, player_name)
@@ -295,6 +285,51 @@ class PromotionManager(QObject):
             errors=all_errors,
         )
 
+    def plan_mass_promotion(self, army_units: List[Dict[str, Any]], player_name: str) -> List[PromotionOption]:
+        """
+        Plan the largest conflict-free set of promotions for an army.
+
+        Each army unit is promoted at most once and each DUA/pool unit is used at most once.
+        Promotions all raise health by one, so the most valuable plan is a maximum matching
+        between army units and promotion targets, found with augmenting paths.
+        Units without species/max_health data cannot be promoted and are skipped.
+        """
+        unit_options: List[List[PromotionOption]] = []
+        for unit_dict in army_units:
+            if not isinstance(unit_dict.get("species"), dict) or "max_health" not in unit_dict:
+                continue
+            options = self._find_unit_promotion_options(unit_dict, player_name)
+            if options:
+                unit_options.append(options)
+
+        # Target unit (by identity) -> index into unit_options of the army unit it is assigned to
+        assigned: Dict[int, int] = {}
+        chosen: List[Optional[PromotionOption]] = [None] * len(unit_options)
+
+        def augment(unit_index: int, visited: set) -> bool:
+            options = unit_options[unit_index]
+            # Take a free target first; only displace another unit's target when none is free
+            for option in options:
+                if id(option.target_unit) not in assigned:
+                    assigned[id(option.target_unit)] = unit_index
+                    chosen[unit_index] = option
+                    return True
+            for option in options:
+                target_id = id(option.target_unit)
+                if target_id in visited:
+                    continue
+                visited.add(target_id)
+                if augment(assigned[target_id], visited):
+                    assigned[target_id] = unit_index
+                    chosen[unit_index] = option
+                    return True
+            return False
+
+        for unit_index in range(len(unit_options)):
+            augment(unit_index, set())
+
+        return [option for option in chosen if option is not None]
+
     def calculate_health_worth_promotion(
         self, available_health_worth: int, army_units: List[Dict[str, Any]], player_name: str
     ) -> List[PromotionOption]:
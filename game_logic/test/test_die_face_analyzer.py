@@ -166,6 +166,27 @@ class TestDieFaceAnalyzer(unittest.TestCase):
         face_counts = self.analyzer.count_die_faces([unknown_unit])
         assert face_counts == {}
 
+    def test_count_die_faces_reads_each_unit_type_once(self):
+        """Test that unit definitions are looked up once per unit type and totals are cached."""
+        units = [self.melee_unit, self.missile_unit, self.dict_melee_unit]
+
+        first = self.analyzer.count_die_faces(units)
+        first["Melee"] = 0  # Callers get a copy, not the cached totals
+        second = self.analyzer.count_die_faces(list(reversed(units)))
+
+        assert second == {"Melee": 6, "Missile": 4, "Save": 6, "Maneuver": 3, "SAI": 2}
+        assert self.mock_unit_roster.get_unit_definition.call_count == 2
+
+    def test_count_die_faces_after_composition_change(self):
+        """Test that a changed army composition is counted afresh."""
+        assert self.analyzer.count_die_faces([self.melee_unit])["Melee"] == 3
+        assert self.analyzer.count_die_faces([self.melee_unit, self.melee_unit])["Melee"] == 6
+
+        self.melee_unit_def["die_faces"]["face_6"] = "Melee"
+        self.analyzer.invalidate_face_tables()
+
+        assert self.analyzer.count_die_faces([self.melee_unit])["Melee"] == 4
+
     def test_get_sorted_face_counts(self):
         """Test sorting face counts by priority and count."""
         face_counts = {
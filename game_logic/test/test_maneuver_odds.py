@@ -0,0 +1,161 @@
+import itertools
+import time
+
+import pytest
+
+from game_logic.maneuver_odds import ManeuverOddsCalculator, convolve, sai_maneuver_results
+from models.unit_data import UNIT_DATA, get_unit_by_id
+from models.unit_instance import UnitInstance
+from models.unit_model import UnitModel
+from utils.odds_cache import OddsCache
+
+
+def _unit(unit_id, **overrides):
+    definition = get_unit_by_id(unit_id)
+    unit = {"name": definition.name, "unit_type_id": unit_id, "species": definition.species.name}
+    unit.update(overrides)
+    return unit
+
+
+def _brute_force_success(calculator, maneuvering_units, counter_units):
+    """Enumerate every combination of rolled faces and count successful maneuvers."""
+    value_lists = []
+    for unit in maneuvering_units + counter_units:
+        distribution = calculator.unit_distribution(unit)
+        faces = calculator.unit_faces(unit)
+        # Recover per-face values from the distribution: each face has weight 1/len(faces)
+        values = []
+        for total, p in enumerate(distribution):
+            values.extend([total] * round(p * len(faces)))
+        value_lists.append(values)
+
+    successes = 0
+    outcomes = 0
+    split = len(maneuvering_units)
+    for roll in itertools.product(*value_lists):
+        outcomes += 1
+        if sum(roll[:split]) >= sum(roll[split:]):
+            successes += 1
+    return successes / outcomes
+
+
+class TestSaiManeuverResults:
+    def test_maneuver_generating_sais(self):
+        assert sai_maneuver_results("Fly_3") == 3
+        assert sai_maneuver_results("Hoof_2") == 2
+        assert sai_maneuver_results("Trample_4") == 4
+        assert sai_maneuver_results("Rend_3") == 3
+        assert sai_maneuver_results("Create Fireminions") == 4
+
+    def test_non_maneuver_sais(self):
+        assert sai_maneuver_results("Frost Cantrip") == 0
+        assert sai_maneuver_results("Roar") == 0
+        assert sai_maneuver_results("Not A Face") == 0
+
+
+class TestManeuverOddsCalculator:
+    def test_unopposed_maneuver_always_succeeds(self):
+        odds = ManeuverOddsCalculator().calculate([_unit("amazon_charioteer")], [])
+        assert odds.success_probability == pytest.approx(1.0)
+
+    def test_single_die_distribution(self):
+        # Charioteer: ID_1, Move_1, Melee_2, Move_1, Save_1, Move_1
+        distribution = ManeuverOddsCalculator().unit_distribution(_unit("amazon_charioteer"))
+        assert distribution == pytest.approx((2 / 6, 4 / 6))
+
+    def test_matches_brute_force_enumeration(self):
+        calculator = ManeuverOddsCalculator(["earth", "fire"])
+        maneuvering = [_unit(unit.unit_id) for unit in UNIT_DATA[:3]]
+        counter = [_unit(unit.unit_id) for unit in UNIT_DATA[40:43]]
+
+        odds = calculator.calculate(maneuvering, [counter])
+
+        assert odds.success_probability == pytest.approx(_brute_force_success(calculator, maneuvering, counter))
+
+    def test_multiple_counter_armies_are_combined(self):
+        calculator = ManeuverOddsCalculator()
+        maneuvering = [_unit("amazon_battle_rider")]
+        counter_a = [_unit("amazon_charioteer")]
+        counter_b = [_unit("amazon_charioteer")]
+
+        odds = calculator.calculate(maneuvering, [counter_a, counter_b])
+
+        assert odds.success_probability == pytest.approx(
+            _brute_force_success(calculator, maneuvering, counter_a + counter_b)
+        )
+
+    def test_faces_list_and_unit_type_lookup_agree(self):
+        definition = UNIT_DATA[40]
+        calculator = ManeuverOddsCalculator()
+        by_faces = calculator.unit_distribution({"name": definition.name, "faces": definition.get_face_names()})
+        by_type = calculator.unit_distribution({"name": definition.name, "unit_type_id": definition.unit_id})
+        assert by_faces == by_type
+
+    def test_game_state_units_resolve(self):
+        # Army units as the game state stores them: face dicts, species dict, instance unit ids
+        dwarf = next(unit for unit in UNIT_DATA if unit.species.name == "Dwarf")
+        unit_data = UnitModel.from_unit_data(dwarf.unit_id).to_dict()
+        unit_data["unit_id"] = "player_1_campaign_1"
+        unit = UnitInstance.from_dict(unit_data)
+
+        at_earth = ManeuverOddsCalculator(["earth"])
+        assert at_earth.unit_distribution(unit) == at_earth.unit_distribution(_unit(dwarf.unit_id))
+        assert at_earth.unit_distribution(unit) != ManeuverOddsCalculator(["water"]).unit_distribution(unit)
+        assert at_earth.unit_distribution(unit_data) == at_earth.unit_distribution(unit)
+
+    def test_dwarves_count_melee_as_maneuver_at_earth(self):
+        dwarf = next(unit for unit in UNIT_DATA if unit.species.name == "Dwarf")
+        unit = _unit(dwarf.unit_id)
+
+        at_water = ManeuverOddsCalculator(["water"]).unit_distribution(unit)
+        at_earth = ManeuverOddsCalculator(["earth"]).unit_distribution(unit)
+
+        assert sum(t * p for t, p in enumerate(at_earth)) > sum(t * p for t, p in enumerate(at_water))
+
+    def test_eighth_face_doubles_id(self):
+        calculator = ManeuverOddsCalculator()
+        normal = calculator.unit_distribution(_unit("amazon_battle_rider"))
+        doubled = calculator.unit_distribution(_unit("amazon_battle_rider"), id_doubled=True)
+        # ID_2 becomes 4 maneuver results
+        assert doubled[4] == pytest.approx(1 / 6)
+        assert normal[2] == pytest.approx(1 / 6)
+
+    def test_unknown_units_are_reported(self):
+        odds = ManeuverOddsCalculator().calculate([{"name": "Mystery Unit"}], [[_unit("amazon_charioteer")]])
+        assert odds.unresolved_units == ["Mystery Unit"]
+
+    def test_cached_odds_are_reused(self):
+        cache = OddsCache()
+        calculator = ManeuverOddsCalculator(["earth"], cache=cache)
+        maneuvering = [_unit("amazon_battle_rider"), _unit("amazon_charioteer")]
+        counter = [_unit(unit.unit_id) for unit in UNIT_DATA[40:43]]
+
+        odds = calculator.calculate(maneuvering, [counter])
+        # Same composition in a different order, from a new calculator
+        cached = ManeuverOddsCalculator(["earth"], cache=cache).calculate(maneuvering[::-1], [counter])
+
+        assert cached == odds
+        assert cache.get_stats()["hits"] == 1
+        assert ManeuverOddsCalculator(["water"], cache=cache).calculate(maneuvering, [counter]) is not None
+        assert cache.get_stats()["entries"] == 2
+
+        calculator.calculate([{"name": "Mystery Unit"}], [counter])
+        assert cache.get_stats()["entries"] == 2
+
+    def test_large_armies_resolve_quickly(self):
+        calculator = ManeuverOddsCalculator(["earth", "air"])
+        maneuvering = [_unit(unit.unit_id) for unit in UNIT_DATA[:15]]
+        counter = [_unit(unit.unit_id) for unit in UNIT_DATA[40:55]]
+        calculator.calculate(maneuvering, [counter])  # Warm the unit caches
+
+        start = time.perf_counter()
+        odds = calculator.calculate(maneuvering, [counter, counter[:5]])
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        assert 0.0 <= odds.success_probability <= 1.0
+        assert sum(odds.maneuvering_distribution) == pytest.approx(1.0)
+        assert elapsed_ms < 10.0
+
+
+def test_convolve():
+    assert convolve((0.5, 0.5), (0.5, 0.5)) == pytest.approx((0.25, 0.5, 0.25))
@@ -0,0 +1,129 @@
+import json
+
+from utils import odds_cache
+from utils.odds_cache import ODDS_CACHE_FORMAT_VERSION, OddsCache, fingerprint_odds_sources, odds_key
+
+
+def _unit(name, unit_type_id, health=1):
+    return {"name": name, "unit_type_id": unit_type_id, "species": "Amazons", "health": health}
+
+
+class TestOddsKey:
+    def test_unit_order_and_names_do_not_matter(self):
+        army = [_unit("Rider", "amazon_battle_rider"), _unit("Charioteer", "amazon_charioteer")]
+        renamed = [_unit("Other Charioteer", "amazon_charioteer"), _unit("Other Rider", "amazon_battle_rider")]
+
+        assert odds_key("maneuver", [army], "maneuver") == odds_key("maneuver", [renamed], "maneuver")
+
+    def test_inputs_are_part_of_the_key(self):
+        army = [_unit("Rider", "amazon_battle_rider")]
+        other = [_unit("Charioteer", "amazon_charioteer")]
+        key = odds_key("maneuver", [army, other], "maneuver", terrain_flags={"elements": ["earth"]})
+
+        assert key != odds_key("maneuver", [other, army], "maneuver", terrain_flags={"elements": ["earth"]})
+        assert key != odds_key("maneuver", [army, other], "maneuver", terrain_flags={"elements": ["fire"]})
+        assert key != odds_key("maneuver", [army, other], "melee", terrain_flags={"elements": ["earth"]})
+        assert key != odds_key("combat", [army, other], "maneuver", terrain_flags={"elements": ["earth"]})
+        assert key != odds_key(
+            "maneuver", [army, other], "maneuver", {"melee_bonus": 1}, terrain_flags={"elements": ["earth"]}
+        )
+        assert key != odds_key("maneuver", [army, other], "maneuver", terrain_flags={"elements": ["earth"]}, version=2)
+
+
+class TestOddsCache:
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = OddsCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.get_stats() == {"hits": 3, "misses": 1, "evictions": 1, "entries": 2, "hit_rate": 0.75}
+
+    def test_get_or_compute_encodes_and_decodes(self):
+        cache = OddsCache()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return (0.25, 0.75)
+
+        for _ in range(3):
+            assert cache.get_or_compute("key", compute, encode=list, decode=tuple) == (0.25, 0.75)
+        assert len(calls) == 1
+
+    def test_entries_persist_across_instances(self, tmp_path):
+        path = tmp_path / "odds_cache.json"
+        cache = OddsCache(path, max_entries=2)
+        for key, value in [("a", {"p": 0.1}), ("b", {"p": 0.2}), ("c", {"p": 0.3})]:
+            cache.put(key, value)
+        cache.flush()
+
+        reloaded = OddsCache(path)
+        assert reloaded.get("a") is None
+        assert reloaded.get("c") == {"p": 0.3}
+        assert reloaded.get_stats()["entries"] == 2
+
+    def test_stale_or_unreadable_files_are_ignored(self, tmp_path):
+        path = tmp_path / "odds_cache.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "format_version": ODDS_CACHE_FORMAT_VERSION + 1,
+                    "sources": fingerprint_odds_sources(),
+                    "entries": [["a", 1]],
+                }
+            )
+        )
+        assert OddsCache(path).get("a") is None
+
+        path.write_text("{not json")
+        cache = OddsCache(path)
+        assert cache.get("a") is None
+        cache.put("a", 1)
+        cache.flush()
+        assert OddsCache(path).get("a") == 1
+
+    def test_files_from_other_odds_sources_are_dropped(self, tmp_path):
+        path = tmp_path / "odds_cache.json"
+        cache = OddsCache(path, sources_fingerprint="old faces")
+        cache.put("a", 1)
+        cache.flush()
+
+        assert OddsCache(path, sources_fingerprint="old faces").get("a") == 1
+        changed = OddsCache(path, sources_fingerprint="new faces")
+        assert changed.get("a") is None
+        changed.put("b", 2)
+        changed.flush()
+        assert OddsCache(path, sources_fingerprint="old faces").get("b") is None
+        assert OddsCache(path, sources_fingerprint="new faces").get("b") == 2
+
+    def test_default_fingerprint_covers_odds_sources(self, tmp_path):
+        path = tmp_path / "odds_cache.json"
+        cache = OddsCache(path)
+        cache.put("a", 1)
+        cache.flush()
+
+        assert json.loads(path.read_text())["sources"] == fingerprint_odds_sources()
+        assert OddsCache(path).get("a") == 1
+
+
+class TestSharedOddsCache:
+    def test_defaults_to_the_user_cache_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(odds_cache, "_shared_cache", None)
+        monkeypatch.delenv(odds_cache.CACHE_PATH_ENV_VAR, raising=False)
+        monkeypatch.setenv("DRAGON_DICE_CACHE_DIR", str(tmp_path))
+
+        assert odds_cache.get_odds_cache().path == tmp_path / "odds_cache.json"
+
+    def test_env_var_sets_the_path_or_keeps_the_cache_in_memory(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(odds_cache, "_shared_cache", None)
+        monkeypatch.setenv(odds_cache.CACHE_PATH_ENV_VAR, str(tmp_path / "odds.json"))
+        assert odds_cache.get_odds_cache().path == tmp_path / "odds.json"
+
+        monkeypatch.setattr(odds_cache, "_shared_cache", None)
+        monkeypatch.setenv(odds_cache.CACHE_PATH_ENV_VAR, "")
+        assert odds_cache.get_odds_cache().path is None
@@ -0,0 +1,95 @@
+from unittest.mock import Mock
+
+from game_logic.promotion_manager import PromotionManager
+from models.game_state.dua_manager import DUAManager
+
+
+def _unit(name, species, max_health, unit_id=None):
+    return {
+        "name": name,
+        "unit_id": unit_id or name.lower().replace(" ", "_"),
+        "species": {"name": species, "elements": ["fire"]},
+        "health": max_health,
+        "max_health": max_health,
+    }
+
+
+class TestDUAPromotionIndex:
+    def setup_method(self):
+        self.dua_manager = DUAManager(turn_manager=Mock(get_current_turn=Mock(return_value=1)))
+        self.dua_manager.initialize_player_dua("Player 1")
+
+    def test_candidates_follow_dua_changes(self):
+        self.dua_manager.add_killed_unit(_unit("Goblin Thug", "Goblin", 2), "Player 1")
+        self.dua_manager.add_killed_unit(_unit("Goblin Raider", "Goblin", 3), "Player 1")
+        self.dua_manager.add_killed_unit(_unit("Dwarf Soldier", "Dwarf", 2), "Player 1")
+
+        candidates = self.dua_manager.get_promotion_candidates("Player 1", "Goblin", 2)
+        assert [unit.name for unit in candidates] == ["Goblin Thug"]
+
+        self.dua_manager.remove_unit_from_dua("Player 1", "Goblin Thug")
+        assert self.dua_manager.get_promotion_candidates("Player 1", "Goblin", 2) == []
+
+        self.dua_manager.bury_unit("Player 1", "Goblin Raider")
+        assert self.dua_manager.get_promotion_candidates("Player 1", "Goblin", 3) == []
+
+    def test_direct_list_edits_rebuild_the_index(self):
+        self.dua_manager.add_killed_unit(_unit("Goblin Thug", "Goblin", 2), "Player 1")
+        self.dua_manager.get_player_dua("Player 1").clear()
+
+        assert self.dua_manager.get_promotion_candidates("Player 1", "Goblin", 2) == []
+
+
+class TestMassPromotionPlanner:
+    def setup_method(self):
+        self.dua_manager = DUAManager(turn_manager=Mock(get_current_turn=Mock(return_value=1)))
+        self.dua_manager.initialize_player_dua("Player 1")
+        self.promotion_manager = PromotionManager(dua_manager=self.dua_manager)
+
+    def test_each_dua_unit_is_used_once(self):
+        for i in range(2):
+            self.dua_manager.add_killed_unit(_unit(f"Goblin Raider {i}", "Goblin", 2), "Player 1")
+        army_units = [_unit(f"Goblin Thug {i}", "Goblin", 1) for i in range(3)]
+
+        plan = self.promotion_manager.plan_mass_promotion(army_units, "Player 1")
+
+        assert len(plan) == 2
+        assert len({id(option.target_unit) for option in plan}) == 2
+        assert len({id(option.source_unit) for option in plan}) == 2
+
+    def test_plan_covers_every_promotable_unit_across_species_and_health(self):
+        dua_units = [
+            _unit("Goblin Raider", "Goblin", 2),
+            _unit("Goblin Chieftain", "Goblin", 3),
+            _unit("Dwarf Guard", "Dwarf", 2),
+        ]
+        for unit in dua_units:
+            self.dua_manager.add_killed_unit(unit, "Player 1")
+        army_units = [
+            _unit("Goblin Thug", "Goblin", 1),
+            _unit("Goblin Raider", "Goblin", 2, unit_id="goblin_raider_army"),
+            _unit("Dwarf Soldier", "Dwarf", 1),
+            _unit("Dwarf Lord", "Dwarf", 4),
+            {"name": "Summoned Thing", "health": 1},  # No species data: cannot be promoted
+        ]
+
+        plan = self.promotion_manager.plan_mass_promotion(army_units, "Player 1")
+
+        pairs = {(option.source_unit["name"], option.target_unit["name"]) for option in plan}
+        assert pairs == {
+            ("Goblin Thug", "Goblin Raider"),
+            ("Goblin Raider", "Goblin Chieftain"),
+            ("Dwarf Soldier", "Dwarf Guard"),
+        }
+
+    def test_mass_promotion_executes_the_plan(self):
+        for i in range(2):
+            self.dua_manager.add_killed_unit(_unit(f"Goblin Raider {i}", "Goblin", 2), "Player 1")
+        army_units = [_unit(f"Goblin Thug {i}", "Goblin", 1) for i in range(3)]
+
+        result = self.promotion_manager.execute_mass_promotion(army_units, "Player 1")
+
+        assert result.success
+        assert result.errors == []
+        assert [unit["max_health"] for unit in result.promoted_units] == [2, 2]
+        assert len(result.exchanged_from_dua) == 2
@@ -1,6 +1,6 @@
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from PySide6.QtCore import Signal
+from PySide6.QtCore import QEvent, QObject, Signal
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -8,14 +8,14 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from controllers.gameplay_controller import GameplayController
 from models.app_data_model import AppDataModel
-from views.distance_rolls_view import DistanceRollsView
-from views.frontier_selection_view import FrontierSelectionView
-from views.main_gameplay_view import MainGameplayView
-from views.player_setup_view import PlayerSetupView
+from utils.startup_profiler import STARTUP_PROFILER
 from views.welcome_view import WelcomeView
 
+# Every view after the welcome screen is imported when first shown, keeping startup fast
+if TYPE_CHECKING:
+    from views.player_setup_view import PlayerSetupView
+
 
 class MainWindow(QMainWindow):
     """
@@ -24,14 +24,25 @@ class MainWindow(QMainWindow):
     """
 
     view_switched_and_ready = Signal()
-
-    def __init__(self):
+    first_paint = Signal()
+
+    def __init__(self, defer_catalogs: bool = False, revalidate: bool = False):
+        """
+        Args:
+            defer_catalogs: Show the welcome view before the model catalogs are loaded, and load
+                them on a background thread instead. Call start_catalog_warmup() once shown.
+            revalidate: Validate every catalog at startup, ignoring cached validation results.
+        """
         super().__init__()
         self.setWindowTitle("Dragon Dice Companion (PySide6)")
         self.setGeometry(100, 100, 1280, 720)
-        self.data_model = AppDataModel()
+        self.data_model = AppDataModel(defer_catalogs=defer_catalogs, revalidate=revalidate)
+        self.data_model.catalogs_warmed.connect(self._finish_catalog_warmup)
+        self.data_model.catalogs_ready.connect(lambda: STARTUP_PROFILER.mark("catalogs ready"))
         self.current_controller = None
         self.player_setup_view_instance: Optional[PlayerSetupView] = None
+        self._first_paint_seen = False
+        self.installEventFilter(self)
 
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
@@ -47,6 +58,34 @@ class MainWindow(QMainWindow):
         self.data_model.all_distance_rolls_submitted.connect(self.data_model.initialize_game_engine)
         self.data_model.game_engine_initialized.connect(self.show_main_gameplay_view)
 
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:  # noqa: N802
+        if not self._first_paint_seen and watched is self and event.type() == QEvent.Type.Paint:
+            self._first_paint_seen = True
+            self.removeEventFilter(self)
+            STARTUP_PROFILER.mark("first paint")
+            self.first_paint.emit()
+        return super().eventFilter(watched, event)
+
+    def start_catalog_warmup(self):
+        """Import and validate the model catalogs in the background while the welcome view is up."""
+        self.data_model.warm_up_catalogs_in_background()
+
+    def _finish_catalog_warmup(self):
+        """Validate the warmed-up catalogs on the GUI thread; a validation failure ends the app."""
+        STARTUP_PROFILER.mark("catalog modules imported")
+        try:
+            self.data_model.load_catalogs()
+        except ValueError as e:
+            from components.error_dialog import ErrorDialog
+
+            ErrorDialog.show_error(
+                self,
+                "Dragon Dice - Data Error",
+                "Internal game data failed validation.",
+                str(e),
+            )
+            QApplication.quit()
+
     def switch_view(self, new_view_widget):
         """Removes the current view and adds the new one."""
         if self._current_view:
@@ -79,6 +118,8 @@ class MainWindow(QMainWindow):
         self.switch_view(welcome_widget)
 
     def show_player_setup_view(self):
+        from views.player_setup_view import PlayerSetupView
+
         if self.data_model._num_players is None:  # _point_value check removed
             print("Error: Number of players or point value not set before proceeding to player setup.")
             return
@@ -132,6 +173,8 @@ class MainWindow(QMainWindow):
             self.show_welcome_view()
 
     def show_frontier_selection_view(self):
+        from views.frontier_selection_view import FrontierSelectionView
+
         print("All player setups complete. Transitioning to Frontier Selection...")
         player_names = self.data_model.get_player_names()
         proposed_terrains = self.data_model.get_proposed_frontier_terrains()
@@ -149,6 +192,8 @@ class MainWindow(QMainWindow):
 
     def _go_back_to_last_player_setup(self):
         """Navigates back to the setup screen of the last configured player."""
+        from views.player_setup_view import PlayerSetupView
+
         print("MainWindow: _go_back_to_last_player_setup called")
 
         if self.data_model._num_players is not None and self.data_model._num_players > 0:
@@ -200,6 +245,8 @@ class MainWindow(QMainWindow):
             self.player_setup_view_instance = None
 
     def show_distance_rolls_view(self):
+        from views.distance_rolls_view import DistanceRollsView
+
         print(
             f"Frontier '{self.data_model._frontier_terrain}' and first player '{self.data_model._first_player_name}' set. Transitioning to Distance Rolls..."
         )
@@ -228,6 +275,9 @@ class MainWindow(QMainWindow):
         self.switch_view(distance_view)
 
     def show_main_gameplay_view(self, game_engine_instance):
+        from controllers.gameplay_controller import GameplayController
+        from views.main_gameplay_view import MainGameplayView
+
         if not game_engine_instance:
             from components.error_dialog import ErrorDialog
 
@@ -1,4 +1,21 @@
 # This file makes the 'models' directory a Python package.
-from .app_data_model import AppDataModel  # noqa: F401
-from .help_text_model import HelpTextModel  # noqa: F401
-from .terrain_model import Terrain  # noqa: F401
+# Package-level exports are resolved lazily, so importing any single model module
+# does not pull in AppDataModel and the full catalogs at application startup.
+from importlib import import_module
+from typing import Any
+
+_LAZY_EXPORTS = {
+    "AppDataModel": ".app_data_model",
+    "HelpTextModel": ".help_text_model",
+    "Terrain": ".terrain_model",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_EXPORTS:
+        value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,3 +1,5 @@
+import importlib
+import threading
 from typing import TYPE_CHECKING, Dict, List, Optional
 
 from PySide6.QtCore import QObject, Signal
@@ -5,10 +7,24 @@ from PySide6.QtCore import QObject, Signal
 if TYPE_CHECKING:
     from game_logic.game_orchestrator import GameOrchestrator as GameEngine
 
-from models.dragon_model import calculate_required_dragons
+    from .terrain_model import Terrain
+
 from utils import strict_get
 
-from .terrain_model import TERRAIN_DATA, Terrain
+# Modules imported by the background warm-up so they are ready before the player leaves the welcome screen
+WARMUP_MODULES = [
+    "models.die_face_model",
+    "models.species_model",
+    "models.unit_data",
+    "models.unit_model",
+    "models.terrain_model",
+    "models.dragon_model",
+    "models.spell_model",
+    "models.minor_terrain_model",
+    "models.sai_processor",
+    "game_logic.game_orchestrator",
+    "controllers.gameplay_controller",
+]
 
 
 class AppDataModel(QObject):
@@ -24,11 +40,20 @@ class AppDataModel(QObject):
     frontier_set = Signal(str, str)
     all_distance_rolls_submitted = Signal(list)
     game_engine_initialized = Signal(object)  # Signal will carry GameEngine instance
+    catalogs_warmed = Signal()  # Emitted (from the warm-up thread) once catalog modules are imported
+    catalogs_ready = Signal()
 
-    def __init__(self):
+    def __init__(self, defer_catalogs: bool = False, revalidate: bool = False):
+        """
+        Args:
+            defer_catalogs: Skip catalog validation and loading here. They then run on the first
+                call to load_catalogs(), or on demand when catalog data is first needed.
+            revalidate: Ignore cached validation results and validate every catalog.
+        """
         super().__init__()
-        # Validate all internal data at startup
-        self._validate_internal_data()
+        self._catalogs_loaded = False
+        self._revalidate = revalidate
+        self._warmup_thread: Optional[threading.Thread] = None
 
         self._num_players = None
         self._force_size = 24  # DEFAULT_FORCE_SIZE
@@ -40,9 +65,51 @@ class AppDataModel(QObject):
         self._all_terrains: List[Terrain] = []
         self.current_setup_player_index: int = 0  # Track current player being set up
         self._terrain_display_options: List[str] = []
+
+        if not defer_catalogs:
+            self.load_catalogs()
+
+    def load_catalogs(self) -> None:
+        """
+        Validate all internal data and load the terrain catalog.
+        Safe to call repeatedly; only the first call does any work.
+        Raises ValueError if validation fails.
+        """
+        if self._catalogs_loaded:
+            return
+        # Validate all internal data at startup
+        self._validate_internal_data()
         self._initialize_terrains()
+        self._catalogs_loaded = True
+        self.catalogs_ready.emit()
+
+    def are_catalogs_loaded(self) -> bool:
+        return self._catalogs_loaded
+
+    def warm_up_catalogs_in_background(self) -> None:
+        """
+        Import the model catalogs and game logic on a background thread.
+        Emits catalogs_warmed when done; connect it to load_catalogs() (queued to this object's thread).
+        """
+        if self._catalogs_loaded or self._warmup_thread is not None:
+            return
+
+        def warm_up():
+            for module_name in WARMUP_MODULES:
+                try:
+                    importlib.import_module(module_name)
+                except Exception as e:
+                    # load_catalogs() re-imports on the GUI thread and reports the real error
+                    print(f"AppDataModel: Background warm-up of {module_name} failed: {e}")
+                    break
+            self.catalogs_warmed.emit()
+
+        self._warmup_thread = threading.Thread(target=warm_up, name="catalog-warmup", daemon=True)
+        self._warmup_thread.start()
 
     def _initialize_terrains(self):
+        from .terrain_model import TERRAIN_DATA
+
         try:
             # TERRAIN_DATA contains static Terrain objects
             self._all_terrains = list(TERRAIN_DATA.values())
@@ -95,14 +162,16 @@ class AppDataModel(QObject):
     def get_player_setup_data(self):
         return self._player_setup_data_list
 
-    def get_all_terrains_list(self) -> List[Terrain]:
+    def get_all_terrains_list(self) -> List["Terrain"]:
+        self.load_catalogs()
         return self._all_terrains
 
     def get_terrain_display_options(self) -> List[str]:
         """Returns terrain display options formatted with element color icons for PlayerSetupView."""
+        self.load_catalogs()
         return [self._format_terrain_for_display(terrain) for terrain in self._all_terrains]
 
-    def _format_terrain_for_display(self, terrain: Terrain) -> str:
+    def _format_terrain_for_display(self, terrain: "Terrain") -> str:
         """Format terrain with element color icons for display."""
         element_icons = terrain.get_color_string()
         return f"{element_icons} {terrain.name}"
@@ -112,6 +181,8 @@ class AppDataModel(QObject):
 
         Official Dragon Dice rules: 1 dragon per 24 points (or part thereof)
         """
+        from models.dragon_model import calculate_required_dragons
+
         return calculate_required_dragons(self._force_size)
 
     def get_proposed_frontier_terrains(self):
@@ -146,6 +217,9 @@ class AppDataModel(QObject):
             print("Error: Cannot initialize GameEngine. Required setup data is missing.")
             return None
 
+        # The game needs validated catalogs, even if the background warm-up has not finished yet
+        self.load_catalogs()
+
         # Import GameEngine here to avoid circular import
         from game_logic.game_orchestrator import GameOrchestrator as GameEngine
 
@@ -196,58 +270,25 @@ class AppDataModel(QObject):
     def _validate_internal_data(self) -> None:
         """
         Comprehensive validation of all internal data at startup.
-        Calls all individual validation functions to ensure data integrity.
+        Catalogs that passed validation before and whose source is unchanged are skipped;
+        construct with revalidate=True to validate everything regardless of the cache.
         """
-        print("🔍 Validating internal data...")
-
-        try:
-            # Validate terrain data
-            from models.terrain_model import validate_terrain_data
-
-            validate_terrain_data()
-
-            # Validate dragon data
-            from models.dragon_model import validate_dragon_data
-
-            validate_dragon_data()
-
-            # Validate species data
-            from models.species_model import validate_species_elements
-
-            if not validate_species_elements():
-                raise ValueError("Species validation failed")
-            print("✓ All species data validated successfully")
+        from models.catalog_validation import CatalogValidator
 
-            # Validate unit data integrity
-            from models.unit_data import validate_unit_data_integrity
-
-            if not validate_unit_data_integrity():
-                raise ValueError("Unit data integrity validation failed")
-            print("✓ Unit data integrity validated successfully")
-
-            # Validate unit die face assignments
-            self.validate_unit_die_faces()
-
-            # Validate comprehensive unit data
-            from models.unit_model import UnitModel
-
-            validation_report = UnitModel.validate_all_unit_data()
-            if validation_report.get("invalid_units"):
-                invalid_count = len(validation_report["invalid_units"])
-                total_count = validation_report["valid_units"] + invalid_count
-                print(f"⚠️  Warning: {invalid_count}/{total_count} units failed validation")
-                for invalid_unit in validation_report["invalid_units"][:3]:  # Show first 3
-                    print(f"  - {invalid_unit['unit_id']}: {invalid_unit['error']}")
-                if invalid_count > 3:
-                    print(f"  ... and {invalid_count - 3} more")
-
-            print("✅ All internal data validation passed")
+        print("🔍 Validating internal data...")
 
-        except Exception as e:
-            error_msg = f"Internal data validation failed: {e}"
+        report = CatalogValidator(revalidate=self._revalidate).validate_all()
+        if not report.passed:
+            error_msg = "Internal data validation failed: " + "; ".join(
+                f"{name}: {error}" for name, error in report.failed.items()
+            )
             print(f"❌ {error_msg}")
             raise ValueError(error_msg)
 
+        if report.cached:
+            print(f"✓ Unchanged since last validation: {', '.join(report.cached)}")
+        print("✅ All internal data validation passed")
+
     def get_unit_definitions(self) -> Dict[str, List[Dict]]:
         """Get unit definitions grouped by species for UI consumption."""
         try:
@@ -0,0 +1,276 @@
+"""
+Constraint-driven army building for Dragon Dice.
+
+Enumerates, counts and samples legal home/campaign/horde splits from a unit catalog. The
+DragonDiceArmyValidator rules are applied while armies are built rather than on finished
+compositions: every army gets at least one unit, no army exceeds 50% of the force, magic
+units stay within 50% of the force and the armies add up to the exact force size.
+
+Unit types can be taken any number of times. A points DP counts, for every (points, magic
+points) total, how many distinct unit selections reach it, so compositions can be streamed
+lazily with dead branches pruned, counted exactly and sampled uniformly at random.
+"""
+
+import random
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from models.army_model import ARMY_DATA, get_all_army_types
+from models.army_validation import DragonDiceArmyValidator
+from utils import strict_get
+
+# army type display name -> unit type ids
+ArmySplit = Dict[str, List[str]]
+
+# (points, magic points) -> number of unit selections
+PointsTable = Dict[Tuple[int, int], int]
+
+
+@dataclass(frozen=True)
+class CatalogUnit:
+    """A unit type as seen by the builder."""
+
+    unit_type: str
+    points: int
+    magic_points: int  # Points counted against the magic cap (0 for non-magic units)
+
+
+@dataclass(frozen=True)
+class _ArmyStart:
+    """Units an army already has before building."""
+
+    points: int
+    magic_points: int
+    unit_count: int
+
+
+class ArmyBuilder:
+    """
+    Builds legal army splits for one force.
+
+    Armies are keyed by army type display name ("Home", "Campaign", "Horde"); the horde army
+    is only built for games with more than one player, matching the validator.
+    """
+
+    def __init__(self, unit_definitions: List[Dict[str, Any]], force_size: int, num_players: int = 2):
+        """
+        Args:
+            unit_definitions: Unit definitions (id, max_health, unit_class_type) to build from
+            force_size: Total force size in points
+            num_players: Number of players (a horde army is only built with 2+ players)
+        """
+        self.force_size = force_size
+        self.num_players = num_players
+
+        limits = DragonDiceArmyValidator().get_force_size_limits(force_size)
+        self.max_points_per_army = strict_get(limits, "max_points_per_army")
+        self.max_magic_points = strict_get(limits, "max_magic_points")
+
+        self.army_types = [
+            strict_get(ARMY_DATA[army_type], "display_name")
+            for army_type in get_all_army_types()
+            if army_type != "HORDE" or num_players > 1
+        ]
+
+        self.units: List[CatalogUnit] = []
+        for definition in unit_definitions:
+            points = strict_get(definition, "max_health")
+            is_magic = strict_get(definition, "unit_class_type") == "Magic"
+            self.units.append(CatalogUnit(strict_get(definition, "id"), points, points if is_magic else 0))
+
+        self._selection_tables = self._build_selection_tables()
+
+    @classmethod
+    def from_unit_roster(cls, unit_roster, species: List[str], force_size: int, num_players: int = 2) -> "ArmyBuilder":
+        """Builder over the roster's units of the given species."""
+        units_by_species = unit_roster.get_available_unit_types_by_species()
+        definitions = [definition for name in species for definition in strict_get(units_by_species, name)]
+        return cls(definitions, force_size, num_players)
+
+    def iter_compositions(self, existing: Optional[ArmySplit] = None) -> Iterator[ArmySplit]:
+        """
+        Lazily yield every legal composition, each exactly once.
+
+        Args:
+            existing: Units already placed in each army; yielded compositions extend them
+        """
+        starts, points_needed, magic_budget = self._plan(existing)
+        totals = self._completion_tables(starts)
+        if not any(totals[0].get((points_needed, magic), 0) for magic in range(magic_budget + 1)):
+            return
+
+        for additions in self._iter_additions(0, starts, totals, points_needed, magic_budget):
+            yield self._merge(existing, additions)
+
+    def count_compositions(self, existing: Optional[ArmySplit] = None) -> int:
+        """Exact number of legal compositions (extending existing, if given)."""
+        starts, points_needed, magic_budget = self._plan(existing)
+        totals = self._completion_tables(starts)
+        return sum(totals[0].get((points_needed, magic), 0) for magic in range(magic_budget + 1))
+
+    def sample(self, existing: Optional[ArmySplit] = None, rng: Optional[random.Random] = None) -> Optional[ArmySplit]:
+        """
+        Uniformly random legal composition, or None if there is none.
+
+        For many samples use sampler(), which does the counting once.
+        """
+        return next(self.sampler(existing, rng), None)
+
+    def sampler(self, existing: Optional[ArmySplit] = None, rng: Optional[random.Random] = None) -> Iterator[ArmySplit]:
+        """Endless stream of uniformly random legal compositions (empty if there are none)."""
+        rng = rng or random.Random()
+        starts, points_needed, magic_budget = self._plan(existing)
+        totals = self._completion_tables(starts)
+        magic_weights = [totals[0].get((points_needed, magic), 0) for magic in range(magic_budget + 1)]
+        if not any(magic_weights):
+            return
+
+        while True:
+            points, magic = points_needed, rng.choices(range(magic_budget + 1), magic_weights)[0]
+            additions = []
+            for army_index in range(len(self.army_types)):
+                options = self._army_options(army_index, starts, totals, points, magic)
+                weights = [ways for _, _, ways in options]
+                army_points, army_magic, _ = rng.choices(options, weights)[0]
+                additions.append(self._sample_selection(0, army_points, army_magic, rng))
+                points -= army_points
+                magic -= army_magic
+            yield self._merge(existing, additions)
+
+    def fill_remaining_points(self, existing: ArmySplit) -> Optional[ArmySplit]:
+        """First legal composition that keeps existing units, or None if it cannot be completed."""
+        return next(self.iter_compositions(existing), None)
+
+    def _plan(self, existing: Optional[ArmySplit]) -> Tuple[List[_ArmyStart], int, int]:
+        """Per-army starting totals, points still to place and the remaining magic budget."""
+        units_by_type = {unit.unit_type: unit for unit in self.units}
+        starts = []
+        for army_type in self.army_types:
+            placed = [strict_get(units_by_type, unit_type) for unit_type in (existing or {}).get(army_type, [])]
+            starts.append(
+                _ArmyStart(sum(unit.points for unit in placed), sum(unit.magic_points for unit in placed), len(placed))
+            )
+        points_needed = self.force_size - sum(start.points for start in starts)
+        magic_budget = self.max_magic_points - sum(start.magic_points for start in starts)
+        return starts, points_needed, magic_budget
+
+    def _build_selection_tables(self) -> List[PointsTable]:
+        """
+        tables[i][(points, magic)]: number of unit selections from units[i:] with those totals.
+
+        A selection is a multiset of unit types; walking the catalog in order means each is
+        counted once. Totals are capped at one army's maximum.
+        """
+        cap = self.max_points_per_army
+        tables: List[PointsTable] = [{(0, 0): 1}]
+        for unit in reversed(self.units):
+            table = dict(tables[0])
+            # Unbounded knapsack: ascending points so a unit can be taken repeatedly
+            for points in range(unit.points, cap + 1):
+                for magic in range(unit.magic_points, cap + 1):
+                    ways = table.get((points - unit.points, magic - unit.magic_points), 0)
+                    if ways:
+                        table[(points, magic)] = table.get((points, magic), 0) + ways
+            tables.insert(0, table)
+        return tables
+
+    def _completion_tables(self, starts: List[_ArmyStart]) -> List[PointsTable]:
+        """
+        totals[j][(points, magic)]: number of ways for armies j.. to add exactly those totals.
+
+        Each army's additions must keep it within the per-army cap and leave it with at least
+        one unit.
+        """
+        totals: List[PointsTable] = [{(0, 0): 1}]
+        for start in reversed(starts):
+            following = totals[0]
+            table: PointsTable = {}
+            for (army_points, army_magic), ways in self._army_choices(start):
+                for (points, magic), following_ways in following.items():
+                    total_magic = army_magic + magic
+                    if total_magic > self.max_magic_points:
+                        continue
+                    key = (army_points + points, total_magic)
+                    table[key] = table.get(key, 0) + ways * following_ways
+            totals.insert(0, table)
+        return totals
+
+    def _army_choices(self, start: _ArmyStart) -> List[Tuple[Tuple[int, int], int]]:
+        """(points, magic) additions allowed for one army, with their number of selections."""
+        min_points = 0 if start.unit_count else 1
+        max_points = self.max_points_per_army - start.points
+        return [
+            ((points, magic), ways)
+            for (points, magic), ways in self._selection_tables[0].items()
+            if min_points <= points <= max_points
+        ]
+
+    def _army_options(
+        self, army_index: int, starts: List[_ArmyStart], totals: List[PointsTable], points: int, magic: int
+    ) -> List[Tuple[int, int, int]]:
+        """(points, magic, ways) for one army that leave the following armies a completion."""
+        following = totals[army_index + 1]
+        options = []
+        for (army_points, army_magic), ways in self._army_choices(starts[army_index]):
+            following_ways = following.get((points - army_points, magic - army_magic), 0)
+            if following_ways:
+                options.append((army_points, army_magic, ways * following_ways))
+        return options
+
+    def _iter_additions(
+        self, army_index: int, starts: List[_ArmyStart], totals: List[PointsTable], points: int, magic_budget: int
+    ) -> Iterator[List[List[str]]]:
+        """Unit additions for armies army_index.. adding exactly points within the magic budget."""
+        if army_index == len(starts):
+            if points == 0:
+                yield []
+            return
+
+        following = totals[army_index + 1]
+        for (army_points, army_magic), _ in self._army_choices(starts[army_index]):
+            if army_points > points or army_magic > magic_budget:
+                continue
+            remaining_budget = magic_budget - army_magic
+            if not any(following.get((points - army_points, magic), 0) for magic in range(remaining_budget + 1)):
+                continue
+            for selection in self._iter_selections(0, army_points, army_magic):
+                for rest in self._iter_additions(
+                    army_index + 1, starts, totals, points - army_points, remaining_budget
+                ):
+                    yield [selection] + rest
+
+    def _iter_selections(self, unit_index: int, points: int, magic: int) -> Iterator[List[str]]:
+        """Unit selections from units[unit_index:] with exactly these totals."""
+        if not self._selection_tables[unit_index].get((points, magic), 0):
+            return
+        if unit_index == len(self.units):
+            yield []
+            return
+
+        unit = self.units[unit_index]
+        if self._selection_tables[unit_index].get((points - unit.points, magic - unit.magic_points), 0):
+            for rest in self._iter_selections(unit_index, points - unit.points, magic - unit.magic_points):
+                yield [unit.unit_type] + rest
+        yield from self._iter_selections(unit_index + 1, points, magic)
+
+    def _sample_selection(self, unit_index: int, points: int, magic: int, rng: random.Random) -> List[str]:
+        """Uniformly random unit selection from units[unit_index:] with exactly these totals."""
+        selection = []
+        while points or magic:
+            unit = self.units[unit_index]
+            take_ways = self._selection_tables[unit_index].get((points - unit.points, magic - unit.magic_points), 0)
+            skip_ways = self._selection_tables[unit_index + 1].get((points, magic), 0)
+            if rng.randrange(take_ways + skip_ways) < take_ways:
+                selection.append(unit.unit_type)
+                points -= unit.points
+                magic -= unit.magic_points
+            else:
+                unit_index += 1
+        return selection
+
+    def _merge(self, existing: Optional[ArmySplit], additions: List[List[str]]) -> ArmySplit:
+        """Existing units followed by the additions, per army type."""
+        return {
+            army_type: list((existing or {}).get(army_type, [])) + added
+            for army_type, added in zip(self.army_types, additions)
+        }
@@ -0,0 +1,304 @@
+"""
+Expected-value army optimization for Dragon Dice.
+
+Finds the force that maximizes an objective (expected melee plus saves, magic of chosen
+elements, ...) under the DragonDiceArmyValidator rules. Each unit in UNIT_DATA gets a
+precomputed vector of expected results per roll type; objectives are linear in those
+vectors, so a force's score is the sum of its units' scores. A branch-and-bound search
+over unit counts finds the best force, bounded by the greedy LP relaxation of the point
+and magic caps, and the chosen units are then split into home/campaign/horde armies.
+
+Expected results per roll of a unit die:
+- Melee, missile, magic, save and maneuver faces count their value for their own roll type
+- ID faces count their value (the unit's health) for every roll type
+- SAI faces count their value for each roll type they apply to (an approximation; the
+  actual effect of many SAIs depends on the situation)
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from models.army_builder import ArmyBuilder
+from models.die_face_codes import (
+    FACE_APPLIES_MASKS,
+    FACE_VALUES,
+    RESULT_ID,
+    RESULT_KINDS,
+    RESULT_NONE,
+    ROLL_CONTEXT_BITS,
+)
+from models.unit_data import UNIT_DATA
+from models.unit_model import UnitModel
+from utils import strict_get
+
+# Roll types in expectation vectors, indexed like the RESULT_* constants they count
+ROLL_TYPES = ("melee", "missile", "magic", "save", "maneuver")
+
+# Class type counted against the magic cap (as in DragonDiceArmyValidator)
+MAGIC_CLASS_TYPE = "Magic"
+
+
+@dataclass(frozen=True)
+class UnitExpectation:
+    """Expected results per roll of one unit type."""
+
+    unit_id: str
+    species: str
+    unit_class_type: str
+    points: int
+    elements: Tuple[str, ...]
+    expected: Tuple[float, ...]  # One entry per ROLL_TYPES
+
+    @property
+    def magic_points(self) -> int:
+        """Points counted against the magic cap."""
+        return self.points if self.unit_class_type == MAGIC_CLASS_TYPE else 0
+
+    def expected_results(self, roll_type: str) -> float:
+        """Expected results of one roll type."""
+        return self.expected[ROLL_TYPES.index(roll_type)]
+
+
+def compute_unit_expectation(unit: UnitModel) -> UnitExpectation:
+    """Expected results per roll type for one unit's die."""
+    totals = [0.0] * len(ROLL_TYPES)
+    for face in unit.faces:
+        code = face.face_id
+        value = FACE_VALUES[code]
+        result_kind = RESULT_KINDS[code]
+        if result_kind == RESULT_ID:
+            for index in range(len(ROLL_TYPES)):
+                totals[index] += value
+        elif result_kind < len(ROLL_TYPES):
+            totals[result_kind] += value
+        elif result_kind == RESULT_NONE:
+            for index, roll_type in enumerate(ROLL_TYPES):
+                if FACE_APPLIES_MASKS[code] & ROLL_CONTEXT_BITS.get(roll_type, 0):
+                    totals[index] += value
+
+    return UnitExpectation(
+        unit_id=unit.unit_id,
+        species=unit.get_species_name(),
+        unit_class_type=unit.unit_type,
+        points=unit.max_health,
+        elements=tuple(unit.elements),
+        expected=tuple(total / len(unit.faces) for total in totals),
+    )
+
+
+_UNIT_EXPECTATIONS: Dict[str, UnitExpectation] = {}
+
+
+def get_unit_expectations() -> Dict[str, UnitExpectation]:
+    """Expectation vectors for every unit in UNIT_DATA (computed once)."""
+    if not _UNIT_EXPECTATIONS:
+        for unit in UNIT_DATA:
+            _UNIT_EXPECTATIONS[unit.unit_id] = compute_unit_expectation(unit)
+    return _UNIT_EXPECTATIONS
+
+
+@dataclass(frozen=True)
+class ArmyObjective:
+    """
+    Linear objective over expected results.
+
+    Args:
+        weights: Roll type -> weight for its expected results
+        magic_elements: If given, magic only counts for units of one of these elements
+    """
+
+    weights: Dict[str, float] = field(hash=False)
+    magic_elements: Optional[FrozenSet[str]] = None
+
+    @classmethod
+    def melee_and_saves(cls) -> "ArmyObjective":
+        """Expected melee plus save results (offense and defense against a melee opponent)."""
+        return cls({"melee": 1.0, "save": 1.0})
+
+    @classmethod
+    def magic_for_elements(cls, elements: Iterable[str]) -> "ArmyObjective":
+        """Expected magic results from units of the given elements."""
+        return cls({"magic": 1.0}, frozenset(element.upper() for element in elements))
+
+    def score(self, unit: UnitExpectation) -> float:
+        """Objective value of one unit."""
+        total = 0.0
+        for roll_type, weight in self.weights.items():
+            wrong_element = self.magic_elements is not None and not self.magic_elements.intersection(unit.elements)
+            if roll_type == "magic" and wrong_element:
+                continue
+            total += weight * unit.expected_results(roll_type)
+        return total
+
+
+@dataclass
+class OptimizedForce:
+    """Best force found and its objective value."""
+
+    armies: Dict[str, List[str]]  # Army type display name -> unit ids
+    score: float
+    nodes_searched: int
+
+
+@dataclass(frozen=True)
+class _Candidate:
+    unit: UnitExpectation
+    score: float
+
+
+class ArmyOptimizer:
+    """Branch-and-bound search for the force that maximizes an objective."""
+
+    def __init__(self, expectations: Optional[Dict[str, UnitExpectation]] = None, species: Optional[List[str]] = None):
+        """
+        Args:
+            expectations: Unit expectation vectors (defaults to all of UNIT_DATA)
+            species: Restrict the catalog to these species
+        """
+        catalog = list((expectations or get_unit_expectations()).values())
+        if species is not None:
+            wanted = {name.upper() for name in species}
+            catalog = [unit for unit in catalog if unit.species.upper() in wanted]
+        self.catalog = catalog
+
+    def optimize(self, objective: ArmyObjective, force_size: int, num_players: int = 2) -> Optional[OptimizedForce]:
+        """
+        Best legal force for the objective, or None if no legal force exists.
+
+        Ties are broken towards the unit found first in the catalog.
+        """
+        builder = ArmyBuilder([], force_size, num_players)
+        candidates = [
+            candidate
+            for candidate in self._candidates(objective)
+            if candidate.unit.points <= builder.max_points_per_army
+        ]
+
+        def split(units: List[UnitExpectation]) -> Optional[Dict[str, List[str]]]:
+            return _split_into_armies(units, builder.army_types, builder.max_points_per_army)
+
+        search = _BranchAndBound(candidates, force_size, builder.max_magic_points, split)
+        search.run()
+        if search.best_armies is None:
+            return None
+        return OptimizedForce(search.best_armies, search.best_score, search.nodes)
+
+    def _candidates(self, objective: ArmyObjective) -> List[_Candidate]:
+        """
+        Best unit for each (points, magic) slot, ordered by score per point.
+
+        Legality only depends on a unit's points and whether it is magic, so a lower-scoring
+        unit with the same points and class never improves a force.
+        """
+        best: Dict[Tuple[int, int], _Candidate] = {}
+        for unit in self.catalog:
+            candidate = _Candidate(unit, objective.score(unit))
+            slot = (unit.points, unit.magic_points)
+            if slot not in best or candidate.score > best[slot].score:
+                best[slot] = candidate
+        return sorted(best.values(), key=lambda candidate: candidate.score / candidate.unit.points, reverse=True)
+
+
+class _BranchAndBound:
+    """Depth-first search over unit counts, best score per point first."""
+
+    def __init__(
+        self,
+        candidates: List[_Candidate],
+        force_size: int,
+        max_magic_points: int,
+        split: Callable[[List[UnitExpectation]], Optional[Dict[str, List[str]]]],
+    ):
+        self.candidates = candidates
+        self.force_size = force_size
+        self.max_magic_points = max_magic_points
+        self.split = split  # Army assignment for a force's units, or None if they cannot be split legally
+        self.best_score = float("-inf")
+        self.best_armies: Optional[Dict[str, List[str]]] = None
+        self.nodes = 0
+
+    def run(self):
+        self._search(0, self.force_size, self.max_magic_points, 0.0, [])
+
+    def _search(self, index: int, points: int, magic: int, score: float, counts: List[int]):
+        self.nodes += 1
+        if points == 0:
+            if score > self.best_score:
+                units = [candidate.unit for candidate, count in zip(self.candidates, counts) for _ in range(count)]
+                armies = self.split(units)
+                if armies is not None:
+                    self.best_score = score
+                    self.best_armies = armies
+            return
+        if index == len(self.candidates) or self._bound(index, points, magic) + score <= self.best_score:
+            return
+
+        candidate = self.candidates[index]
+        unit = candidate.unit
+        most = points // unit.points
+        if unit.magic_points:
+            most = min(most, magic // unit.magic_points)
+        for count in range(most, -1, -1):
+            self._search(
+                index + 1,
+                points - count * unit.points,
+                magic - count * unit.magic_points,
+                score + count * candidate.score,
+                counts + [count],
+            )
+
+    def _bound(self, index: int, points: int, magic: int) -> float:
+        """Greedy fractional fill of the remaining points (magic units limited by the magic cap)."""
+        bound = 0.0
+        for candidate in self.candidates[index:]:
+            if points <= 0:
+                break
+            room = min(points, magic) if candidate.unit.magic_points else points
+            if room <= 0:
+                continue
+            bound += room * candidate.score / candidate.unit.points
+            points -= room
+            if candidate.unit.magic_points:
+                magic -= room
+        return bound
+
+
+def _split_into_armies(
+    units: List[UnitExpectation], army_types: List[str], max_points_per_army: int
+) -> Optional[Dict[str, List[str]]]:
+    """Assign units to armies so each has a unit and stays within the per-army cap."""
+    ordered = sorted(units, key=lambda unit: unit.points, reverse=True)
+    if len(ordered) < len(army_types):
+        return None
+    assignment: List[List[UnitExpectation]] = [[] for _ in army_types]
+    loads = [0] * len(army_types)
+
+    def place(position: int) -> bool:
+        if position == len(ordered):
+            return all(assignment)
+        # Units still to place must be able to fill the empty armies
+        if len(ordered) - position < sum(1 for army in assignment if not army):
+            return False
+        unit = ordered[position]
+        tried_loads = set()
+        for army_index in range(len(army_types)):
+            if loads[army_index] + unit.points > max_points_per_army or loads[army_index] in tried_loads:
+                continue
+            tried_loads.add(loads[army_index])
+            assignment[army_index].append(unit)
+            loads[army_index] += unit.points
+            if place(position + 1):
+                return True
+            assignment[army_index].pop()
+            loads[army_index] -= unit.points
+        return False
+
+    if not place(0):
+        return None
+    return {army_type: [unit.unit_id for unit in army_units] for army_type, army_units in zip(army_types, assignment)}
+
+
+def get_expected_results(unit_id: str) -> Dict[str, float]:
+    """Expected results per roll type for one unit type in UNIT_DATA."""
+    unit = strict_get(get_unit_expectations(), unit_id)
+    return dict(zip(ROLL_TYPES, unit.expected))
@@ -0,0 +1,212 @@
+"""
+Cached validation of the static game catalogs.
+
+Each catalog (terrains, dragons, species, units, spells, die faces) is validated by the
+functions its model module already provides. The result is stored in the user cache
+together with a fingerprint of the catalog's source modules, so on the next launch
+only catalogs whose sources changed are validated again.
+"""
+
+import hashlib
+import importlib.util
+import json
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from config.paths import ProjectPaths
+
+CACHE_FORMAT_VERSION = 1
+
+
+class CatalogCheck(NamedTuple):
+    """A catalog, the modules whose source determines its validity, and its validation."""
+
+    name: str
+    modules: Tuple[str, ...]
+    validate: Callable[[], None]  # Raises ValueError when the catalog is invalid
+
+
+def _require(passed: bool, message: str) -> None:
+    if not passed:
+        raise ValueError(message)
+
+
+def _validate_terrains() -> None:
+    from models.terrain_model import validate_terrain_data
+
+    _require(validate_terrain_data(), "Terrain validation failed")
+
+
+def _validate_dragons() -> None:
+    from models.dragon_model import validate_dragon_data
+
+    _require(validate_dragon_data(), "Dragon validation failed")
+
+
+def _validate_species() -> None:
+    from models.species_model import validate_species_abilities, validate_species_elements
+
+    _require(validate_species_elements(), "Species validation failed")
+    _require(validate_species_abilities(), "Species ability validation failed")
+    print("✓ All species data validated successfully")
+
+
+def _validate_spells() -> None:
+    from models.spell_model import validate_spell_elements
+
+    _require(validate_spell_elements(), "Spell validation failed")
+
+
+def _validate_die_faces() -> None:
+    from models.die_face_model import validate_die_faces
+
+    _require(validate_die_faces(), "Die face validation failed")
+
+
+def _validate_units() -> None:
+    from models.app_data_model import AppDataModel
+    from models.unit_data import validate_unit_data_integrity
+    from models.unit_model import UnitModel
+
+    _require(validate_unit_data_integrity(), "Unit data integrity validation failed")
+    print("✓ Unit data integrity validated successfully")
+
+    # Validate unit die face assignments
+    AppDataModel.validate_unit_die_faces()
+
+    # Validate comprehensive unit data; problems here are reported but not fatal
+    validation_report = UnitModel.validate_all_unit_data()
+    if validation_report.get("invalid_units"):
+        invalid_count = len(validation_report["invalid_units"])
+        total_count = validation_report["valid_units"] + invalid_count
+        print(f"⚠️  Warning: {invalid_count}/{total_count} units failed validation")
+        for invalid_unit in validation_report["invalid_units"][:3]:  # Show first 3
+            print(f"  - {invalid_unit['unit_id']}: {invalid_unit['error']}")
+        if invalid_count > 3:
+            print(f"  ... and {invalid_count - 3} more")
+
+
+CATALOG_CHECKS: List[CatalogCheck] = [
+    CatalogCheck("terrains", ("models.terrain_model", "models.element_model"), _validate_terrains),
+    CatalogCheck(
+        "dragons", ("models.dragon_model", "models.die_face_model", "models.element_model"), _validate_dragons
+    ),
+    CatalogCheck("species", ("models.species_model", "models.element_model", "utils.field_access"), _validate_species),
+    CatalogCheck(
+        "units",
+        (
+            "models.unit_data",
+            "models.unit_model",
+            "models.die_face_model",
+            "models.species_model",
+            "models.element_model",
+            "models.app_data_model",
+            "utils.field_access",
+        ),
+        _validate_units,
+    ),
+    CatalogCheck("spells", ("models.spell_model", "models.element_model", "utils.field_access"), _validate_spells),
+    CatalogCheck("die_faces", ("models.die_face_model", "utils.field_access"), _validate_die_faces),
+]
+
+
+def _module_source_path(module_name: str) -> Path:
+    """Locate a module's source file without importing it."""
+    spec = importlib.util.find_spec(module_name)
+    if spec is None or spec.origin is None:
+        raise ValueError(f"Cannot locate source for catalog module '{module_name}'")
+    return Path(spec.origin)
+
+
+def fingerprint_catalog(check: CatalogCheck) -> str:
+    """Hash the sources of a catalog's modules, this validation module and the Python version."""
+    digest = hashlib.sha256()
+    digest.update(sys.version.encode("utf-8"))
+    for path in [Path(__file__)] + [_module_source_path(name) for name in check.modules]:
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+@dataclass
+class CatalogValidationReport:
+    """Which catalogs were validated, which were skipped as unchanged, and which failed."""
+
+    validated: List[str] = field(default_factory=list)
+    cached: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def passed(self) -> bool:
+        return not self.failed
+
+
+class CatalogValidator:
+    """
+    Validates game catalogs, skipping those whose source fingerprint matches a cached pass.
+    Failed results are recorded but always validated again on the next run.
+    """
+
+    def __init__(
+        self,
+        checks: Optional[List[CatalogCheck]] = None,
+        cache_file: Optional[Path] = None,
+        revalidate: bool = False,
+    ):
+        self.checks = checks if checks is not None else CATALOG_CHECKS
+        self.cache_file = cache_file if cache_file is not None else ProjectPaths().validation_cache_file
+        self.revalidate = revalidate
+
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.cache_file, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != CACHE_FORMAT_VERSION:
+            return {}
+        return data.get("catalogs", {})
+
+    def _save_cache(self, catalogs: Dict[str, Dict[str, Any]]) -> None:
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_file, "w", encoding="utf-8") as f:
+                json.dump({"version": CACHE_FORMAT_VERSION, "catalogs": catalogs}, f, indent=2)
+        except OSError as e:
+            # A read-only cache only costs a full validation next launch
+            print(f"Warning: Could not write validation cache {self.cache_file}: {e}")
+
+    def validate_all(self) -> CatalogValidationReport:
+        """Validate every catalog that changed since its last successful validation."""
+        report = CatalogValidationReport()
+        cached_results = {} if self.revalidate else self._load_cache()
+        results = dict(cached_results)
+
+        for check in self.checks:
+            fingerprint = fingerprint_catalog(check)
+            cached = cached_results.get(check.name)
+            if cached and cached.get("passed") and cached.get("fingerprint") == fingerprint:
+                report.cached.append(check.name)
+                continue
+
+            try:
+                check.validate()
+                report.validated.append(check.name)
+                error = None
+            except Exception as e:
+                error = str(e)
+                report.failed[check.name] = error
+
+            results[check.name] = {
+                "fingerprint": fingerprint,
+                "passed": error is None,
+                "error": error,
+                "validated_at": datetime.now().isoformat(timespec="seconds"),
+            }
+
+        if report.validated or report.failed or self.revalidate:
+            self._save_cache(results)
+        return report
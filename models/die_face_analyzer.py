@@ -6,14 +6,21 @@ die faces from unit compositions, extracted from UI components for better
 testability and reusability.
 """
 
+from array import array
 from collections import Counter
 from dataclasses import dataclass
-from typing import Any, Dict, List, Tuple
-from typing import Counter as TypingCounter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from models.die_face_model import get_face_icon_by_name
 from utils import strict_get, strict_get_optional
 
+# Die face slots of the dict-style die_faces format
+STANDARD_FACE_KEYS = ["face_1", "face_2", "face_3", "face_4", "face_5", "face_6"]
+EIGHTH_FACE_KEYS = ["eighth_face_1", "eighth_face_2"]
+
+# Composition (sorted (unit_type, count) pairs) -> totals
+Composition = Tuple[Tuple[str, int], ...]
+
 
 @dataclass
 class DieFaceCount:
@@ -29,6 +36,71 @@ class DieFaceCount:
             self.icon = get_face_icon_by_name(self.face_type)
 
 
+class FaceCountTable:
+    """
+    Per-unit-type face vectors with cached per-army totals.
+
+    Each unit type's face counts (or values) are computed once by row_source and stored as
+    an int array over a shared face column index. An army's totals are the sum of its unit
+    types' rows weighted by how many of each it has, cached by composition so a changed
+    composition is simply a different cache entry.
+    """
+
+    MAX_CACHED_ARMIES = 256
+
+    def __init__(self, row_source: Callable[[str], Optional[Dict[str, int]]]):
+        """
+        Args:
+            row_source: Face name -> count for a unit type, or None if the type is unknown
+        """
+        self._row_source = row_source
+        self._columns: Dict[str, int] = {}
+        self._column_names: List[str] = []
+        self._rows: Dict[str, Optional[array]] = {}
+        self._army_totals: Dict[Composition, Dict[str, int]] = {}
+
+    def row(self, unit_type: str) -> Optional[array]:
+        """Face vector for a unit type (None if unknown); may be shorter than the column index."""
+        if unit_type not in self._rows:
+            counts = self._row_source(unit_type)
+            if counts is None:
+                self._rows[unit_type] = None
+            else:
+                for face_name in counts:
+                    if face_name not in self._columns:
+                        self._columns[face_name] = len(self._column_names)
+                        self._column_names.append(face_name)
+                row = array("l", bytes(array("l").itemsize * len(self._column_names)))
+                for face_name, count in counts.items():
+                    row[self._columns[face_name]] += count
+                self._rows[unit_type] = row
+        return self._rows[unit_type]
+
+    def army_totals(self, unit_types: Iterable[str]) -> Dict[str, int]:
+        """Face name -> total over all units (only faces with a nonzero total)."""
+        composition: Composition = tuple(sorted(Counter(unit_types).items()))
+        totals = self._army_totals.get(composition)
+        if totals is None:
+            rows = [(self.row(unit_type), count) for unit_type, count in composition]
+            summed = array("l", bytes(array("l").itemsize * len(self._column_names)))
+            for row, count in rows:
+                if row is None:
+                    continue
+                for column, value in enumerate(row):
+                    if value:
+                        summed[column] += value * count
+            totals = {self._column_names[column]: value for column, value in enumerate(summed) if value}
+            if len(self._army_totals) >= self.MAX_CACHED_ARMIES:
+                self._army_totals.clear()
+            self._army_totals[composition] = totals
+        return dict(totals)
+
+    def invalidate(self) -> None:
+        """Drop all rows and totals (after unit definitions change)."""
+        self._rows.clear()
+        self._army_totals.clear()
+
+
 class DieFaceAnalyzer:
     """
     Analyzes die faces from unit definitions and compositions.
@@ -58,6 +130,13 @@ class DieFaceAnalyzer:
             unit_roster: Optional unit roster for looking up unit definitions
         """
         self.unit_roster = unit_roster
+        self._face_counts = FaceCountTable(self._unit_face_counts)
+        self._magic_face_counts: Dict[str, int] = {}
+
+    def invalidate_face_tables(self) -> None:
+        """Forget cached per-unit-type face counts (after unit definitions change)."""
+        self._face_counts.invalidate()
+        self._magic_face_counts.clear()
 
     def count_magic_results_by_element(self, units: List[Any]) -> Dict[str, int]:
         """
@@ -89,21 +168,17 @@ class DieFaceAnalyzer:
 
             # Get magic face count for this unit
             unit_type = getattr(unit, "unit_type", strict_get_optional(unit, "unit_type", ""))
-            unit_def = self.unit_roster.get_unit_by_type_id(unit_type)
-
-            if unit_def:
-                magic_faces = [face for face in unit_def.faces if "magic" in face.name.lower()]
-                magic_count = len(magic_faces)
-
-                # Distribute magic results among unit's elements
-                if unit_elements and magic_count > 0:
-                    # For multi-element units, player chooses element distribution
-                    # For now, distribute evenly among elements
-                    for element in unit_elements:
-                        element_name = element.lower()
-                        if element_name not in element_magic_counts:
-                            element_magic_counts[element_name] = 0
-                        element_magic_counts[element_name] += magic_count
+            magic_count = self._unit_magic_face_count(unit_type)
+
+            # Distribute magic results among unit's elements (unknown unit types have None)
+            if unit_elements and magic_count:
+                # For multi-element units, player chooses element distribution
+                # For now, distribute evenly among elements
+                for element in unit_elements:
+                    element_name = element.lower()
+                    if element_name not in element_magic_counts:
+                        element_magic_counts[element_name] = 0
+                    element_magic_counts[element_name] += magic_count
 
         return element_magic_counts
 
@@ -120,46 +195,39 @@ class DieFaceAnalyzer:
         if not self.unit_roster or not units:
             return {}
 
-        face_counts: TypingCounter[str] = Counter()
-
+        unit_types = []
         for unit in units:
             if hasattr(unit, "unit_type"):
                 unit_type = unit.unit_type
             else:
                 unit_type = strict_get(unit, "unit_type")
+            if unit_type:
+                unit_types.append(unit_type)
+
+        return self._face_counts.army_totals(unit_types)
 
-            if not unit_type:
-                continue
+    def _unit_face_counts(self, unit_type: str) -> Optional[Dict[str, int]]:
+        """Face type -> count on one unit type's die, ID faces excluded (None if unknown)."""
+        unit_def = self.unit_roster.get_unit_definition(unit_type)
+        if not unit_def or "die_faces" not in unit_def:
+            return None
 
-            unit_def = self.unit_roster.get_unit_definition(unit_type)
+        die_faces = unit_def["die_faces"]
+        face_counts: Dict[str, int] = {}
+        for face_key in STANDARD_FACE_KEYS + EIGHTH_FACE_KEYS:
+            face_type = die_faces.get(face_key)
+            if face_type and face_type != "ID":  # Don't count ID faces
+                face_counts[face_type] = face_counts.get(face_type, 0) + 1
+        return face_counts
+
+    def _unit_magic_face_count(self, unit_type: str) -> Optional[int]:
+        """Number of magic faces on one unit type's die (None if unknown)."""
+        if unit_type not in self._magic_face_counts:
+            unit_def = self.unit_roster.get_unit_by_type_id(unit_type)
             if not unit_def:
-                continue
-
-            if "die_faces" not in unit_def:
-                continue
-
-            die_faces = unit_def["die_faces"]
-
-            # Count standard faces (face_1 through face_6)
-            for face_key in [
-                "face_1",
-                "face_2",
-                "face_3",
-                "face_4",
-                "face_5",
-                "face_6",
-            ]:
-                face_type = die_faces.get(face_key)
-                if face_type and face_type != "ID":  # Don't count ID faces
-                    face_counts[face_type] += 1
-
-            # Count eighth faces
-            for face_key in ["eighth_face_1", "eighth_face_2"]:
-                face_type = die_faces.get(face_key)
-                if face_type and face_type != "ID":  # Don't count ID faces
-                    face_counts[face_type] += 1
-
-        return dict(face_counts)
+                return None
+            self._magic_face_counts[unit_type] = sum(1 for face in unit_def.faces if "magic" in face.name.lower())
+        return self._magic_face_counts[unit_type]
 
     def get_sorted_face_counts(self, face_counts: Dict[str, int]) -> List[DieFaceCount]:
         """
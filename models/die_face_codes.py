@@ -0,0 +1,164 @@
+"""
+Integer-coded die faces and roll encoding for Dragon Dice.
+
+Every DieFaceModel in ALL_DIE_FACES (dragon faces included) carries a face_id.
+This module extends those ids with the few extra codes a roll entry can need (no result,
+a generic SAI, SAIs without a face of their own, and entries only mentioning Bullseye),
+precomputes per-code attributes as
+flat tables indexed by code, and encodes the face results entered for a roll
+("M", "Mi", "S", "ID", "SAI", "Bullseye", ...) as int arrays. Counting results is then a
+table lookup per die instead of string normalization and list membership tests.
+
+Codes follow the sorted face names, so adding a face to the catalog renumbers them. They
+are only meant for use within a process; persist face names, never codes.
+"""
+
+from array import array
+from typing import Dict, Iterable, List, Mapping, Sequence, Union
+
+from models.die_face_model import ALL_DIE_FACES, FACE_TYPE_SPECIAL
+from models.sai_registry import SAI_REGISTRY
+
+# Result kinds a code counts toward when tallying a roll
+RESULT_MELEE = 0
+RESULT_MISSILE = 1
+RESULT_MAGIC = 2
+RESULT_SAVE = 3
+RESULT_MANEUVER = 4
+RESULT_ID = 5
+RESULT_SAI = 6
+RESULT_NONE = 7
+RESULT_KIND_COUNT = 8
+
+_RESULT_KIND_BY_FACE_TYPE = {
+    "MELEE": RESULT_MELEE,
+    "MISSILE": RESULT_MISSILE,
+    "MAGIC": RESULT_MAGIC,
+    "SAVE": RESULT_SAVE,
+    "MOVE": RESULT_MANEUVER,
+    "ID": RESULT_ID,
+}
+
+# Roll contexts named in the SAI registry's "applies" lists, one bit each
+ROLL_CONTEXT_BITS: Dict[str, int] = {
+    context: 1 << index
+    for index, context in enumerate(sorted({context for info in SAI_REGISTRY.values() for context in info["applies"]}))
+}
+
+RollCodes = array  # array("H") of face codes, one per die face rolled
+
+
+def roll_context_mask(contexts: Iterable[str]) -> int:
+    """Bitmask for a collection of SAI roll contexts ("melee", "save", "any", ...)."""
+    mask = 0
+    for context in contexts:
+        mask |= ROLL_CONTEXT_BITS.get(context, 0)
+    return mask
+
+
+def _sai_kind(face_name: str) -> str:
+    """SAI registry key a face is an instance of ("Fly_3" -> "fly"), or "" if none."""
+    normalized = face_name.lower()
+    for sai_name in SAI_REGISTRY:
+        if normalized == sai_name or normalized.startswith((f"{sai_name}_", f"{sai_name} ")):
+            return sai_name
+    return ""
+
+
+# Per-code attribute tables, indexed by code
+FACE_NAMES: List[str] = []
+FACE_TYPES: List[str] = []
+FACE_VALUES: List[int] = []
+FACE_SAI_KINDS: List[str] = []
+FACE_APPLIES_MASKS: List[int] = []
+FACE_GRANTS_REROLL: List[bool] = []
+RESULT_KINDS: List[int] = []
+
+
+def _add_code(
+    name: str, face_type: str, value: int, sai_kind: str, result_kind: int, grants_reroll: bool = False
+) -> int:
+    FACE_NAMES.append(name)
+    FACE_TYPES.append(face_type)
+    FACE_VALUES.append(value)
+    FACE_SAI_KINDS.append(sai_kind)
+    FACE_APPLIES_MASKS.append(roll_context_mask(SAI_REGISTRY[sai_kind]["applies"]) if sai_kind else 0)
+    FACE_GRANTS_REROLL.append(grants_reroll or sai_kind == "bullseye")
+    RESULT_KINDS.append(result_kind)
+    return len(FACE_NAMES) - 1
+
+
+# Die face codes match DieFaceModel.face_id
+for _face_name in sorted(ALL_DIE_FACES):
+    _face = ALL_DIE_FACES[_face_name]
+    _result_kind = _RESULT_KIND_BY_FACE_TYPE.get(_face.face_type, RESULT_NONE)
+    _add_code(
+        _face_name,
+        _face.face_type,
+        _face.base_value,
+        _sai_kind(_face_name) if _result_kind == RESULT_NONE else "",
+        _result_kind,
+    )
+
+# Roll-entry codes that are not die faces
+NO_RESULT_CODE = _add_code("", "", 0, "", RESULT_NONE)
+GENERIC_SAI_CODE = _add_code("SAI", FACE_TYPE_SPECIAL, 0, "", RESULT_SAI)
+# Any other entry mentioning Bullseye ("Bullseye_3", "bullseye x2"): counts as nothing and
+# is no SAI face, but still lets the unit re-roll
+BULLSEYE_MENTION_CODE = _add_code("Bullseye (mentioned)", FACE_TYPE_SPECIAL, 0, "", RESULT_NONE, True)
+
+# Code entered for each named SAI: its die face where one has the same name, otherwise its own code
+_face_codes_by_lower_name = {name.lower(): code for code, name in enumerate(FACE_NAMES) if name}
+SAI_CODES: Dict[str, int] = {}
+for _sai_name in SAI_REGISTRY:
+    if _sai_name in _face_codes_by_lower_name:
+        SAI_CODES[_sai_name] = _face_codes_by_lower_name[_sai_name]
+    else:
+        SAI_CODES[_sai_name] = _add_code(_sai_name.title(), FACE_TYPE_SPECIAL, 0, _sai_name, RESULT_NONE)
+
+# Face result shortcuts accepted for roll entry (matched lower-cased and stripped)
+_TOKEN_CODES: Dict[str, int] = {
+    "m": ALL_DIE_FACES["Melee_1"].face_id,
+    "melee": ALL_DIE_FACES["Melee_1"].face_id,
+    "mi": ALL_DIE_FACES["Missile_1"].face_id,
+    "missile": ALL_DIE_FACES["Missile_1"].face_id,
+    "mg": ALL_DIE_FACES["Magic_1"].face_id,
+    "magic": ALL_DIE_FACES["Magic_1"].face_id,
+    "s": ALL_DIE_FACES["Save_1"].face_id,
+    "save": ALL_DIE_FACES["Save_1"].face_id,
+    "ma": ALL_DIE_FACES["Move_1"].face_id,
+    "maneuver": ALL_DIE_FACES["Move_1"].face_id,
+    "id": ALL_DIE_FACES["ID_1"].face_id,
+    "sai": GENERIC_SAI_CODE,
+    **SAI_CODES,
+}
+
+
+def encode_face_result(face_result: str) -> int:
+    """Code for one entered face result; unrecognized or empty entries give NO_RESULT_CODE."""
+    normalized = face_result.lower().strip()
+    code = _TOKEN_CODES.get(normalized)
+    if code is not None:
+        return code
+    return BULLSEYE_MENTION_CODE if "bullseye" in normalized else NO_RESULT_CODE
+
+
+def encode_roll(face_results: Iterable[str]) -> RollCodes:
+    """Encode one unit's entered face results as an int array."""
+    return array("H", [encode_face_result(face_result) for face_result in face_results if face_result])
+
+
+def encode_roll_results(roll_results: Mapping[str, Union[Sequence[str], RollCodes]]) -> Dict[str, RollCodes]:
+    """Encode unit_name -> face results; already-encoded rolls are passed through."""
+    return {
+        unit_name: face_results if isinstance(face_results, array) else encode_roll(face_results)
+        for unit_name, face_results in roll_results.items()
+    }
+
+
+def count_results(codes: Iterable[int]) -> List[int]:
+    """Number of faces of each result kind in a roll, indexed by RESULT_* constant."""
+    counts = [0] * RESULT_KIND_COUNT
+    for code in codes:
+        counts[RESULT_KINDS[code]] += 1
+    return counts
@@ -22,6 +22,7 @@ class DieFaceModel:
         self.description = description
         self.face_type = face_type  # ID, MOVE, MELEE, MISSILE, SAVE, MAGIC, SPECIAL
         self.base_value = base_value  # Numeric value for basic faces (0 for special abilities)
+        self.face_id: Optional[int] = None  # Integer id, assigned once the catalog is built (not for persisting)
 
     def __repr__(self):
         return f"DieFaceModel(name='{self.name}', type='{self.face_type}', value={self.base_value})"
@@ -1134,6 +1135,10 @@ DRAGON_DIE_FACES = {
 
 ALL_DIE_FACES.update(DRAGON_DIE_FACES)
 
+# Integer ids (in name order, so adding a face renumbers them) for encoding rolls as small-integer arrays
+for _face_id, _face_name in enumerate(sorted(ALL_DIE_FACES)):
+    ALL_DIE_FACES[_face_name].face_id = _face_id
+
 
 # Helper functions for die face access
 def get_die_face(face_name: str) -> Optional[DieFaceModel]:
@@ -2,7 +2,7 @@ import uuid
 from typing import Any, Dict, List, Optional
 
 from models.die_face_model import DRAGON_DIE_FACES, DieFaceModel
-from models.element_model import ELEMENT_DATA
+from models.element_model import ELEMENT_DATA, element_bit, element_mask
 
 
 class DragonModel:
@@ -25,6 +25,7 @@ class DragonModel:
         self.dragon_form = dragon_form.upper()  # DRAKE or WYRM
         self.dragon_type = dragon_type.upper()
         self.elements = [element.upper() for element in elements]
+        self.element_mask = element_mask(self.elements)
         self.owner = owner
 
         # Set health based on dragon type, defaulting to 5 (10 for White Dragons)
@@ -107,15 +108,16 @@ class DragonModel:
 
     def has_element(self, element: str) -> bool:
         """Check if the dragon has a specific element."""
-        return element.upper() in self.elements
+        return bool(self.element_mask & element_bit(element))
 
     def has_any_element(self, elements: List[str]) -> bool:
         """Check if the dragon has any of the specified elements."""
-        return any(self.has_element(element) for element in elements)
+        return bool(self.element_mask & element_mask(elements))
 
     def has_all_elements(self, elements: List[str]) -> bool:
         """Check if the dragon has all of the specified elements."""
-        return all(self.has_element(element) for element in elements)
+        required_mask = element_mask(elements)
+        return self.element_mask & required_mask == required_mask
 
     def is_white_dragon(self) -> bool:
         """Check if this is a White Dragon."""
@@ -289,6 +291,7 @@ class DragonTypeModel:
         self.name = name
         self.dragon_type = dragon_type
         self.elements = elements  # List of element keys like ["FIRE"] or ["WATER", "AIR"]
+        self.element_mask = element_mask(elements)
         self.is_white = is_white
 
         self._validate()
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence
 
 
 class ElementModel:
@@ -35,6 +35,49 @@ ELEMENT_DATA = {
 }
 
 
+# Element bitmasks: one bit per element, so element sets can be compared with integer ops
+ELEMENT_BITS: Dict[str, int] = {element_name: 1 << index for index, element_name in enumerate(ELEMENT_DATA)}
+ALL_ELEMENTS_MASK = sum(ELEMENT_BITS.values())
+
+
+def element_mask(elements: Iterable[str]) -> int:
+    """Bitmask for a collection of element names (case-insensitive). Unknown names are ignored."""
+    mask = 0
+    for element_name in elements:
+        mask |= ELEMENT_BITS.get(element_name.upper(), 0)
+    return mask
+
+
+def element_bit(element_name: Optional[str]) -> int:
+    """Bit for a single element name, or 0 if it is not an element (e.g. None or "ELEMENTAL")."""
+    return ELEMENT_BITS.get(element_name.upper(), 0) if element_name else 0
+
+
+def elements_from_mask(mask: int) -> List[str]:
+    """Element names in a bitmask, in ELEMENT_DATA order."""
+    return [element_name for element_name, bit in ELEMENT_BITS.items() if mask & bit]
+
+
+def shares_element(mask_a: int, mask_b: int) -> bool:
+    """Check if two element bitmasks have at least one element in common."""
+    return bool(mask_a & mask_b)
+
+
+def has_all_elements(mask: int, required_mask: int) -> bool:
+    """Check if a bitmask contains every element of another."""
+    return mask & required_mask == required_mask
+
+
+def filter_by_element_mask(masks: Sequence[int], required_mask: int, match_all: bool = False) -> List[int]:
+    """
+    Indices of the masks matching required_mask, for batch filtering of precomputed masks.
+    Matches any shared element by default, or every required element with match_all.
+    """
+    if match_all:
+        return [index for index, mask in enumerate(masks) if mask & required_mask == required_mask]
+    return [index for index, mask in enumerate(masks) if mask & required_mask]
+
+
 # Helper functions
 def get_element(element_name: str) -> Optional[ElementModel]:
     """Get an element by name."""
@@ -6,14 +6,32 @@ Buried units are removed from the DUA and placed in the BUA.
 Spells can target the BUA but not the Summoning Pool.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from PySide6.QtCore import QObject, Signal
 
+from models.element_model import element_bit
+from models.game_state.indexed_collection import IndexedCollection, element_index
 from models.minor_terrain_model import MinorTerrain
 from models.unit_model import UnitModel
 
 
+def _species_index(unit: UnitModel) -> Tuple[Any, ...]:
+    return (unit.species,)
+
+
+def _id_index(unit: UnitModel) -> Tuple[str, ...]:
+    return (unit.get_id(), unit.name)
+
+
+# Per-player BUA indexes: species, element bit and unit id or name
+BUA_INDEXES = {
+    "species": _species_index,
+    "element": element_index,
+    "id": _id_index,
+}
+
+
 class BUAManager(QObject):
     """Manages the Buried Units Area (BUA) for all players."""
 
@@ -22,15 +40,15 @@ class BUAManager(QObject):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        # Player name -> List of UnitModel
-        self._player_buas: Dict[str, List[UnitModel]] = {}
+        # Player name -> UnitModels indexed by BUA_INDEXES
+        self._player_buas: Dict[str, IndexedCollection[UnitModel]] = {}
         # Player name -> List of MinorTerrain (for Amazon abilities and Esfah's Gift)
         self._player_minor_terrain_buas: Dict[str, List[MinorTerrain]] = {}
 
     def initialize_player_bua(self, player_name: str):
         """Initialize a player's BUA (starts empty)."""
         if player_name not in self._player_buas:
-            self._player_buas[player_name] = []
+            self._player_buas[player_name] = IndexedCollection(BUA_INDEXES)
             print(f"BUAManager: Initialized empty BUA for {player_name}")
             self.bua_updated.emit(player_name)
 
@@ -63,42 +81,42 @@ class BUAManager(QObject):
         if player_name not in self._player_buas:
             return None
 
-        bua = self._player_buas[player_name]
-        for i, unit in enumerate(bua):
-            if unit.get_id() == unit_id or unit.name == unit_id:
-                removed_unit = bua.pop(i)
-                print(f"BUAManager: Removed {removed_unit.name} from {player_name}'s BUA")
-                self.bua_updated.emit(player_name)
-                return removed_unit
+        removed_unit = self._player_buas[player_name].pop_first("id", unit_id)
+        if removed_unit is not None:
+            print(f"BUAManager: Removed {removed_unit.name} from {player_name}'s BUA")
+            self.bua_updated.emit(player_name)
+            return removed_unit
 
         print(f"BUAManager: Unit {unit_id} not found in {player_name}'s BUA")
         return None
 
     def get_player_bua(self, player_name: str) -> List[UnitModel]:
         """Get all units in a player's BUA."""
-        return self._player_buas.get(player_name, []).copy()
+        bua = self._player_buas.get(player_name)
+        return bua.items() if bua is not None else []
 
     def get_units_by_species(self, player_name: str, species: str) -> List[UnitModel]:
         """Get units in a player's BUA by species."""
-        bua = self.get_player_bua(player_name)
-        return [unit for unit in bua if unit.species == species]
+        bua = self._player_buas.get(player_name)
+        return bua.lookup("species", species) if bua is not None else []
 
     def get_units_by_element(self, player_name: str, element: str) -> List[UnitModel]:
         """Get units in a player's BUA that have a specific element."""
-        bua = self.get_player_bua(player_name)
-        return [unit for unit in bua if element in unit.elements]
+        bua = self._player_buas.get(player_name)
+        return bua.lookup("element", element_bit(element)) if bua is not None else []
 
     def has_units(self, player_name: str) -> bool:
         """Check if a player has any units in their BUA."""
-        return len(self.get_player_bua(player_name)) > 0
+        return self.get_unit_count(player_name) > 0
 
     def get_unit_count(self, player_name: str) -> int:
         """Get the number of units in a player's BUA."""
-        return len(self.get_player_bua(player_name))
+        return len(self._player_buas.get(player_name, ()))
 
     def get_species_count(self, player_name: str, species: str) -> int:
         """Get the count of a specific species in a player's BUA."""
-        return len(self.get_units_by_species(player_name, species))
+        bua = self._player_buas.get(player_name)
+        return bua.count_by("species", species) if bua is not None else 0
 
     def get_total_health(self, player_name: str) -> int:
         """Get the total health of all units in a player's BUA."""
@@ -143,17 +161,14 @@ class BUAManager(QObject):
 
     def find_unit_in_bua(self, player_name: str, unit_id: str) -> Optional[UnitModel]:
         """Find a specific unit in a player's BUA."""
-        bua = self.get_player_bua(player_name)
-        for unit in bua:
-            if unit.get_id() == unit_id or unit.name == unit_id:
-                return unit
-        return None
+        bua = self._player_buas.get(player_name)
+        return bua.first("id", unit_id) if bua is not None else None
 
     def clear_player_bua(self, player_name: str):
         """Clear all units from a player's BUA."""
         if player_name in self._player_buas:
             unit_count = len(self._player_buas[player_name])
-            self._player_buas[player_name] = []
+            self._player_buas[player_name] = IndexedCollection(BUA_INDEXES)
             print(f"BUAManager: Cleared {unit_count} units from {player_name}'s BUA")
             self.bua_updated.emit(player_name)
 
@@ -185,7 +200,7 @@ class BUAManager(QObject):
         if player_name not in self._player_buas:
             self.initialize_player_bua(player_name)
 
-        self._player_buas[player_name] = units
+        self._player_buas[player_name] = IndexedCollection(BUA_INDEXES, units)
         print(f"BUAManager: Imported {len(units)} units to {player_name}'s BUA")
         self.bua_updated.emit(player_name)
 
@@ -248,7 +263,8 @@ class BUAManager(QObject):
     def get_minor_terrains_in_bua_by_element(self, player_name: str, element: str) -> List[MinorTerrain]:
         """Get minor terrains in a player's BUA that match a specific element."""
         bua = self.get_player_minor_terrain_bua(player_name)
-        return [terrain for terrain in bua if terrain.has_element(element)]
+        bit = element_bit(element)
+        return [terrain for terrain in bua if terrain.element_mask & bit]
 
     def get_minor_terrains_in_bua_by_color(self, player_name: str, color: str) -> List[MinorTerrain]:
         """Get minor terrains in a player's BUA that match a specific color."""
@@ -9,14 +9,28 @@ This module handles the management of dead units, including:
 5. Special DUA-related effects
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from PySide6.QtCore import QObject, Signal
 
+from models.element_model import element_bit, element_mask
+from models.game_state.indexed_collection import IndexedCollection, element_index
 from utils.field_access import strict_get, strict_get_optional
 
+PromotionKey = Tuple[str, int]  # (species name, max health)
+
+
+def promotion_key(unit_data: Dict[str, Any]) -> Optional[PromotionKey]:
+    """Species/health key used to match promotion candidates, or None if the unit data lacks either."""
+    species = unit_data.get("species")
+    max_health = unit_data.get("max_health")
+    if not isinstance(species, dict) or not species.get("name") or max_health is None:
+        return None
+    return species["name"], max_health
+
 
 class DUAState(Enum):
     """Possible states for units in the DUA."""
@@ -42,6 +56,10 @@ class DUAUnit:
     death_location: str = ""
     death_turn: int = 0
     burial_conditions: List[str] = field(default_factory=list)
+    element_mask: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.element_mask = element_mask(self.elements)
 
     def can_be_resurrected(self) -> bool:
         """Check if this unit can be resurrected."""
@@ -87,6 +105,37 @@ class DUAUnit:
         )
 
 
+def _species_name(species: Any) -> Any:
+    """Name of a species given as a name, a species dict or a SpeciesModel (the species index key)."""
+    if isinstance(species, Mapping):
+        return strict_get_optional(species, "name", "")
+    if species is not None and not isinstance(species, str):
+        return getattr(species, "name", species)
+    return species
+
+
+def _species_index(unit: DUAUnit) -> Tuple[Any, ...]:
+    return (_species_name(unit.species),)
+
+
+def _name_index(unit: DUAUnit) -> Tuple[str, ...]:
+    return (unit.name,)
+
+
+def _promotion_index(unit: DUAUnit) -> Tuple[PromotionKey, ...]:
+    key = promotion_key(unit.unit_data)
+    return (key,) if key is not None else ()
+
+
+# Per-player DUA indexes: species, element bit, unit name and promotion key
+DUA_INDEXES = {
+    "species": _species_index,
+    "element": element_index,
+    "name": _name_index,
+    "promotion": _promotion_index,
+}
+
+
 class DUAManager(QObject):
     """Manages the Dead Unit Area for all players."""
 
@@ -94,8 +143,8 @@ class DUAManager(QObject):
 
     def __init__(self, turn_manager, parent=None):
         super().__init__(parent)
-        # DUA storage: player_name -> list of DUAUnit
-        self.dua_by_player: Dict[str, List[DUAUnit]] = {}
+        # DUA storage: player_name -> DUAUnits indexed by DUA_INDEXES
+        self.dua_by_player: Dict[str, IndexedCollection[DUAUnit]] = {}
 
         # Burial conditions that apply to all units
         self.global_burial_conditions: List[str] = []
@@ -142,11 +191,8 @@ class DUAManager(QObject):
             burial_conditions=burial_conditions,
         )
 
-        # Initialize player's DUA if needed
-        if owner not in self.dua_by_player:
-            self.dua_by_player[owner] = []
-
-        # Add to player's DUA
+        # Add to player's DUA (initializing it if needed)
+        self.initialize_player_dua(owner)
         self.dua_by_player[owner].append(dua_unit)
 
         # Emit signal
@@ -169,7 +215,7 @@ class DUAManager(QObject):
 
         return dua_units
 
-    def get_player_dua(self, player_name: str) -> List[DUAUnit]:
+    def get_player_dua(self, player_name: str) -> IndexedCollection[DUAUnit]:
         """Get all units in a player's DUA."""
         if player_name not in self.dua_by_player:
             raise ValueError(
@@ -184,13 +230,23 @@ class DUAManager(QObject):
 
     def get_units_by_element(self, player_name: str, element: str) -> List[DUAUnit]:
         """Get units in DUA that contain a specific element."""
-        player_dua = self.get_player_dua(player_name)
-        return [unit for unit in player_dua if element in unit.elements and unit.can_be_resurrected()]
+        units = self.get_player_dua(player_name).lookup("element", element_bit(element))
+        return [unit for unit in units if unit.can_be_resurrected()]
 
-    def get_units_by_species(self, player_name: str, species: str) -> List[DUAUnit]:
-        """Get units in DUA of a specific species."""
-        player_dua = self.get_player_dua(player_name)
-        return [unit for unit in player_dua if unit.species == species and unit.can_be_resurrected()]
+    def get_units_by_species(self, player_name: str, species: Any) -> List[DUAUnit]:
+        """Get units in DUA of a specific species (given by name, species dict or SpeciesModel)."""
+        units = self.get_player_dua(player_name).lookup("species", _species_name(species))
+        return [unit for unit in units if unit.can_be_resurrected()]
+
+    def get_promotion_candidates(self, player_name: str, species_name: str, max_health: int) -> List[DUAUnit]:
+        """
+        Get resurrectable DUA units of a species and max health, for promotion.
+
+        Served from the player's (species, max health) index, so the lookup does not scan
+        the player's whole DUA.
+        """
+        units = self.get_player_dua(player_name).lookup("promotion", (species_name, max_health))
+        return [unit for unit in units if unit.can_be_resurrected()]
 
     def resurrect_unit(self, player_name: str, unit_name: str) -> Optional[DUAUnit]:
         """
@@ -203,10 +259,8 @@ class DUAManager(QObject):
         Returns:
             The resurrected unit if successful, None otherwise
         """
-        player_dua = self.get_player_dua(player_name)
-
-        for unit in player_dua:
-            if unit.name == unit_name and unit.can_be_resurrected():
+        for unit in self.get_player_dua(player_name).lookup("name", unit_name):
+            if unit.can_be_resurrected():
                 # Mark as returning (will be removed when added to army)
                 unit.state = DUAState.RETURNING
                 return unit
@@ -224,14 +278,7 @@ class DUAManager(QObject):
         Returns:
             True if unit was removed, False otherwise
         """
-        player_dua = self.get_player_dua(player_name)
-
-        for i, unit in enumerate(player_dua):
-            if unit.name == unit_name:
-                player_dua.pop(i)
-                return True
-
-        return False
+        return self.get_player_dua(player_name).pop_first("name", unit_name) is not None
 
     def bury_unit(self, player_name: str, unit_name: str, burial_reason: str = "spell") -> bool:
         """
@@ -245,10 +292,8 @@ class DUAManager(QObject):
         Returns:
             True if unit was buried, False otherwise
         """
-        player_dua = self.get_player_dua(player_name)
-
-        for unit in player_dua:
-            if unit.name == unit_name and unit.can_be_buried():
+        for unit in self.get_player_dua(player_name).lookup("name", unit_name):
+            if unit.can_be_buried():
                 unit.state = DUAState.BURIED
                 unit.burial_conditions.append(burial_reason)
                 return True
@@ -335,13 +380,13 @@ class DUAManager(QObject):
 
         return stats
 
-    def get_all_dua_units(self) -> Dict[str, List[DUAUnit]]:
+    def get_all_dua_units(self) -> Dict[str, IndexedCollection[DUAUnit]]:
         """Get all DUA units for all players."""
         return self.dua_by_player.copy()
 
     def clear_player_dua(self, player_name: str):
         """Clear all units from a player's DUA."""
-        self.dua_by_player[player_name] = []
+        self.dua_by_player[player_name] = IndexedCollection(DUA_INDEXES)
 
     def set_current_turn(self, turn: int):
         """Set the current game turn (delegates to turn manager)."""
@@ -350,14 +395,12 @@ class DUAManager(QObject):
     def initialize_player_dua(self, player_name: str):
         """Initialize DUA for a player."""
         if player_name not in self.dua_by_player:
-            self.dua_by_player[player_name] = []
+            self.dua_by_player[player_name] = IndexedCollection(DUA_INDEXES)
 
     def add_unit_to_dua(self, dua_unit: DUAUnit):
         """Add a DUA unit directly to the DUA."""
         owner = dua_unit.original_owner
-        if owner not in self.dua_by_player:
-            self.dua_by_player[owner] = []
-
+        self.initialize_player_dua(owner)
         self.dua_by_player[owner].append(dua_unit)
         self.dua_updated.emit(owner)
 
@@ -392,7 +435,7 @@ class DUAManager(QObject):
     def import_dua_state(self, state: Dict[str, Any]):
         """Import DUA state from save/load."""
         self.dua_by_player = {
-            player: [DUAUnit.from_dict(unit_data) for unit_data in units]
+            player: IndexedCollection(DUA_INDEXES, (DUAUnit.from_dict(unit_data) for unit_data in units))
             for player, units in strict_get(state, "dua_by_player").items()
         }
         self.global_burial_conditions = strict_get(state, "global_burial_conditions")
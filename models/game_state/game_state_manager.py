@@ -4,8 +4,10 @@ from PySide6.QtCore import QObject, Signal
 
 # For type hinting and potential reconstruction
 # For type hinting and potential reconstruction
-from models.unit_model import UnitModel
+from models.game_state.terrain_control_tracker import TerrainControlTracker, terrain_face
+from models.unit_instance import UnitInstance
 from utils.field_access import strict_get, strict_get_optional
+from utils.read_model_cache import ReadModelCache
 
 
 # Custom exceptions for game state management
@@ -86,7 +88,7 @@ class GameStateManager(QObject):
         #     "armies": {
         #         "home": {
         #             "name": "Home Guard", "points_value": 10, "location": "Highland",
-        #             "units": [
+        #             "units": [  # UnitInstance objects (dict-compatible)
         #                 {"id": "unit1", "name": "Goblin Infantry", "health": 1, "max_health": 1, "abilities": {"id_results": {constants.ICON_MELEE: 1}}},
         #                 {"id": "unit2", "name": "Orc Archer", "health": 2, "max_health": 2, "abilities": {"id_results": {constants.ICON_MISSILE: 1}}}
         #             ]
@@ -106,6 +108,16 @@ class GameStateManager(QObject):
         # "Frontier Name": {"name": "Frontier Name", "type": "Frontier", "face": 3, "controller": None, "armies_present": ["P1_Campaign", "P2_Campaign"]}
         # "Player 1 Home": {"name": "Player 1 Home", "type": "Home", "face": 1, "controller": None, "armies_present": ["P1_Home"]}
 
+        # Army strength per terrain and derived terrain control, kept current by the mutators below
+        self.terrain_control = TerrainControlTracker()
+
+        # Change versions per player and per terrain, bumped by the mutators below from one
+        # monotonically increasing counter; memoized read models are keyed on them
+        self._version_counter = 0
+        self._player_versions: Dict[str, int] = {}
+        self._terrain_versions: Dict[str, int] = {}
+        self.read_models = ReadModelCache()
+
         self._initialize_state(initial_player_setup_data, frontier_terrain, distance_rolls)
 
     def _initialize_state(
@@ -165,7 +177,7 @@ class GameStateManager(QObject):
                 self.players[player_name]["armies"][army_type_key] = {
                     "name": army_details["name"],
                     "points_value": strict_get(army_details, "allocated_points"),
-                    "units": [UnitModel.from_dict(u_data).to_dict() for u_data in strict_get(army_details, "units")],
+                    "units": [UnitInstance.from_dict(u_data) for u_data in strict_get(army_details, "units")],
                     "location": location,
                 }
 
@@ -206,6 +218,7 @@ class GameStateManager(QObject):
             }
         # Add unique identifiers to all armies
         self.update_army_identifiers_to_specific()
+        self.refresh_terrain_control()
 
         print(f"GameStateManager: Initialized Players: {list(self.players.keys())}")
         print(f"GameStateManager: Initialized Terrains: {self.terrains}")
@@ -249,7 +262,7 @@ class GameStateManager(QObject):
         # Also add any explicitly defined reserve units from setup
         if "reserve_units" in player_setup_data:
             for unit_data in player_setup_data["reserve_units"]:
-                reserve_unit = UnitModel.from_dict(unit_data).to_dict()
+                reserve_unit = UnitInstance.from_dict(unit_data)
                 player_data["reserve_pool"].append(reserve_unit)
 
     def _create_reserve_units(self, player_name: str, points_available: int) -> List[Dict[str, Any]]:
@@ -273,9 +286,9 @@ class GameStateManager(QObject):
 
         # Sort by health (using health as cost proxy)
         available_units.sort(
-            key=lambda u: unit_roster.get_unit_definition(u["id"])
-            and unit_roster.get_unit_definition(u["id"])["max_health"]
-            or 0
+            key=lambda u: (
+                unit_roster.get_unit_definition(u["id"]) and unit_roster.get_unit_definition(u["id"])["max_health"] or 0
+            )
         )
 
         unit_count = 0
@@ -494,6 +507,8 @@ class GameStateManager(QObject):
                 if unit["health"] <= 0:
                     self._move_unit_to_dua(target_player, unit)
                     army["units"].remove(unit)
+                    self._sync_army_control(target_player, army)
+                self.mark_player_changed(target_player)
                 self.game_state_changed.emit()
                 return
 
@@ -534,6 +549,9 @@ class GameStateManager(QObject):
 
         source_army["units"].remove(unit_to_move)
         target_army["units"].append(unit_to_move)
+        self._update_army_control(player_name, from_army, source_army)
+        self._update_army_control(player_name, to_army, target_army)
+        self.mark_player_changed(player_name)
         self.game_state_changed.emit()
 
     def _move_unit_to_dua(self, player_name: str, unit: Dict[str, Any]):
@@ -556,6 +574,8 @@ class GameStateManager(QObject):
             if unit.get("name") == unit_name:
                 army["units"].remove(unit)
                 player_data.setdefault("buried_unit_area", []).append(unit)
+                self._update_army_control(player_name, army_identifier, army)
+                self.mark_player_changed(player_name)
                 self.game_state_changed.emit()
                 return True
         return False
@@ -574,6 +594,8 @@ class GameStateManager(QObject):
             if unit.get("name") == unit_name:
                 army["units"].remove(unit)
                 player_data.setdefault("reserve_area", []).append(unit)
+                self._update_army_control(player_name, army_identifier, army)
+                self.mark_player_changed(player_name)
                 self.game_state_changed.emit()
                 return True
         return False
@@ -594,6 +616,8 @@ class GameStateManager(QObject):
             if unit.get("name") == unit_name:
                 reserve_area.remove(unit)
                 target_army_data["units"].append(unit)
+                self._update_army_control(player_name, target_army, target_army_data)
+                self.mark_player_changed(player_name)
                 self.game_state_changed.emit()
                 return True
         return False
@@ -614,6 +638,8 @@ class GameStateManager(QObject):
             if unit.get("name") == unit_name:
                 reserve_pool.remove(unit)
                 target_army_data["units"].append(unit)
+                self._update_army_control(player_name, target_army, target_army_data)
+                self.mark_player_changed(player_name)
                 self.game_state_changed.emit()
                 return True
         return False
@@ -626,12 +652,15 @@ class GameStateManager(QObject):
             raise ArmyNotFoundError(player_name, army_identifier)
 
         army["location"] = location
+        self._update_army_control(player_name, army_identifier, army)
+        self.mark_player_changed(player_name)
         self.game_state_changed.emit()
 
     def update_terrain_control(self, terrain_name: str, controlling_player: Optional[str]) -> None:
-        """Update which player controls a terrain."""
-        terrain = self.get_terrain_data(terrain_name)
-        terrain["controlling_player"] = controlling_player
+        """Update which player controls a terrain (None returns it to control by army strength)."""
+        self.get_terrain_data(terrain_name)
+        self.terrain_control.set_controller(terrain_name, controlling_player)
+        self.mark_terrain_changed(terrain_name)
         self.game_state_changed.emit()
 
     def update_terrain_face(self, terrain_name: str, face: str) -> bool:
@@ -639,6 +668,8 @@ class GameStateManager(QObject):
         try:
             terrain = self.get_terrain_data(terrain_name)
             terrain["face"] = int(face) if isinstance(face, str) else face
+            self.terrain_control.update_terrain_face(terrain_name, terrain_face(terrain))
+            self.mark_terrain_changed(terrain_name)
             self.game_state_changed.emit()
             return True
         except TerrainNotFoundError as e:
@@ -651,9 +682,10 @@ class GameStateManager(QObject):
     def set_terrain_controller(self, terrain_name: str, controlling_player: Optional[str]) -> bool:
         """Set the controlling player for a terrain. Returns True on success."""
         try:
-            terrain = self.get_terrain_data(terrain_name)
-            terrain["controlling_player"] = controlling_player
+            self.get_terrain_data(terrain_name)
+            self.terrain_control.set_controller(terrain_name, controlling_player)
             print(f"GameStateManager: Set {terrain_name} controller to {controlling_player}")
+            self.mark_terrain_changed(terrain_name)
             self.game_state_changed.emit()
             return True
         except TerrainNotFoundError as e:
@@ -664,9 +696,11 @@ class GameStateManager(QObject):
         """Get the controlling player for a terrain."""
         try:
             terrain = self.get_terrain_data(terrain_name)
-            return terrain.get("controlling_player")
         except TerrainNotFoundError:
             return None
+        # Picks up a face set directly on the terrain dict
+        self.terrain_control.update_terrain_face(terrain_name, terrain_face(terrain))
+        return self.terrain_control.get_terrain_control(terrain_name).controller
 
     def reset_terrain_control_when_lost(self, terrain_name: str) -> bool:
         """Reset terrain from eighth face to seventh when control is lost."""
@@ -674,8 +708,10 @@ class GameStateManager(QObject):
             terrain = self.get_terrain_data(terrain_name)
             if terrain.get("face") == 8:
                 terrain["face"] = 7
-                terrain["controlling_player"] = None
+                self.terrain_control.set_controller(terrain_name, None)
+                self.terrain_control.update_terrain_face(terrain_name, terrain_face(terrain))
                 print(f"GameStateManager: Reset {terrain_name} from eighth to seventh face due to control loss")
+                self.mark_terrain_changed(terrain_name)
                 self.game_state_changed.emit()
                 return True
             return False
@@ -687,20 +723,19 @@ class GameStateManager(QObject):
         """Check if terrain control should be lost due to army destruction/abandonment."""
         terrains_lost = []
 
-        # Find terrains controlled by this player
-        for terrain_name, terrain_data in self.terrains.items():
-            if terrain_data.get("controlling_player") == player_name:
-                # Check if the controlling army still exists and has units
-                try:
-                    army_units = self.get_army_units(player_name, army_id)
-                    if not army_units or all(strict_get(unit, "health") <= 0 for unit in army_units):
-                        # Army destroyed or has no healthy units, lose control
-                        self.reset_terrain_control_when_lost(terrain_name)
-                        terrains_lost.append(terrain_name)
-                except (PlayerNotFoundError, ArmyNotFoundError):
-                    # Army no longer exists, lose control
+        # Find terrains assigned to this player (control by army strength follows the armies by itself)
+        for terrain_name in self.terrain_control.get_assigned_terrains(player_name):
+            # Check if the controlling army still exists and has units
+            try:
+                army_units = self.get_army_units(player_name, army_id)
+                if not army_units or all(strict_get(unit, "health") <= 0 for unit in army_units):
+                    # Army destroyed or has no healthy units, lose control
                     self.reset_terrain_control_when_lost(terrain_name)
                     terrains_lost.append(terrain_name)
+            except (PlayerNotFoundError, ArmyNotFoundError):
+                # Army no longer exists, lose control
+                self.reset_terrain_control_when_lost(terrain_name)
+                terrains_lost.append(terrain_name)
 
         return terrains_lost
 
@@ -794,19 +829,73 @@ class GameStateManager(QObject):
         """Add a unit to the summoning pool."""
         player_data = self.get_player_data(player_name)
         player_data.setdefault("summoning_pool", []).append(unit)
+        self.mark_player_changed(player_name)
         self.game_state_changed.emit()
 
+    def refresh_terrain_control(self) -> None:
+        """Rebuild terrain control tracking from scratch, e.g. after editing state dicts directly."""
+        self.terrain_control.rebuild(self.players, self.terrains)
+        self.mark_all_changed()
+
+    # State versions
+    def _next_version(self) -> int:
+        self._version_counter += 1
+        return self._version_counter
+
+    def mark_player_changed(self, player_name: str) -> None:
+        """Bump a player's version so read models derived from their state are recomputed."""
+        self._player_versions[player_name] = self._next_version()
+
+    def mark_terrain_changed(self, terrain_name: str) -> None:
+        """Bump a terrain's version so read models derived from it are recomputed."""
+        self._terrain_versions[terrain_name] = self._next_version()
+
+    def mark_all_changed(self) -> None:
+        """Bump every player and terrain version, e.g. after editing state dicts directly."""
+        for player_name in self.players:
+            self.mark_player_changed(player_name)
+        for terrain_name in self.terrains:
+            self.mark_terrain_changed(terrain_name)
+
+    def get_player_version(self, player_name: str) -> int:
+        """Current version of a player's state (0 if never changed)."""
+        return self._player_versions.get(player_name, 0)
+
+    def get_terrain_version(self, terrain_name: str) -> int:
+        """Current version of a terrain's state (0 if never changed)."""
+        return self._terrain_versions.get(terrain_name, 0)
+
+    def get_state_version(self) -> int:
+        """Version of the whole player and terrain state; changes whenever any of it changes."""
+        return self._version_counter
+
+    def get_terrain_versions(self) -> Tuple[Tuple[str, int], ...]:
+        """(terrain name, version) for every terrain, usable as a read model cache key."""
+        return tuple((terrain_name, self.get_terrain_version(terrain_name)) for terrain_name in self.terrains)
+
+    def _update_army_control(self, player_name: str, army_type: str, army: Dict[str, Any]) -> None:
+        """
+        Report an army's changed strength or location to the terrain control tracker.
+
+        Control of the locations the army left and entered can change with it, so their
+        versions are bumped too (read models of other players' armies there depend on them).
+        """
+        for location in self.terrain_control.update_army(player_name, army_type, army):
+            self.mark_terrain_changed(location)
+
+    def _sync_army_control(self, player_name: str, army: Dict[str, Any]) -> None:
+        """Report an army's changed strength or location to the terrain control tracker."""
+        for army_type, army_data in strict_get(self.get_player_data(player_name), "armies").items():
+            if army_data is army:
+                self._update_army_control(player_name, army_type, army_data)
+                return
+
     def check_victory_conditions(self) -> Optional[str]:
         """Check if any player has won by capturing required terrains."""
         # Simple victory condition: control majority of terrains
-        player_terrain_counts: Dict[str, int] = {}
+        player_terrain_counts = self.terrain_control.get_controlled_terrain_counts()
         total_terrains = len(self.terrains)
 
-        for terrain_data in self.terrains.values():
-            controlling_player = terrain_data.get("controlling_player")
-            if controlling_player:
-                player_terrain_counts[controlling_player] = strict_get(player_terrain_counts, controlling_player) + 1
-
         # Check if any player controls more than half the terrains
         for player, count in player_terrain_counts.items():
             if count > total_terrains // 2:
@@ -859,6 +948,7 @@ class GameStateManager(QObject):
                 player_data.setdefault("dead_unit_area", []).append(unit)
 
         if units_affected:
+            self._sync_army_control(player_name, army)
             # Check if army is now destroyed and automatically lose terrain control
             army_units = strict_get(army, "units")
             if not army_units or all(strict_get(unit, "health") <= 0 for unit in army_units):
@@ -870,6 +960,7 @@ class GameStateManager(QObject):
                     for terrain_name in terrains_lost:
                         self.reset_terrain_control_when_lost(terrain_name)
 
+            self.mark_player_changed(player_name)
             self.game_state_changed.emit()
 
     def get_player_data(self, player_name: str) -> Dict[str, Any]:
@@ -917,6 +1008,7 @@ class GameStateManager(QObject):
             raise ArmyNotFoundError(player_name, army_type)
 
         player_data["active_army_type"] = army_type
+        self.mark_player_changed(player_name)
         self.game_state_changed.emit()
 
     def determine_active_army_by_location(self, player_name: str, current_location: str) -> Optional[str]:
@@ -1078,7 +1170,17 @@ class GameStateManager(QObject):
         - total_health: Sum of all unit health points
         - points_value: Total point value of the army
         - units: List of unit data for the army
+
+        The summary is memoized until the player's state changes and should be treated as read-only.
         """
+        return self.read_models.get(
+            ("armies_summary", player_name),
+            self.get_player_version(player_name),
+            lambda: self._build_player_armies_summary(player_name),
+        )
+
+    def _build_player_armies_summary(self, player_name: str) -> List[Dict[str, Any]]:
+        """Compute the armies summary returned by get_player_armies_summary."""
         player_data = self.get_player_data_safe(player_name)
         if not player_data:
             return []
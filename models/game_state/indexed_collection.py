@@ -0,0 +1,210 @@
+"""
+Indexed item collections for the game area managers.
+
+The DUA, BUA, Reserve Area and Summoning Pool each keep an ordered list of units (or
+dragons) per player and look them up by species, element, id or name. An
+IndexedCollection holds one player's items in insertion order together with secondary
+indexes built from key functions, so those lookups and removals by id or name touch only
+the matching items instead of scanning the whole area.
+
+The collection is also a MutableSequence, so the managers can keep handing out their
+per-player areas as live lists. Indexing, appending, popping the last item and clearing
+stay cheap; other positional edits (insert, slice assignment, ...) rebuild the indexes.
+Sequence.count() keeps its list meaning; count_by() counts the items under an index key.
+
+Index keys are computed when an item is added, so they must come from fields that do not
+change while the item is in the collection. Unhashable keys (e.g. a species given as a
+dict) are not indexed.
+"""
+
+from collections.abc import Hashable, MutableSequence
+from typing import Any, Callable, Dict, Generic, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
+
+T = TypeVar("T")
+
+# Item -> keys it is found under in one index
+KeyFunction = Callable[[T], Iterable[Hashable]]
+
+
+def element_keys(element_mask: int) -> Tuple[int, ...]:
+    """Element bits set in a mask, for indexing by element_bit(element)."""
+    keys = []
+    while element_mask:
+        bit = element_mask & -element_mask
+        keys.append(bit)
+        element_mask ^= bit
+    return tuple(keys)
+
+
+def element_index(item) -> Tuple[int, ...]:
+    """Key function indexing an item with an element_mask by each element (look up with element_bit)."""
+    return element_keys(item.element_mask)
+
+
+class IndexedCollection(MutableSequence, Generic[T]):
+    """Insertion-ordered items with secondary indexes and O(1) removal."""
+
+    def __init__(self, indexes: Dict[str, KeyFunction], items: Iterable[T] = ()):
+        """
+        Args:
+            indexes: Index name -> function giving the keys an item is found under
+            items: Initial items
+        """
+        self._key_functions = indexes
+        self._items: Dict[int, T] = {}  # Handle -> item, in insertion order
+        self._order: List[int] = []  # Handles in insertion order; removed ones are dropped lazily
+        self._handles: Dict[int, List[int]] = {}  # id(item) -> its handles
+        self._item_keys: Dict[int, Dict[str, Tuple[Hashable, ...]]] = {}  # Handle -> index name -> keys
+        self._indexes: Dict[str, Dict[Hashable, Dict[int, T]]] = {name: {} for name in indexes}
+        self._next_handle = 0
+        for item in items:
+            self.append(item)
+
+    def append(self, item: T) -> None:
+        """Append an item."""
+        handle = self._next_handle
+        self._next_handle += 1
+        self._items[handle] = item
+        self._order.append(handle)
+        self._handles.setdefault(id(item), []).append(handle)
+
+        item_keys = {}
+        for name, key_function in self._key_functions.items():
+            keys = tuple(dict.fromkeys(key for key in key_function(item) if isinstance(key, Hashable)))
+            item_keys[name] = keys
+            index = self._indexes[name]
+            for key in keys:
+                index.setdefault(key, {})[handle] = item
+        self._item_keys[handle] = item_keys
+
+    def remove(self, item: T) -> None:
+        """Remove the first occurrence of an item (found by identity, then equality, like list.remove)."""
+        handles = self._handles.get(id(item))
+        if handles:
+            self._remove_handle(handles[0])
+            return
+        for handle, candidate in self._items.items():
+            if candidate == item:
+                self._remove_handle(handle)
+                return
+        raise ValueError(f"{item!r} is not in the collection")
+
+    def clear(self) -> None:
+        self._items.clear()
+        self._order.clear()
+        self._handles.clear()
+        self._item_keys.clear()
+        for index in self._indexes.values():
+            index.clear()
+
+    def pop_first(self, index: str, key: Hashable) -> Optional[T]:
+        """Remove and return the earliest added item under a key, or None."""
+        bucket = self._bucket(index, key)
+        if not bucket:
+            return None
+        handle = next(iter(bucket))
+        item = bucket[handle]
+        self._remove_handle(handle)
+        return item
+
+    def first(self, index: str, key: Hashable) -> Optional[T]:
+        """Earliest added item under a key, or None."""
+        bucket = self._bucket(index, key)
+        return next(iter(bucket.values()), None) if bucket else None
+
+    def lookup(self, index: str, key: Hashable) -> List[T]:
+        """Items under a key, in insertion order."""
+        bucket = self._bucket(index, key)
+        return list(bucket.values()) if bucket else []
+
+    def count_by(self, index: str, key: Hashable) -> int:
+        """Number of items under a key."""
+        bucket = self._bucket(index, key)
+        return len(bucket) if bucket else 0
+
+    def items(self) -> List[T]:
+        """All items, in insertion order."""
+        return list(self._items.values())
+
+    # Sequence protocol
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        order = self._live_order()
+        if isinstance(index, slice):
+            return [self._items[handle] for handle in order[index]]
+        return self._items[order[index]]
+
+    def __setitem__(self, index: Union[int, slice], value: Any) -> None:
+        items = self.items()
+        items[index] = value
+        self._rebuild(items)
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        if isinstance(index, int):
+            order = self._live_order()
+            handle = order[index]
+            del order[index]
+            self._remove_handle(handle)
+            return
+        items = self.items()
+        del items[index]
+        self._rebuild(items)
+
+    def insert(self, index: int, item: T) -> None:
+        if index >= len(self._items):
+            self.append(item)
+            return
+        items = self.items()
+        items.insert(index, item)
+        self._rebuild(items)
+
+    def __iter__(self) -> Iterator[T]:
+        # Iterate over a snapshot so callers can remove the item they are looking at
+        return iter(self.items())
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, IndexedCollection)):
+            return self.items() == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __reduce__(self):
+        # Handles are keyed by id(item), so copies and unpickled collections re-index their items
+        return IndexedCollection, (self._key_functions, self.items())
+
+    def __repr__(self):
+        return f"IndexedCollection({self.items()!r})"
+
+    def _rebuild(self, items: List[T]) -> None:
+        self.clear()
+        for item in items:
+            self.append(item)
+
+    def _live_order(self) -> List[int]:
+        # Drop the handles of items removed by key since the last positional access
+        if len(self._order) != len(self._items):
+            self._order = [handle for handle in self._order if handle in self._items]
+        return self._order
+
+    def _bucket(self, index: str, key: Hashable) -> Optional[Dict[int, T]]:
+        if not isinstance(key, Hashable):
+            return None
+        return self._indexes[index].get(key)
+
+    def _remove_handle(self, handle: int) -> None:
+        item = self._items.pop(handle)
+        handles = self._handles[id(item)]
+        handles.remove(handle)
+        if not handles:
+            del self._handles[id(item)]
+        for name, keys in self._item_keys.pop(handle).items():
+            index = self._indexes[name]
+            for key in keys:
+                bucket = index[key]
+                del bucket[handle]
+                if not bucket:
+                    del index[key]
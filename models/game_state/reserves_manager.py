@@ -10,10 +10,11 @@ This module handles the management of units in the Reserve Area, including:
 """
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from PySide6.QtCore import QObject, Signal
 
+from models.game_state.indexed_collection import IndexedCollection
 from models.spell_model import get_reserve_spells
 from utils import strict_get
 
@@ -63,6 +64,21 @@ class ReserveUnit:
         )
 
 
+def _species_index(unit: ReserveUnit) -> Tuple[Any, ...]:
+    return (unit.species,)
+
+
+def _name_index(unit: ReserveUnit) -> Tuple[str, ...]:
+    return (unit.name,)
+
+
+# Per-player Reserve Area indexes: species and unit name
+RESERVE_INDEXES = {
+    "species": _species_index,
+    "name": _name_index,
+}
+
+
 class ReservesManager(QObject):
     """Manages the Reserve Area for all players."""
 
@@ -70,8 +86,8 @@ class ReservesManager(QObject):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        # Reserve storage: player_name -> list of ReserveUnit
-        self.reserves_by_player: Dict[str, List[ReserveUnit]] = {}
+        # Reserve storage: player_name -> ReserveUnits indexed by RESERVE_INDEXES
+        self.reserves_by_player: Dict[str, IndexedCollection[ReserveUnit]] = {}
 
         # Current game turn for tracking
         self.current_turn = 1
@@ -82,7 +98,7 @@ class ReservesManager(QObject):
     def initialize_player_reserves(self, player_name: str):
         """Initialize reserves for a player."""
         if player_name not in self.reserves_by_player:
-            self.reserves_by_player[player_name] = []
+            self.reserves_by_player[player_name] = IndexedCollection(RESERVE_INDEXES)
 
     def add_unit_to_reserves(
         self,
@@ -115,11 +131,8 @@ class ReservesManager(QObject):
             entry_reason=entry_reason,
         )
 
-        # Initialize player's reserves if needed
-        if owner not in self.reserves_by_player:
-            self.reserves_by_player[owner] = []
-
-        # Add to player's reserves
+        # Add to player's reserves (initializing them if needed)
+        self.initialize_player_reserves(owner)
         self.reserves_by_player[owner].append(reserve_unit)
 
         # Emit signal
@@ -141,15 +154,9 @@ class ReservesManager(QObject):
         if owner not in self.reserves_by_player:
             return None
 
-        player_reserves = self.reserves_by_player[owner]
-
-        for i, unit in enumerate(player_reserves):
-            if unit.name == unit_name:
-                return player_reserves.pop(i)
+        return self.reserves_by_player[owner].pop_first("name", unit_name)
 
-        return None
-
-    def get_player_reserves(self, player_name: str) -> List[ReserveUnit]:
+    def get_player_reserves(self, player_name: str) -> IndexedCollection[ReserveUnit]:
         """Get all units in a player's Reserve Area."""
         if player_name not in self.reserves_by_player:
             raise ValueError(
@@ -159,8 +166,7 @@ class ReservesManager(QObject):
 
     def get_reserve_units_by_species(self, player_name: str, species: str) -> List[ReserveUnit]:
         """Get reserve units of a specific species."""
-        player_reserves = self.get_player_reserves(player_name)
-        return [unit for unit in player_reserves if unit.species == species]
+        return self.get_player_reserves(player_name).lookup("species", species)
 
     def get_amazon_ivory_magic_generation(self, player_name: str) -> int:
         """
@@ -371,7 +377,7 @@ class ReservesManager(QObject):
 
     def clear_player_reserves(self, player_name: str):
         """Clear all units from a player's Reserve Area."""
-        self.reserves_by_player[player_name] = []
+        self.reserves_by_player[player_name] = IndexedCollection(RESERVE_INDEXES)
 
     def set_current_turn(self, turn: int):
         """Set the current game turn."""
@@ -389,12 +395,12 @@ class ReservesManager(QObject):
     def import_reserves_state(self, state: Dict[str, Any]):
         """Import reserves state from save/load."""
         self.reserves_by_player = {
-            player: [ReserveUnit.from_dict(unit_data) for unit_data in units]
+            player: IndexedCollection(RESERVE_INDEXES, (ReserveUnit.from_dict(unit_data) for unit_data in units))
             for player, units in strict_get(state, "reserves_by_player").items()
         }
         self.current_turn = strict_get(state, "current_turn")
 
-    def get_all_reserves(self) -> Dict[str, List[ReserveUnit]]:
+    def get_all_reserves(self) -> Dict[str, IndexedCollection[ReserveUnit]]:
         """Get all reserves for all players."""
         return self.reserves_by_player.copy()
 
@@ -5,14 +5,38 @@ The Summoning Pool is where players' dragons are stored at the start of the game
 Dragons can be summoned from the pool to terrains, and when killed, they return to the pool.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from PySide6.QtCore import QObject, Signal
 
 from models.dragon_model import DragonModel
+from models.element_model import element_bit
+from models.game_state.indexed_collection import IndexedCollection, element_index, element_keys
 from models.minor_terrain_model import MinorTerrain, get_all_minor_terrain_objects
 
 
+def _type_index(dragon: DragonModel) -> Tuple[str, ...]:
+    return (dragon.dragon_type,)
+
+
+def _dragonkin_element_index(dragon: DragonModel) -> Tuple[int, ...]:
+    # Dragonkin are recognized by name, as in get_dragonkin_by_element
+    return element_keys(dragon.element_mask) if "dragonkin" in dragon.name.lower() else ()
+
+
+def _id_index(dragon: DragonModel) -> Tuple[str, ...]:
+    return (dragon.get_id(), dragon.name)
+
+
+# Per-player summoning pool indexes: element bit, dragon type, dragonkin element bit and id or name
+POOL_INDEXES = {
+    "element": element_index,
+    "type": _type_index,
+    "dragonkin_element": _dragonkin_element_index,
+    "id": _id_index,
+}
+
+
 class SummoningPoolManager(QObject):
     """Manages the Summoning Pool for all players."""
 
@@ -21,8 +45,8 @@ class SummoningPoolManager(QObject):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        # Player name -> List of DragonModel
-        self._player_pools: Dict[str, List[DragonModel]] = {}
+        # Player name -> DragonModels indexed by POOL_INDEXES
+        self._player_pools: Dict[str, IndexedCollection[DragonModel]] = {}
         # Player name -> List of MinorTerrain
         self._minor_terrain_pools: Dict[str, List[MinorTerrain]] = {}
         # Track summoned dragons: terrain_name -> List of dragon data
@@ -30,17 +54,14 @@ class SummoningPoolManager(QObject):
 
     def initialize_player_pool(self, player_name: str, initial_dragons: List[DragonModel]):
         """Initialize a player's summoning pool with their starting dragons."""
-        if player_name not in self._player_pools:
-            self._player_pools[player_name] = []
-
-        self._player_pools[player_name] = initial_dragons.copy()
+        self._player_pools[player_name] = IndexedCollection(POOL_INDEXES, initial_dragons)
         print(f"SummoningPoolManager: Initialized {player_name}'s pool with {len(initial_dragons)} dragons")
         self.pool_updated.emit(player_name)
 
     def add_dragon_to_pool(self, player_name: str, dragon: DragonModel):
         """Add a dragon to a player's summoning pool (e.g., when dragon is killed)."""
         if player_name not in self._player_pools:
-            self._player_pools[player_name] = []
+            self._player_pools[player_name] = IndexedCollection(POOL_INDEXES)
 
         self._player_pools[player_name].append(dragon)
         print(f"SummoningPoolManager: Added {dragon.name} to {player_name}'s summoning pool")
@@ -51,57 +72,53 @@ class SummoningPoolManager(QObject):
         if player_name not in self._player_pools:
             return None
 
-        pool = self._player_pools[player_name]
-        for i, dragon in enumerate(pool):
-            if dragon.get_id() == dragon_id or dragon.name == dragon_id:
-                removed_dragon = pool.pop(i)
-                print(f"SummoningPoolManager: Removed {removed_dragon.name} from {player_name}'s summoning pool")
-                self.pool_updated.emit(player_name)
-                return removed_dragon
+        removed_dragon = self._player_pools[player_name].pop_first("id", dragon_id)
+        if removed_dragon is not None:
+            print(f"SummoningPoolManager: Removed {removed_dragon.name} from {player_name}'s summoning pool")
+            self.pool_updated.emit(player_name)
+            return removed_dragon
 
         print(f"SummoningPoolManager: Dragon {dragon_id} not found in {player_name}'s pool")
         return None
 
     def get_player_pool(self, player_name: str) -> List[DragonModel]:
         """Get all dragons in a player's summoning pool."""
+        return self._get_player_dragons(player_name).items()
+
+    def _get_player_dragons(self, player_name: str) -> IndexedCollection[DragonModel]:
         if player_name not in self._player_pools:
             raise ValueError(
                 f"Player '{player_name}' not found in summoning pool system. Available players: {list(self._player_pools.keys())}"
             )
-        return self._player_pools[player_name].copy()
+        return self._player_pools[player_name]
 
     def get_available_dragons(self, player_name: str, dragon_type: Optional[str] = None) -> List[DragonModel]:
         """Get available dragons for summoning, optionally filtered by type."""
-        pool = self.get_player_pool(player_name)
-
         if dragon_type:
-            return [dragon for dragon in pool if dragon.dragon_type == dragon_type]
+            return self.get_dragons_by_type(player_name, dragon_type)
 
-        return pool
+        return self.get_player_pool(player_name)
 
     def has_dragons(self, player_name: str) -> bool:
         """Check if a player has any dragons in their summoning pool."""
-        return len(self.get_player_pool(player_name)) > 0
+        return self.get_dragon_count(player_name) > 0
 
     def get_dragon_count(self, player_name: str) -> int:
         """Get the number of dragons in a player's summoning pool."""
-        return len(self.get_player_pool(player_name))
+        return len(self._get_player_dragons(player_name))
 
     def get_dragons_by_element(self, player_name: str, element: str) -> List[DragonModel]:
         """Get dragons in a player's pool that match a specific element."""
-        pool = self.get_player_pool(player_name)
-        return [dragon for dragon in pool if element in dragon.elements]
+        return self._get_player_dragons(player_name).lookup("element", element_bit(element))
 
     def get_dragons_by_type(self, player_name: str, dragon_type: str) -> List[DragonModel]:
         """Get dragons in a player's pool that match a specific type."""
-        pool = self.get_player_pool(player_name)
-        return [dragon for dragon in pool if dragon.dragon_type == dragon_type]
+        return self._get_player_dragons(player_name).lookup("type", dragon_type)
 
     def get_dragonkin_by_element(self, player_name: str, element: str) -> List[DragonModel]:
         """Get dragonkin units in a player's pool that match a specific element."""
-        pool = self.get_player_pool(player_name)
-        # Filter for dragonkin (assuming they have "dragonkin" in their name or type)
-        return [dragon for dragon in pool if "dragonkin" in dragon.name.lower() and element in dragon.elements]
+        # Dragonkin are recognized by "dragonkin" in their name
+        return self._get_player_dragons(player_name).lookup("dragonkin_element", element_bit(element))
 
     def get_pool_statistics(self, player_name: str) -> Dict[str, Any]:
         """Get statistics about a player's summoning pool."""
@@ -141,22 +158,17 @@ class SummoningPoolManager(QObject):
 
     def can_summon_dragon(self, player_name: str, dragon_id: str) -> bool:
         """Check if a player can summon a specific dragon."""
-        pool = self.get_player_pool(player_name)
-        return any(dragon.get_id() == dragon_id or dragon.name == dragon_id for dragon in pool)
+        return self.find_dragon_in_pool(player_name, dragon_id) is not None
 
     def find_dragon_in_pool(self, player_name: str, dragon_id: str) -> Optional[DragonModel]:
         """Find a specific dragon in a player's pool."""
-        pool = self.get_player_pool(player_name)
-        for dragon in pool:
-            if dragon.get_id() == dragon_id or dragon.name == dragon_id:
-                return dragon
-        return None
+        return self._get_player_dragons(player_name).first("id", dragon_id)
 
     def clear_player_pool(self, player_name: str):
         """Clear all dragons from a player's summoning pool."""
         if player_name in self._player_pools:
             dragon_count = len(self._player_pools[player_name])
-            self._player_pools[player_name] = []
+            self._player_pools[player_name] = IndexedCollection(POOL_INDEXES)
             print(f"SummoningPoolManager: Cleared {dragon_count} dragons from {player_name}'s pool")
             self.pool_updated.emit(player_name)
 
@@ -319,7 +331,8 @@ class SummoningPoolManager(QObject):
     def get_minor_terrains_by_element(self, player_name: str, element: str) -> List[MinorTerrain]:
         """Get minor terrains in a player's pool that match a specific element."""
         pool = self.get_player_minor_terrain_pool(player_name)
-        return [terrain for terrain in pool if terrain.has_element(element)]
+        bit = element_bit(element)
+        return [terrain for terrain in pool if terrain.element_mask & bit]
 
     def get_minor_terrains_by_color(self, player_name: str, color: str) -> List[MinorTerrain]:
         """Get minor terrains in a player's pool that match a specific base terrain name."""
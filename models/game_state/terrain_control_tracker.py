@@ -0,0 +1,209 @@
+"""
+Incremental terrain control tracking for Dragon Dice.
+
+Keeps per-terrain army strength tallies up to date as armies move, units die or
+change armies, and terrains turn, so terrain control, eighth-face status and the
+number of terrains each player controls can be read without scanning every army.
+
+Control follows the Eighth Face rules used by EighthFaceManager: a terrain is only
+controlled when it shows its eighth face, by the player with the greatest army
+strength (unit count) there; ties leave it uncontrolled. A controller assigned with
+set_controller() (e.g. by GameStateManager.set_terrain_controller) takes precedence
+until it is cleared.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+ArmyKey = Tuple[str, str]  # (player_name, army_type)
+
+EIGHTH_FACE = 8
+
+
+def terrain_face(terrain_info: Dict[str, Any]) -> int:
+    """Current face of a terrain entry ("current_face", falling back to "face")."""
+    face = terrain_info.get("current_face")
+    if face is None:
+        face = terrain_info.get("face", 1)
+    return int(face)
+
+
+@dataclass
+class TerrainControl:
+    """Control status of a single terrain."""
+
+    terrain_name: str
+    face: int
+    controller: Optional[str] = None
+    control_strength: int = 0
+    player_strengths: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def at_eighth_face(self) -> bool:
+        return self.face == EIGHTH_FACE
+
+
+class TerrainControlTracker:
+    """
+    Tracks army strength per terrain and derives control incrementally.
+
+    Callers report changes with update_army(), remove_army(), update_terrain_face() and
+    set_controller(), or call sync() to pick up direct edits; only terrains touched since
+    the last query are re-evaluated.
+    """
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self) -> None:
+        self._army_positions: Dict[ArmyKey, Tuple[str, int]] = {}  # army -> (location, strength)
+        self._armies_at: Dict[str, Dict[ArmyKey, int]] = {}  # location -> army -> strength
+        self._faces: Dict[str, int] = {}
+        self._assigned_controllers: Dict[str, str] = {}
+        self._control: Dict[str, TerrainControl] = {}
+        self._controlled_counts: Dict[str, int] = {}
+        self._dirty: Set[str] = set()
+        self.terrains_evaluated = 0  # Running count of terrain re-evaluations
+
+    def rebuild(self, players: Dict[str, Dict[str, Any]], terrains: Dict[str, Dict[str, Any]]) -> None:
+        """Discard all tracked state and rebuild it from the full game state."""
+        self._reset()
+        self.sync(players, terrains)
+
+    def sync(self, players: Dict[str, Dict[str, Any]], terrains: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Pick up changes made directly on the state dicts rather than reported to the tracker.
+        Linear in terrains plus armies; only terrains that actually changed are marked for re-evaluation.
+        Armies no longer in players stop being tracked.
+        """
+        for terrain_name, terrain_info in terrains.items():
+            self.update_terrain_face(terrain_name, terrain_face(terrain_info))
+        current_armies: Set[ArmyKey] = set()
+        for player_name, player_data in players.items():
+            for army_type, army_data in player_data.get("armies", {}).items():
+                current_armies.add((player_name, army_type))
+                self.update_army(player_name, army_type, army_data)
+        for player_name, army_type in set(self._army_positions) - current_armies:
+            self.remove_army(player_name, army_type)
+
+    def update_army(self, player_name: str, army_type: str, army_data: Dict[str, Any]) -> List[str]:
+        """
+        Record an army's current location and strength.
+
+        Returns:
+            Locations whose army strengths changed (the army's previous and current location)
+        """
+        key = (player_name, army_type)
+        location = army_data.get("location")
+        if not location:
+            return self.remove_army(player_name, army_type)
+
+        strength = len(army_data.get("units", []))
+        if self._army_positions.get(key) == (location, strength):
+            return []
+
+        changed = self.remove_army(player_name, army_type)
+        self._army_positions[key] = (location, strength)
+        self._armies_at.setdefault(location, {})[key] = strength
+        self._dirty.add(location)
+        if location not in changed:
+            changed.append(location)
+        return changed
+
+    def remove_army(self, player_name: str, army_type: str) -> List[str]:
+        """Stop tracking an army; returns the location it left, if it was tracked."""
+        key = (player_name, army_type)
+        position = self._army_positions.pop(key, None)
+        if position is None:
+            return []
+        location = position[0]
+        armies = self._armies_at.get(location, {})
+        armies.pop(key, None)
+        if not armies:
+            self._armies_at.pop(location, None)
+        self._dirty.add(location)
+        return [location]
+
+    def update_terrain_face(self, terrain_name: str, face: int) -> None:
+        """Record a terrain's current face."""
+        if self._faces.get(terrain_name) != face:
+            self._faces[terrain_name] = face
+            self._dirty.add(terrain_name)
+
+    def set_controller(self, terrain_name: str, player_name: Optional[str]) -> None:
+        """Assign a terrain's controller, overriding army strength; None clears the assignment."""
+        if player_name is None:
+            if self._assigned_controllers.pop(terrain_name, None) is None:
+                return
+        elif self._assigned_controllers.get(terrain_name) == player_name:
+            return
+        else:
+            self._assigned_controllers[terrain_name] = player_name
+        self._dirty.add(terrain_name)
+
+    def armies_at(self, location: str) -> Dict[ArmyKey, int]:
+        """Armies at a location with their strengths."""
+        return dict(self._armies_at.get(location, {}))
+
+    def get_terrain_control(self, terrain_name: str) -> TerrainControl:
+        """Control status of one terrain."""
+        self._flush()
+        return self._control[terrain_name]
+
+    def get_all_terrain_control(self) -> Dict[str, TerrainControl]:
+        """Control status of every tracked terrain."""
+        self._flush()
+        return dict(self._control)
+
+    def get_controlled_terrain_counts(self) -> Dict[str, int]:
+        """Number of terrains each player controls."""
+        self._flush()
+        return dict(self._controlled_counts)
+
+    def get_controlled_terrains(self, player_name: str) -> List[str]:
+        """Names of the terrains a player controls."""
+        self._flush()
+        return [name for name, control in self._control.items() if control.controller == player_name]
+
+    def get_assigned_terrains(self, player_name: str) -> List[str]:
+        """Names of the terrains assigned to a player with set_controller()."""
+        return [name for name, controller in self._assigned_controllers.items() if controller == player_name]
+
+    @property
+    def total_terrains(self) -> int:
+        return len(self._faces)
+
+    def _flush(self) -> None:
+        """Re-evaluate terrains changed since the last query."""
+        for terrain_name in self._dirty:
+            if terrain_name in self._faces:
+                self._evaluate(terrain_name)
+        self._dirty.clear()
+
+    def _evaluate(self, terrain_name: str) -> None:
+        self.terrains_evaluated += 1
+        previous = self._control.get(terrain_name)
+        if previous and previous.controller:
+            self._controlled_counts[previous.controller] -= 1
+            if not self._controlled_counts[previous.controller]:
+                del self._controlled_counts[previous.controller]
+
+        player_strengths: Dict[str, int] = {}
+        for (player_name, _army_type), strength in self._armies_at.get(terrain_name, {}).items():
+            player_strengths[player_name] = player_strengths.get(player_name, 0) + strength
+
+        control = TerrainControl(terrain_name, self._faces[terrain_name], player_strengths=player_strengths)
+        assigned_controller = self._assigned_controllers.get(terrain_name)
+        if assigned_controller is not None:
+            control.controller = assigned_controller
+            control.control_strength = player_strengths.get(assigned_controller, 0)
+            self._controlled_counts[assigned_controller] = self._controlled_counts.get(assigned_controller, 0) + 1
+        elif control.at_eighth_face and player_strengths:
+            control.control_strength = max(player_strengths.values())
+            leaders = [player for player, strength in player_strengths.items() if strength == control.control_strength]
+            # If there's a tie, no one controls the terrain
+            if len(leaders) == 1:
+                control.controller = leaders[0]
+                self._controlled_counts[control.controller] = self._controlled_counts.get(control.controller, 0) + 1
+
+        self._control[terrain_name] = control
@@ -1,5 +1,6 @@
 from typing import Dict, List, Optional
 
+from models.element_model import element_bit, element_mask
 from models.terrain_model import Terrain
 
 
@@ -1163,8 +1164,8 @@ def get_all_minor_terrain_objects() -> List[MinorTerrain]:
 
 def get_minor_terrains_by_element(element: str) -> List[MinorTerrain]:
     """Get all minor terrains that contain a specific element."""
-    element = element.upper()
-    return [terrain for terrain in MINOR_TERRAIN_DATA.values() if terrain.has_element(element)]
+    bit = element_bit(element)
+    return [terrain for terrain in MINOR_TERRAIN_DATA.values() if terrain.element_mask & bit]
 
 
 def get_minor_terrains_by_base_name(base_name: str) -> List[MinorTerrain]:
@@ -1178,8 +1179,8 @@ def get_minor_terrains_by_base_name(base_name: str) -> List[MinorTerrain]:
 
 def get_minor_terrains_by_elements(elements: List[str]) -> List[MinorTerrain]:
     """Get all minor terrains that have the specified elements."""
-    elements_set = {elem.upper() for elem in elements}
-    return [terrain for terrain in MINOR_TERRAIN_DATA.values() if set(terrain.elements) == elements_set]
+    mask = element_mask(elements)
+    return [terrain for terrain in MINOR_TERRAIN_DATA.values() if terrain.element_mask == mask]
 
 
 def get_minor_terrains_by_eighth_face(eighth_face: str) -> List[MinorTerrain]:
@@ -5,9 +5,29 @@ This module handles the complex SAI calculations and interactions during combat,
 including cantrips, combat modifications, and other special effects.
 """
 
+from array import array
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
-
+from itertools import chain
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from models.die_face_codes import (
+    FACE_APPLIES_MASKS,
+    FACE_GRANTS_REROLL,
+    FACE_SAI_KINDS,
+    GENERIC_SAI_CODE,
+    RESULT_ID,
+    RESULT_MAGIC,
+    RESULT_MANEUVER,
+    RESULT_MELEE,
+    RESULT_MISSILE,
+    RESULT_SAI,
+    RESULT_SAVE,
+    ROLL_CONTEXT_BITS,
+    RollCodes,
+    count_results,
+    encode_roll_results,
+)
+from models.sai_registry import SAI_REGISTRY
 from utils.field_access import strict_get, strict_get_optional
 
 
@@ -113,6 +133,32 @@ class CombatRollResult:
     targeting_results: List[TargetingResult] = field(default_factory=list)  # Applied targeting results
 
 
+# Result types tallied per roll, with the result kind each counts
+RAW_RESULT_KINDS: Dict[str, int] = {
+    "melee": RESULT_MELEE,
+    "missile": RESULT_MISSILE,
+    "magic": RESULT_MAGIC,
+    "save": RESULT_SAVE,
+    "maneuver": RESULT_MANEUVER,
+    "id": RESULT_ID,
+    "sai": RESULT_SAI,
+}
+# Result types carried through the 10-step resolution
+RESOLVED_RESULT_TYPES = ["melee", "missile", "magic", "save", "maneuver"]
+
+
+@dataclass
+class BatchRollResult:
+    """Totals for a stack of rolls resolved together; each column has one entry per roll, in stack order."""
+
+    raw: Dict[str, array] = field(default_factory=dict)  # Keyed by RAW_RESULT_KINDS
+    final: Dict[str, array] = field(default_factory=dict)  # Keyed by RESOLVED_RESULT_TYPES
+    modifiers: List[List[RollModifier]] = field(default_factory=list)  # Every modifier each roll generated
+
+    def __len__(self) -> int:
+        return len(self.modifiers)
+
+
 class SAIProcessor:
     """
     Processes Special Action Icons (SAIs) and their effects during combat.
@@ -122,95 +168,28 @@ class SAIProcessor:
     and special abilities.
     """
 
-    # Comprehensive SAI registry from special_action_icons.md
-    SAI_REGISTRY = {
-        "attune": {
-            "applies": ["magic"],
-            "description": "During a magic action, Attune generates X magic results of any element. Attune may also change the normal (non-ID, non-SAI) magic results of one unit in the marching army to the same element as the Attune magic results.",
-        },
-        "bash": {
-            "applies": ["dragon_attack", "save"],
-            "description": "During a save roll against a melee attack, target one unit from the attacking army. The targeted unit takes damage equal to the melee results it generated. The targeted unit must make a save roll against this damage. Bash also generates save results equal to the targeted unit's melee results. During other save rolls, Bash generates X save results. During a dragon attack choose an attacking dragon that has inflicted damage. That dragon takes damage equal to the amount of damage it inflicted. Bash also generates save results equal to the damage the chosen dragon did.",
-        },
-        "belly": {"applies": ["any"], "description": "During any roll, the unit loses its automatic save results."},
-        "breath": {
-            "applies": ["melee"],
-            "description": "During a melee attack, target X health-worth of units in the defending army. The targets are killed.",
-        },
-        "bullseye": {
-            "applies": ["dragon_attack", "missile"],
-            "description": "During a missile attack, target X health-worth of units in the defending army. The targets make a save roll. Those that do not generate a save result are killed. Roll this unit again and apply the new result as well. During a dragon attack, Bullseye generates X missile results.",
-        },
-        "cantrip": {
-            "applies": ["magic", "non_maneuver"],
-            "description": "During a magic action or Magic Negation (Frostwings - page 23) roll, Cantrip generates X magic results. During other non-maneuver rolls, Cantrip generates X magic results that only allow you to cast spells marked as 'Cantrip' from the spell list.",
-        },
-        "charge": {
-            "applies": ["melee"],
-            "description": "During a melee attack, the attacking army counts all Maneuver results as if they were Melee results. Instead of making a regular save roll or a counter-attack, the defending army makes a combination save and melee roll. The attacking army takes damage equal to these melee results. Only save results generated by spells may reduce this damage. Charge has no effect during a counter-attack.",
-        },
-        "charm": {
-            "applies": ["melee"],
-            "description": "During a melee attack, target up to X health-worth of units in the defending army; those units don't roll to save during this march. Instead, the owner rolls these units and adds their results to the attacking army's results. Those units may take damage from the melee attack as normal.",
-        },
-        "choke": {
-            "applies": ["melee"],
-            "description": "During a melee attack, this effect is delayed until after the target army rolls for saves. Target up to X healthworth of units in the that army that rolled an ID icon. The targets are killed. None of their results are counted towards the army's save results.",
-        },
-        "cloak": {
-            "applies": ["dragon_attack", "individual", "magic", "save"],
-            "description": "During a save roll or dragon attack, add X non-magical save results to the army containing this unit until the beginning of your next turn. During a magic action, Cloak generates X magic results. During a roll for an individual-targeting effect, Cloak generates X magic, maneuver, melee, missile, or save results.",
-        },
-        "coil": {
-            "applies": ["dragon_attack", "melee"],
-            "description": "During a melee attack, target one unit in the defending army. The target takes X damage and makes a combination roll, counting save and melee results. Any melee results that the target generates inflict damage on the Coiling unit with no save possible. During a dragon attack, Coil generates X melee results.",
-        },
-        "confuse": {
-            "applies": ["melee", "missile"],
-            "description": "During a melee or missile attack, this effect is delayed until after the target army rolls for saves. Target up to X health-worth of units in the that army. Re-roll the targeted units, ignoring all previous results.",
-        },
-        "convert": {
-            "applies": ["melee"],
-            "description": "During a melee attack, target up to X health-worth of units in the defending army. The targets make a save roll. Those that do not generate a save result are killed. The attacking player may return up to the amount of heath-worth killed this way from their DUA to the attacking army.",
-        },
-        "counter": {
-            "applies": ["dragon_attack", "melee", "save"],
-            "description": "During a save roll against a melee attack, Counter generates X save results and inflicts X damage upon the attacking army. Only save results generated by spells may reduce this damage. During any other save roll, Counter generates X save results. During a melee attack, Counter generates X melee results. During a dragon attack, Counter generates X save and X melee results.",
-        },
-        "create_fireminions": {
-            "applies": ["any_non_individual"],
-            "description": "During any army roll, Create Fireminions generates X magic, maneuver, melee, missile or save results.",
-        },
-        "crush": {
-            "applies": ["dragon_attack", "missile"],
-            "description": "During a missile attack, target up to X healthworth of units in the defending army. The targets make a maneuver roll. Those that do not generate a maneuver result are killed. Each unit killed must make a save roll. Those that do not generate a save result on this second roll are buried. During a dragon attack, Crush generates X missile results.",
-        },
-        "decapitate": {
-            "applies": ["melee", "dragon_attack"],
-            "description": "During a melee attack, this effect is delayed until after the target army rolls for saves. Target one unit that rolled an ID icon. The target is killed. None of their results are counted towards the army's save results. During a dragon attack, kill one dragon that rolled Jaws. If no dragon rolled Jaws, Decapitate generates three melee results.",
-        },
-        "elevate": {
-            "applies": ["dragon_attack", "maneuver", "missile", "save"],
-            "description": "During a maneuver roll, Elevate generates X maneuver results. During a missile attack, double one unit's missile results. During a save roll against a melee attack, double one unit's save results. During a dragon attack, double one unit's missile or save results.",
-        },
-        "fly": {"applies": ["any"], "description": "During any roll, Fly generates X maneuver or X save results."},
-        "regenerate": {
-            "applies": ["non_maneuver"],
-            "description": "During any non-maneuver roll, choose one: Regenerate generates X save results, OR, you may return up to X health-worth of units from your DUA to the army containing this unit.",
-        },
-        "rend": {
-            "applies": ["dragon_attack", "maneuver", "melee"],
-            "description": "During a melee or dragon attack, Rend generates X melee results. Roll this unit again and apply the new result as well. During a maneuver roll, Rend generates X maneuver results.",
-        },
-        "trample": {
-            "applies": ["any"],
-            "description": "During any roll, Trample generates X maneuver and X melee results.",
-        },
-        "vanish": {
-            "applies": ["save"],
-            "description": "During a save roll, Vanish generates X save results. The unit may then move to any terrain or its Reserve Area. If the unit moves, the save results still apply to the army that the Vanishing unit left.",
-        },
-        # More SAIs can be added incrementally as needed
+    # SAI rules registry (see models.sai_registry)
+    SAI_REGISTRY = SAI_REGISTRY
+
+    # Effect handler method for each implemented SAI; SAIs without one are noted as unimplemented
+    SAI_EFFECT_HANDLERS: Dict[str, str] = {
+        "cantrip": "_apply_cantrip_effect",
+        "bash": "_apply_bash_effect",
+        "bullseye": "_apply_bullseye_effect",
+        "counter": "_apply_counter_effect",
+        "fly": "_apply_fly_effect",
+        "regenerate": "_apply_regenerate_effect",
+        "rend": "_apply_rend_effect",
+        "trample": "_apply_trample_effect",
+        "vanish": "_apply_vanish_effect",
+        "attune": "_apply_attune_effect",
+        "belly": "_apply_belly_effect",
+        "breath": "_apply_breath_effect",
+        "charge": "_apply_charge_effect",
+        "charm": "_apply_charm_effect",
+        "choke": "_apply_choke_effect",
+        "cloak": "_apply_cloak_effect",
+        "elevate": "_apply_elevate_effect",
     }
 
     def __init__(self, unit_roster=None, dua_manager=None):
@@ -228,9 +207,16 @@ class SAIProcessor:
         self._targeting_restrictions = {}  # Track what's already been targeted
         self._pending_targeting_requests = []  # Requests waiting for UI resolution
 
+        # Bound effect handler per SAI face code, so applying a rolled SAI is a single lookup
+        self._sai_effect_handlers: Dict[int, Callable[..., None]] = {
+            code: getattr(self, self.SAI_EFFECT_HANDLERS[sai_name])
+            for code, sai_name in enumerate(FACE_SAI_KINDS)
+            if sai_name in self.SAI_EFFECT_HANDLERS
+        }
+
     def process_combat_roll(
         self,
-        roll_results: Dict[str, List[str]],
+        roll_results: Dict[str, Union[List[str], RollCodes]],
         combat_type: str,
         army_units: List[Dict[str, Any]],
         is_attacker: bool = True,
@@ -243,7 +229,7 @@ class SAIProcessor:
         Process a complete combat roll including SAI effects.
 
         Args:
-            roll_results: Dictionary of unit_name -> face_results
+            roll_results: Dictionary of unit_name -> face_results (entered strings or encoded RollCodes)
             combat_type: Type of combat ("melee", "missile", "magic")
             army_units: List of unit data for the army
             is_attacker: Whether this is the attacking army
@@ -252,45 +238,21 @@ class SAIProcessor:
             CombatRollResult with all calculations
         """
         result = CombatRollResult()
+        unit_counts = self._count_unit_results(encode_roll_results(roll_results))
 
-        # Count raw results
-        for _unit_name, face_results in roll_results.items():
-            for face_result in face_results:
-                if face_result:
-                    normalized = face_result.lower().strip()
-
-                    if normalized in ["m", "melee"]:
-                        result.raw_melee += 1
-                    elif normalized in ["mi", "missile"]:
-                        result.raw_missile += 1
-                    elif normalized in ["mg", "magic"]:
-                        result.raw_magic += 1
-                    elif normalized in ["s", "save"]:
-                        result.raw_save += 1
-                    elif normalized in ["ma", "maneuver"]:
-                        result.raw_maneuver += 1
-                    elif normalized in ["id"]:
-                        result.raw_id += 1
-                    elif normalized in ["sai"]:
-                        result.raw_sai += 1
-
-        # Start with raw results
-        result.final_melee = result.raw_melee
-        result.final_missile = result.raw_missile
-        result.final_magic = result.raw_magic
-        result.final_save = result.raw_save
-        result.final_maneuver = result.raw_maneuver
+        # Count raw results and start with them as the final results
+        self._count_raw_results(result, unit_counts)
 
         # Process SAI effects
         if result.raw_sai > 0:
-            self._process_sai_effects(result, roll_results, combat_type, army_units, is_attacker)
+            self._process_sai_effects(result, unit_counts, combat_type, army_units, is_attacker)
 
         # Add ID face bonuses (ID faces generate results equal to unit health)
-        self._process_id_faces(result, roll_results, army_units, combat_type, terrain_eighth_face_controlled)
+        self._process_id_faces(result, unit_counts, army_units, combat_type, terrain_eighth_face_controlled)
 
         # Process species abilities
         self._process_species_abilities(
-            result, roll_results, army_units, combat_type, is_attacker, terrain_elements, player_name, opponent_name
+            result, unit_counts, army_units, combat_type, is_attacker, terrain_elements, player_name, opponent_name
         )
 
         return result
@@ -298,7 +260,7 @@ class SAIProcessor:
     def _process_sai_effects(
         self,
         result: CombatRollResult,
-        roll_results: Dict[str, List[str]],
+        unit_counts: Dict[str, List[int]],
         combat_type: str,
         army_units: List[Dict[str, Any]],
         is_attacker: bool,
@@ -309,8 +271,8 @@ class SAIProcessor:
         # In a full implementation, this would look up specific SAI effects
         # from unit definitions and spell/ability databases
 
-        for unit_name, face_results in roll_results.items():
-            sai_count = sum(1 for face in face_results if face.lower().strip() == "sai")
+        for unit_name, counts in unit_counts.items():
+            sai_count = counts[RESULT_SAI]
 
             if sai_count > 0:
                 # Find the unit data
@@ -380,15 +342,15 @@ class SAIProcessor:
     def _process_id_faces(
         self,
         result: CombatRollResult,
-        roll_results: Dict[str, List[str]],
+        unit_counts: Dict[str, List[int]],
         army_units: List[Dict[str, Any]],
         combat_type: str,
         terrain_eighth_face_controlled: bool = False,
     ):
         """Process ID face bonuses."""
 
-        for unit_name, face_results in roll_results.items():
-            id_count = sum(1 for face in face_results if face.lower().strip() == "id")
+        for unit_name, counts in unit_counts.items():
+            id_count = counts[RESULT_ID]
 
             if id_count > 0:
                 # Find unit health for ID bonus calculation
@@ -421,7 +383,7 @@ class SAIProcessor:
     def _process_species_abilities(
         self,
         result: CombatRollResult,
-        roll_results: Dict[str, List[str]],
+        unit_counts: Dict[str, List[int]],
         army_units: List[Dict[str, Any]],
         combat_type: str,
         is_attacker: bool,
@@ -435,7 +397,7 @@ class SAIProcessor:
             terrain_elements = []  # Would get from terrain data in full implementation
 
         # Process each unit's species abilities
-        for unit_name, face_results in roll_results.items():
+        for unit_name, counts in unit_counts.items():
             unit_data = self._find_unit_data(unit_name, army_units)
             if not unit_data:
                 continue
@@ -450,7 +412,7 @@ class SAIProcessor:
                 and "fire" in terrain_elements
             ):
                 # Count save results for this unit
-                save_count = sum(1 for face in face_results if face.lower().strip() in ["s", "save"])
+                save_count = counts[RESULT_SAVE]
 
                 if save_count > 0:
                     # Convert saves to melee for counter-attack
@@ -467,7 +429,7 @@ class SAIProcessor:
             # Mountain Master: Dwarves count melee results as maneuver results at earth terrain
             if species == "Dwarves" and combat_type == "maneuver" and "earth" in terrain_elements:
                 # Count melee results for this unit
-                melee_count = sum(1 for face in face_results if face.lower().strip() in ["m", "melee"])
+                melee_count = counts[RESULT_MELEE]
 
                 if melee_count > 0:
                     # Convert melee to maneuver
@@ -484,7 +446,7 @@ class SAIProcessor:
             # Swamp Master: Goblins count melee results as maneuver results at earth terrain
             if species == "Goblins" and combat_type == "maneuver" and "earth" in terrain_elements:
                 # Count melee results for this unit
-                melee_count = sum(1 for face in face_results if face.lower().strip() in ["m", "melee"])
+                melee_count = counts[RESULT_MELEE]
 
                 if melee_count > 0:
                     # Convert melee to maneuver
@@ -507,7 +469,7 @@ class SAIProcessor:
                 and "air" in terrain_elements
             ):
                 # Count maneuver results for this unit
-                maneuver_count = sum(1 for face in face_results if face.lower().strip() in ["ma", "maneuver"])
+                maneuver_count = counts[RESULT_MANEUVER]
 
                 if maneuver_count > 0:
                     # Convert maneuver to melee for counter-attack
@@ -529,7 +491,7 @@ class SAIProcessor:
                 and "fire" in terrain_elements
             ):
                 # Count save results for this unit
-                save_count = sum(1 for face in face_results if face.lower().strip() in ["s", "save"])
+                save_count = counts[RESULT_SAVE]
 
                 if save_count > 0:
                     # Convert saves to melee for attack
@@ -551,7 +513,7 @@ class SAIProcessor:
                 and "water" in terrain_elements
             ):
                 # Count maneuver results for this unit
-                maneuver_count = sum(1 for face in face_results if face.lower().strip() in ["ma", "maneuver"])
+                maneuver_count = counts[RESULT_MANEUVER]
 
                 if maneuver_count > 0:
                     # Convert maneuver to save
@@ -580,7 +542,7 @@ class SAIProcessor:
 
             # Coral Elves missile results count as saves during save rolls (existing ability from rules)
             if species == "Coral Elves" and combat_type == "save" and not is_attacker:
-                missile_count = sum(1 for face in face_results if face.lower().strip() in ["mi", "missile"])
+                missile_count = counts[RESULT_MISSILE]
                 if missile_count > 0:
                     result.final_save += missile_count
                     result.sai_results.append(
@@ -600,7 +562,7 @@ class SAIProcessor:
                 and "water" in terrain_elements
             ):
                 # Count maneuver results for this unit
-                maneuver_count = sum(1 for face in face_results if face.lower().strip() in ["ma", "maneuver"])
+                maneuver_count = counts[RESULT_MANEUVER]
 
                 if maneuver_count > 0:
                     # Convert maneuver to save specifically against missile damage
@@ -619,7 +581,7 @@ class SAIProcessor:
                 # Amazon magic results can be any element present in the terrain
                 # This is handled differently - we note that their magic is terrain-element flexible
                 # The actual element assignment happens during spell casting
-                amazon_magic_count = sum(1 for face in face_results if face.lower().strip() in ["mg", "magic"])
+                amazon_magic_count = counts[RESULT_MAGIC]
 
                 if amazon_magic_count > 0:
                     result.special_notes.append(
@@ -632,7 +594,7 @@ class SAIProcessor:
 
             # Coral Elves: Missile results count as saves during save rolls
             if species == "Coral Elves" and combat_type == "save" and not is_attacker:
-                missile_count = sum(1 for face in face_results if face.lower().strip() in ["mi", "missile"])
+                missile_count = counts[RESULT_MISSILE]
                 if missile_count > 0:
                     result.final_save += missile_count
                     result.sai_results.append(
@@ -653,7 +615,7 @@ class SAIProcessor:
             # Bone Magic (Undead): Additional magic results based on DUA count
             if species == "Undead" and combat_type == "magic" and is_attacker and self.dua_manager and player_name:
                 # Count non-ID magic results for this unit
-                non_id_magic_count = sum(1 for face in face_results if face.lower().strip() in ["mg", "magic"])
+                non_id_magic_count = counts[RESULT_MAGIC]
 
                 if non_id_magic_count > 0:
                     # Get dead Undead count from DUA (max 4)
@@ -700,7 +662,7 @@ class SAIProcessor:
                 and player_name
             ):
                 dead_lava_elves_count = self._get_dua_species_count(player_name, "Lava Elves", max_count=3)
-                missile_count = sum(1 for face in face_results if face.lower().strip() in ["mi", "missile"])
+                missile_count = counts[RESULT_MISSILE]
 
                 if dead_lava_elves_count > 0 and missile_count > 0:
                     cursed_missile_count = min(dead_lava_elves_count, missile_count)
@@ -728,7 +690,9 @@ class SAIProcessor:
 
         return count
 
-    def calculate_cantrip_magic(self, roll_results: Dict[str, List[str]], army_units: List[Dict[str, Any]]) -> int:
+    def calculate_cantrip_magic(
+        self, roll_results: Dict[str, Union[List[str], RollCodes]], army_units: List[Dict[str, Any]]
+    ) -> int:
         """
         Calculate magic points available from cantrip SAIs.
 
@@ -741,8 +705,8 @@ class SAIProcessor:
         """
         cantrip_magic = 0
 
-        for unit_name, face_results in roll_results.items():
-            sai_count = sum(1 for face in face_results if face.lower().strip() == "sai")
+        for unit_name, counts in self._count_unit_results(encode_roll_results(roll_results)).items():
+            sai_count = counts[RESULT_SAI]
 
             if sai_count > 0:
                 # Check if this unit has cantrip ability
@@ -841,27 +805,20 @@ class SAIProcessor:
         return "\n".join(lines)
 
     # New 10-step resolution engine methods
-    def _count_raw_results(self, result: CombatRollResult, roll_results: Dict[str, List[str]]):
+    def _count_unit_results(self, coded_rolls: Dict[str, RollCodes]) -> Dict[str, List[int]]:
+        """Count each unit's results by kind (indexed by the RESULT_* constants)."""
+        return {unit_name: count_results(codes) for unit_name, codes in coded_rolls.items()}
+
+    def _count_raw_results(self, result: CombatRollResult, unit_counts: Dict[str, List[int]]):
         """Step 1: Count the raw die face results."""
-        for _unit_name, face_results in roll_results.items():
-            for face_result in face_results:
-                if face_result:
-                    normalized = face_result.lower().strip()
-
-                    if normalized in ["m", "melee"]:
-                        result.raw_melee += 1
-                    elif normalized in ["mi", "missile"]:
-                        result.raw_missile += 1
-                    elif normalized in ["mg", "magic"]:
-                        result.raw_magic += 1
-                    elif normalized in ["s", "save"]:
-                        result.raw_save += 1
-                    elif normalized in ["ma", "maneuver"]:
-                        result.raw_maneuver += 1
-                    elif normalized in ["id"]:
-                        result.raw_id += 1
-                    elif normalized in ["sai"]:
-                        result.raw_sai += 1
+        for counts in unit_counts.values():
+            result.raw_melee += counts[RESULT_MELEE]
+            result.raw_missile += counts[RESULT_MISSILE]
+            result.raw_magic += counts[RESULT_MAGIC]
+            result.raw_save += counts[RESULT_SAVE]
+            result.raw_maneuver += counts[RESULT_MANEUVER]
+            result.raw_id += counts[RESULT_ID]
+            result.raw_sai += counts[RESULT_SAI]
 
         # Initialize final results with raw results
         result.final_melee = result.raw_melee
@@ -874,7 +831,7 @@ class SAIProcessor:
         self,
         result: CombatRollResult,
         delayed_effects: List[DelayedEffect],
-        roll_results: Dict[str, List[str]],
+        coded_rolls: Dict[str, RollCodes],
         army_units: List[Dict[str, Any]],
     ):
         """Step 2: Apply delayed SAI effects from attacker's roll."""
@@ -886,15 +843,15 @@ class SAIProcessor:
     def _process_reroll_effects(
         self,
         result: CombatRollResult,
-        roll_results: Dict[str, List[str]],
+        coded_rolls: Dict[str, RollCodes],
         army_units: List[Dict[str, Any]],
         combat_type: str,
     ):
         """Step 3: Process re-roll effects like Bullseye."""
         # Identify units with re-roll SAIs
-        for unit_name, face_results in roll_results.items():
-            for face_result in face_results:
-                if face_result and "bullseye" in face_result.lower():
+        for unit_name, codes in coded_rolls.items():
+            for code in codes:
+                if FACE_GRANTS_REROLL[code]:
                     # Bullseye allows re-rolling the unit
                     reroll = RerollEffect(
                         unit_name=unit_name,
@@ -910,7 +867,7 @@ class SAIProcessor:
     def _identify_and_apply_sai_effects(
         self,
         result: CombatRollResult,
-        roll_results: Dict[str, List[str]],
+        coded_rolls: Dict[str, RollCodes],
         combat_type: str,
         army_units: List[Dict[str, Any]],
         is_attacker: bool,
@@ -918,21 +875,20 @@ class SAIProcessor:
     ):
         """Step 4: Identify and apply SAI effects."""
         # Process SAI faces to generate modifiers
-        for unit_name, face_results in roll_results.items():
+        for unit_name, codes in coded_rolls.items():
             # Collect all SAI faces (including specific SAI names)
-            sai_faces = [face for face in face_results if self._is_sai_face(face)]
+            sai_faces = [code for code in codes if self._is_sai_face(code)]
 
             if sai_faces:
                 unit_data = self._find_unit_data(unit_name, army_units)
                 if unit_data:
                     self._generate_sai_modifiers(result, unit_data, sai_faces, combat_type, is_attacker)
 
-    def _is_sai_face(self, face_result: str) -> bool:
-        """Check if a face result is an SAI face."""
-        face_name = face_result.lower().strip()
+    def _is_sai_face(self, code: int) -> bool:
+        """Check if a face code is an SAI face."""
         return (
-            face_name == "sai"  # Generic SAI
-            or face_name in self.SAI_REGISTRY  # Specific SAI
+            code == GENERIC_SAI_CODE  # Generic SAI
+            or bool(FACE_SAI_KINDS[code])  # Specific SAI
         )
 
     def _determine_die_type(self, unit_data: Dict[str, Any]) -> str:
@@ -976,94 +932,50 @@ class SAIProcessor:
         self,
         result: CombatRollResult,
         unit_data: Dict[str, Any],
-        sai_faces_rolled: List[str],
+        sai_faces_rolled: List[int],
         combat_type: str,
         is_attacker: bool,
     ):
-        """Generate modifiers from SAI effects using the comprehensive SAI registry."""
+        """Generate modifiers from a unit's rolled SAI faces in one pass through the handler registry."""
         unit_name = strict_get(unit_data, "name", "Unit")
+        roll_type_mask = self._roll_type_mask(combat_type, is_attacker)
+        x_value: Optional[int] = None
 
-        # Process each SAI face rolled
         for sai_face in sai_faces_rolled:
-            sai_name = sai_face.lower().strip()
-
             # Skip generic "sai" faces - they need specific SAI identification
-            if sai_name == "sai":
+            if sai_face == GENERIC_SAI_CODE:
+                continue
+            # Skip SAIs that don't apply to this roll type
+            if not FACE_APPLIES_MASKS[sai_face] & roll_type_mask:
                 continue
 
-            # Look up SAI in registry
-            if sai_name in self.SAI_REGISTRY:
-                sai_info = self.SAI_REGISTRY[sai_name]
-                self._apply_specific_sai_effect(result, unit_data, sai_name, sai_info, 1, combat_type, is_attacker)
-            else:
-                # Unknown SAI - log for debugging
-                result.special_notes.append(f"Unknown SAI: {sai_name} on {unit_name}")
+            # X-value depends only on the unit's die type, so it is worked out once per unit
+            if x_value is None:
+                x_value = self._calculate_x_value_for_sai(self._determine_die_type(unit_data), 1)
+            self._apply_specific_sai_effect(result, unit_name, sai_face, x_value, combat_type, is_attacker)
 
     def _apply_specific_sai_effect(
         self,
         result: CombatRollResult,
-        unit_data: Dict[str, Any],
-        sai_name: str,
-        sai_info: Dict[str, Any],
-        icons_rolled: int,
+        unit_name: str,
+        sai_face: int,
+        x_value: int,
         combat_type: str,
         is_attacker: bool,
     ):
-        """Apply a specific SAI effect based on the rules registry."""
-        unit_name = strict_get(unit_data, "name", "Unit")
-
-        # Check if this SAI applies to the current roll type
-        applies_to: List[str] = strict_get_optional(sai_info, "applies", [])
-        current_roll_type = self._normalize_roll_type(combat_type, is_attacker)
-
-        if not ("any" in applies_to or current_roll_type in applies_to):
-            return  # SAI doesn't apply to this roll type
-
-        # Calculate X-value based on die type and face data
-        # For now, assume 6-sided dice unless unit data indicates otherwise
-        die_type = self._determine_die_type(unit_data)
-        x_value = self._calculate_x_value_for_sai(die_type, icons_rolled)
-
-        # Apply specific SAI effects
-        if sai_name == "cantrip":
-            self._apply_cantrip_effect(result, unit_name, x_value, combat_type, is_attacker)
-        elif sai_name == "bash":
-            self._apply_bash_effect(result, unit_name, x_value, combat_type, is_attacker)
-        elif sai_name == "bullseye":
-            self._apply_bullseye_effect(result, unit_name, x_value, combat_type, is_attacker)
-        elif sai_name == "counter":
-            self._apply_counter_effect(result, unit_name, x_value, combat_type, is_attacker)
-        elif sai_name == "fly":
-            self._apply_fly_effect(result, unit_name, x_value, combat_type, is_attacker)
-        elif sai_name == "regenerate":
-            self._apply_regenerate_effect(result, unit_name, x_value, combat_type, is_attacker)
-        elif sai_name == "rend":
-            self._apply_rend_effect(result, unit_name, x_value, combat_type, is_attacker)
-        elif sai_name == "trample":
-            self._apply_trample_effect(result, unit_name, x_value, combat_type, is_attacker)
-        elif sai_name == "vanish":
-            self._apply_vanish_effect(result, unit_name, x_value, combat_type, is_attacker)
-        elif sai_name == "attune":
-            self._apply_attune_effect(result, unit_name, x_value, combat_type, is_attacker)
-        elif sai_name == "belly":
-            self._apply_belly_effect(result, unit_name, x_value, combat_type, is_attacker)
-        elif sai_name == "breath":
-            self._apply_breath_effect(result, unit_name, x_value, combat_type, is_attacker)
-        elif sai_name == "charge":
-            self._apply_charge_effect(result, unit_name, x_value, combat_type, is_attacker)
-        elif sai_name == "charm":
-            self._apply_charm_effect(result, unit_name, x_value, combat_type, is_attacker)
-        elif sai_name == "choke":
-            self._apply_choke_effect(result, unit_name, x_value, combat_type, is_attacker)
-        elif sai_name == "cloak":
-            self._apply_cloak_effect(result, unit_name, x_value, combat_type, is_attacker)
-        elif sai_name == "elevate":
-            self._apply_elevate_effect(result, unit_name, x_value, combat_type, is_attacker)
-        # Add more specific SAI implementations here
+        """Apply one SAI face's effect through its registered handler."""
+        handler = self._sai_effect_handlers.get(sai_face)
+        if handler:
+            handler(result, unit_name, x_value, combat_type, is_attacker)
         else:
             # Generic SAI handling - log that it needs implementation
+            sai_name = FACE_SAI_KINDS[sai_face]
             result.special_notes.append(f"{unit_name} {sai_name.title()}: Effect needs implementation (X={x_value})")
 
+    def _roll_type_mask(self, combat_type: str, is_attacker: bool) -> int:
+        """Roll context bits an SAI's applies mask must share to take effect on this roll."""
+        return ROLL_CONTEXT_BITS["any"] | ROLL_CONTEXT_BITS.get(self._normalize_roll_type(combat_type, is_attacker), 0)
+
     def _normalize_roll_type(self, combat_type: str, is_attacker: bool) -> str:
         """Normalize roll type to match SAI applies conditions."""
         if combat_type == "save":
@@ -1565,7 +1477,7 @@ class SAIProcessor:
         self,
         result: CombatRollResult,
         subtotal: Dict[str, int],
-        roll_results: Dict[str, List[str]],
+        unit_counts: Dict[str, List[int]],
         army_units: List[Dict[str, Any]],
         terrain_elements: List[str],
     ):
@@ -1595,7 +1507,7 @@ class SAIProcessor:
 
     def _process_roll_with_10_step_resolution(
         self,
-        roll_results: Dict[str, List[str]],
+        roll_results: Dict[str, Union[List[str], RollCodes]],
         combat_type: str,
         army_units: List[Dict[str, Any]],
         is_attacker: bool,
@@ -1616,21 +1528,13 @@ class SAIProcessor:
 
         # STEP 1: Roll the dice (already done - we have roll_results)
         result.resolution_log.append("Step 1: Dice rolled")
-        self._count_raw_results(result, roll_results)
+        coded_rolls = encode_roll_results(roll_results)
+        unit_counts = self._count_unit_results(coded_rolls)
+        self._count_raw_results(result, unit_counts)
 
-        # STEP 2: Apply delayed SAI effects from attacker (if this is a save roll)
-        result.resolution_log.append("Step 2: Applying delayed effects from attacker")
-        if combat_type == "save" and delayed_effects_from_attacker:
-            self._apply_delayed_effects(result, delayed_effects_from_attacker, roll_results, army_units)
-
-        # STEP 3: Handle re-roll effects
-        result.resolution_log.append("Step 3: Processing re-roll effects")
-        self._process_reroll_effects(result, roll_results, army_units, combat_type)
-
-        # STEP 4: Identify and apply SAI effects
-        result.resolution_log.append("Step 4: Processing SAI effects")
-        self._identify_and_apply_sai_effects(
-            result, roll_results, combat_type, army_units, is_attacker, terrain_elements
+        # STEPS 2-4: Delayed effects, re-roll effects and SAI effects
+        self._apply_roll_effects(
+            result, coded_rolls, combat_type, army_units, is_attacker, terrain_elements, delayed_effects_from_attacker
         )
 
         # STEP 5: Count non-SAI generated action results
@@ -1655,30 +1559,179 @@ class SAIProcessor:
 
         # STEP 10: Apply add modifiers and counts-as results
         result.resolution_log.append("Step 10: Applying add modifiers and counts-as results")
-        self._apply_add_modifiers_and_counts_as(result, subtotal, roll_results, army_units, terrain_elements)
+        self._apply_add_modifiers_and_counts_as(result, subtotal, unit_counts, army_units, terrain_elements)
 
         # Process ID faces and species abilities (these add counts-as modifiers)
         self._process_id_faces_for_resolution(
-            result, roll_results, army_units, combat_type, terrain_eighth_face_controlled
+            result, unit_counts, army_units, combat_type, terrain_eighth_face_controlled
         )
         self._process_species_abilities_for_resolution(
-            result, roll_results, army_units, combat_type, is_attacker, terrain_elements, player_name, opponent_name
+            result, unit_counts, army_units, combat_type, is_attacker, terrain_elements, player_name, opponent_name
         )
 
         result.resolution_log.append("Resolution complete")
         return result
 
+    def _apply_roll_effects(
+        self,
+        result: CombatRollResult,
+        coded_rolls: Dict[str, RollCodes],
+        combat_type: str,
+        army_units: List[Dict[str, Any]],
+        is_attacker: bool,
+        terrain_elements: List[str],
+        delayed_effects_from_attacker: List[DelayedEffect],
+    ):
+        """Steps 2-4: apply delayed, re-roll and SAI effects, collecting their modifiers on the result."""
+        # STEP 2: Apply delayed SAI effects from attacker (if this is a save roll)
+        result.resolution_log.append("Step 2: Applying delayed effects from attacker")
+        if combat_type == "save" and delayed_effects_from_attacker:
+            self._apply_delayed_effects(result, delayed_effects_from_attacker, coded_rolls, army_units)
+
+        # STEP 3: Handle re-roll effects
+        result.resolution_log.append("Step 3: Processing re-roll effects")
+        self._process_reroll_effects(result, coded_rolls, army_units, combat_type)
+
+        # STEP 4: Identify and apply SAI effects
+        result.resolution_log.append("Step 4: Processing SAI effects")
+        self._identify_and_apply_sai_effects(
+            result, coded_rolls, combat_type, army_units, is_attacker, terrain_elements
+        )
+
+    def process_roll_batch(
+        self,
+        roll_stack: Sequence[Dict[str, Union[List[str], RollCodes]]],
+        combat_type: str,
+        army_units: List[Dict[str, Any]],
+        is_attacker: bool = True,
+        terrain_elements: Optional[List[str]] = None,
+        terrain_eighth_face_controlled: bool = False,
+        player_name: Optional[str] = None,
+        opponent_name: Optional[str] = None,
+        delayed_effects_from_attacker: Optional[List[DelayedEffect]] = None,
+    ) -> BatchRollResult:
+        """
+        Resolve a stack of rolls by the same army with the 10-step process in one pass.
+
+        Modifiers are gathered exactly as the single-roll resolution gathers them, once per
+        distinct roll. Steps 5-10 then run column-wise over every roll that produced the same
+        modifiers. Totals and modifiers match resolving each roll on its own; per-roll logs,
+        notes and re-roll effects are not kept.
+
+        Args:
+            roll_stack: One unit_name -> face_results mapping per roll (entered strings or RollCodes)
+            combat_type: Type of combat ("melee", "missile", "magic", "save", "maneuver")
+            army_units: List of unit data for the army
+
+        Returns:
+            BatchRollResult with one entry per roll in each column
+        """
+        if terrain_elements is None:
+            terrain_elements = []
+        if delayed_effects_from_attacker is None:
+            delayed_effects_from_attacker = []
+
+        roll_count = len(roll_stack)
+        batch = BatchRollResult(
+            raw={result_type: array("l", [0]) * roll_count for result_type in RAW_RESULT_KINDS},
+            final={result_type: array("l", [0]) * roll_count for result_type in RESOLVED_RESULT_TYPES},
+        )
+        # Distinct roll -> (all modifiers, steps 6-10 operations)
+        gathered: Dict[Tuple, Tuple[List[RollModifier], Tuple[Tuple[str, int, str], ...]]] = {}
+        # Steps 6-10 operations -> indexes of the rolls they apply to
+        groups: Dict[Tuple[Tuple[str, int, str], ...], List[int]] = {}
+
+        for index, roll_results in enumerate(roll_stack):
+            coded_rolls = encode_roll_results(roll_results)
+            roll_key = tuple((unit_name, tuple(codes)) for unit_name, codes in coded_rolls.items())
+            if roll_key not in gathered:
+                scratch = CombatRollResult()
+                unit_counts = self._count_unit_results(coded_rolls)
+                self._apply_roll_effects(
+                    scratch,
+                    coded_rolls,
+                    combat_type,
+                    army_units,
+                    is_attacker,
+                    terrain_elements,
+                    delayed_effects_from_attacker,
+                )
+                operations = self._resolution_operations(scratch.modifiers)
+                # ID and species modifiers are added after the final totals, as in the single-roll path
+                self._process_id_faces_for_resolution(
+                    scratch, unit_counts, army_units, combat_type, terrain_eighth_face_controlled
+                )
+                self._process_species_abilities_for_resolution(
+                    scratch,
+                    unit_counts,
+                    army_units,
+                    combat_type,
+                    is_attacker,
+                    terrain_elements,
+                    player_name,
+                    opponent_name,
+                )
+                gathered[roll_key] = (scratch.modifiers, operations)
+
+            modifiers, operations = gathered[roll_key]
+            batch.modifiers.append(modifiers)
+            groups.setdefault(operations, []).append(index)
+
+            # STEP 1: Count the raw die face results
+            counts = count_results(chain.from_iterable(coded_rolls.values()))
+            for result_type, result_kind in RAW_RESULT_KINDS.items():
+                batch.raw[result_type][index] = counts[result_kind]
+
+        # STEPS 5-10, once per group of rolls sharing the same operations
+        for operations, indexes in groups.items():
+            subtotal = {
+                result_type: [batch.raw[result_type][i] for i in indexes] for result_type in RESOLVED_RESULT_TYPES
+            }
+            for operation, value, target_result_type in operations:
+                column = strict_get(subtotal, target_result_type)
+                if operation == "subtract":
+                    subtotal[target_result_type] = [max(0, current - value) for current in column]
+                elif operation == "divide":
+                    subtotal[target_result_type] = [current // value for current in column]
+                elif operation == "multiply":
+                    subtotal[target_result_type] = [current * value for current in column]
+                else:
+                    subtotal[target_result_type] = [current + value for current in column]
+            for result_type in RESOLVED_RESULT_TYPES:
+                final_column = batch.final[result_type]
+                for index, value in zip(indexes, subtotal[result_type]):
+                    final_column[index] = value
+
+        return batch
+
+    def _resolution_operations(self, modifiers: List[RollModifier]) -> Tuple[Tuple[str, int, str], ...]:
+        """(operation, value, target) for each modifier, in the order steps 6-10 apply them."""
+        step_filters = [
+            lambda modifier: modifier.modifier_type == "subtract",
+            lambda modifier: modifier.modifier_type == "divide",
+            lambda modifier: modifier.modifier_type == "add" and "SAI" in modifier.source,
+            lambda modifier: modifier.modifier_type == "multiply",
+            lambda modifier: modifier.modifier_type == "add" and "SAI" not in modifier.source,
+            lambda modifier: modifier.modifier_type == "counts_as",
+        ]
+        return tuple(
+            (modifier.modifier_type, modifier.value, modifier.target_result_type)
+            for step_filter in step_filters
+            for modifier in modifiers
+            if step_filter(modifier)
+        )
+
     def _process_id_faces_for_resolution(
         self,
         result: CombatRollResult,
-        roll_results: Dict[str, List[str]],
+        unit_counts: Dict[str, List[int]],
         army_units: List[Dict[str, Any]],
         combat_type: str,
         terrain_eighth_face_controlled: bool,
     ):
         """Process ID face bonuses using the resolution engine."""
-        for unit_name, face_results in roll_results.items():
-            id_count = sum(1 for face in face_results if face.lower().strip() == "id")
+        for unit_name, counts in unit_counts.items():
+            id_count = counts[RESULT_ID]
 
             if id_count > 0:
                 unit_data = self._find_unit_data(unit_name, army_units)
@@ -1707,7 +1760,7 @@ class SAIProcessor:
     def _process_species_abilities_for_resolution(
         self,
         result: CombatRollResult,
-        roll_results: Dict[str, List[str]],
+        unit_counts: Dict[str, List[int]],
         army_units: List[Dict[str, Any]],
         combat_type: str,
         is_attacker: bool,
@@ -1716,7 +1769,7 @@ class SAIProcessor:
         opponent_name: Optional[str],
     ):
         """Process species abilities using counts-as modifiers."""
-        for unit_name, face_results in roll_results.items():
+        for unit_name, counts in unit_counts.items():
             unit_data = self._find_unit_data(unit_name, army_units)
             if not unit_data:
                 continue
@@ -1725,7 +1778,7 @@ class SAIProcessor:
 
             # Dwarven Might: saves count as melee at fire terrain during counter-attack
             if species == "Dwarves" and combat_type == "melee" and not is_attacker and "fire" in terrain_elements:
-                save_count = sum(1 for face in face_results if face.lower().strip() in ["s", "save"])
+                save_count = counts[RESULT_SAVE]
                 if save_count > 0:
                     modifier = RollModifier(
                         modifier_type="counts_as",
@@ -1743,7 +1796,7 @@ class SAIProcessor:
                 and not is_attacker
                 and "water" in terrain_elements
             ):
-                maneuver_count = sum(1 for face in face_results if face.lower().strip() in ["ma", "maneuver"])
+                maneuver_count = counts[RESULT_MANEUVER]
                 if maneuver_count > 0:
                     modifier = RollModifier(
                         modifier_type="counts_as",
@@ -1756,14 +1809,14 @@ class SAIProcessor:
 
             # Add other species abilities as counts-as modifiers
             self._add_other_species_counts_as_modifiers(
-                result, unit_data, face_results, combat_type, is_attacker, terrain_elements
+                result, unit_data, counts, combat_type, is_attacker, terrain_elements
             )
 
     def _add_other_species_counts_as_modifiers(
         self,
         result: CombatRollResult,
         unit_data: Dict[str, Any],
-        face_results: List[str],
+        counts: List[int],
         combat_type: str,
         is_attacker: bool,
         terrain_elements: List[str],
@@ -1774,7 +1827,7 @@ class SAIProcessor:
 
         # Mountain Master: melee counts as maneuver at earth terrain
         if species == "Dwarves" and combat_type == "maneuver" and "earth" in terrain_elements:
-            melee_count = sum(1 for face in face_results if face.lower().strip() in ["m", "melee"])
+            melee_count = counts[RESULT_MELEE]
             if melee_count > 0:
                 modifier = RollModifier(
                     modifier_type="counts_as",
@@ -1793,7 +1846,7 @@ class SAIProcessor:
             and "earth" in terrain_elements
             and "air" in terrain_elements
         ):
-            maneuver_count = sum(1 for face in face_results if face.lower().strip() in ["ma", "maneuver"])
+            maneuver_count = counts[RESULT_MANEUVER]
             if maneuver_count > 0:
                 modifier = RollModifier(
                     modifier_type="counts_as",
@@ -1806,7 +1859,7 @@ class SAIProcessor:
 
         # Flaming Shields: saves count as melee during attack at fire terrain
         if species == "Firewalkers" and combat_type == "melee" and is_attacker and "fire" in terrain_elements:
-            save_count = sum(1 for face in face_results if face.lower().strip() in ["s", "save"])
+            save_count = counts[RESULT_SAVE]
             if save_count > 0:
                 modifier = RollModifier(
                     modifier_type="counts_as",
@@ -1939,7 +1992,12 @@ class SAIProcessor:
 
         for army_id, army_units in all_armies.items():
             # Filter by army type (attacking/defending/any)
-            if target_army_type == "defending" and "defending" not in army_id.lower() or target_army_type == "attacking" and "attacking" not in army_id.lower():
+            if (
+                target_army_type == "defending"
+                and "defending" not in army_id.lower()
+                or target_army_type == "attacking"
+                and "attacking" not in army_id.lower()
+            ):
                 continue
             if target_army_type == "any":
                 pass  # All armies are valid
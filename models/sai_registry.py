@@ -0,0 +1,99 @@
+"""
+Special Action Icon (SAI) rules registry for Dragon Dice.
+
+Maps each SAI name to the roll types it applies to and its rules text. Kept free of
+other model imports so both the SAI processor and the die face tables can use it.
+"""
+
+from typing import Any, Dict
+
+# Comprehensive SAI registry from special_action_icons.md
+SAI_REGISTRY: Dict[str, Dict[str, Any]] = {
+    "attune": {
+        "applies": ["magic"],
+        "description": "During a magic action, Attune generates X magic results of any element. Attune may also change the normal (non-ID, non-SAI) magic results of one unit in the marching army to the same element as the Attune magic results.",
+    },
+    "bash": {
+        "applies": ["dragon_attack", "save"],
+        "description": "During a save roll against a melee attack, target one unit from the attacking army. The targeted unit takes damage equal to the melee results it generated. The targeted unit must make a save roll against this damage. Bash also generates save results equal to the targeted unit's melee results. During other save rolls, Bash generates X save results. During a dragon attack choose an attacking dragon that has inflicted damage. That dragon takes damage equal to the amount of damage it inflicted. Bash also generates save results equal to the damage the chosen dragon did.",
+    },
+    "belly": {"applies": ["any"], "description": "During any roll, the unit loses its automatic save results."},
+    "breath": {
+        "applies": ["melee"],
+        "description": "During a melee attack, target X health-worth of units in the defending army. The targets are killed.",
+    },
+    "bullseye": {
+        "applies": ["dragon_attack", "missile"],
+        "description": "During a missile attack, target X health-worth of units in the defending army. The targets make a save roll. Those that do not generate a save result are killed. Roll this unit again and apply the new result as well. During a dragon attack, Bullseye generates X missile results.",
+    },
+    "cantrip": {
+        "applies": ["magic", "non_maneuver"],
+        "description": "During a magic action or Magic Negation (Frostwings - page 23) roll, Cantrip generates X magic results. During other non-maneuver rolls, Cantrip generates X magic results that only allow you to cast spells marked as 'Cantrip' from the spell list.",
+    },
+    "charge": {
+        "applies": ["melee"],
+        "description": "During a melee attack, the attacking army counts all Maneuver results as if they were Melee results. Instead of making a regular save roll or a counter-attack, the defending army makes a combination save and melee roll. The attacking army takes damage equal to these melee results. Only save results generated by spells may reduce this damage. Charge has no effect during a counter-attack.",
+    },
+    "charm": {
+        "applies": ["melee"],
+        "description": "During a melee attack, target up to X health-worth of units in the defending army; those units don't roll to save during this march. Instead, the owner rolls these units and adds their results to the attacking army's results. Those units may take damage from the melee attack as normal.",
+    },
+    "choke": {
+        "applies": ["melee"],
+        "description": "During a melee attack, this effect is delayed until after the target army rolls for saves. Target up to X healthworth of units in the that army that rolled an ID icon. The targets are killed. None of their results are counted towards the army's save results.",
+    },
+    "cloak": {
+        "applies": ["dragon_attack", "individual", "magic", "save"],
+        "description": "During a save roll or dragon attack, add X non-magical save results to the army containing this unit until the beginning of your next turn. During a magic action, Cloak generates X magic results. During a roll for an individual-targeting effect, Cloak generates X magic, maneuver, melee, missile, or save results.",
+    },
+    "coil": {
+        "applies": ["dragon_attack", "melee"],
+        "description": "During a melee attack, target one unit in the defending army. The target takes X damage and makes a combination roll, counting save and melee results. Any melee results that the target generates inflict damage on the Coiling unit with no save possible. During a dragon attack, Coil generates X melee results.",
+    },
+    "confuse": {
+        "applies": ["melee", "missile"],
+        "description": "During a melee or missile attack, this effect is delayed until after the target army rolls for saves. Target up to X health-worth of units in the that army. Re-roll the targeted units, ignoring all previous results.",
+    },
+    "convert": {
+        "applies": ["melee"],
+        "description": "During a melee attack, target up to X health-worth of units in the defending army. The targets make a save roll. Those that do not generate a save result are killed. The attacking player may return up to the amount of heath-worth killed this way from their DUA to the attacking army.",
+    },
+    "counter": {
+        "applies": ["dragon_attack", "melee", "save"],
+        "description": "During a save roll against a melee attack, Counter generates X save results and inflicts X damage upon the attacking army. Only save results generated by spells may reduce this damage. During any other save roll, Counter generates X save results. During a melee attack, Counter generates X melee results. During a dragon attack, Counter generates X save and X melee results.",
+    },
+    "create_fireminions": {
+        "applies": ["any_non_individual"],
+        "description": "During any army roll, Create Fireminions generates X magic, maneuver, melee, missile or save results.",
+    },
+    "crush": {
+        "applies": ["dragon_attack", "missile"],
+        "description": "During a missile attack, target up to X healthworth of units in the defending army. The targets make a maneuver roll. Those that do not generate a maneuver result are killed. Each unit killed must make a save roll. Those that do not generate a save result on this second roll are buried. During a dragon attack, Crush generates X missile results.",
+    },
+    "decapitate": {
+        "applies": ["melee", "dragon_attack"],
+        "description": "During a melee attack, this effect is delayed until after the target army rolls for saves. Target one unit that rolled an ID icon. The target is killed. None of their results are counted towards the army's save results. During a dragon attack, kill one dragon that rolled Jaws. If no dragon rolled Jaws, Decapitate generates three melee results.",
+    },
+    "elevate": {
+        "applies": ["dragon_attack", "maneuver", "missile", "save"],
+        "description": "During a maneuver roll, Elevate generates X maneuver results. During a missile attack, double one unit's missile results. During a save roll against a melee attack, double one unit's save results. During a dragon attack, double one unit's missile or save results.",
+    },
+    "fly": {"applies": ["any"], "description": "During any roll, Fly generates X maneuver or X save results."},
+    "regenerate": {
+        "applies": ["non_maneuver"],
+        "description": "During any non-maneuver roll, choose one: Regenerate generates X save results, OR, you may return up to X health-worth of units from your DUA to the army containing this unit.",
+    },
+    "rend": {
+        "applies": ["dragon_attack", "maneuver", "melee"],
+        "description": "During a melee or dragon attack, Rend generates X melee results. Roll this unit again and apply the new result as well. During a maneuver roll, Rend generates X maneuver results.",
+    },
+    "trample": {
+        "applies": ["any"],
+        "description": "During any roll, Trample generates X maneuver and X melee results.",
+    },
+    "vanish": {
+        "applies": ["save"],
+        "description": "During a save roll, Vanish generates X save results. The unit may then move to any terrain or its Reserve Area. If the unit moves, the save results still apply to the army that the Vanishing unit left.",
+    },
+    # More SAIs can be added incrementally as needed
+}
@@ -1,7 +1,7 @@
 # models/species_model.py
 from typing import Any, Dict, List, Optional, Tuple
 
-from models.element_model import ELEMENT_DATA
+from models.element_model import ELEMENT_DATA, element_bit, element_mask
 from utils.field_access import strict_get, strict_get_optional
 
 
@@ -48,6 +48,7 @@ class SpeciesModel:
         self.name = name
         self.display_name = display_name
         self.elements = elements  # Element names like ["DEATH", "EARTH"]
+        self.element_mask = element_mask(elements)
         self.element_colors = element_colors  # [(icon, color_name), ...]
         self.description = description
         self.abilities = abilities or []  # List of species abilities
@@ -66,7 +67,7 @@ class SpeciesModel:
 
     def has_element(self, element: str) -> bool:
         """Check if this species has a specific element."""
-        return element.upper() in self.elements
+        return bool(self.element_mask & element_bit(element))
 
     def get_abilities(self) -> List[SpeciesAbility]:
         """Get the list of species abilities."""
@@ -556,8 +557,8 @@ def get_species(species_name: str) -> Optional[SpeciesModel]:
 
 def get_species_by_element(element: str) -> List[SpeciesModel]:
     """Get all species that have a specific element."""
-    element = element.upper()
-    return [species for species in ALL_SPECIES.values() if species.has_element(element)]
+    bit = element_bit(element)
+    return [species for species in ALL_SPECIES.values() if species.element_mask & bit]
 
 
 def get_all_species_names() -> List[str]:
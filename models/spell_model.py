@@ -1,7 +1,7 @@
 # models/spell_model.py
 from typing import Any, Dict, List, Optional
 
-from models.element_model import ELEMENT_DATA
+from models.element_model import ELEMENT_DATA, element_bit
 from utils.field_access import strict_get, strict_get_optional
 
 
@@ -25,6 +25,7 @@ class SpellModel:
         self.cantrip = cantrip
         self.effect = effect
         self.element = element  # For organizing spells by element
+        self.element_mask = element_bit(element)  # 0 for Elemental spells
 
     def __repr__(self):
         return f"SpellModel(name='{self.name}', element='{self.element}', cost={self.cost})"
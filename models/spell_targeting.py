@@ -10,9 +10,11 @@ This module handles spell targeting logic including:
 - Summoning Pool restrictions (spells cannot target the Summoning Pool)
 """
 
+from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 
+from models.element_model import element_mask
 from models.spell_model import SpellModel
 from utils import strict_get
 
@@ -28,6 +30,91 @@ class TargetType(Enum):
     SUMMONING_POOL = "summoning_pool"  # NOT VALID - spells cannot target this
 
 
+@dataclass(frozen=True)
+class SpellTargetProfile:
+    """Targeting facts for a spell, parsed once from its effect text and restrictions."""
+
+    target_types: Tuple[TargetType, ...]
+    own_targets_only: bool  # Effect says "your": only the caster's armies and units
+    targets_dua: bool  # Effect mentions the DUA or resurrection
+    targets_bua: bool  # Effect mentions the BUA or burial
+    summons: bool  # Effect mentions summoning
+    element_restricted: bool  # Targets must share the spell's element
+    element_mask: int
+    species: str  # "Any" when not species-restricted
+
+
+# Target profile per spell, keyed by the spell fields it is parsed from
+_TARGET_PROFILES: Dict[Tuple[str, str, str], SpellTargetProfile] = {}
+
+
+def get_spell_target_profile(spell: SpellModel) -> SpellTargetProfile:
+    """Targeting profile for a spell, parsed on first use and reused afterwards."""
+    key = (spell.effect, spell.element, spell.species)
+    profile = _TARGET_PROFILES.get(key)
+    if profile is None:
+        effect_lower = spell.effect.lower()
+        profile = SpellTargetProfile(
+            target_types=tuple(_parse_target_types(effect_lower)),
+            own_targets_only="your" in effect_lower,
+            targets_dua="dua" in effect_lower or "resurrect" in effect_lower,
+            targets_bua="bua" in effect_lower or "buried" in effect_lower,
+            summons="summon" in effect_lower,
+            element_restricted=spell.element != "ANY" and spell.element != "ELEMENTAL",
+            element_mask=spell.element_mask,
+            species=spell.species,
+        )
+        _TARGET_PROFILES[key] = profile
+    return profile
+
+
+def _parse_target_types(effect_lower: str) -> List[TargetType]:
+    """Parse lower-cased spell effect text to determine what types of targets are valid."""
+    target_types = []
+
+    # Check for army targeting
+    if "army" in effect_lower or "casting army" in effect_lower:
+        target_types.append(TargetType.ARMY)
+
+    # Check for unit targeting
+    if "unit" in effect_lower or "target one" in effect_lower or "target any" in effect_lower:
+        target_types.append(TargetType.UNIT)
+
+    # Check for terrain targeting
+    if "terrain" in effect_lower:
+        target_types.append(TargetType.TERRAIN)
+
+    # Check for DUA targeting
+    if "dua" in effect_lower or "dead units area" in effect_lower or "resurrect" in effect_lower:
+        target_types.append(TargetType.DUA)
+
+    # Check for BUA targeting
+    if "bua" in effect_lower or "buried units area" in effect_lower or "buried" in effect_lower:
+        target_types.append(TargetType.BUA)
+
+    # Check for dragon summoning spells (use summoning pool as source)
+    if "summon" in effect_lower and ("dragon" in effect_lower or "dragonkin" in effect_lower):
+        target_types.append(TargetType.SUMMONING_POOL)
+    elif "summoning pool" in effect_lower:
+        # Other summoning pool references (like Esfah's Gift)
+        target_types.append(TargetType.SUMMONING_POOL)
+
+    return target_types
+
+
+# Valid-target result keys, by the target type that fills them
+_RESULT_KEYS = {
+    TargetType.ARMY: "armies",
+    TargetType.UNIT: "units",
+    TargetType.TERRAIN: "terrains",
+    TargetType.DUA: "dua_units",
+    TargetType.BUA: "bua_units",
+    TargetType.SUMMONING_POOL: "summoning_pool_sources",
+}
+# Pools built from the game_state dict, which may be cached per caller-supplied state version
+_STATE_POOL_TYPES = (TargetType.ARMY, TargetType.UNIT, TargetType.TERRAIN)
+
+
 class SpellTargetingManager:
     """Manages spell targeting logic and validation."""
 
@@ -36,79 +123,101 @@ class SpellTargetingManager:
         self.bua_manager = bua_manager
         self.summoning_pool_manager = summoning_pool_manager
 
+        # Army/unit/terrain candidate pools for the last (caster, state version) seen
+        self._pool_cache_key: Optional[Tuple[str, Hashable]] = None
+        self._pool_cache: Dict[TargetType, List[Tuple[Dict[str, Any], Any]]] = {}
+
     def get_valid_targets(
-        self, spell: SpellModel, caster_player: str, game_state: Dict[str, Any]
+        self,
+        spell: SpellModel,
+        caster_player: str,
+        game_state: Dict[str, Any],
+        state_version: Optional[Hashable] = None,
     ) -> Dict[str, List[Dict[str, Any]]]:
-        """Get all valid targets for a spell."""
-        valid_targets: Dict[str, List[Dict[str, Any]]] = {
-            "armies": [],
-            "units": [],
-            "terrains": [],
-            "dua_units": [],
-            "bua_units": [],
+        """
+        Get all valid targets for a spell.
+
+        When state_version is given (e.g. GameStateManager.get_state_version()), the army, unit
+        and terrain candidates scanned from game_state are reused while the caster and version
+        stay the same. DUA, BUA and summoning pool candidates are always read fresh.
+        """
+        return self.get_valid_targets_for_spells([spell], caster_player, game_state, state_version)[spell.name]
+
+    def get_valid_targets_for_spells(
+        self,
+        spells: List[SpellModel],
+        caster_player: str,
+        game_state: Dict[str, Any],
+        state_version: Optional[Hashable] = None,
+    ) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+        """Get valid targets for each spell (keyed by spell name), scanning each candidate pool once."""
+        state_pools = self._get_state_pools(caster_player, state_version)
+        area_pools: Dict[TargetType, List[Tuple[Dict[str, Any], Any]]] = {}  # DUA, BUA and summoning pool
+        pool_builders = {
+            TargetType.ARMY: lambda: self._build_army_pool(caster_player, game_state),
+            TargetType.UNIT: lambda: self._build_unit_pool(caster_player, game_state),
+            TargetType.TERRAIN: lambda: self._build_terrain_pool(game_state),
+            TargetType.DUA: lambda: self._build_area_pool(
+                self.dua_manager.get_player_dua(caster_player), caster_player, "DUA"
+            ),
+            TargetType.BUA: lambda: self._build_area_pool(
+                self.bua_manager.get_player_bua(caster_player), caster_player, "BUA"
+            ),
+            TargetType.SUMMONING_POOL: lambda: self._build_summoning_pool(caster_player),
+        }
+        pool_filters = {
+            TargetType.ARMY: self._army_matches,
+            TargetType.UNIT: self._unit_matches,
+            TargetType.TERRAIN: self._terrain_matches,
+            TargetType.DUA: self._dua_unit_matches,
+            TargetType.BUA: self._bua_unit_matches,
+            TargetType.SUMMONING_POOL: self._summoning_source_matches,
         }
 
-        # Parse spell effect to determine target types
-        target_types = self._parse_spell_target_types(spell)
-
-        for target_type in target_types:
-            if target_type == TargetType.ARMY:
-                valid_targets["armies"] = self._get_valid_army_targets(spell, caster_player, game_state)
-            elif target_type == TargetType.UNIT:
-                valid_targets["units"] = self._get_valid_unit_targets(spell, caster_player, game_state)
-            elif target_type == TargetType.TERRAIN:
-                valid_targets["terrains"] = self._get_valid_terrain_targets(spell, caster_player, game_state)
-            elif target_type == TargetType.DUA:
-                valid_targets["dua_units"] = self._get_valid_dua_targets(spell, caster_player, game_state)
-            elif target_type == TargetType.BUA:
-                valid_targets["bua_units"] = self._get_valid_bua_targets(spell, caster_player, game_state)
-            elif target_type == TargetType.SUMMONING_POOL:
-                # Dragon summoning spells use summoning pool as source, not target
-                valid_targets["summoning_pool_sources"] = self._get_valid_summoning_pool_sources(
-                    spell, caster_player, game_state
-                )
-
-        return valid_targets
+        targets_by_spell = {}
+        for spell in spells:
+            profile = get_spell_target_profile(spell)
+            valid_targets: Dict[str, List[Dict[str, Any]]] = {
+                "armies": [],
+                "units": [],
+                "terrains": [],
+                "dua_units": [],
+                "bua_units": [],
+            }
+            for target_type in profile.target_types:
+                pools = state_pools if target_type in _STATE_POOL_TYPES else area_pools
+                if target_type not in pools:
+                    pools[target_type] = pool_builders[target_type]()
+                matches = pool_filters[target_type]
+                valid_targets[_RESULT_KEYS[target_type]] = [
+                    target_info
+                    for target_info, mask in pools[target_type]
+                    if matches(spell, profile, target_info, mask)
+                ]
+            targets_by_spell[spell.name] = valid_targets
+
+        return targets_by_spell
+
+    def _get_state_pools(
+        self, caster_player: str, state_version: Optional[Hashable]
+    ) -> Dict[TargetType, List[Tuple[Dict[str, Any], Any]]]:
+        """Army/unit/terrain pools to fill for a call: the cached ones while caster and version match."""
+        if state_version is None:
+            return {}
+        cache_key = (caster_player, state_version)
+        if cache_key != self._pool_cache_key:
+            self._pool_cache_key = cache_key
+            self._pool_cache = {}
+        return self._pool_cache
 
     def _parse_spell_target_types(self, spell: SpellModel) -> List[TargetType]:
         """Parse spell effect text to determine what types of targets are valid."""
-        target_types = []
-        effect_lower = spell.effect.lower()
-
-        # Check for army targeting
-        if "army" in effect_lower or "casting army" in effect_lower:
-            target_types.append(TargetType.ARMY)
-
-        # Check for unit targeting
-        if "unit" in effect_lower or "target one" in effect_lower or "target any" in effect_lower:
-            target_types.append(TargetType.UNIT)
-
-        # Check for terrain targeting
-        if "terrain" in effect_lower:
-            target_types.append(TargetType.TERRAIN)
-
-        # Check for DUA targeting
-        if "dua" in effect_lower or "dead units area" in effect_lower or "resurrect" in effect_lower:
-            target_types.append(TargetType.DUA)
+        return list(get_spell_target_profile(spell).target_types)
 
-        # Check for BUA targeting
-        if "bua" in effect_lower or "buried units area" in effect_lower or "buried" in effect_lower:
-            target_types.append(TargetType.BUA)
-
-        # Check for dragon summoning spells (use summoning pool as source)
-        if "summon" in effect_lower and ("dragon" in effect_lower or "dragonkin" in effect_lower):
-            target_types.append(TargetType.SUMMONING_POOL)
-        elif "summoning pool" in effect_lower:
-            # Other summoning pool references (like Esfah's Gift)
-            target_types.append(TargetType.SUMMONING_POOL)
-
-        return target_types
-
-    def _get_valid_army_targets(
-        self, spell: SpellModel, caster_player: str, game_state: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
-        """Get valid army targets for a spell."""
-        valid_armies = []
+    # Candidate pools: (target info, element mask or None when elements are missing) per candidate
+    def _build_army_pool(self, caster_player: str, game_state: Dict[str, Any]) -> List[Tuple[Dict[str, Any], Any]]:
+        """Scan all armies into army target candidates."""
+        pool = []
 
         # Get all armies from game state
         if "all_players_data" not in game_state:
@@ -134,18 +243,13 @@ class SpellTargetingManager:
                     "units": army_data["units"],
                     "is_own_army": player_name == caster_player,
                 }
+                pool.append((army_info, self._army_element_mask(army_info)))
 
-                # Apply spell-specific targeting rules
-                if self._is_valid_army_target(spell, army_info, caster_player):
-                    valid_armies.append(army_info)
+        return pool
 
-        return valid_armies
-
-    def _get_valid_unit_targets(
-        self, spell: SpellModel, caster_player: str, game_state: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
-        """Get valid unit targets for a spell."""
-        valid_units = []
+    def _build_unit_pool(self, caster_player: str, game_state: Dict[str, Any]) -> List[Tuple[Dict[str, Any], Any]]:
+        """Scan all army units into unit target candidates."""
+        pool = []
 
         # Get all units from all armies
         if "all_players_data" not in game_state:
@@ -172,18 +276,13 @@ class SpellTargetingManager:
                         "location": army_data["location"],
                         "is_own_unit": player_name == caster_player,
                     }
+                    pool.append((unit_info, self._unit_element_mask(unit)))
 
-                    # Apply spell-specific targeting rules
-                    if self._is_valid_unit_target(spell, unit_info, caster_player):
-                        valid_units.append(unit_info)
-
-        return valid_units
+        return pool
 
-    def _get_valid_terrain_targets(
-        self, spell: SpellModel, caster_player: str, game_state: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
-        """Get valid terrain targets for a spell."""
-        valid_terrains = []
+    def _build_terrain_pool(self, game_state: Dict[str, Any]) -> List[Tuple[Dict[str, Any], Any]]:
+        """Scan all terrains into terrain target candidates."""
+        pool = []
 
         if "terrain_data" not in game_state:
             raise ValueError("Game state missing required 'terrain_data' field")
@@ -202,151 +301,142 @@ class SpellTargetingManager:
                 "elements": terrain_info["elements"],
                 "controller": terrain_info.get("controller"),  # Controller can be None/optional
             }
+            pool.append((terrain_target, element_mask(terrain_info["elements"])))
 
-            # Apply spell-specific targeting rules
-            if self._is_valid_terrain_target(spell, terrain_target, caster_player):
-                valid_terrains.append(terrain_target)
+        return pool
 
-        return valid_terrains
-
-    def _get_valid_dua_targets(
-        self, spell: SpellModel, caster_player: str, game_state: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
-        """Get valid DUA targets for a spell."""
-        valid_dua_units = []
-
-        # Get units from caster's DUA
-        dua_units = self.dua_manager.get_player_dua(caster_player)
-
-        for unit in dua_units:
-            unit_info = {
-                "player": caster_player,
-                "unit_data": unit.to_dict(),
-                "location": "DUA",
-                "is_own_unit": True,
-            }
-
-            # Apply spell-specific targeting rules
-            if self._is_valid_dua_target(spell, unit_info, caster_player):
-                valid_dua_units.append(unit_info)
-
-        return valid_dua_units
-
-    def _get_valid_bua_targets(
-        self, spell: SpellModel, caster_player: str, game_state: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
-        """Get valid BUA targets for a spell."""
-        valid_bua_units = []
-
-        # Get units from caster's BUA
-        bua_units = self.bua_manager.get_player_bua(caster_player)
-
-        for unit in bua_units:
+    def _build_area_pool(self, units: List[Any], caster_player: str, location: str) -> List[Tuple[Dict[str, Any], Any]]:
+        """Wrap the caster's DUA or BUA units as target candidates."""
+        pool = []
+        for unit in units:
             unit_info = {
                 "player": caster_player,
                 "unit_data": unit.to_dict(),
-                "location": "BUA",
+                "location": location,
                 "is_own_unit": True,
             }
-
-            # Apply spell-specific targeting rules
-            if self._is_valid_bua_target(spell, unit_info, caster_player):
-                valid_bua_units.append(unit_info)
-
-        return valid_bua_units
-
-    def _is_valid_army_target(self, spell: SpellModel, army_info: Dict[str, Any], caster_player: str) -> bool:
-        """Check if an army is a valid target for a spell."""
-        # Basic targeting rules
-        effect_lower = spell.effect.lower()
-
+            pool.append((unit_info, self._unit_element_mask(unit_info["unit_data"])))
+        return pool
+
+    def _army_element_mask(self, army_info: Dict[str, Any]) -> Optional[int]:
+        """Combined element mask of an army's units, or None if any unit is missing its elements."""
+        army_mask = 0
+        for unit in army_info["units"]:
+            if "elements" not in unit:
+                return None
+            army_mask |= element_mask(unit["elements"])
+        return army_mask
+
+    def _unit_element_mask(self, unit_data: Dict[str, Any]) -> Optional[int]:
+        """Element mask of a unit, or None if it is missing its elements."""
+        if "elements" not in unit_data:
+            return None
+        return element_mask(unit_data["elements"])
+
+    # Per-spell filters over candidate pools
+    def _army_matches(
+        self, spell: SpellModel, profile: SpellTargetProfile, army_info: Dict[str, Any], army_mask: Optional[int]
+    ) -> bool:
         # Check for "your" vs "any" targeting
-        if "your" in effect_lower and not army_info["is_own_army"]:
+        if profile.own_targets_only and not army_info["is_own_army"]:
             return False
 
-        # Check for element matching if required
-        if spell.element != "ANY" and spell.element != "ELEMENTAL":
-            # Check if army has units with matching elements
-            army_elements = set()
-            for unit in army_info["units"]:
-                if "elements" not in unit:
-                    raise ValueError(f"Unit in army '{army_info['army_id']}' missing required 'elements' field")
-                army_elements.update(unit["elements"])
-
-            if spell.element not in army_elements:
+        # Check if army has units with matching elements
+        if profile.element_restricted:
+            if army_mask is None:
+                raise ValueError(f"Unit in army '{army_info['army_id']}' missing required 'elements' field")
+            if not profile.element_mask & army_mask:
                 return False
 
         return True
 
-    def _is_valid_unit_target(self, spell: SpellModel, unit_info: Dict[str, Any], caster_player: str) -> bool:
-        """Check if a unit is a valid target for a spell."""
-        effect_lower = spell.effect.lower()
+    def _unit_matches(
+        self, spell: SpellModel, profile: SpellTargetProfile, unit_info: Dict[str, Any], unit_mask: Optional[int]
+    ) -> bool:
         unit_data = unit_info["unit_data"]
 
         # Check for "your" vs "any" targeting
-        if "your" in effect_lower and not unit_info["is_own_unit"]:
+        if profile.own_targets_only and not unit_info["is_own_unit"]:
             return False
 
         # Check for species restrictions
-        if spell.species != "Any":
+        if profile.species != "Any":
             if "species" not in unit_data:
                 raise ValueError("Unit data missing required 'species' field when checking species restriction")
-            if unit_data["species"] != spell.species:
+            if unit_data["species"] != profile.species:
                 return False
 
         # Check for element matching if required
-        if spell.element != "ANY" and spell.element != "ELEMENTAL":
-            if "elements" not in unit_data:
+        if profile.element_restricted:
+            if unit_mask is None:
                 raise ValueError("Unit data missing required 'elements' field when checking element restriction")
-            unit_elements = unit_data["elements"]
-            if spell.element not in unit_elements:
+            if not profile.element_mask & unit_mask:
                 return False
 
         return True
 
-    def _is_valid_terrain_target(self, spell: SpellModel, terrain_info: Dict[str, Any], caster_player: str) -> bool:
-        """Check if a terrain is a valid target for a spell."""
+    def _terrain_matches(
+        self, spell: SpellModel, profile: SpellTargetProfile, terrain_info: Dict[str, Any], terrain_mask: int
+    ) -> bool:
         # Most spells can target any terrain
         return True
 
-    def _is_valid_dua_target(self, spell: SpellModel, unit_info: Dict[str, Any], caster_player: str) -> bool:
-        """Check if a DUA unit is a valid target for a spell."""
-        effect_lower = spell.effect.lower()
-        unit_data = unit_info["unit_data"]
-
+    def _dua_unit_matches(
+        self, spell: SpellModel, profile: SpellTargetProfile, unit_info: Dict[str, Any], unit_mask: Optional[int]
+    ) -> bool:
         # Only certain spells can target DUA
-        if "dua" not in effect_lower and "resurrect" not in effect_lower:
+        if not profile.targets_dua:
             return False
 
         # Check for element matching if required
-        if spell.element != "ANY" and spell.element != "ELEMENTAL":
-            if "elements" not in unit_data:
+        if profile.element_restricted:
+            if unit_mask is None:
                 raise ValueError("DUA unit data missing required 'elements' field when checking element restriction")
-            unit_elements = unit_data["elements"]
-            if spell.element not in unit_elements:
+            if not profile.element_mask & unit_mask:
                 return False
 
         return True
 
-    def _is_valid_bua_target(self, spell: SpellModel, unit_info: Dict[str, Any], caster_player: str) -> bool:
-        """Check if a BUA unit is a valid target for a spell."""
-        effect_lower = spell.effect.lower()
-        unit_data = unit_info["unit_data"]
-
+    def _bua_unit_matches(
+        self, spell: SpellModel, profile: SpellTargetProfile, unit_info: Dict[str, Any], unit_mask: Optional[int]
+    ) -> bool:
         # Only certain spells can target BUA
-        if "bua" not in effect_lower and "buried" not in effect_lower:
+        if not profile.targets_bua:
             return False
 
         # Check for element matching if required
-        if spell.element != "ANY" and spell.element != "ELEMENTAL":
-            if "elements" not in unit_data:
+        if profile.element_restricted:
+            if unit_mask is None:
                 raise ValueError("BUA unit data missing required 'elements' field when checking element restriction")
-            unit_elements = unit_data["elements"]
-            if spell.element not in unit_elements:
+            if not profile.element_mask & unit_mask:
                 return False
 
         return True
 
+    def _is_valid_army_target(self, spell: SpellModel, army_info: Dict[str, Any], caster_player: str) -> bool:
+        """Check if an army is a valid target for a spell."""
+        return self._army_matches(spell, get_spell_target_profile(spell), army_info, self._army_element_mask(army_info))
+
+    def _is_valid_unit_target(self, spell: SpellModel, unit_info: Dict[str, Any], caster_player: str) -> bool:
+        """Check if a unit is a valid target for a spell."""
+        unit_mask = self._unit_element_mask(unit_info["unit_data"])
+        return self._unit_matches(spell, get_spell_target_profile(spell), unit_info, unit_mask)
+
+    def _is_valid_terrain_target(self, spell: SpellModel, terrain_info: Dict[str, Any], caster_player: str) -> bool:
+        """Check if a terrain is a valid target for a spell."""
+        # Most spells can target any terrain
+        return True
+
+    def _is_valid_dua_target(self, spell: SpellModel, unit_info: Dict[str, Any], caster_player: str) -> bool:
+        """Check if a DUA unit is a valid target for a spell."""
+        unit_mask = self._unit_element_mask(unit_info["unit_data"])
+        return self._dua_unit_matches(spell, get_spell_target_profile(spell), unit_info, unit_mask)
+
+    def _is_valid_bua_target(self, spell: SpellModel, unit_info: Dict[str, Any], caster_player: str) -> bool:
+        """Check if a BUA unit is a valid target for a spell."""
+        unit_mask = self._unit_element_mask(unit_info["unit_data"])
+        return self._bua_unit_matches(spell, get_spell_target_profile(spell), unit_info, unit_mask)
+
     def validate_spell_target(
         self, spell: SpellModel, target_type: str, target_data: Dict[str, Any], caster_player: str
     ) -> Tuple[bool, str]:
@@ -418,14 +508,12 @@ class SpellTargetingManager:
 
         return "Unknown target"
 
-    def _get_valid_summoning_pool_sources(
-        self, spell: SpellModel, caster_player: str, game_state: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
-        """Get valid dragons/units from summoning pool for summoning spells."""
-        valid_sources: List[Dict[str, Any]] = []
+    def _build_summoning_pool(self, caster_player: str) -> List[Tuple[Dict[str, Any], Any]]:
+        """Wrap the caster's summoning pool dragons as summoning sources."""
+        pool: List[Tuple[Dict[str, Any], Any]] = []
 
         if not self.summoning_pool_manager:
-            return valid_sources
+            return pool
 
         # Get caster's summoning pool
         player_pool = self.summoning_pool_manager.get_player_pool(caster_player)
@@ -439,17 +527,13 @@ class SpellTargetingManager:
                 "elements": dragon.elements,
                 "name": dragon.name,
             }
+            pool.append((dragon_info, None))
 
-            # Apply spell-specific rules
-            if self._is_valid_summoning_source(spell, dragon_info, caster_player):
-                valid_sources.append(dragon_info)
-
-        return valid_sources
-
-    def _is_valid_summoning_source(self, spell: SpellModel, dragon_info: Dict[str, Any], caster_player: str) -> bool:
-        """Check if a dragon is a valid source for a summoning spell."""
-        effect_lower = spell.effect.lower()
+        return pool
 
+    def _summoning_source_matches(
+        self, spell: SpellModel, profile: SpellTargetProfile, dragon_info: Dict[str, Any], mask: None
+    ) -> bool:
         if spell.name == "Summon White Dragon":
             # Only White Dragons can be summoned with this spell
             return dragon_info.get("dragon_type") == "WHITE"
@@ -463,4 +547,8 @@ class SpellTargetingManager:
             return "dragonkin" in strict_get(dragon_info, "name").lower()
 
         # Default: allow all dragons for summoning spells
-        return "summon" in effect_lower
+        return profile.summons
+
+    def _is_valid_summoning_source(self, spell: SpellModel, dragon_info: Dict[str, Any], caster_player: str) -> bool:
+        """Check if a dragon is a valid source for a summoning spell."""
+        return self._summoning_source_matches(spell, get_spell_target_profile(spell), dragon_info, None)
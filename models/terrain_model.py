@@ -1,6 +1,6 @@
 from typing import Dict, List, Optional
 
-from models.element_model import ELEMENT_DATA
+from models.element_model import ELEMENT_DATA, element_bit, element_mask
 
 
 class TerrainFace:
@@ -34,6 +34,7 @@ class Terrain:
         self.eighth_face = eighth_face  # Variant (Bridge, Castle, etc.)
         self.faces = [TerrainFace(face["name"], face["description"]) for face in faces]
         self.elements = elements
+        self.element_mask = element_mask(elements or [])
         self.is_advanced = is_advanced
 
         # Display name
@@ -92,7 +93,7 @@ class Terrain:
 
     def has_element(self, element: str) -> bool:
         """Check if this terrain has a specific element."""
-        return element.upper() in (self.elements or [])
+        return bool(self.element_mask & element_bit(element))
 
     def is_major_terrain(self) -> bool:
         """Check if this is a major terrain."""
@@ -1096,8 +1097,8 @@ def get_all_terrain_objects() -> List[Terrain]:
 
 def get_terrains_by_element(element: str) -> List[Terrain]:
     """Get all terrains that contain a specific element."""
-    element = element.upper()
-    return [terrain for terrain in TERRAIN_DATA.values() if terrain.has_element(element)]
+    bit = element_bit(element)
+    return [terrain for terrain in TERRAIN_DATA.values() if terrain.element_mask & bit]
 
 
 def get_terrains_by_type(terrain_type: str) -> List[Terrain]:
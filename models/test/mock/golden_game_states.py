@@ -0,0 +1,203 @@
+"""
+Golden game states for fast test setup.
+
+Building a GameEngine with create_typed_game_engine validates the player setup, creates
+every manager and runs phase initialization; tests that need a mid-game state then play
+their way there. The golden states here are built once per scenario and setup, captured
+as a pickled snapshot of the engine's game data (players, terrains, turn, DUA, BUA,
+Summoning Pools, Reserves, effects) and restored by unpickling.
+
+Restoring into an existing engine only replaces its game data, so a test class can build
+one engine and reset it for each test:
+
+    engine = create_golden_engine("dragons_summoned")
+    ...
+    restore_golden_state(engine, "dragons_summoned")
+
+Only the data attributes listed in GOLDEN_STATE_ATTRIBUTES are captured; signal
+connections and phase controllers are left as they are. Catalog minor terrains are
+pickled by reference, so restored Summoning Pools share them just like new ones do.
+"""
+
+import io
+import pickle
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Tuple
+
+from game_logic.game_orchestrator import GameOrchestrator as GameEngine
+from models.dragon_model import DragonModel
+from models.minor_terrain_model import MINOR_TERRAIN_DATA
+from models.test.mock.typed_game_setup import create_standard_two_player_engine
+from utils.field_access import strict_get
+
+# Engine component ("" for the engine itself) -> attributes holding its game data
+GOLDEN_STATE_ATTRIBUTES: Dict[str, Tuple[str, ...]] = {
+    "": (
+        "_current_phase",
+        "_current_march_step",
+        "_current_action_step",
+        "_current_player_name",
+        "_is_very_first_turn",
+        "_current_acting_army",
+    ),
+    "turn_manager": (
+        "current_player_idx",
+        "current_phase_idx",
+        "current_phase",
+        "current_march_step",
+        "current_action_step",
+        "is_first_turn_of_game",
+        "current_turn",
+    ),
+    "game_state_manager": ("players", "terrains", "terrain_control"),
+    "effect_manager": ("active_effects",),
+    "minor_terrain_manager": ("_terrain_placements",),
+    "dua_manager": ("dua_by_player", "global_burial_conditions"),
+    "bua_manager": ("_player_buas", "_player_minor_terrain_buas"),
+    "summoning_pool_manager": ("_player_pools", "_minor_terrain_pools", "_summoned_dragons"),
+    "reserves_manager": ("reserves_by_player", "current_turn"),
+}
+
+
+@dataclass(frozen=True)
+class GoldenGameState:
+    """A captured engine state and the setup it was built with."""
+
+    scenario: str
+    engine_kwargs: Tuple[Tuple[str, Any], ...]  # Arguments for create_standard_two_player_engine
+    snapshot: bytes  # Pickled {component: {attribute: value}}
+
+
+class _GoldenPickler(pickle.Pickler):
+    """Pickler storing catalog minor terrains as references to MINOR_TERRAIN_DATA."""
+
+    _catalog_keys = {id(terrain): key for key, terrain in MINOR_TERRAIN_DATA.items()}
+
+    def persistent_id(self, obj: Any) -> Any:
+        key = self._catalog_keys.get(id(obj))
+        if key is not None and MINOR_TERRAIN_DATA.get(key) is obj:
+            return ("minor_terrain", key)
+        return None
+
+
+class _GoldenUnpickler(pickle.Unpickler):
+    def persistent_load(self, pid: Any) -> Any:
+        kind, key = pid
+        if kind != "minor_terrain":
+            raise pickle.UnpicklingError(f"Unknown persistent id {pid!r}")
+        return MINOR_TERRAIN_DATA[key]
+
+
+def capture_game_state(engine: GameEngine) -> bytes:
+    """Pickle the game data of an engine."""
+    state = {
+        component: {name: getattr(_component(engine, component), name) for name in names}
+        for component, names in GOLDEN_STATE_ATTRIBUTES.items()
+    }
+    buffer = io.BytesIO()
+    _GoldenPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(state)
+    return buffer.getvalue()
+
+
+def restore_game_state(engine: GameEngine, snapshot: bytes) -> GameEngine:
+    """Replace an engine's game data with a fresh copy of a captured snapshot."""
+    for component, values in _GoldenUnpickler(io.BytesIO(snapshot)).load().items():
+        target = _component(engine, component)
+        for name, value in values.items():
+            setattr(target, name, value)
+
+    # Restored dicts are new objects, so bump every version instead of restoring the
+    # captured ones; read models cached for the old state are never returned again
+    engine.game_state_manager.mark_all_changed()
+    engine.core_engine.read_models.invalidate()
+    return engine
+
+
+def _component(engine: GameEngine, component: str) -> Any:
+    return getattr(engine, component) if component else engine
+
+
+# Scenarios, each applied to a freshly initialized standard two-player engine
+
+
+def _first_march(engine: GameEngine) -> None:
+    """Initial state: first player choosing an acting army for the First March."""
+
+
+def _after_first_march(engine: GameEngine) -> None:
+    """First March done, first player in the Second March."""
+    engine.advance_phase()
+
+
+def _dragons_summoned(engine: GameEngine) -> None:
+    """Every player has a Drake and a Wyrm in their Summoning Pool and the Drake at the frontier."""
+    pool_manager = engine.summoning_pool_manager
+    for player_name in engine.player_names:
+        drake = DragonModel(f"{player_name} Fire Drake", "DRAKE", "FIRE_ELEMENTAL", ["FIRE"], player_name)
+        wyrm = DragonModel(f"{player_name} Water Wyrm", "WYRM", "WATER_ELEMENTAL", ["WATER"], player_name)
+        pool_manager.initialize_player_pool(player_name, [drake, wyrm])
+        pool_manager.summon_dragon_to_terrain(player_name, drake.get_id(), engine.frontier_terrain)
+
+
+def _full_dua_bua(engine: GameEngine) -> None:
+    """Every player's campaign army was killed; its first unit is buried, the rest are in the DUA."""
+    game_state_manager = engine.game_state_manager
+    for player_name in engine.player_names:
+        campaign = strict_get(strict_get(game_state_manager.get_player_data(player_name), "armies"), "campaign")
+        location = strict_get(campaign, "location")
+        for unit in list(strict_get(campaign, "units")):
+            game_state_manager.update_unit_health(player_name, "campaign", strict_get(unit, "name"), 0)
+            engine.dua_manager.add_killed_unit(unit, player_name, death_location=location)
+
+        buried = engine.dua_manager.get_player_dua(player_name)[0]
+        engine.dua_manager.bury_unit(player_name, buried.name)
+        engine.bua_manager.bury_unit(player_name, buried.unit_data.to_unit_model())
+
+
+GOLDEN_SCENARIOS: Dict[str, Callable[[GameEngine], None]] = {
+    "first_march": _first_march,
+    "after_first_march": _after_first_march,
+    "dragons_summoned": _dragons_summoned,
+    "full_dua_bua": _full_dua_bua,
+}
+
+_golden_states: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], GoldenGameState] = {}
+
+
+def get_golden_state(scenario: str, **engine_kwargs: Any) -> GoldenGameState:
+    """
+    Golden state for a scenario, built on first use and cached for the session.
+
+    Args:
+        scenario: Key of GOLDEN_SCENARIOS
+        **engine_kwargs: Arguments for create_standard_two_player_engine
+
+    Raises:
+        ValueError: If the scenario is unknown
+    """
+    if scenario not in GOLDEN_SCENARIOS:
+        raise ValueError(f"Unknown golden scenario '{scenario}'. Available: {', '.join(GOLDEN_SCENARIOS)}")
+
+    key = (scenario, tuple(sorted(engine_kwargs.items())))
+    golden = _golden_states.get(key)
+    if golden is None:
+        engine = create_standard_two_player_engine(**engine_kwargs)
+        GOLDEN_SCENARIOS[scenario](engine)
+        golden = _golden_states[key] = GoldenGameState(scenario, key[1], capture_game_state(engine))
+    return golden
+
+
+def create_golden_engine(scenario: str, **engine_kwargs: Any) -> GameEngine:
+    """Create a standard two-player engine in a scenario's golden state."""
+    golden = get_golden_state(scenario, **engine_kwargs)
+    return restore_game_state(create_standard_two_player_engine(**engine_kwargs), golden.snapshot)
+
+
+def restore_golden_state(engine: GameEngine, scenario: str, **engine_kwargs: Any) -> GameEngine:
+    """
+    Reset an engine to a scenario's golden state.
+
+    The engine must have been created with the same engine_kwargs, e.g. by
+    create_golden_engine or create_standard_two_player_engine.
+    """
+    return restore_game_state(engine, get_golden_state(scenario, **engine_kwargs).snapshot)
@@ -2,74 +2,217 @@
 """
 Run all model snapshot tests.
 
-This script runs all the individual snapshot tests and provides a summary.
+The model catalogs and snapshot test modules are imported once in this process,
+then each snapshot file is checked in its own forked worker so the suites run in
+parallel without re-importing anything. A per-file diff summary is printed for
+any snapshot that no longer matches its model data.
+
+Snapshots are only regenerated when --update is passed.
 """
 
-import subprocess
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import multiprocessing
 import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+# How many changed keys to list per category before summarizing the rest
+MAX_LISTED_KEYS = 5
+
+
+class SnapshotSuite(NamedTuple):
+    """One snapshot test module and the snapshot file it guards."""
+
+    name: str
+    module: str
+    test_class: str
+    serializer: str
+    snapshot_file: str
+
+
+SNAPSHOT_SUITES = [
+    SnapshotSuite(
+        "species", "models.test.species", "TestSpeciesSnapshots", "_serialize_species_data", "species_data.json"
+    ),
+    SnapshotSuite("spells", "models.test.spells", "TestSpellSnapshots", "_serialize_spell_data", "spell_data.json"),
+    SnapshotSuite(
+        "dragon_forms",
+        "models.test.dragon_forms",
+        "TestDragonFormSnapshots",
+        "_serialize_dragon_form_data",
+        "dragon_form_data.json",
+    ),
+    SnapshotSuite(
+        "dragon_types",
+        "models.test.dragon_types",
+        "TestDragonTypeSnapshots",
+        "_serialize_dragon_type_data",
+        "dragon_type_data.json",
+    ),
+    SnapshotSuite(
+        "terrains", "models.test.terrains", "TestTerrainSnapshots", "_serialize_terrain_data", "terrain_data.json"
+    ),
+    SnapshotSuite("units", "models.test.units", "TestUnitSnapshots", "_serialize_unit_data", "unit_data.json"),
+    SnapshotSuite(
+        "die_faces", "models.test.die_faces", "TestDieFaceSnapshots", "_serialize_die_face_data", "die_face_data.json"
+    ),
+]
+
+
+@dataclass
+class SnapshotDiff:
+    """Keys that differ between the current model data and a snapshot file."""
+
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+    def describe(self) -> List[str]:
+        lines = []
+        for label, keys in (("added", self.added), ("removed", self.removed), ("changed", self.changed)):
+            if keys:
+                listed = ", ".join(keys[:MAX_LISTED_KEYS])
+                more = f" (+{len(keys) - MAX_LISTED_KEYS} more)" if len(keys) > MAX_LISTED_KEYS else ""
+                lines.append(f"{len(keys)} {label}: {listed}{more}")
+        return lines
+
+
+@dataclass
+class SuiteResult:
+    """Outcome of one snapshot suite."""
+
+    name: str
+    passed: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+    diff: Optional[SnapshotDiff] = None
+    duration: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        return not self.failed
+
+
+def diff_snapshot(current: Dict[str, Any], existing: Dict[str, Any]) -> SnapshotDiff:
+    """Compare serialized model data against a snapshot, key by key."""
+    return SnapshotDiff(
+        added=sorted(key for key in current if key not in existing),
+        removed=sorted(key for key in existing if key not in current),
+        changed=sorted(key for key in current if key in existing and current[key] != existing[key]),
+    )
+
+
+def load_suite_class(suite: SnapshotSuite):
+    return getattr(importlib.import_module(suite.module), suite.test_class)
+
+
+def run_suite(suite: SnapshotSuite, update: bool = False) -> SuiteResult:
+    """Run every test method of a snapshot suite in this process."""
+    start = time.perf_counter()
+    result = SuiteResult(name=suite.name)
+    test_class = load_suite_class(suite)
+    instance = test_class()
+
+    # Diff before running anything, since --update rewrites the snapshot file
+    current = json.loads(json.dumps(getattr(instance, suite.serializer)()))
+    existing = instance._read_snapshot(suite.snapshot_file)
+    if existing:
+        result.diff = diff_snapshot(current, existing)
+
+    # Definition order, so comparisons run before any generator
+    method_names = [name for name in vars(test_class) if name.startswith("test_")]
+    if not update:
+        # Generators overwrite the snapshot files; only run them when asked to
+        method_names = [name for name in method_names if not name.startswith("test_generate_")]
+
+    for method_name in method_names:
+        output = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(output):
+                getattr(instance, method_name)()
+            result.passed.append(method_name)
+        except Exception as e:
+            message = str(e).splitlines()[0] if str(e) else type(e).__name__
+            if not isinstance(e, AssertionError):
+                message = f"{type(e).__name__}: {message}\n{traceback.format_exc(limit=3)}"
+            result.failed[method_name] = message
+
+    result.duration = time.perf_counter() - start
+    return result
+
+
+def run_all_suites(
+    suites: List[SnapshotSuite], workers: Optional[int] = None, update: bool = False
+) -> List[SuiteResult]:
+    """Run snapshot suites in forked workers, or serially where fork is unavailable."""
+    # Import every catalog up front so forked workers inherit them instead of re-importing
+    for suite in suites:
+        load_suite_class(suite)
+
+    if "fork" not in multiprocessing.get_all_start_methods() or workers == 1:
+        return [run_suite(suite, update) for suite in suites]
+
+    context = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(max_workers=workers or len(suites), mp_context=context) as pool:
+        futures = [pool.submit(run_suite, suite, update) for suite in suites]
+        return [future.result() for future in futures]
+
+
+def print_report(results: List[SuiteResult], elapsed: float) -> None:
+    print("📊 Summary:")
+    for result in results:
+        status = "✅ PASS" if result.success else "❌ FAIL"
+        print(f"  {result.name}: {status} ({len(result.passed)} passed, {result.duration * 1000:.0f} ms)")
+        for method_name, message in result.failed.items():
+            print(f"      ✗ {method_name}: {message}")
+        if result.diff is not None and not result.diff.is_empty():
+            for line in result.diff.describe():
+                print(f"      Δ {line}")
 
-
-def run_test_file(test_file: Path) -> bool:
-    """Run a single test file and return True if successful."""
-    try:
-        result = subprocess.run(
-            [sys.executable, "-m", "pytest", str(test_file), "-v"],
-            capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent.parent.parent,
-        )
-        return result.returncode == 0
-    except Exception as e:
-        print(f"Error running {test_file}: {e}")
-        return False
+    passed = sum(1 for result in results if result.success)
+    print(f"\nResults: {passed}/{len(results)} test files passed in {elapsed:.2f}s")
 
 
-def main():
+def main(argv: Optional[List[str]] = None) -> int:
     """Run all snapshot tests."""
-    test_files = [
-        Path(__file__).parent / "species.py",
-        Path(__file__).parent / "spells.py",
-        Path(__file__).parent / "dragon_forms.py",
-        Path(__file__).parent / "dragon_types.py",
-        Path(__file__).parent / "terrains.py",
-        Path(__file__).parent / "units.py",
-        Path(__file__).parent / "die_faces.py",
-    ]
-
-    results = {}
+    parser = argparse.ArgumentParser(description="Run Dragon Dice model snapshot tests")
+    parser.add_argument("suites", nargs="*", help="Suites to run (default: all)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (1 runs serially)")
+    parser.add_argument("--update", action="store_true", help="Also run the snapshot generators")
+    args = parser.parse_args(argv)
+
+    suites = [suite for suite in SNAPSHOT_SUITES if not args.suites or suite.name in args.suites]
+    if not suites:
+        print(f"Unknown suite(s): {', '.join(args.suites)}")
+        print(f"Available: {', '.join(suite.name for suite in SNAPSHOT_SUITES)}")
+        return 2
 
     print("🔄 Running all model snapshot tests...")
     print("=" * 50)
 
-    for test_file in test_files:
-        test_name = test_file.stem
-        print(f"\n📋 Running {test_name} tests...")
-
-        success = run_test_file(test_file)
-        results[test_name] = success
-
-        if success:
-            print(f"✅ {test_name} tests passed")
-        else:
-            print(f"❌ {test_name} tests failed")
-
-    print("\n" + "=" * 50)
-    print("📊 Summary:")
-
-    passed = sum(1 for success in results.values() if success)
-    total = len(results)
-
-    for test_name, success in results.items():
-        status = "✅ PASS" if success else "❌ FAIL"
-        print(f"  {test_name}: {status}")
-
-    print(f"\nResults: {passed}/{total} test files passed")
+    start = time.perf_counter()
+    results = run_all_suites(suites, workers=args.workers, update=args.update)
+    print_report(results, time.perf_counter() - start)
 
-    if passed == total:
+    failed = sum(1 for result in results if not result.success)
+    if failed == 0:
         print("\n🎉 All snapshot tests passed!")
         return 0
-    print(f"\n⚠️  {total - passed} test file(s) failed")
+    print(f"\n⚠️  {failed} test file(s) failed")
     return 1
 
 
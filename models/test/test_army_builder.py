@@ -0,0 +1,75 @@
+import itertools
+import random
+from unittest.mock import Mock
+
+from models.army_builder import ArmyBuilder
+from models.army_validation import ArmyComposition, DragonDiceArmyValidator
+
+UNIT_DEFINITIONS = {
+    "thug": {"id": "thug", "max_health": 1, "unit_class_type": "Heavy Melee"},
+    "shaman": {"id": "shaman", "max_health": 1, "unit_class_type": "Magic"},
+    "rider": {"id": "rider", "max_health": 2, "unit_class_type": "Cavalry"},
+}
+
+
+def _validator():
+    return DragonDiceArmyValidator(Mock(get_unit_definition=UNIT_DEFINITIONS.get))
+
+
+def _compositions(armies):
+    return [
+        ArmyComposition(
+            army_type,
+            [{"unit_type": unit_type, "max_health": UNIT_DEFINITIONS[unit_type]["max_health"]} for unit_type in units],
+        )
+        for army_type, units in armies.items()
+    ]
+
+
+def _is_legal(armies, force_size, num_players):
+    return _validator().validate_army_composition(_compositions(armies), force_size, num_players).is_valid
+
+
+class TestArmyBuilder:
+    def test_enumerates_exactly_the_legal_compositions(self):
+        force_size = 6
+        builder = ArmyBuilder(list(UNIT_DEFINITIONS.values()), force_size, num_players=2)
+        selections = [
+            list(selection)
+            for count in range(1, force_size // 2 + 1)
+            for selection in itertools.combinations_with_replacement(UNIT_DEFINITIONS, count)
+        ]
+        brute_force = sum(
+            _is_legal({"Home": home, "Campaign": campaign, "Horde": horde}, force_size, 2)
+            for home, campaign, horde in itertools.product(selections, repeat=3)
+        )
+
+        compositions = list(builder.iter_compositions())
+
+        assert len(compositions) == brute_force == builder.count_compositions()
+        assert len({repr(composition) for composition in compositions}) == len(compositions)
+        assert all(_is_legal(composition, force_size, 2) for composition in compositions)
+
+    def test_single_player_builds_no_horde(self):
+        builder = ArmyBuilder(list(UNIT_DEFINITIONS.values()), 6, num_players=1)
+
+        composition = builder.sample(rng=random.Random(3))
+
+        assert list(composition) == ["Home", "Campaign"]
+        assert _is_legal(composition, 6, 1)
+
+    def test_samples_are_legal(self):
+        builder = ArmyBuilder(list(UNIT_DEFINITIONS.values()), 24, num_players=2)
+        sampler = builder.sampler(rng=random.Random(7))
+
+        assert all(_is_legal(next(sampler), 24, 2) for _ in range(50))
+
+    def test_fill_remaining_points_keeps_existing_units(self):
+        builder = ArmyBuilder(list(UNIT_DEFINITIONS.values()), 8, num_players=2)
+
+        filled = builder.fill_remaining_points({"Home": ["shaman", "shaman", "shaman"], "Horde": ["rider"]})
+
+        assert filled["Home"][:3] == ["shaman", "shaman", "shaman"]
+        assert filled["Horde"][:1] == ["rider"]
+        assert _is_legal(filled, 8, 2)
+        assert builder.fill_remaining_points({"Home": ["rider", "rider", "rider"]}) is None
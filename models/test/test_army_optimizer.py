@@ -0,0 +1,52 @@
+import pytest
+
+from models.army_builder import ArmyBuilder
+from models.army_optimizer import ArmyObjective, ArmyOptimizer, get_expected_results, get_unit_expectations
+
+
+def _builder(optimizer, force_size, num_players):
+    definitions = [
+        {"id": unit.unit_id, "max_health": unit.points, "unit_class_type": unit.unit_class_type}
+        for unit in optimizer.catalog
+    ]
+    return ArmyBuilder(definitions, force_size, num_players)
+
+
+def _score(objective, armies):
+    expectations = get_unit_expectations()
+    return sum(objective.score(expectations[unit_id]) for units in armies.values() for unit_id in units)
+
+
+class TestUnitExpectations:
+    def test_id_faces_count_for_every_roll_type(self):
+        # ID_2, Move_3, Melee_2, Move_3, Melee_2, Save_2
+        expected = get_expected_results("amazon_battle_rider")
+
+        assert expected["melee"] == pytest.approx(6 / 6)
+        assert expected["save"] == pytest.approx(4 / 6)
+        assert expected["maneuver"] == pytest.approx(8 / 6)
+        assert expected["missile"] == pytest.approx(2 / 6)
+
+
+class TestArmyOptimizer:
+    @pytest.mark.parametrize(
+        "objective", [ArmyObjective.melee_and_saves(), ArmyObjective.magic_for_elements(["death"])]
+    )
+    @pytest.mark.parametrize(("force_size", "num_players"), [(6, 2), (8, 1)])
+    def test_matches_exhaustive_search(self, objective, force_size, num_players):
+        optimizer = ArmyOptimizer(species=["Goblin"])
+        builder = _builder(optimizer, force_size, num_players)
+
+        result = optimizer.optimize(objective, force_size, num_players)
+
+        best = max(_score(objective, armies) for armies in builder.iter_compositions())
+        assert result.score == pytest.approx(best)
+        assert _score(objective, result.armies) == pytest.approx(best)
+        assert builder.count_compositions(result.armies) == 1  # Already a complete legal force
+
+    def test_units_too_large_for_any_army_are_skipped(self):
+        result = ArmyOptimizer(species=["Amazon"]).optimize(ArmyObjective.melee_and_saves(), 6)
+
+        assert all(
+            get_unit_expectations()[unit_id].points <= 3 for units in result.armies.values() for unit_id in units
+        )
@@ -0,0 +1,100 @@
+import json
+
+import pytest
+
+from models.catalog_validation import CatalogCheck, CatalogValidator
+
+
+class _RecordingCheck:
+    """Validation callable that records each call and can be made to fail."""
+
+    def __init__(self):
+        self.calls = 0
+        self.error = None
+
+    def __call__(self):
+        self.calls += 1
+        if self.error:
+            raise ValueError(self.error)
+
+
+@pytest.fixture
+def catalog_modules(tmp_path, monkeypatch):
+    """Two throwaway catalog modules on sys.path, so their sources can be edited."""
+    (tmp_path / "fake_terrains.py").write_text("TERRAINS = ['Highland']\n")
+    (tmp_path / "fake_spells.py").write_text("SPELLS = ['Hailstorm']\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def checks():
+    return {"terrains": _RecordingCheck(), "spells": _RecordingCheck()}
+
+
+def _validator(checks, cache_file, revalidate=False):
+    catalog_checks = [
+        CatalogCheck("terrains", ("fake_terrains",), checks["terrains"]),
+        CatalogCheck("spells", ("fake_spells",), checks["spells"]),
+    ]
+    return CatalogValidator(catalog_checks, cache_file=cache_file, revalidate=revalidate)
+
+
+class TestCatalogValidator:
+    def test_unchanged_catalogs_are_skipped_on_the_next_run(self, catalog_modules, checks):
+        cache_file = catalog_modules / "cache" / "validation.json"
+
+        first = _validator(checks, cache_file).validate_all()
+        second = _validator(checks, cache_file).validate_all()
+
+        assert first.validated == ["terrains", "spells"]
+        assert second.validated == []
+        assert second.cached == ["terrains", "spells"]
+        assert checks["terrains"].calls == 1
+        assert checks["spells"].calls == 1
+
+    def test_only_changed_catalog_is_revalidated(self, catalog_modules, checks):
+        cache_file = catalog_modules / "validation.json"
+        _validator(checks, cache_file).validate_all()
+
+        (catalog_modules / "fake_spells.py").write_text("SPELLS = ['Hailstorm', 'Palsy']\n")
+        report = _validator(checks, cache_file).validate_all()
+
+        assert report.validated == ["spells"]
+        assert report.cached == ["terrains"]
+
+    def test_revalidate_ignores_the_cache(self, catalog_modules, checks):
+        cache_file = catalog_modules / "validation.json"
+        _validator(checks, cache_file).validate_all()
+
+        report = _validator(checks, cache_file, revalidate=True).validate_all()
+
+        assert report.validated == ["terrains", "spells"]
+        assert checks["terrains"].calls == 2
+
+    def test_failures_are_reported_and_never_cached(self, catalog_modules, checks):
+        cache_file = catalog_modules / "validation.json"
+        checks["spells"].error = "Spell 'Palsy' has unknown element"
+
+        first = _validator(checks, cache_file).validate_all()
+        second = _validator(checks, cache_file).validate_all()
+
+        assert not first.passed
+        assert first.failed == {"spells": "Spell 'Palsy' has unknown element"}
+        assert second.failed == first.failed
+        assert checks["spells"].calls == 2
+        assert json.loads(cache_file.read_text())["catalogs"]["spells"]["passed"] is False
+
+    def test_corrupt_cache_falls_back_to_full_validation(self, catalog_modules, checks):
+        cache_file = catalog_modules / "validation.json"
+        cache_file.write_text("{not json")
+
+        report = _validator(checks, cache_file).validate_all()
+
+        assert report.validated == ["terrains", "spells"]
+
+    def test_game_catalogs_pass(self, tmp_path):
+        report = CatalogValidator(cache_file=tmp_path / "validation.json", revalidate=True).validate_all()
+
+        assert report.passed
+        assert report.validated == ["terrains", "dragons", "species", "units", "spells", "die_faces"]
@@ -0,0 +1,185 @@
+from array import array
+
+from models.die_face_codes import (
+    BULLSEYE_MENTION_CODE,
+    FACE_APPLIES_MASKS,
+    FACE_GRANTS_REROLL,
+    FACE_NAMES,
+    FACE_SAI_KINDS,
+    FACE_TYPES,
+    FACE_VALUES,
+    GENERIC_SAI_CODE,
+    NO_RESULT_CODE,
+    RESULT_ID,
+    RESULT_MANEUVER,
+    RESULT_MELEE,
+    RESULT_NONE,
+    RESULT_SAI,
+    RESULT_SAVE,
+    ROLL_CONTEXT_BITS,
+    SAI_CODES,
+    count_results,
+    encode_face_result,
+    encode_roll,
+    encode_roll_results,
+)
+from models.die_face_model import ALL_DIE_FACES, DRAGON_DIE_FACES
+from models.sai_processor import RAW_RESULT_KINDS, RESOLVED_RESULT_TYPES, RollModifier, SAIProcessor
+
+
+class TestFaceCodes:
+    def test_every_die_face_has_a_matching_code(self):
+        face_ids = sorted(face.face_id for face in ALL_DIE_FACES.values())
+        assert face_ids == list(range(len(ALL_DIE_FACES)))
+        for face_name, face in ALL_DIE_FACES.items():
+            assert FACE_NAMES[face.face_id] == face_name
+            assert FACE_TYPES[face.face_id] == face.face_type
+            assert FACE_VALUES[face.face_id] == face.base_value
+        assert all(face.face_id is not None for face in DRAGON_DIE_FACES.values())
+
+    def test_sai_faces_know_their_sai_and_roll_contexts(self):
+        fly_3 = ALL_DIE_FACES["Fly_3"].face_id
+        assert FACE_SAI_KINDS[fly_3] == "fly"
+        assert FACE_APPLIES_MASKS[fly_3] == ROLL_CONTEXT_BITS["any"]
+        assert FACE_SAI_KINDS[ALL_DIE_FACES["Counter (scorching)"].face_id] == "counter"
+        assert FACE_SAI_KINDS[ALL_DIE_FACES["Melee_3"].face_id] == ""
+
+    def test_entered_results_are_encoded(self):
+        assert encode_face_result(" M ") == ALL_DIE_FACES["Melee_1"].face_id
+        assert encode_face_result("Maneuver") == ALL_DIE_FACES["Move_1"].face_id
+        assert encode_face_result("SAI") == GENERIC_SAI_CODE
+        assert encode_face_result("bullseye") == SAI_CODES["bullseye"] == ALL_DIE_FACES["Bullseye"].face_id
+        assert FACE_SAI_KINDS[encode_face_result("Cantrip")] == "cantrip"
+        assert encode_face_result("not a face") == NO_RESULT_CODE
+
+    def test_only_exact_entries_count_but_any_bullseye_mention_rerolls(self):
+        assert encode_face_result("Melee_3") == NO_RESULT_CODE
+        assert encode_face_result("Bullseye_3") == encode_face_result("bullseye x2") == BULLSEYE_MENTION_CODE
+        assert FACE_GRANTS_REROLL[BULLSEYE_MENTION_CODE]
+        assert FACE_GRANTS_REROLL[SAI_CODES["bullseye"]]
+        assert not FACE_SAI_KINDS[BULLSEYE_MENTION_CODE]
+        assert count_results(encode_roll(["Bullseye_3"]))[RESULT_NONE] == 1
+
+    def test_counting(self):
+        counts = count_results(encode_roll(["m", "Melee", "s", "id", "sai", "junk", ""]))
+        assert counts[RESULT_MELEE] == 2
+        assert counts[RESULT_SAVE] == 1
+        assert counts[RESULT_ID] == 1
+        assert counts[RESULT_SAI] == 1
+        assert counts[RESULT_MANEUVER] == 0
+        assert counts[RESULT_NONE] == 1
+
+    def test_encoded_rolls_pass_through(self):
+        encoded = encode_roll_results({"Unit": ["m", "s"]})
+        assert isinstance(encoded["Unit"], array)
+        assert encode_roll_results(encoded)["Unit"] is encoded["Unit"]
+
+
+def test_processor_accepts_strings_or_codes():
+    army_units = [
+        {"name": "Guard", "species": "Dwarves", "health": 2},
+        {"name": "Scout", "species": "Goblins", "health": 1},
+    ]
+    roll_results = {"Guard": ["M", "ID", "S"], "Scout": ["Ma", "SAI", "bullseye"]}
+    processor = SAIProcessor()
+
+    from_strings = processor.process_combat_roll(roll_results, "melee", army_units, terrain_elements=["earth"])
+    from_codes = processor.process_combat_roll(
+        encode_roll_results(roll_results), "melee", army_units, terrain_elements=["earth"]
+    )
+
+    assert from_strings == from_codes
+    assert (from_strings.raw_melee, from_strings.raw_id, from_strings.raw_save) == (1, 1, 1)
+    assert from_strings.final_melee == 1 + 2  # Melee face plus ID at 2 health
+
+
+def test_bullseye_mentions_allow_rerolls_without_counting_as_sai():
+    army_units = [{"name": "Scout", "species": "Goblins", "health": 1}]
+    result = SAIProcessor()._process_roll_with_10_step_resolution(
+        {"Scout": ["Bullseye_3", "Mi"]}, "missile", army_units, True, [], False, None, None, None
+    )
+
+    assert [effect.unit_name for effect in result.reroll_effects] == ["Scout"]
+    assert result.raw_sai == 0
+    assert result.final_missile == 1
+
+
+class TestSAIEffectDispatch:
+    def test_every_handler_names_a_registry_sai_and_an_effect_method(self):
+        processor = SAIProcessor()
+        for sai_name, method_name in SAIProcessor.SAI_EFFECT_HANDLERS.items():
+            assert sai_name in SAIProcessor.SAI_REGISTRY
+            assert callable(getattr(processor, method_name))
+
+    def test_new_sai_handlers_are_registered_without_touching_the_dispatch(self):
+        class ProcessorWithCoil(SAIProcessor):
+            SAI_EFFECT_HANDLERS = {**SAIProcessor.SAI_EFFECT_HANDLERS, "coil": "_apply_coil_effect"}
+
+            def _apply_coil_effect(self, result, unit_name, x_value, combat_type, is_attacker):
+                result.special_notes.append(f"{unit_name} Coil: {x_value}")
+
+        army_units = [{"name": "Knight", "species": "Amazon", "health": 1, "unit_type": "monster"}]
+
+        def resolve(processor):
+            return processor._process_roll_with_10_step_resolution(
+                {"Knight": ["Coil", "Confuse"]}, "melee", army_units, True, None, False, None, None, None
+            )
+
+        notes = resolve(ProcessorWithCoil()).special_notes
+
+        assert "Knight Coil: 4" in notes
+        assert "Knight Confuse: Effect needs implementation (X=4)" in notes
+        assert "Knight Coil: Effect needs implementation (X=4)" in resolve(SAIProcessor()).special_notes
+
+
+class TestBatchRollResolution:
+    army_units = [
+        {"name": "Guard", "species": "Dwarves", "health": 2},
+        {"name": "Scout", "species": "Goblins", "health": 1, "unit_type": "monster"},
+    ]
+
+    def _resolve_one(self, processor, roll_results):
+        return processor._process_roll_with_10_step_resolution(
+            roll_results, "melee", self.army_units, False, ["fire"], True, "Player 1", "Player 2", None
+        )
+
+    def test_batch_matches_single_roll_resolution(self):
+        class ProcessorWithAllSteps(SAIProcessor):
+            def _apply_charge_effect(self, result, unit_name, x_value, combat_type, is_attacker):
+                result.modifiers.append(RollModifier("subtract", 1, f"{unit_name} Charge", "save"))
+                result.modifiers.append(RollModifier("divide", 2, f"{unit_name} Charge", "melee"))
+                result.modifiers.append(RollModifier("multiply", 3, f"{unit_name} Charge", "melee"))
+
+        roll_stack = [
+            {"Guard": ["M", "S", "ID"], "Scout": ["Charge", "M"]},
+            {"Guard": ["S", "S"], "Scout": ["Bash", "Mi"]},
+            {"Guard": ["M", "M", "M"], "Scout": ["Charge", "Cantrip"]},
+            {"Guard": ["M", "S", "ID"], "Scout": ["Charge", "M"]},
+            {"Guard": [], "Scout": ["SAI"]},
+        ]
+        processor = ProcessorWithAllSteps()
+
+        batch = processor.process_roll_batch(
+            roll_stack, "melee", self.army_units, False, ["fire"], True, "Player 1", "Player 2"
+        )
+
+        assert len(batch) == len(roll_stack)
+        for index, roll_results in enumerate(roll_stack):
+            single = self._resolve_one(processor, roll_results)
+            assert batch.modifiers[index] == single.modifiers
+            for result_type in RAW_RESULT_KINDS:
+                assert batch.raw[result_type][index] == getattr(single, f"raw_{result_type}")
+            for result_type in RESOLVED_RESULT_TYPES:
+                assert batch.final[result_type][index] == getattr(single, f"final_{result_type}")
+
+    def test_repeated_rolls_gather_modifiers_once(self):
+        processor = SAIProcessor()
+        calls = []
+        original = processor._apply_roll_effects
+        processor._apply_roll_effects = lambda *args: calls.append(1) or original(*args)
+
+        batch = processor.process_roll_batch([{"Scout": ["Charge"]}] * 10, "melee", self.army_units)
+
+        assert len(calls) == 1
+        assert list(batch.raw["sai"]) == [0] * 10
+        assert len(set(batch.final["melee"])) == 1
@@ -0,0 +1,69 @@
+from models.dragon_model import DragonModel
+from models.element_model import (
+    ALL_ELEMENTS_MASK,
+    ELEMENT_BITS,
+    element_bit,
+    element_mask,
+    elements_from_mask,
+    filter_by_element_mask,
+    has_all_elements,
+    shares_element,
+)
+from models.minor_terrain_model import get_minor_terrains_by_elements
+from models.species_model import ALL_SPECIES, get_species_by_element
+from models.spell_model import ALL_SPELLS
+from models.terrain_model import TERRAIN_DATA, get_terrains_by_element
+
+
+class TestElementMask:
+    def test_masks_are_case_insensitive_and_ignore_unknown_names(self):
+        assert element_mask(["fire", "WATER"]) == ELEMENT_BITS["FIRE"] | ELEMENT_BITS["WATER"]
+        assert element_mask(["Bogus"]) == 0
+        assert element_bit(None) == 0
+        assert element_bit("ELEMENTAL") == 0
+        assert element_mask(ELEMENT_BITS) == ALL_ELEMENTS_MASK
+
+    def test_round_trip(self):
+        assert elements_from_mask(element_mask(["EARTH", "DEATH"])) == ["DEATH", "EARTH"]
+
+    def test_set_predicates(self):
+        fire_earth = element_mask(["FIRE", "EARTH"])
+        assert shares_element(fire_earth, element_mask(["EARTH", "WATER"]))
+        assert not shares_element(fire_earth, element_mask(["AIR"]))
+        assert has_all_elements(fire_earth, element_mask(["FIRE"]))
+        assert not has_all_elements(fire_earth, element_mask(["FIRE", "AIR"]))
+
+    def test_batch_filter(self):
+        masks = [element_mask(["FIRE"]), element_mask(["AIR", "WATER"]), element_mask(["FIRE", "WATER"])]
+        assert filter_by_element_mask(masks, element_mask(["WATER"])) == [1, 2]
+        assert filter_by_element_mask(masks, element_mask(["FIRE", "WATER"]), match_all=True) == [2]
+
+
+class TestCatalogElementMasks:
+    def test_catalog_masks_match_element_lists(self):
+        for species in ALL_SPECIES.values():
+            assert species.element_mask == element_mask(species.elements)
+        for terrain in TERRAIN_DATA.values():
+            assert terrain.element_mask == element_mask(terrain.elements)
+        for spell in ALL_SPELLS.values():
+            assert spell.element_mask == element_bit(spell.element)
+
+    def test_lookups_match_list_scans(self):
+        for element_name in ELEMENT_BITS:
+            assert get_species_by_element(element_name.lower()) == [
+                species for species in ALL_SPECIES.values() if element_name in species.elements
+            ]
+            assert get_terrains_by_element(element_name) == [
+                terrain for terrain in TERRAIN_DATA.values() if element_name in terrain.elements
+            ]
+        assert all(
+            set(terrain.elements) == {"AIR", "WATER"} for terrain in get_minor_terrains_by_elements(["water", "air"])
+        )
+
+    def test_dragon_element_predicates(self):
+        dragon = DragonModel("Storm", "DRAKE", "AIR_WATER_HYBRID", ["air", "water"], "Player 1")
+        assert dragon.has_element("Water")
+        assert dragon.has_any_element(["FIRE", "AIR"])
+        assert not dragon.has_any_element(["FIRE", "DEATH"])
+        assert dragon.has_all_elements(["WATER", "AIR"])
+        assert not dragon.has_all_elements(["WATER", "FIRE"])
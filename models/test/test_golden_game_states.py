@@ -0,0 +1,59 @@
+import pytest
+
+from models.test.mock.golden_game_states import create_golden_engine, get_golden_state, restore_golden_state
+from utils.field_access import strict_get
+
+
+def _campaign_units(engine, player_name="Player 1"):
+    player_data = engine.game_state_manager.get_player_data(player_name)
+    return strict_get(strict_get(strict_get(player_data, "armies"), "campaign"), "units")
+
+
+class TestGoldenGameStates:
+    def test_restore_resets_engine_state(self):
+        engine = create_golden_engine("after_first_march")
+        assert engine.current_phase == "SECOND_MARCH"
+
+        unit = _campaign_units(engine)[0]
+        engine.game_state_manager.update_unit_health("Player 1", "campaign", unit["name"], 0)
+        engine.advance_phase()
+        assert engine.current_phase == "RESERVES"
+
+        restore_golden_state(engine, "after_first_march")
+        assert engine.current_phase == "SECOND_MARCH"
+        assert engine.turn_manager.current_phase == "SECOND_MARCH"
+        assert [unit["name"] for unit in _campaign_units(engine)][0] == unit["name"]
+
+    def test_engines_get_independent_copies(self):
+        first = create_golden_engine("full_dua_bua")
+        second = create_golden_engine("full_dua_bua")
+
+        first.dua_manager.get_player_dua("Player 1").clear()
+
+        assert _campaign_units(second) == []
+        assert len(second.dua_manager.get_player_dua("Player 1")) == 2
+        assert len(second.bua_manager.get_player_bua("Player 1")) == 1
+        assert second.dua_manager.remove_unit_from_dua("Player 1", "Campaign Unit 2")
+
+    def test_restored_units_share_catalog_data(self):
+        engine = create_golden_engine("first_march")
+        other = create_golden_engine("first_march")
+
+        assert _campaign_units(engine)[0].model is _campaign_units(other)[0].model
+
+    def test_dragons_summoned(self):
+        engine = create_golden_engine("dragons_summoned", frontier_terrain="Flatland")
+
+        pool = engine.summoning_pool_manager
+        assert [dragon["name"] for dragon in pool.get_dragons_at_terrain("Flatland")] == [
+            "Player 1 Fire Drake",
+            "Player 2 Fire Drake",
+        ]
+        assert [dragon.name for dragon in pool.get_dragons_by_element("Player 2", "water")] == ["Player 2 Water Wyrm"]
+        assert get_golden_state("dragons_summoned", frontier_terrain="Flatland") is get_golden_state(
+            "dragons_summoned", frontier_terrain="Flatland"
+        )
+
+    def test_unknown_scenario(self):
+        with pytest.raises(ValueError, match="Unknown golden scenario"):
+            get_golden_state("endgame")
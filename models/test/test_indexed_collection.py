@@ -0,0 +1,143 @@
+import copy
+import pickle
+from unittest.mock import Mock
+
+import pytest
+
+from models.dragon_model import DragonModel
+from models.game_state.bua_manager import BUAManager
+from models.game_state.dua_manager import DUAManager
+from models.game_state.indexed_collection import IndexedCollection, element_index
+from models.game_state.reserves_manager import ReservesManager
+from models.game_state.summoning_pool_manager import SummoningPoolManager
+from models.test.mock.typed_models import create_test_unit
+
+
+def _species_keys(item):
+    return (item.species,)
+
+
+class _Item:
+    def __init__(self, name, species, element_mask):
+        self.name = name
+        self.species = species
+        self.element_mask = element_mask
+
+    def __repr__(self):
+        return f"_Item({self.name})"
+
+
+def _collection(*items):
+    return IndexedCollection(
+        {"name": lambda item: (item.name,), "species": lambda item: (item.species,), "element": element_index},
+        items,
+    )
+
+
+class TestIndexedCollection:
+    def test_lookups_follow_insertion_order(self):
+        a, b, c = _Item("a", "Goblin", 0b011), _Item("b", "Dwarf", 0b010), _Item("c", "Goblin", 0b100)
+        collection = _collection(a, b, c)
+
+        assert collection.lookup("species", "Goblin") == [a, c]
+        assert collection.lookup("element", 0b010) == [a, b]
+        assert collection.count_by("element", 0b100) == 1
+        assert collection.lookup("species", {"name": "Goblin"}) == []
+
+        assert collection.pop_first("species", "Goblin") is a
+        assert collection.lookup("element", 0b010) == [b]
+        assert collection == [b, c]
+
+    def test_list_edits_keep_indexes_current(self):
+        a, b, c = _Item("a", "Goblin", 1), _Item("b", "Goblin", 1), _Item("c", "Goblin", 1)
+        collection = _collection(a, b)
+
+        collection.insert(0, c)
+        assert collection.lookup("species", "Goblin") == [c, a, b]
+        del collection[1]
+        collection.remove(b)
+        assert collection.first("name", "a") is None
+        assert collection.lookup("species", "Goblin") == [c]
+        with pytest.raises(ValueError, match="not in the collection"):
+            collection.remove(b)
+
+        collection.clear()
+        assert not collection
+        assert collection.lookup("species", "Goblin") == []
+
+    def test_sequence_methods_after_removals_by_key(self):
+        a, b, c, d = (_Item(name, "Goblin", 1) for name in "abcd")
+        collection = _collection(a, b, c, d)
+
+        assert collection.pop_first("name", "b") is b
+        assert (collection[1], collection[-1], collection[1:]) == (c, d, [c, d])
+        assert collection.index(d) == 2
+        assert collection.count(a) == 1
+        assert collection.pop() is d
+        assert collection.pop(0) is a
+        assert collection == [c]
+        assert collection.lookup("species", "Goblin") == [c]
+
+    def test_copies_are_reindexed(self):
+        collection = IndexedCollection({"species": _species_keys}, [_Item("a", "Goblin", 1), _Item("b", "Dwarf", 2)])
+
+        for duplicate in (copy.deepcopy(collection), pickle.loads(pickle.dumps(collection))):
+            assert [item.name for item in duplicate.lookup("species", "Goblin")] == ["a"]
+            duplicate.remove(duplicate[0])
+            assert [item.name for item in duplicate] == ["b"]
+        assert len(collection) == 2
+
+
+class TestAreaManagers:
+    def test_dua_lookups_and_removal(self):
+        manager = DUAManager(turn_manager=Mock(get_current_turn=Mock(return_value=1)))
+        for name, species, elements in [("Thug", "Goblin", ["DEATH"]), ("Soldier", "Dwarf", ["FIRE", "EARTH"])]:
+            manager.add_killed_unit({"name": name, "species": species, "health": 1, "elements": elements}, "Player 1")
+
+        assert [unit.name for unit in manager.get_units_by_element("Player 1", "fire")] == ["Soldier"]
+        assert [unit.name for unit in manager.get_units_by_species("Player 1", "Goblin")] == ["Thug"]
+        assert manager.remove_unit_from_dua("Player 1", "Thug")
+        assert not manager.remove_unit_from_dua("Player 1", "Thug")
+        assert manager.get_units_by_species("Player 1", "Goblin") == []
+
+    def test_dua_species_lookup_with_species_dicts(self):
+        manager = DUAManager(turn_manager=Mock(get_current_turn=Mock(return_value=1)))
+        goblin = {"name": "Goblin", "elements": ["DEATH"]}
+        manager.add_killed_unit({"name": "Thug", "species": goblin, "health": 1, "elements": ["DEATH"]}, "Player 1")
+
+        assert [unit.name for unit in manager.get_units_by_species("Player 1", "Goblin")] == ["Thug"]
+        assert [unit.name for unit in manager.get_units_by_species("Player 1", goblin)] == ["Thug"]
+
+    def test_reserves_lookups_and_removal(self):
+        manager = ReservesManager()
+        for name in ["Warrior", "Archer"]:
+            manager.add_unit_to_reserves({"name": name, "species": "Amazons", "health": 1, "elements": []}, "P1")
+
+        assert manager.get_amazon_ivory_magic_generation("P1") == 2
+        assert manager.remove_unit_from_reserves("P1", "Archer").name == "Archer"
+        assert [unit.name for unit in manager.get_reserve_units_by_species("P1", "Amazons")] == ["Warrior"]
+
+    def test_bua_lookups_and_removal(self):
+        manager = BUAManager()
+        thug = create_test_unit(unit_id="thug_1", name="Thug", unit_type="thug", species_key="GOBLIN")
+        rider = create_test_unit(unit_id="rider_1", name="Rider", unit_type="rider")
+        manager.bury_units("P1", [thug, rider])
+
+        assert manager.get_units_by_element("P1", "death") == [thug]
+        assert manager.get_species_count("P1", thug.species) == 1
+        assert manager.find_unit_in_bua("P1", "Rider") is rider
+        assert manager.remove_unit_from_bua("P1", "thug_1") is thug
+        assert manager.get_player_bua("P1") == [rider]
+
+    def test_summoning_pool_lookups_and_removal(self):
+        manager = SummoningPoolManager()
+        drake = DragonModel("Fire Drake", "DRAKE", "FIRE_ELEMENTAL", ["FIRE"], "P1")
+        dragonkin = DragonModel("Fire Dragonkin", "DRAKE", "FIRE_ELEMENTAL", ["FIRE"], "P1")
+        manager.initialize_player_pool("P1", [drake, dragonkin])
+
+        assert manager.get_dragons_by_element("P1", "fire") == [drake, dragonkin]
+        assert manager.get_dragonkin_by_element("P1", "fire") == [dragonkin]
+        assert manager.get_available_dragons("P1", "FIRE_ELEMENTAL") == [drake, dragonkin]
+        assert manager.can_summon_dragon("P1", drake.get_id())
+        assert manager.remove_dragon_from_pool("P1", "Fire Drake") is drake
+        assert manager.get_dragons_by_type("P1", "FIRE_ELEMENTAL") == [dragonkin]
@@ -0,0 +1,133 @@
+from unittest.mock import Mock
+
+from controllers.army_data_service import ArmyDataService
+from game_logic.core_engine import CoreEngine
+from models.game_state.game_state_manager import GameStateManager
+from models.test.mock import create_army_dict, create_player_setup_dict
+from utils.read_model_cache import ReadModelCache
+
+
+def _game_state_manager():
+    players = []
+    for name, home_terrain in [("Player 1", "Highland"), ("Player 2", "Coastland")]:
+        player = create_player_setup_dict(name=name, home_terrain=home_terrain)
+        player["armies"] = {
+            "home": create_army_dict(location=f"{name} {home_terrain}", unit_count=2, army_type="home"),
+            "campaign": create_army_dict(location="Flatland", unit_count=3, army_type="campaign"),
+        }
+        players.append(player)
+    return GameStateManager(players, "Flatland", [("Player 1", 3), ("Player 2", 3), ("__frontier__", 3)])
+
+
+class TestReadModelCache:
+    def test_recomputes_only_when_versions_change(self):
+        cache = ReadModelCache()
+        compute = Mock(side_effect=["first", "second"])
+
+        assert cache.get("summary", (1, 1), compute) == "first"
+        assert cache.get("summary", (1, 1), compute) == "first"
+        assert cache.get("summary", (2, 1), compute) == "second"
+
+        assert compute.call_count == 2
+        assert cache.get_stats() == {"hits": 1, "misses": 2, "entries": 1}
+
+
+class TestGameStateVersions:
+    def setup_method(self):
+        self.manager = _game_state_manager()
+
+    def test_mutators_bump_only_what_they_touch(self):
+        player_1 = self.manager.get_player_version("Player 1")
+        player_2 = self.manager.get_player_version("Player 2")
+        frontier = self.manager.get_terrain_version("Flatland")
+
+        self.manager.update_army_location("Player 1", "campaign", "Player 2 Coastland")
+        assert self.manager.get_player_version("Player 1") > player_1
+        assert self.manager.get_player_version("Player 2") == player_2
+
+        self.manager.update_terrain_face("Flatland", "5")
+        assert self.manager.get_terrain_version("Flatland") > frontier
+        assert self.manager.get_player_version("Player 2") == player_2
+
+    def test_armies_summary_is_memoized_until_the_player_changes(self):
+        first = self.manager.get_player_armies_summary("Player 1")
+        assert self.manager.get_player_armies_summary("Player 1") is first
+        assert self.manager.read_models.hits == 1
+
+        self.manager.move_unit_to_bua("Player 1", "home", first[0]["units"][0]["name"])
+        updated = self.manager.get_player_armies_summary("Player 1")
+
+        assert updated is not first
+        assert [army["unit_count"] for army in updated] == [1, 3]
+        assert self.manager.read_models.misses == 2
+
+
+class TestServiceReadModels:
+    def setup_method(self):
+        self.manager = _game_state_manager()
+
+    def test_formatted_army_data_follows_terrain_control(self):
+        for player_data in self.manager.get_all_players_data().values():
+            for army in player_data["armies"].values():
+                for unit in army["units"]:
+                    unit["species"] = "Amazon"
+        self.manager.refresh_terrain_control()
+        service = ArmyDataService(self.manager)
+
+        first = service.get_formatted_army_data("Player 1")
+        assert service.get_formatted_army_data("Player 1") is first
+        assert not any(army["terrain_controlled"] for army in first["armies"])
+
+        self.manager.set_terrain_controller("Flatland", "Player 1")
+        updated = service.get_formatted_army_data("Player 1")
+
+        assert [army["terrain_controlled"] for army in updated["armies"]] == [False, True]
+        assert service.read_models.get_stats() == {"hits": 1, "misses": 2, "entries": 1}
+
+    def test_formatted_army_data_follows_army_strength_at_its_terrain(self):
+        for player_data in self.manager.get_all_players_data().values():
+            for army in player_data["armies"].values():
+                for unit in army["units"]:
+                    unit["species"] = "Amazon"
+        self.manager.refresh_terrain_control()
+        self.manager.update_army_location("Player 2", "campaign", "Player 2 Coastland")
+        self.manager.update_terrain_face("Flatland", "8")
+        service = ArmyDataService(self.manager)
+
+        assert self.manager.get_terrain_controller("Flatland") == "Player 1"
+        assert [army["terrain_controlled"] for army in service.get_formatted_army_data("Player 1")["armies"]] == [
+            False,
+            True,
+        ]
+
+        # An equal-strength army arriving ties the terrain, so nobody controls it any more
+        self.manager.update_army_location("Player 2", "campaign", "Flatland")
+
+        assert self.manager.get_terrain_controller("Flatland") is None
+        assert not any(army["terrain_controlled"] for army in service.get_formatted_army_data("Player 1")["armies"])
+
+        # Losing a unit leaves Player 2 weaker than Player 1 again
+        unit_name = self.manager.get_army_units("Player 2", "campaign")[0]["name"]
+        self.manager.update_unit_health("Player 2", "campaign", unit_name, 0)
+
+        assert self.manager.get_terrain_controller("Flatland") == "Player 1"
+        assert service.get_formatted_army_data("Player 1")["armies"][1]["terrain_controlled"]
+
+    def test_relevant_terrains_are_memoized_per_terrain_versions(self):
+        managers = {name: Mock() for name in ["bua_manager", "dua_manager", "reserves_manager"]}
+        managers.update({name: Mock() for name in ["summoning_pool_manager", "effect_manager", "turn_manager"]})
+        managers.update({name: Mock() for name in ["action_resolver", "promotion_manager", "eighth_face_manager"]})
+        managers.update({name: Mock() for name in ["dragon_attack_manager", "minor_terrain_manager"]})
+        managers.update(game_state_manager=self.manager, species_ability_manager=Mock())
+        engine = CoreEngine(managers)
+        self.manager.get_terrain_data("Flatland")["armies"] = {"Player 1": ["campaign"]}
+        self.manager.mark_terrain_changed("Flatland")
+
+        assert list(engine.get_relevant_terrains_info(["Player 1"])) == ["Flatland"]
+        assert list(engine.get_relevant_terrains_info(["Player 1"])) == ["Flatland"]
+
+        self.manager.get_terrain_data("Flatland")["armies"] = {}
+        self.manager.mark_terrain_changed("Flatland")
+
+        assert engine.get_relevant_terrains_info(["Player 1"]) == {}
+        assert engine.get_read_model_stats()["core_engine"] == {"hits": 1, "misses": 2, "entries": 1}
@@ -0,0 +1,65 @@
+from unittest.mock import Mock
+
+from models.spell_model import ALL_SPELLS, SpellModel
+from models.spell_targeting import SpellTargetingManager, TargetType, get_spell_target_profile
+
+
+def _unit(name, species, elements):
+    return {"name": name, "species": species, "elements": elements}
+
+
+def _game_state():
+    return {
+        "all_players_data": {
+            "Player 1": {"armies": {"home": {"location": "Highland", "units": [_unit("Guard", "Dwarf", ["FIRE"])]}}},
+            "Player 2": {"armies": {"home": {"location": "Coastland", "units": [_unit("Elf", "Coral Elf", ["AIR"])]}}},
+        },
+        "terrain_data": {"Highland": {"name": "Highland", "elements": ["FIRE", "EARTH"]}},
+    }
+
+
+def _manager():
+    dua_manager = Mock(get_player_dua=Mock(return_value=[]))
+    bua_manager = Mock(get_player_bua=Mock(return_value=[]))
+    return SpellTargetingManager(dua_manager, bua_manager, summoning_pool_manager=None)
+
+
+class TestSpellTargetProfile:
+    def test_profile_is_parsed_once_per_spell(self):
+        spell = SpellModel("Burning Wrath", "Any", 3, False, False, "Target one of your units at any terrain.", "FIRE")
+
+        profile = get_spell_target_profile(spell)
+
+        assert profile is get_spell_target_profile(spell)
+        assert profile.target_types == (TargetType.UNIT, TargetType.TERRAIN)
+        assert profile.own_targets_only
+        assert profile.element_restricted
+
+
+class TestTargetPools:
+    def test_batch_matches_single_spell_lookups(self):
+        manager = _manager()
+        spells = list(ALL_SPELLS.values())
+
+        batch = manager.get_valid_targets_for_spells(spells, "Player 1", _game_state())
+
+        for spell in spells:
+            assert batch[spell.name] == manager.get_valid_targets(spell, "Player 1", _game_state())
+
+    def test_pools_are_reused_while_the_state_version_holds(self):
+        manager = _manager()
+        game_state = _game_state()
+        spell = SpellModel("Firestorm", "Any", 3, False, False, "Target any army.", "FIRE")
+        scans = []
+        build_army_pool = manager._build_army_pool
+        manager._build_army_pool = lambda *args: scans.append(1) or build_army_pool(*args)
+
+        first = manager.get_valid_targets(spell, "Player 1", game_state, state_version=1)
+        game_state["all_players_data"]["Player 2"]["armies"]["home"]["units"][0]["elements"] = ["FIRE"]
+        cached = manager.get_valid_targets(spell, "Player 1", game_state, state_version=1)
+        refreshed = manager.get_valid_targets(spell, "Player 1", game_state, state_version=2)
+
+        assert len(scans) == 2
+        assert [army["player"] for army in first["armies"]] == ["Player 1"]
+        assert cached == first
+        assert [army["player"] for army in refreshed["armies"]] == ["Player 1", "Player 2"]
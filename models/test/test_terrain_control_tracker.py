@@ -0,0 +1,149 @@
+import random
+
+from models.game_state.game_state_manager import GameStateManager
+from models.game_state.terrain_control_tracker import TerrainControlTracker
+from models.test.mock import create_army_dict, create_player_setup_dict
+
+
+def _army(location, unit_count):
+    return {"location": location, "units": [{"name": f"Unit {i}", "health": 1} for i in range(unit_count)]}
+
+
+def _brute_force_controllers(players, terrains):
+    """Reference control evaluation: scan every army for every terrain."""
+    controllers = {}
+    for terrain_name, terrain_info in terrains.items():
+        strengths = {}
+        for player_name, player_data in players.items():
+            for army in player_data["armies"].values():
+                if army["location"] == terrain_name:
+                    strengths[player_name] = strengths.get(player_name, 0) + len(army["units"])
+        controller = None
+        if terrain_info["face"] == 8 and strengths:
+            best = max(strengths.values())
+            leaders = [player for player, strength in strengths.items() if strength == best]
+            controller = leaders[0] if len(leaders) == 1 else None
+        controllers[terrain_name] = controller
+    return controllers
+
+
+class TestTerrainControlTracker:
+    def setup_method(self):
+        self.terrains = {"Highland": {"face": 8}, "Coastland": {"face": 8}, "Flatland": {"face": 3}}
+        self.players = {
+            "Player 1": {"armies": {"home": _army("Highland", 3), "campaign": _army("Coastland", 2)}},
+            "Player 2": {"armies": {"home": _army("Coastland", 2), "campaign": _army("Flatland", 5)}},
+        }
+        self.tracker = TerrainControlTracker()
+        self.tracker.rebuild(self.players, self.terrains)
+
+    def test_control_requires_eighth_face_and_a_clear_leader(self):
+        control = self.tracker.get_all_terrain_control()
+
+        assert control["Highland"].controller == "Player 1"
+        assert control["Highland"].control_strength == 3
+        assert control["Coastland"].controller is None  # Tied 2-2
+        assert control["Flatland"].controller is None  # Not at eighth face
+        assert self.tracker.get_controlled_terrain_counts() == {"Player 1": 1}
+
+    def test_only_changed_terrains_are_reevaluated(self):
+        self.tracker.get_all_terrain_control()
+        evaluated_before = self.tracker.terrains_evaluated
+
+        # Player 2 reinforces Coastland: breaks the tie without touching the other terrains
+        self.players["Player 2"]["armies"]["home"]["units"].append({"name": "Reinforcement", "health": 1})
+        self.tracker.update_army("Player 2", "home", self.players["Player 2"]["armies"]["home"])
+
+        assert self.tracker.get_controlled_terrain_counts() == {"Player 1": 1, "Player 2": 1}
+        assert self.tracker.terrains_evaluated - evaluated_before == 1
+
+    def test_army_move_and_face_change_update_counts(self):
+        campaign = self.players["Player 2"]["armies"]["campaign"]
+        campaign["location"] = "Highland"
+        self.tracker.update_army("Player 2", "campaign", campaign)
+        self.tracker.update_terrain_face("Flatland", 8)
+
+        assert self.tracker.get_terrain_control("Highland").controller == "Player 2"
+        assert self.tracker.get_terrain_control("Flatland").controller is None  # Now empty
+        assert self.tracker.get_controlled_terrain_counts() == {"Player 2": 1}
+
+    def test_sync_drops_armies_that_no_longer_exist(self):
+        del self.players["Player 1"]["armies"]["home"]
+        self.tracker.sync(self.players, self.terrains)
+
+        assert self.tracker.armies_at("Highland") == {}
+        assert self.tracker.get_terrain_control("Highland").controller is None
+        assert self.tracker.get_controlled_terrain_counts() == {}
+
+    def test_assigned_controller_overrides_army_strength(self):
+        self.tracker.set_controller("Flatland", "Player 1")
+        self.tracker.set_controller("Highland", "Player 2")
+
+        assert self.tracker.get_terrain_control("Flatland").controller == "Player 1"
+        assert self.tracker.get_controlled_terrain_counts() == {"Player 1": 1, "Player 2": 1}
+        assert self.tracker.get_assigned_terrains("Player 2") == ["Highland"]
+
+        self.tracker.set_controller("Highland", None)
+        assert self.tracker.get_terrain_control("Highland").controller == "Player 1"
+        assert self.tracker.get_controlled_terrain_counts() == {"Player 1": 2}
+
+    def test_matches_full_scan_through_random_changes(self):
+        rng = random.Random(7)
+        terrain_names = list(self.terrains)
+        for _ in range(200):
+            player_name = rng.choice(list(self.players))
+            army_type = rng.choice(["home", "campaign"])
+            army = self.players[player_name]["armies"][army_type]
+            change = rng.random()
+            if change < 0.4:
+                army["location"] = rng.choice(terrain_names)
+            elif change < 0.7:
+                army["units"] = army["units"][:-1] if army["units"] else [{"name": "New", "health": 1}]
+            else:
+                self.terrains[rng.choice(terrain_names)]["face"] = rng.choice([7, 8])
+            self.tracker.sync(self.players, self.terrains)
+
+            expected = _brute_force_controllers(self.players, self.terrains)
+            actual = {name: control.controller for name, control in self.tracker.get_all_terrain_control().items()}
+            assert actual == expected
+
+
+class TestGameStateManagerTerrainControl:
+    def setup_method(self):
+        players = []
+        for name, home_terrain in [("Player 1", "Highland"), ("Player 2", "Coastland")]:
+            player = create_player_setup_dict(name=name, home_terrain=home_terrain)
+            player["armies"] = {
+                "home": create_army_dict(location=f"{name} {home_terrain}", unit_count=2, army_type="home"),
+                "campaign": create_army_dict(location="Flatland", unit_count=3, army_type="campaign"),
+            }
+            players.append(player)
+        self.manager = GameStateManager(players, "Flatland", [("Player 1", 8), ("Player 2", 8), ("__frontier__", 8)])
+
+    def test_victory_check_uses_tracked_control(self):
+        # Each player holds their home terrain; the frontier is tied
+        assert self.manager.terrain_control.get_controlled_terrain_counts() == {"Player 1": 1, "Player 2": 1}
+        assert self.manager.check_victory_conditions() is None
+
+        # Player 2's campaign army falls back home, handing Player 1 the frontier
+        self.manager.update_army_location("Player 2", "campaign", "Player 2 Coastland")
+
+        assert self.manager.terrain_control.get_controlled_terrain_counts() == {"Player 1": 2, "Player 2": 1}
+        assert self.manager.check_victory_conditions() == "Player 1"
+
+    def test_terrain_face_changes_are_tracked(self):
+        self.manager.update_terrain_face("Player 1 Highland", "7")
+
+        assert self.manager.terrain_control.get_controlled_terrain_counts() == {"Player 2": 1}
+
+    def test_assigned_controller_is_the_only_source_of_control(self):
+        self.manager.set_terrain_controller("Flatland", "Player 2")
+
+        assert self.manager.get_terrain_controller("Flatland") == "Player 2"
+        assert self.manager.get_terrain_controller("Player 1 Highland") == "Player 1"
+        assert self.manager.check_victory_conditions() == "Player 2"
+        assert "controlling_player" not in self.manager.terrains["Flatland"]
+
+        self.manager.update_terrain_control("Flatland", None)
+        assert self.manager.get_terrain_controller("Flatland") is None  # Tied again
+        assert self.manager.check_victory_conditions() is None
@@ -0,0 +1,113 @@
+import copy
+
+import pytest
+from PySide6.QtCore import QObject, Signal
+
+from models.game_state.dua_manager import DUAManager
+from models.game_state.game_state_manager import GameStateManager
+from models.test.mock import create_army_dict, create_player_setup_dict
+from models.test.mock.typed_models import create_test_unit
+from models.unit_data import get_unit_by_id
+from models.unit_instance import UnitInstance, to_unit_dict
+from utils.field_access import strict_get
+
+
+def _unit_dict(unit_id, name="Battle Rider", health=2):
+    data = get_unit_by_id("amazon_battle_rider").to_dict()
+    data.update(unit_id=unit_id, name=name, health=health)
+    return data
+
+
+class TestUnitInstance:
+    def test_dict_view_matches_unit_dict(self):
+        data = create_test_unit(unit_id="unit_1", name="Test Unit", unit_type="test_warrior", health=2).to_dict()
+
+        unit = UnitInstance.from_dict(data)
+
+        assert unit == data
+        assert unit.to_dict() == data
+        assert strict_get(unit, "species")["name"] == "Amazon"
+        assert "location" not in unit
+        assert not hasattr(unit, "__dict__")
+
+    def test_units_of_one_type_share_catalog_data(self):
+        first = UnitInstance.from_dict(_unit_dict("unit_1", "First"))
+        second = UnitInstance.from_dict(_unit_dict("unit_2", "Second", health=1))
+
+        assert first.model is second.model
+        assert first["species"] is second["species"]
+        assert (first["name"], second["name"]) == ("First", "Second")
+        assert (first.health, second.health) == (2, 1)
+
+    def test_writes_update_instance_state(self):
+        unit = UnitInstance.from_dict(_unit_dict("unit_1"))
+        other = UnitInstance.from_dict(_unit_dict("unit_2"))
+
+        unit["health"] = 1
+        unit["location"] = "Reserve Area"
+        unit["species"] = "Amazon"
+        unit["status"] = "stunned"
+
+        assert unit.health == 1
+        assert unit.location == "Reserve Area"
+        assert unit["species"] == "Amazon"
+        assert other["species"]["name"] == "Amazon"
+        assert list(unit) == [*_unit_dict("unit_1"), "location", "status"]
+
+        duplicate = copy.deepcopy(unit)
+        duplicate["health"] = 0
+        assert duplicate.model is unit.model
+        assert unit["health"] == 1
+
+    def test_shared_catalog_data_is_read_only(self):
+        unit = UnitInstance.from_dict(_unit_dict("unit_1"))
+
+        with pytest.raises(TypeError):
+            unit["species"]["name"] = "Goblin"
+        with pytest.raises(TypeError):
+            unit["faces"].append({"name": "Melee_9"})
+        with pytest.raises(TypeError):
+            unit["species"]["elements"].clear()
+
+        faces = copy.deepcopy(unit["faces"])
+        faces[0]["name"] = "Changed"
+        assert type(faces) is list
+        assert unit["faces"][0]["name"] != "Changed"
+        assert unit.to_dict()["species"]["name"] == "Amazon"
+
+    def test_units_survive_dict_signals_as_unit_dicts(self, qtbot):
+        class _Emitter(QObject):
+            unit_selected = Signal(dict)
+
+        unit = UnitInstance.from_dict(_unit_dict("unit_1"))
+        emitter = _Emitter()
+        received = []
+        emitter.unit_selected.connect(received.append)
+
+        emitter.unit_selected.emit(to_unit_dict(unit))
+
+        assert received == [unit.to_dict()]
+        assert to_unit_dict(_unit_dict("unit_2")) == _unit_dict("unit_2")
+
+
+class TestGameStateUnits:
+    def test_army_units_are_unit_instances(self):
+        players = []
+        for name, home_terrain in [("Player 1", "Highland"), ("Player 2", "Coastland")]:
+            player = create_player_setup_dict(name=name, home_terrain=home_terrain)
+            player["armies"] = {"home": create_army_dict(location=f"{name} {home_terrain}", unit_count=2)}
+            players.append(player)
+        manager = GameStateManager(players, "Flatland", [("Player 1", 3), ("Player 2", 3), ("__frontier__", 3)])
+
+        units = manager.get_army_units("Player 1", "home")
+        manager.update_unit_health("Player 1", "home", units[0]["name"], 0)
+
+        assert all(isinstance(unit, UnitInstance) for unit in units)
+        dead = strict_get(manager.get_player_data("Player 1"), "dead_unit_area")[0]
+        dua_unit = DUAManager(turn_manager=_TurnManager()).add_killed_unit(dead, "Player 1")
+        assert dua_unit.unit_data.model is dead.model
+
+
+class _TurnManager:
+    def get_current_turn(self):
+        return 1
@@ -0,0 +1,289 @@
+"""
+Compact unit instances for in-game armies.
+
+A UnitInstance holds the state of one unit in play (id, name, health, location) and an
+interned reference to the catalog UnitModel shared by every unit of the same type for
+everything that does not change during a game (unit type, max health, species, faces).
+
+During the migration away from plain unit dicts a UnitInstance is also a MutableMapping
+with the keys of UnitModel.to_dict() (plus "location" when set and any extra keys), so
+strict_get and friends keep working. The "species" and "faces" values are built once per
+catalog unit and shared by all its instances, so they are read-only (copying them gives
+plain dicts and lists); assigning a key of the catalog unit stores an override for that
+instance's dict view only.
+
+PySide6 cannot convert a UnitInstance for a Signal(dict) and delivers {} instead; emit
+to_unit_dict(unit) rather than the unit itself.
+"""
+
+import copy
+from collections.abc import Mapping, MutableMapping
+from typing import Any, Dict, Iterator, List, NoReturn, Optional, Tuple
+
+from models.unit_model import UnitModel
+
+# Keys of UnitModel.to_dict(), in order
+UNIT_KEYS = ("unit_id", "name", "unit_type", "health", "max_health", "species", "faces")
+
+# Keys stored on the instance rather than the catalog unit
+INSTANCE_KEYS = frozenset({"unit_id", "name", "health", "location"})
+
+# Keys taken from the catalog unit
+CATALOG_KEYS = frozenset({"unit_type", "max_health", "species", "faces"})
+
+# (unit type, max health, species name, face names)
+CatalogKey = Tuple[str, int, Optional[str], Tuple[str, ...]]
+
+
+def _read_only(*_args, **_kwargs) -> NoReturn:
+    raise TypeError("Catalog unit data is shared by all instances and cannot be modified; copy it first")
+
+
+class _ReadOnlyDict(dict):
+    """dict shared between unit instances; copies are plain dicts."""
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self) -> Dict[str, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[str, Any]:
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
+class _ReadOnlyList(list):
+    """list shared between unit instances; copies are plain lists."""
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = clear = extend = insert = pop = remove = reverse = sort = _read_only
+
+    def __copy__(self) -> List[Any]:
+        return list(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> List[Any]:
+        return [copy.deepcopy(value, memo) for value in self]
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+
+def _frozen(value: Any) -> Any:
+    """Read-only copy of a dict view of catalog data (nested dicts and lists included)."""
+    if isinstance(value, dict):
+        return _ReadOnlyDict((key, _frozen(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return _ReadOnlyList(_frozen(item) for item in value)
+    return value
+
+
+_CATALOG: Dict[CatalogKey, UnitModel] = {}
+_CATALOG_VIEWS: Dict[int, Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]] = {}
+
+
+def _catalog_key(unit: UnitModel) -> CatalogKey:
+    species_name = unit.species.name if unit.species else None
+    return unit.unit_type, unit.max_health, species_name, tuple(face.name for face in unit.faces)
+
+
+def intern_unit_model(unit: UnitModel) -> UnitModel:
+    """Shared catalog UnitModel for units with the same type, max health, species and faces."""
+    key = _catalog_key(unit)
+    catalog_unit = _CATALOG.get(key)
+    if catalog_unit is None:
+        catalog_unit = _CATALOG[key] = unit
+        _CATALOG_VIEWS[id(unit)] = (
+            _frozen(unit.species.to_dict()) if unit.species else None,
+            _frozen([face.to_dict() for face in unit.faces]),
+        )
+    return catalog_unit
+
+
+def to_unit_dict(unit: Mapping[str, Any]) -> Dict[str, Any]:
+    """Plain unit dict for a UnitInstance or unit dict, e.g. to emit on a Signal(dict)."""
+    return unit.to_dict() if isinstance(unit, UnitInstance) else dict(unit)
+
+
+def get_interned_unit_count() -> int:
+    """Number of distinct catalog units interned so far."""
+    return len(_CATALOG)
+
+
+class UnitInstance(MutableMapping):
+    """A unit in play: per-instance state plus a shared catalog UnitModel."""
+
+    __slots__ = ("model", "unit_id", "name", "health", "location", "_extra")
+
+    def __init__(
+        self,
+        model: UnitModel,
+        unit_id: Optional[str] = None,
+        name: Optional[str] = None,
+        health: Optional[int] = None,
+        location: Optional[str] = None,
+    ):
+        """
+        Args:
+            model: Unit to take the catalog fields from (interned, so it is not kept itself
+                unless it is the first of its kind)
+            unit_id: Instance id (defaults to the model's)
+            name: Instance name (defaults to the model's)
+            health: Current health (defaults to the model's)
+            location: Where the unit is, if tracked on the unit
+        """
+        self.model = intern_unit_model(model)
+        self.unit_id = model.unit_id if unit_id is None else unit_id
+        self.name = model.name if name is None else name
+        self.health = model.health if health is None else health
+        self.location = location
+        self._extra: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "UnitInstance":
+        """Create from a unit dict (as produced by UnitModel.to_dict(), plus optional extra keys)."""
+        if isinstance(data, UnitInstance):
+            return data.copy()
+        instance = cls(UnitModel.from_dict(data), location=data.get("location"))
+        for key, value in data.items():
+            if key not in UNIT_KEYS and key != "location":
+                instance[key] = value
+        return instance
+
+    # Catalog fields as attributes, matching UnitModel
+
+    @property
+    def unit_type(self) -> str:
+        return self.model.unit_type
+
+    @property
+    def max_health(self) -> int:
+        return self.model.max_health
+
+    @property
+    def species(self):
+        return self.model.species
+
+    @property
+    def faces(self):
+        return self.model.faces
+
+    @property
+    def elements(self) -> List[str]:
+        return self.model.elements
+
+    def get_species_name(self) -> str:
+        """Get the species name for this unit."""
+        return self.model.get_species_name()
+
+    def to_unit_model(self) -> UnitModel:
+        """Standalone UnitModel with this instance's state."""
+        return UnitModel(
+            unit_id=self.unit_id,
+            name=self.name,
+            unit_type=self.model.unit_type,
+            health=self.health,
+            max_health=self.model.max_health,
+            species=self.model.species,
+            faces=self.model.faces,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain unit dict with its own species and face dicts."""
+        data = self.to_unit_model().to_dict()
+        if self.location is not None:
+            data["location"] = self.location
+        if self._extra:
+            data.update(copy.deepcopy(self._extra))
+        return data
+
+    def copy(self) -> "UnitInstance":
+        """Shallow copy sharing the catalog unit (like dict.copy())."""
+        duplicate = UnitInstance.__new__(UnitInstance)
+        duplicate.model = self.model
+        duplicate.unit_id = self.unit_id
+        duplicate.name = self.name
+        duplicate.health = self.health
+        duplicate.location = self.location
+        duplicate._extra = dict(self._extra) if self._extra else None
+        return duplicate
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "UnitInstance":
+        # The catalog unit is shared, never copied
+        duplicate = self.copy()
+        if self._extra:
+            duplicate._extra = copy.deepcopy(self._extra, memo)
+        return duplicate
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for slot, value in state.items():
+            setattr(self, slot, value)
+        # Unpickled units share the catalog unit again
+        self.model = intern_unit_model(self.model)
+
+    # Dict-compatible view
+
+    def __getitem__(self, key: str) -> Any:
+        if key in INSTANCE_KEYS:
+            value = getattr(self, key)
+            if key == "location" and value is None:
+                raise KeyError(key)
+            return value
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        if key == "unit_type":
+            return self.model.unit_type
+        if key == "max_health":
+            return self.model.max_health
+        if key == "species":
+            return _CATALOG_VIEWS[id(self.model)][0]
+        if key == "faces":
+            return _CATALOG_VIEWS[id(self.model)][1]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in INSTANCE_KEYS:
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key == "location" and self.location is not None:
+            self.location = None
+        elif self._extra is not None and key in self._extra and key not in CATALOG_KEYS:
+            del self._extra[key]
+        elif key in UNIT_KEYS:
+            raise TypeError(f"Cannot delete required unit field '{key}'")
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        if key in UNIT_KEYS:
+            return True
+        if key == "location":
+            return self.location is not None
+        return self._extra is not None and key in self._extra
+
+    def __iter__(self) -> Iterator[str]:
+        yield from UNIT_KEYS
+        if self.location is not None:
+            yield "location"
+        if self._extra:
+            yield from (key for key in self._extra if key not in CATALOG_KEYS)
+
+    def __len__(self) -> int:
+        extra_keys = sum(1 for key in self._extra if key not in CATALOG_KEYS) if self._extra else 0
+        return len(UNIT_KEYS) + (self.location is not None) + extra_keys
+
+    def __repr__(self):
+        return (
+            f"UnitInstance(id={self.unit_id}, name='{self.name}', type='{self.model.unit_type}', "
+            f"hp={self.health}/{self.model.max_health})"
+        )
@@ -93,6 +93,11 @@ class UnitModel:
         """Get the elements from the unit's species."""
         return self.species.elements if self.species else []
 
+    @property
+    def element_mask(self) -> int:
+        """Get the element bitmask from the unit's species."""
+        return self.species.element_mask if self.species else 0
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "UnitModel":
         from models.die_face_model import DieFaceModel
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Offscreen rendering benchmark for the gameplay views and dialogs.
+
+Drives MainGameplayView, MagicActionDialog, MeleeCombatDialog, DamageAllocationDialog
+and ReservesPhaseDialog headless (QT_QPA_PLATFORM=offscreen) through scripted game
+states of increasing size, from 2 players with 12 point forces up to 4 players with
+60 point forces. Forces are built from catalog units with the army optimizer, so army
+sizes grow the way real ones do.
+
+For every view and game state it records construction time, refresh latency (a full
+update_ui for the gameplay view; for the dialogs, a refresh that touches every unit
+widget), the time to paint the view into an offscreen pixmap and the number of child
+widgets, and writes a JSON report.
+Given a baseline report, it exits with status 1 when any median refresh or construction
+time regressed by more than the tolerance. A view that raises while being driven through
+a game state gets an "error" entry in the report instead of timings.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Type
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PySide6.QtCore import QCoreApplication, QEvent  # noqa: E402
+from PySide6.QtWidgets import QApplication, QWidget  # noqa: E402
+
+from game_logic.engine_old import GameEngine as LegacyGameEngine  # noqa: E402
+from game_logic.game_orchestrator import GameOrchestrator as GameEngine  # noqa: E402
+from models.army_optimizer import ArmyObjective, ArmyOptimizer  # noqa: E402
+from models.unit_data import get_unit_by_id  # noqa: E402
+from utils.field_access import strict_get  # noqa: E402
+from views.damage_allocation_dialog import DamageAllocationDialog  # noqa: E402
+from views.magic_action_dialog import MagicActionDialog  # noqa: E402
+from views.main_gameplay_view import MainGameplayView  # noqa: E402
+from views.melee_combat_dialog import MeleeCombatDialog  # noqa: E402
+from views.reserves_phase_dialog import ReservesPhaseDialog  # noqa: E402
+
+REPORT_FORMAT_VERSION = 1
+
+# Slowdowns smaller than this are timer noise, whatever the ratio
+MIN_REGRESSION_MS = 1.0
+
+# (number of players, force size in points), smallest to largest
+GAME_SIZES: List[Tuple[int, int]] = [(2, 12), (2, 24), (3, 36), (4, 48), (4, 60)]
+
+HOME_TERRAINS = ["Highland", "Coastland", "Swampland", "Feyland"]
+FRONTIER_TERRAIN = "Flatland"
+PLAYER_SPECIES = ["Goblin", "Amazon", "Dwarf", "Coral Elf"]
+
+# Optimizer army names -> army keys used by the game state
+ARMY_KEYS = {"Home": "home", "Campaign": "campaign", "Horde": "horde"}
+
+# Keep the QApplication alive for as long as the views being measured
+_app = None
+
+
+class ViewBenchmark(NamedTuple):
+    """How to build a view for a game engine (under a parent widget) and how to refresh it."""
+
+    create: Callable[[Any, QWidget], QWidget]
+    refresh: Callable[[QWidget], None]
+    # MainGameplayView still reads the player summaries, terrains and effects through the
+    # legacy engine API, which the orchestrator does not provide
+    engine_class: Type = GameEngine
+
+
+def _player_name(index: int) -> str:
+    return f"Player {index + 1}"
+
+
+def _home_terrain_name(index: int) -> str:
+    return f"{_player_name(index)} {HOME_TERRAINS[index]}"
+
+
+def build_player_setup(num_players: int, force_size: int) -> List[Dict[str, Any]]:
+    """Player setup data with optimized catalog armies of the given force size."""
+    players = []
+    for index in range(num_players):
+        player_name = _player_name(index)
+        species = PLAYER_SPECIES[index % len(PLAYER_SPECIES)]
+        force = ArmyOptimizer(species=[species]).optimize(ArmyObjective.melee_and_saves(), force_size, num_players)
+        if force is None:
+            raise ValueError(f"No legal {force_size} point {species} force for {num_players} players")
+
+        locations = {
+            "home": _home_terrain_name(index),
+            "campaign": FRONTIER_TERRAIN,
+            "horde": _home_terrain_name((index + 1) % num_players),
+        }
+        armies = {}
+        for army_name, unit_ids in force.armies.items():
+            army_key = ARMY_KEYS[army_name]
+            units = []
+            for number, unit_id in enumerate(unit_ids, 1):
+                unit = get_unit_by_id(unit_id).to_dict()
+                unit.update(unit_id=f"{player_name}_{army_key}_{number}", name=f"{unit['name']} {number}")
+                units.append(unit)
+            armies[army_key] = {
+                "name": f"{player_name} {army_name}",
+                "location": locations[army_key],
+                "allocated_points": sum(strict_get(unit, "max_health") for unit in units),
+                "units": units,
+                "unique_id": f"{player_name.lower().replace(' ', '_')}_{army_key}",
+            }
+
+        players.append(
+            {
+                "name": player_name,
+                "home_terrain": HOME_TERRAINS[index],
+                "force_size": force_size,
+                "selected_dragons": [],
+                "armies": armies,
+            }
+        )
+    return players
+
+
+def build_game_engine(num_players: int, force_size: int, engine_class: Type = GameEngine) -> Any:
+    """Initialized engine for a scripted game state of the given size."""
+    distance_rolls = [(_player_name(index), 3 + index % 4) for index in range(num_players)]
+    return engine_class(
+        player_setup_data=build_player_setup(num_players, force_size),
+        first_player_name=_player_name(0),
+        frontier_terrain=FRONTIER_TERRAIN,
+        distance_rolls=[*distance_rolls, ("__frontier__", 4)],
+    )
+
+
+def _army(engine: GameEngine, player_index: int, army_key: str) -> Dict[str, Any]:
+    player_data = engine.game_state_manager.get_player_data(_player_name(player_index))
+    return strict_get(strict_get(player_data, "armies"), army_key)
+
+
+def _create_magic_dialog(engine: GameEngine, parent: QWidget) -> QWidget:
+    army = _army(engine, 0, "home")
+    return MagicActionDialog(_player_name(0), army, strict_get(army, "location"), parent=parent)
+
+
+def _create_melee_dialog(engine: GameEngine, parent: QWidget) -> QWidget:
+    attacker_army, defender_army = _army(engine, 0, "campaign"), _army(engine, 1, "campaign")
+    return MeleeCombatDialog(
+        _player_name(0), attacker_army, _player_name(1), defender_army, FRONTIER_TERRAIN, parent=parent
+    )
+
+
+def _create_damage_dialog(engine: GameEngine, parent: QWidget) -> QWidget:
+    army = _army(engine, 1, "campaign")
+    # The dialog shows each unit's elements, which army units only carry through their species
+    units = [{**unit, "elements": unit.elements} for unit in strict_get(army, "units")]
+    damage = max(1, len(units) // 2)
+    return DamageAllocationDialog(strict_get(army, "name"), {**army, "units": units}, damage, parent=parent)
+
+
+def _create_reserves_dialog(engine: GameEngine, parent: QWidget) -> QWidget:
+    # The first player's home army waits in the Reserve Area
+    reserves = [dict(unit) for unit in strict_get(_army(engine, 0, "home"), "units")]
+    terrain_armies = {
+        strict_get(army, "location"): army for army in (_army(engine, 0, "campaign"), _army(engine, 0, "horde"))
+    }
+    terrains = list(engine.game_state_manager.terrains)
+    return ReservesPhaseDialog(_player_name(0), reserves, terrain_armies, terrains, parent=parent)
+
+
+def _refresh_gameplay_view(view: MainGameplayView) -> None:
+    # update_ui skips updates while the phase and steps are unchanged; forget the last state
+    # so every refresh rebuilds the player summaries, terrains and effects
+    view._last_phase_state = None
+    view.update_ui()
+
+
+def _refresh_damage_dialog(dialog: DamageAllocationDialog) -> None:
+    # Resets and re-assigns every unit's damage, recounting the totals after each change
+    dialog._distribute_evenly()
+
+
+def _refresh_reserves_dialog(dialog: ReservesPhaseDialog) -> None:
+    # Plans every reserve unit to join an existing army, which toggles each unit widget
+    # and rebuilds the deployment plan list
+    widget = dialog.reinforce_widget
+    widget._select_all_units()
+    widget.terrain_combo.setCurrentIndex(widget.terrain_combo.findText(next(iter(widget.existing_terrain_armies))))
+    widget._add_to_deployment()
+
+
+VIEW_BENCHMARKS: Dict[str, ViewBenchmark] = {
+    "MainGameplayView": ViewBenchmark(
+        lambda engine, parent: MainGameplayView(engine, parent=parent), _refresh_gameplay_view, LegacyGameEngine
+    ),
+    "MagicActionDialog": ViewBenchmark(_create_magic_dialog, lambda dialog: dialog._update_step_display()),
+    "MeleeCombatDialog": ViewBenchmark(_create_melee_dialog, lambda dialog: dialog._update_step_display()),
+    "DamageAllocationDialog": ViewBenchmark(_create_damage_dialog, _refresh_damage_dialog),
+    "ReservesPhaseDialog": ViewBenchmark(_create_reserves_dialog, _refresh_reserves_dialog),
+}
+
+
+def _elapsed_ms(start: float) -> float:
+    return (time.perf_counter() - start) * 1000.0
+
+
+def benchmark_view(name: str, engine: Any, repeats: int) -> Dict[str, Any]:
+    """Measure one view against one game state."""
+    benchmark = VIEW_BENCHMARKS[name]
+    app = QApplication.instance()
+
+    # Views are built inside a host widget that is always deleted afterwards, so a view
+    # whose constructor raises does not leave half-built widgets behind
+    host = QWidget()
+    try:
+        start = time.perf_counter()
+        view = benchmark.create(engine, host)
+        construct_ms = _elapsed_ms(start)
+
+        refresh_times = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            benchmark.refresh(view)
+            app.processEvents()
+            refresh_times.append(_elapsed_ms(start))
+
+        start = time.perf_counter()
+        view.grab()
+        render_ms = _elapsed_ms(start)
+
+        widget_count = len(view.findChildren(QWidget))
+    finally:
+        host.deleteLater()
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+    return {
+        "construct_ms": round(construct_ms, 3),
+        "refresh_ms": {
+            "median": round(statistics.median(refresh_times), 3),
+            "max": round(max(refresh_times), 3),
+        },
+        "render_ms": round(render_ms, 3),
+        "widget_count": widget_count,
+    }
+
+
+def run_benchmarks(
+    views: Optional[List[str]] = None, game_sizes: Optional[List[Tuple[int, int]]] = None, repeats: int = 5
+) -> Dict[str, Any]:
+    """Run the benchmarks and return the report."""
+    global _app
+    _app = QApplication.instance() or QApplication([])
+    views = views or list(VIEW_BENCHMARKS)
+    game_sizes = game_sizes or GAME_SIZES
+
+    # Build every view once first, so one-off costs (style sheets, fonts, icons) are not
+    # charged to whichever view happens to be measured first
+    engine_classes = list(dict.fromkeys(VIEW_BENCHMARKS[name].engine_class for name in views))
+    warm_up_engines = {engine_class: build_game_engine(*game_sizes[0], engine_class) for engine_class in engine_classes}
+    for name in views:
+        with contextlib.suppress(Exception):
+            benchmark_view(name, warm_up_engines[VIEW_BENCHMARKS[name].engine_class], repeats=1)
+
+    results = []
+    for num_players, force_size in game_sizes:
+        engines = {
+            engine_class: build_game_engine(num_players, force_size, engine_class) for engine_class in engine_classes
+        }
+        unit_count = sum(
+            len(strict_get(army, "units"))
+            for player_data in next(iter(engines.values())).game_state_manager.players.values()
+            for army in strict_get(player_data, "armies").values()
+        )
+        for name in views:
+            result = {"view": name, "players": num_players, "force_size": force_size, "units": unit_count}
+            try:
+                result.update(benchmark_view(name, engines[VIEW_BENCHMARKS[name].engine_class], repeats))
+            except Exception as e:
+                # Report views that cannot be driven through this state instead of aborting the run
+                result["error"] = f"{type(e).__name__}: {e}"
+            results.append(result)
+
+    return {
+        "format_version": REPORT_FORMAT_VERSION,
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "qt_platform": os.environ.get("QT_QPA_PLATFORM", ""),
+        "repeats": repeats,
+        "results": results,
+    }
+
+
+def find_regressions(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Describe every median refresh or construction time over tolerance times its baseline."""
+
+    def key(result: Dict[str, Any]) -> Tuple[str, int, int]:
+        return strict_get(result, "view"), strict_get(result, "players"), strict_get(result, "force_size")
+
+    baseline_results = {key(result): result for result in strict_get(baseline, "results")}
+    regressions = []
+    for result in strict_get(report, "results"):
+        previous = baseline_results.get(key(result))
+        if previous is None or "error" in result or "error" in previous:
+            continue
+        for metric, current_ms, previous_ms in (
+            ("construct", result["construct_ms"], previous["construct_ms"]),
+            ("refresh", result["refresh_ms"]["median"], previous["refresh_ms"]["median"]),
+        ):
+            if current_ms > previous_ms * tolerance and current_ms - previous_ms > MIN_REGRESSION_MS:
+                view, players, force_size = key(result)
+                regressions.append(
+                    f"{view} ({players} players, {force_size} points): {metric} "
+                    f"{current_ms:.1f} ms vs {previous_ms:.1f} ms baseline"
+                )
+    return regressions
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark offscreen rendering of the gameplay views")
+    parser.add_argument("--views", nargs="+", choices=list(VIEW_BENCHMARKS), help="Views to benchmark (default: all)")
+    parser.add_argument("--repeats", type=int, default=5, help="Refreshes measured per view and game state")
+    parser.add_argument("--output", "-o", help="Write the JSON report here instead of stdout")
+    parser.add_argument("--baseline", help="Earlier JSON report to compare against")
+    parser.add_argument(
+        "--tolerance", type=float, default=1.5, help="Allowed slowdown factor against the baseline (default: 1.5)"
+    )
+    args = parser.parse_args()
+
+    # Keep the game's console logging out of the JSON report on stdout
+    with contextlib.redirect_stdout(sys.stderr):
+        report = run_benchmarks(views=args.views, repeats=args.repeats)
+    report_json = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report_json + "\n")
+        print(f"📊 Wrote view benchmark report to {args.output}", file=sys.stderr)
+    else:
+        print(report_json)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = find_regressions(report, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"⚠️  {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+        print(f"✅ No view regressed by more than {args.tolerance:.2f}x", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
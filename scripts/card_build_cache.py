@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Shared build cache for the reference-card generator scripts.
+
+The generators render one HTML fragment per card (spell, species, dragon form, ...).
+This module keeps a content hash of every card's source data next to its rendered
+fragment, so a rerun only re-renders cards whose inputs changed. Dirty cards are
+rendered in a worker pool when there are enough of them to be worth it, and the
+snapshot catalogs are loaded once per process and shared by every generator.
+"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, NamedTuple, Optional, Set, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SNAPSHOTS_DIR = PROJECT_ROOT / "models" / "test" / "snapshots"
+CACHE_DIR = PROJECT_ROOT / ".card_cache"
+
+# Below this many dirty cards, spinning up worker processes costs more than it saves
+PARALLEL_THRESHOLD = 8
+CACHE_FORMAT_VERSION = 1
+
+
+class CardJob(NamedTuple):
+    """A single card to render: ``render(*args)``, plus any extra inputs that affect its output."""
+
+    render: Callable[..., str]
+    args: Tuple[Any, ...]
+    deps: Any = None
+
+
+@lru_cache(maxsize=None)
+def load_snapshot(name: str) -> Dict[str, Any]:
+    """Load a snapshot catalog (e.g. ``"spell_data"``) once per process.
+
+    The returned dict is shared between all callers and must not be mutated.
+    """
+    with open(SNAPSHOTS_DIR / f"{name}.json", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def content_hash(*parts: Any) -> str:
+    """Return a stable hash of JSON-serializable parts."""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def source_fingerprint(*paths: str) -> str:
+    """Hash the source files a generator depends on, so template edits invalidate the cache."""
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def write_if_changed(path: str, content: str) -> bool:
+    """Write content to path unless the file already holds exactly that content."""
+    target = Path(path)
+    if target.exists() and target.read_text(encoding="utf-8") == content:
+        return False
+    target.write_text(content, encoding="utf-8")
+    return True
+
+
+def _render_job(job: CardJob) -> str:
+    return job.render(*job.args)
+
+
+class CardBuildCache:
+    """Content-hash keyed store of rendered card fragments for one generator."""
+
+    def __init__(self, name: str, salt: str = "", cache_dir: Optional[Path] = CACHE_DIR):
+        self.name = name
+        self.salt = salt
+        self.path = cache_dir / f"{name}.json" if cache_dir is not None else None
+        self.entries: Dict[str, Dict[str, str]] = {}
+        self.rendered = 0
+        self.reused = 0
+        self._seen: Set[str] = set()
+        self._load()
+
+    @classmethod
+    def for_script(cls, name: str, script_path: str) -> "CardBuildCache":
+        """Create a persistent cache salted with the generator script's own source."""
+        return cls(name, salt=source_fingerprint(script_path, __file__))
+
+    def _load(self) -> None:
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == CACHE_FORMAT_VERSION and data.get("salt") == self.salt:
+            self.entries = data.get("entries", {})
+
+    def clear(self) -> None:
+        """Forget every cached card, forcing a full rebuild."""
+        self.entries = {}
+
+    def save(self) -> None:
+        """Persist the cache, dropping cards that were not part of this build.
+
+        A no-op for in-memory caches.
+        """
+        if self.path is None:
+            return
+        self.entries = {key: entry for key, entry in self.entries.items() if key in self._seen}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"version": CACHE_FORMAT_VERSION, "salt": self.salt, "entries": self.entries}
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+
+    def render(self, jobs: Dict[str, CardJob], max_workers: Optional[int] = None) -> Dict[str, str]:
+        """Render every job, reusing cached fragments whose content hash is unchanged.
+
+        Returns the rendered HTML per card key, in the order the jobs were given.
+        Card keys must be unique across all ``render`` calls sharing this cache.
+        """
+        hashes = {key: content_hash(self.salt, job.render.__name__, job.args, job.deps) for key, job in jobs.items()}
+        dirty = [key for key in jobs if self.entries.get(key, {}).get("hash") != hashes[key]]
+
+        workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        if len(dirty) >= PARALLEL_THRESHOLD and workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                fragments = list(pool.map(_render_job, [jobs[key] for key in dirty]))
+        else:
+            fragments = [_render_job(jobs[key]) for key in dirty]
+
+        for key, html in zip(dirty, fragments):
+            self.entries[key] = {"hash": hashes[key], "html": html}
+
+        self._seen.update(jobs)
+        self.rendered += len(dirty)
+        self.reused += len(jobs) - len(dirty)
+        return {key: self.entries[key]["html"] for key in jobs}
+
+    def summary(self) -> str:
+        """Return a one-line summary of rendered vs reused cards."""
+        return f"Rendered {self.rendered} card(s), reused {self.reused} from cache"
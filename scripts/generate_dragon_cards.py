@@ -1,32 +1,32 @@
 #!/usr/bin/env python3
 """
 Generate dragon reference cards HTML combining dragon types and forms with detailed face descriptions.
+
+Cards are rebuilt incrementally: only dragon types and forms whose data changed are re-rendered.
+Pass --force to rebuild every card.
 """
 
-import json
+import argparse
 import os
 import sys
-from pathlib import Path
+from typing import Optional
 
 # Add the project root to the path so we can import models
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models.die_face_model import DRAGON_DIE_FACES
+from scripts.card_build_cache import CardBuildCache, CardJob, load_snapshot, write_if_changed
 from utils import strict_get
 
 
 def load_dragon_type_data():
     """Load dragon type data from snapshot."""
-    dragon_type_file = Path("models/test/snapshots/dragon_type_data.json")
-    with open(dragon_type_file) as f:
-        return json.load(f)
+    return load_snapshot("dragon_type_data")
 
 
 def load_dragon_form_data():
     """Load dragon form data from snapshot."""
-    dragon_form_file = Path("models/test/snapshots/dragon_form_data.json")
-    with open(dragon_form_file) as f:
-        return json.load(f)
+    return load_snapshot("dragon_form_data")
 
 
 def get_element_icon(element):
@@ -56,33 +56,51 @@ def get_face_description(face_name):
     return f"No description available for {face_name}"
 
 
-def generate_dragon_types_section():
+def get_dragon_name(dragon_data):
+    """Get the dragon name without the element icons of its display name."""
+    display_name = dragon_data["display_name"]
+    name_parts = display_name.split(" ", 1)
+    if len(name_parts) > 1:
+        return name_parts[1]
+    return display_name
+
+
+def generate_dragon_item(dragon_data):
+    """Generate HTML for a single dragon type entry."""
+    # Create element icons
+    element_icons = "".join([get_element_icon(elem) for elem in dragon_data["elements"]])
+
+    return f"""                            <div class="dragon-item">
+                                <span class="dragon-icons">{element_icons}</span>
+                                <span class="dragon-name">{get_dragon_name(dragon_data)}</span>
+                                <span class="health-badge">{dragon_data["health"]}</span>
+                                <span class="force-badge">{dragon_data["force_value"]}</span>
+                            </div>
+"""
+
+
+def generate_dragon_types_section(cache: Optional[CardBuildCache] = None, max_workers: Optional[int] = None):
     """Generate the dragon types section HTML."""
     dragon_types = load_dragon_type_data()
+    if cache is None:
+        cache = CardBuildCache("dragon_cards", cache_dir=None)
+
+    items = cache.render(
+        {
+            f"type:{dragon_key}": CardJob(generate_dragon_item, (dragon_data,))
+            for dragon_key, dragon_data in dragon_types.items()
+        },
+        max_workers=max_workers,
+    )
 
     # Group dragons by type
     elemental_dragons = []
     hybrid_dragons = []
     special_dragons = []
 
-    for _dragon_key, dragon_data in dragon_types.items():
+    for dragon_key, dragon_data in dragon_types.items():
         dragon_type = dragon_data["dragon_type"]
-        elements = dragon_data["elements"]
-        health = dragon_data["health"]
-        force_value = dragon_data["force_value"]
-        display_name = dragon_data["display_name"]
-
-        # Create element icons
-        element_icons = "".join([get_element_icon(elem) for elem in elements])
-
-        # Determine dragon name (remove element icons from display name)
-        name_parts = display_name.split(" ", 1)
-        if len(name_parts) > 1:
-            dragon_name = name_parts[1]
-        else:
-            dragon_name = display_name
-
-        dragon_item = {"icons": element_icons, "name": dragon_name, "health": health, "force": force_value}
+        dragon_item = {"name": get_dragon_name(dragon_data), "html": items[f"type:{dragon_key}"]}
 
         if dragon_type == "ELEMENTAL":
             elemental_dragons.append(dragon_item)
@@ -104,13 +122,7 @@ def generate_dragon_types_section():
                         <div class="dragon-list">
 """
     for dragon in elemental_dragons:
-        html += f"""                            <div class="dragon-item">
-                                <span class="dragon-icons">{dragon["icons"]}</span>
-                                <span class="dragon-name">{dragon["name"]}</span>
-                                <span class="health-badge">{dragon["health"]}</span>
-                                <span class="force-badge">{dragon["force"]}</span>
-                            </div>
-"""
+        html += dragon["html"]
     html += """                        </div>
                     </div>
 
@@ -122,13 +134,7 @@ def generate_dragon_types_section():
                         <div class="dragon-list">
 """
     for dragon in hybrid_dragons:
-        html += f"""                            <div class="dragon-item">
-                                <span class="dragon-icons">{dragon["icons"]}</span>
-                                <span class="dragon-name">{dragon["name"]}</span>
-                                <span class="health-badge">{dragon["health"]}</span>
-                                <span class="force-badge">{dragon["force"]}</span>
-                            </div>
-"""
+        html += dragon["html"]
     html += """                        </div>
                     </div>
 
@@ -140,13 +146,7 @@ def generate_dragon_types_section():
                         <div class="dragon-list">
 """
     for dragon in special_dragons:
-        html += f"""                            <div class="dragon-item">
-                                <span class="dragon-icons">{dragon["icons"]}</span>
-                                <span class="dragon-name">{dragon["name"]}</span>
-                                <span class="health-badge">{dragon["health"]}</span>
-                                <span class="force-badge">{dragon["force"]}</span>
-                            </div>
-"""
+        html += dragon["html"]
     html += """                        </div>
                     </div>
 """
@@ -154,40 +154,57 @@ def generate_dragon_types_section():
     return html
 
 
-def generate_dragon_forms_section():
-    """Generate the dragon forms section HTML."""
-    dragon_forms = load_dragon_form_data()
-
-    html = ""
-
-    for _form_key, form_data in dragon_forms.items():
-        display_name = form_data["display_name"]
-        face_names = form_data["face_names"]
+def generate_dragon_form_card(form_data):
+    """Generate HTML for a single dragon form card."""
+    display_name = form_data["display_name"]
+    face_names = form_data["face_names"]
 
-        html += f"""                    <div class="form-card">
+    html = f"""                    <div class="form-card">
                         <div class="form-title">{display_name} ({len(face_names)} faces)</div>
                         <div class="faces-list">
 """
 
-        for face_name in face_names:
-            # Get face description
-            description = get_face_description(face_name)
-            # Get display name (remove underscores and clean up)
-            display_face_name = face_name.replace("_", " ")
+    for face_name in face_names:
+        # Get face description
+        description = get_face_description(face_name)
+        # Get display name (remove underscores and clean up)
+        display_face_name = face_name.replace("_", " ")
 
-            html += f"""                            <div class="face-item">
+        html += f"""                            <div class="face-item">
                                 <div class="face-name">{display_face_name}</div>
                                 <div class="face-description">{description}</div>
                             </div>
 """
 
-        html += """                        </div>
+    html += """                        </div>
                     </div>
 """
 
     return html
 
 
+def generate_dragon_forms_section(cache: Optional[CardBuildCache] = None, max_workers: Optional[int] = None):
+    """Generate the dragon forms section HTML."""
+    dragon_forms = load_dragon_form_data()
+    if cache is None:
+        cache = CardBuildCache("dragon_cards", cache_dir=None)
+
+    # Face descriptions come from the die face model, so they are part of each form's hash
+    cards = cache.render(
+        {
+            f"form:{form_key}": CardJob(
+                generate_dragon_form_card,
+                (form_data,),
+                [get_face_description(face_name) for face_name in form_data["face_names"]],
+            )
+            for form_key, form_data in dragon_forms.items()
+        },
+        max_workers=max_workers,
+    )
+
+    return "".join(cards.values())
+
+
 def generate_special_abilities_section():
     """Generate the special abilities section HTML."""
     return """                <div class="special-abilities">
@@ -229,12 +246,12 @@ def generate_summoning_rules_section():
                 </div>"""
 
 
-def generate_complete_html():
+def generate_complete_html(cache: Optional[CardBuildCache] = None, max_workers: Optional[int] = None):
     """Generate the complete dragon cards HTML file."""
 
     # Generate sections
-    dragon_types_html = generate_dragon_types_section()
-    dragon_forms_html = generate_dragon_forms_section()
+    dragon_types_html = generate_dragon_types_section(cache, max_workers)
+    dragon_forms_html = generate_dragon_forms_section(cache, max_workers)
     special_abilities_html = generate_special_abilities_section()
     summoning_rules_html = generate_summoning_rules_section()
 
@@ -533,6 +550,11 @@ def generate_complete_html():
 
 def main():
     """Generate and save the complete dragon cards HTML."""
+    parser = argparse.ArgumentParser(description="Generate dragon reference cards")
+    parser.add_argument("--force", action="store_true", help="Ignore the card cache and rebuild every card")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes for rendering (default: CPU count)")
+    args = parser.parse_args()
+
     print("Generating dragon reference cards...")
 
     # Load data for statistics
@@ -544,13 +566,18 @@ def main():
     print(f"Available die faces: {len(DRAGON_DIE_FACES)}")
 
     # Generate the complete HTML
-    html_content = generate_complete_html()
+    cache = CardBuildCache.for_script("dragon_cards", __file__)
+    if args.force:
+        cache.clear()
+    html_content = generate_complete_html(cache, max_workers=args.jobs)
+    cache.save()
+    print(cache.summary())
 
     # Save to file
-    with open("assets/dragon_cards.html", "w") as f:
-        f.write(html_content)
-
-    print("\\nGenerated complete dragon reference cards: assets/dragon_cards.html")
+    if write_if_changed("assets/dragon_cards.html", html_content):
+        print("\nGenerated complete dragon reference cards: assets/dragon_cards.html")
+    else:
+        print("\nassets/dragon_cards.html is already up to date")
     print(f"Total dragon types: {len(dragon_types)}")
     print(f"Total dragon forms: {len(dragon_forms)}")
 
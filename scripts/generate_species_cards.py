@@ -2,32 +2,31 @@
 """
 Script to generate species cards HTML for all basic species with proper spell filtering.
 Only includes spells for elements that each species actually possesses.
+
+Cards are rebuilt incrementally: only species whose data, units or spells changed are
+re-rendered. Pass --force to rebuild every card.
 """
 
-import json
+import argparse
 import os
 import sys
-from pathlib import Path
 
 # Add the project root to the path so we can import models
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models.spell_model import SPELLS_BY_ELEMENT
+from scripts.card_build_cache import CardBuildCache, CardJob, load_snapshot, write_if_changed
 from utils import strict_get
 
 
 def load_species_data():
     """Load species data from snapshot."""
-    species_file = Path("models/test/snapshots/species_data.json")
-    with open(species_file) as f:
-        return json.load(f)
+    return load_snapshot("species_data")
 
 
 def load_unit_data():
     """Load unit data from snapshot."""
-    units_file = Path("models/test/snapshots/unit_data.json")
-    with open(units_file) as f:
-        return json.load(f)
+    return load_snapshot("unit_data")
 
 
 def get_css_class_name(species_name):
@@ -273,6 +272,24 @@ def generate_species_card(species_name, species_data, units_data):
     return card_html
 
 
+def build_species_card_jobs(species_keys, species_data, units_data):
+    """Build one card job per species, hashed on its data, its units and its available spells."""
+    jobs = {}
+    for species_key in species_keys:
+        if species_key not in species_data:
+            continue
+        species_info = species_data[species_key]
+        species_name = species_info["name"]
+        # Only this species' units are passed along, so unrelated unit edits don't dirty the card
+        species_units = {
+            unit_id: unit for unit_id, unit in units_data.items() if unit.get("species_name") == species_name
+        }
+        spells = get_spells_for_species(species_info["display_name"], species_info["elements"])
+        spell_deps = {element: [spell.to_dict() for spell in spell_list] for element, spell_list in spells.items()}
+        jobs[species_key] = CardJob(generate_species_card, (species_name, species_info, species_units), spell_deps)
+    return jobs
+
+
 def generate_complete_html(cards_html):
     """Generate complete HTML with CSS and structure."""
     # Read CSS from existing file
@@ -313,6 +330,11 @@ def generate_complete_html(cards_html):
 
 def main():
     """Generate species cards for all basic species with spell filtering."""
+    parser = argparse.ArgumentParser(description="Generate species reference cards")
+    parser.add_argument("--force", action="store_true", help="Ignore the card cache and rebuild every card")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes for rendering (default: CPU count)")
+    args = parser.parse_args()
+
     species_data = load_species_data()
     units_data = load_unit_data()
 
@@ -348,23 +370,23 @@ def main():
                     print(f"  {element}: {len(spell_list)} spells")
 
     # Generate cards
-    cards_html = ""
-    for species_key in basic_species:
-        if species_key in species_data:
-            species_info = species_data[species_key]
-            species_name = species_info["name"]
-            card_html = generate_species_card(species_name, species_info, units_data)
-            cards_html += card_html
+    cache = CardBuildCache.for_script("species_cards", __file__)
+    if args.force:
+        cache.clear()
+    cards = cache.render(build_species_card_jobs(basic_species, species_data, units_data), max_workers=args.jobs)
+    cache.save()
+    print(cache.summary())
+    cards_html = "".join(cards.values())
 
     # Generate complete HTML
     complete_html = generate_complete_html(cards_html)
 
     # Save to file
     output_file = "species_cards_output.html"
-    with open(output_file, "w") as f:
-        f.write(complete_html)
-
-    print(f"\nGenerated complete species cards HTML: {output_file}")
+    if write_if_changed(output_file, complete_html):
+        print(f"\nGenerated complete species cards HTML: {output_file}")
+    else:
+        print(f"\n{output_file} is already up to date")
     print(f"Total species: {len(basic_species)}")
 
 
@@ -1,17 +1,25 @@
 #!/usr/bin/env python3
 """
 Generate spell cards HTML from spell data snapshot.
+
+Cards are rebuilt incrementally: only spells whose snapshot data changed are re-rendered.
+Pass --force to rebuild every card.
 """
 
-import json
-from pathlib import Path
+import argparse
+import os
+import sys
+from typing import Optional
+
+# Add the project root to the path so the shared card cache can be imported
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scripts.card_build_cache import CardBuildCache, CardJob, load_snapshot, write_if_changed
 
 
 def load_spell_data():
     """Load spell data from snapshot."""
-    spell_file = Path("models/test/snapshots/spell_data.json")
-    with open(spell_file) as f:
-        return json.load(f)
+    return load_snapshot("spell_data")
 
 
 def get_element_class(element):
@@ -74,9 +82,19 @@ def generate_spell_card(spell_key, spell_data):  # noqa: ARG001
     return card_html
 
 
-def generate_complete_html():
+def generate_complete_html(cache: Optional[CardBuildCache] = None, max_workers: Optional[int] = None):
     """Generate the complete spell cards HTML file."""
     spell_data = load_spell_data()
+    if cache is None:
+        cache = CardBuildCache("spell_cards", cache_dir=None)
+
+    cards = cache.render(
+        {
+            spell_key: CardJob(generate_spell_card, (spell_key, spell_info))
+            for spell_key, spell_info in spell_data.items()
+        },
+        max_workers=max_workers,
+    )
 
     # Read the base HTML template
     with open("assets/spell_cards_template.html") as f:
@@ -108,8 +126,8 @@ def generate_complete_html():
         <div class="cards-container">
 """
 
-            for spell_key, spell_info in spells_by_element[element]:
-                content_html += generate_spell_card(spell_key, spell_info)
+            for spell_key, _spell_info in spells_by_element[element]:
+                content_html += cards[spell_key]
 
             content_html += """        </div>
     </div>
@@ -123,6 +141,11 @@ def generate_complete_html():
 
 def main():
     """Generate and save the complete spell cards HTML."""
+    parser = argparse.ArgumentParser(description="Generate spell reference cards")
+    parser.add_argument("--force", action="store_true", help="Ignore the card cache and rebuild every card")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes for rendering (default: CPU count)")
+    args = parser.parse_args()
+
     print("Generating spell cards from snapshot data...")
 
     spell_data = load_spell_data()
@@ -139,13 +162,18 @@ def main():
         print(f"  {element}: {count} spells")
 
     # Generate the complete HTML
-    html_content = generate_complete_html()
+    cache = CardBuildCache.for_script("spell_cards", __file__)
+    if args.force:
+        cache.clear()
+    html_content = generate_complete_html(cache, max_workers=args.jobs)
+    cache.save()
+    print(cache.summary())
 
     # Save to file
-    with open("assets/spell_cards.html", "w") as f:
-        f.write(html_content)
-
-    print("\nGenerated complete spell cards HTML: assets/spell_cards.html")
+    if write_if_changed("assets/spell_cards.html", html_content):
+        print("\nGenerated complete spell cards HTML: assets/spell_cards.html")
+    else:
+        print("\nassets/spell_cards.html is already up to date")
     print(f"Total spells: {len(spell_data)}")
 
 
@@ -1,297 +1,362 @@
-#!/usr/bin/env python3
-"""
-Test runner for all E2E tests in the Dragon Dice application.
-Provides comprehensive testing with reporting and CI/CD integration.
-"""
-
-import argparse
-import os
-import sys
-import time
-from pathlib import Path
-
-import pytest
-
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-
-
-def run_e2e_tests(
-    test_categories=None, verbose=False, capture_output=True, save_screenshots=True
-):
-    """
-    Run E2E tests with specified options.
-
-    Args:
-        test_categories: List of test categories to run (default: all)
-        verbose: Enable verbose output
-        capture_output: Capture test output
-        save_screenshots: Save screenshots during visual tests
-    """
-    print("🧪 Dragon Dice E2E Test Suite")
-    print("=" * 50)
-
-    # Available test categories
-    available_categories = {
-        "complete": "test_complete_gameplay_flow.py",
-        "visual": "test_visual_validation.py",
-        "performance": "test_performance_validation.py",
-        "existing": "test_*_flows.py",  # Existing E2E tests
-    }
-
-    if test_categories is None:
-        test_categories = list(available_categories.keys())
-
-    # Build pytest arguments
-    pytest_args = []
-
-    # Add test files based on categories
-    test_dir = Path(__file__).parent
-    for category in test_categories:
-        if category in available_categories:
-            test_pattern = available_categories[category]
-            if category == "existing":
-                # Add existing E2E tests
-                existing_tests = list(test_dir.glob("test_*_flows.py"))
-                pytest_args.extend(str(test) for test in existing_tests)
-            else:
-                test_file = test_dir / test_pattern
-                if test_file.exists():
-                    pytest_args.append(str(test_file))
-                else:
-                    print(f"⚠️ Test file not found: {test_file}")
-
-    if not pytest_args:
-        print("❌ No test files found to run")
-        return False
-
-    # Add pytest options
-    if verbose:
-        pytest_args.extend(["-v", "-s"])
-    else:
-        pytest_args.append("-v")
-
-    if not capture_output:
-        pytest_args.append("--capture=no")
-
-    # Add custom markers and options
-    pytest_args.extend(
-        [
-            "--tb=short",  # Short traceback format
-            "--maxfail=5",  # Stop after 5 failures
-            "--durations=10",  # Show 10 slowest tests
-        ]
-    )
-
-    # Set environment variables for tests
-    if save_screenshots:
-        os.environ["E2E_SAVE_SCREENSHOTS"] = "1"
-
-    print(f"Running tests: {', '.join(test_categories)}")
-    print()
-
-    # Run the tests
-    start_time = time.time()
-    result = pytest.main(pytest_args)
-    end_time = time.time()
-
-    # Print summary
-    print("\n" + "=" * 50)
-    print("🏁 E2E Tests Completed")
-    print(f"⏱️ Total time: {end_time - start_time:.1f} seconds")
-
-    if result == 0:
-        print("✅ All tests passed!")
-    else:
-        print(f"❌ Tests failed with exit code: {result}")
-
-    return result == 0
-
-
-def main():
-    """Main entry point for the test runner."""
-    parser = argparse.ArgumentParser(description="Run Dragon Dice E2E tests")
-
-    parser.add_argument(
-        "--categories",
-        nargs="+",
-        choices=["complete", "visual", "performance", "existing", "all"],
-        default=["all"],
-        help="Test categories to run",
-    )
-
-    parser.add_argument(
-        "--verbose", "-v", action="store_true", help="Enable verbose output"
-    )
-
-    parser.add_argument(
-        "--no-capture",
-        action="store_true",
-        help="Do not capture output (useful for debugging)",
-    )
-
-    parser.add_argument(
-        "--no-screenshots",
-        action="store_true",
-        help="Do not save screenshots during visual tests",
-    )
-
-    parser.add_argument(
-        "--quick",
-        action="store_true",
-        help="Run only essential tests (complete gameplay flow)",
-    )
-
-    args = parser.parse_args()
-
-    # Handle special cases
-    if "all" in args.categories:
-        categories = ["complete", "visual", "performance", "existing"]
-    elif args.quick:
-        categories = ["complete"]
-    else:
-        categories = args.categories
-
-    # Run the tests
-    success = run_e2e_tests(
-        test_categories=categories,
-        verbose=args.verbose,
-        capture_output=not args.no_capture,
-        save_screenshots=not args.no_screenshots,
-    )
-
-    sys.exit(0 if success else 1)
-
-
-if __name__ == "__main__":
-    main()
-    """Comprehensive test runner for end-to-end tests."""
-
-    def __init__(self):
-        self.app = None
-        self.setup_qt_application()
-
-    def setup_qt_application(self):
-        """Set up QApplication for all tests."""
-        if not QApplication.instance():
-            self.app = QApplication(sys.argv)
-        else:
-            self.app = QApplication.instance()
-
-    def run_all_tests(self):
-        """Run all end-to-end test suites."""
-        print("🚀 Dragon Dice Digital - End-to-End Test Suite")
-        print("=" * 60)
-        print("Testing complete user workflows to catch integration issues")
-        print("=" * 60)
-
-        # Create test suite
-        suite = unittest.TestSuite()
-
-        # Add all test classes
-        test_classes = [
-            TestFirstMarchFlows,
-            TestPhaseTransitions,
-            TestActionFlows,
-        ]
-
-        for test_class in test_classes:
-            tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
-            suite.addTests(tests)
-
-        # Run tests with detailed output
-        runner = unittest.TextTestRunner(
-            verbosity=2,
-            stream=sys.stdout,
-            descriptions=True,
-            failfast=False,
-        )
-
-        print(f"\nRunning {suite.countTestCases()} end-to-end tests...\n")
-
-        result = runner.run(suite)
-
-        # Print summary
-        print("\n" + "=" * 60)
-        print("📊 E2E TEST SUMMARY")
-        print("=" * 60)
-        print(f"Tests run: {result.testsRun}")
-        print(f"Failures: {len(result.failures)}")
-        print(f"Errors: {len(result.errors)}")
-        print(f"Skipped: {len(result.skipped)}")
-
-        if result.failures:
-            print(f"\n❌ FAILURES ({len(result.failures)}):")
-            for test, _traceback in result.failures:
-                print(f"  - {test}")
-
-        if result.errors:
-            print(f"\n💥 ERRORS ({len(result.errors)}):")
-            for test, _traceback in result.errors:
-                print(f"  - {test}")
-
-        if result.skipped:
-            print(f"\n⏭️ SKIPPED ({len(result.skipped)}):")
-            for test, reason in result.skipped:
-                print(f"  - {test}: {reason}")
-
-        success_rate = (
-            (
-                (result.testsRun - len(result.failures) - len(result.errors))
-                / result.testsRun
-                * 100
-            )
-            if result.testsRun > 0
-            else 0
-        )
-        print(f"\n✨ Success Rate: {success_rate:.1f}%")
-
-        if result.wasSuccessful():
-            print("🎉 All E2E tests passed! The game workflows are working correctly.")
-        else:
-            print(
-                "⚠️ Some E2E tests failed. Check the failures above for integration issues."
-            )
-
-        return result.wasSuccessful()
-
-    def run_specific_test_suite(self, test_class_name):
-        """Run a specific test suite by name."""
-        test_classes = {
-            "first_march": TestFirstMarchFlows,
-            "phase_transitions": TestPhaseTransitions,
-            "action_flows": TestActionFlows,
-        }
-
-        if test_class_name not in test_classes:
-            print(f"❌ Unknown test suite: {test_class_name}")
-            print(f"Available suites: {', '.join(test_classes.keys())}")
-            return False
-
-        test_class = test_classes[test_class_name]
-        suite = unittest.TestLoader().loadTestsFromTestCase(test_class)
-
-        runner = unittest.TextTestRunner(verbosity=2)
-        result = runner.run(suite)
-
-        return result.wasSuccessful()
-
-
-def main():
-    """Main entry point for the test runner."""
-    runner = E2ETestRunner()
-
-    if len(sys.argv) > 1:
-        # Run specific test suite
-        test_suite = sys.argv[1]
-        success = runner.run_specific_test_suite(test_suite)
-    else:
-        # Run all tests
-        success = runner.run_all_tests()
-
-    sys.exit(0 if success else 1)
-
-
-if __name__ == "__main__":
-    main()
+#!/usr/bin/env python3
+"""
+Test runner for all E2E tests in the Dragon Dice application.
+Provides comprehensive testing with reporting and CI/CD integration.
+
+By default the selected tests are sharded across worker processes. Each worker starts
+a headless (offscreen) QApplication and imports the game catalogs once, then runs its
+shard with pytest; the per-test results are merged into a single report. Tests of one
+class (or module-level tests of one file) always stay in the same shard, so class-level
+setup such as the shared QApplication or GameOrchestrator runs once per worker at most.
+Use --workers 1 to run everything serially in this process.
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# Modules imported by every worker before it runs tests, so the game data catalogs are
+# loaded once per worker instead of being charged to whichever test imports them first
+CATALOG_MODULES = (
+    "models.unit_data",
+    "models.species_model",
+    "models.spell_model",
+    "models.terrain_model",
+    "models.dragon_model",
+    "game_logic.game_orchestrator",
+)
+
+# Keep one QApplication alive for the lifetime of each worker
+_worker_app = None
+
+
+def get_test_files(test_categories):
+    """Test files for the given categories (missing files are reported and skipped)."""
+    # Available test categories
+    available_categories = {
+        "complete": "test_complete_gameplay_flow.py",
+        "visual": "test_visual_validation.py",
+        "performance": "test_performance_validation.py",
+        "existing": "test_*_flows.py",  # Existing E2E tests
+    }
+
+    test_files = []
+    test_dir = Path(__file__).parent
+    for category in test_categories:
+        if category == "all":
+            test_files.extend(str(test) for test in sorted(test_dir.glob("test_*.py")))
+        elif category == "existing":
+            # Add existing E2E tests
+            existing_tests = sorted(test_dir.glob(available_categories[category]))
+            test_files.extend(str(test) for test in existing_tests)
+        elif category in available_categories:
+            test_file = test_dir / available_categories[category]
+            if test_file.exists():
+                test_files.append(str(test_file))
+            else:
+                print(f"⚠️ Test file not found: {test_file}")
+
+    return list(dict.fromkeys(test_files))
+
+
+class _CollectedTests:
+    """Pytest plugin recording the node ids found during collection."""
+
+    def __init__(self):
+        self.node_ids = []
+
+    def pytest_collection_finish(self, session):
+        self.node_ids = [item.nodeid for item in session.items]
+
+
+class _TestResults:
+    """Pytest plugin recording the outcome and duration of each test."""
+
+    def __init__(self):
+        self.results = {}  # Node id -> [outcome, duration, failure text]
+
+    def pytest_runtest_logreport(self, report):
+        result = self.results.setdefault(report.nodeid, ["passed", 0.0, ""])
+        result[1] += report.duration
+        if report.failed:
+            result[0] = "failed" if report.when == "call" else "error"
+            result[2] = report.longreprtext
+        elif report.skipped and result[0] == "passed":
+            result[0] = "skipped"
+
+    def pytest_collectreport(self, report):
+        if report.failed:
+            self.results[report.nodeid] = ["error", 0.0, report.longreprtext]
+
+
+def collect_test_ids(test_files):
+    """Collect the node ids of the tests in the given files without running them."""
+    collected = _CollectedTests()
+    with contextlib.redirect_stdout(io.StringIO()):
+        pytest.main(["--collect-only", "-q", "-p", "no:cacheprovider", *test_files], plugins=[collected])
+    return collected.node_ids
+
+
+def shard_test_ids(node_ids, num_shards):
+    """
+    Split node ids into at most num_shards shards of similar size.
+
+    Tests are grouped by class (or by file for module-level tests) and whole groups are
+    assigned, largest first, to the currently smallest shard.
+    """
+    groups = {}
+    for node_id in node_ids:
+        parts = node_id.split("::")
+        group = "::".join(parts[:2]) if len(parts) > 2 else parts[0]
+        groups.setdefault(group, []).append(node_id)
+
+    shards = [[] for _ in range(max(1, min(num_shards, len(groups))))]
+    for group in sorted(groups.values(), key=len, reverse=True):
+        min(shards, key=len).extend(group)
+    return [shard for shard in shards if shard]
+
+
+def _init_worker():
+    """Start a headless QApplication and pre-load the catalogs in a worker process."""
+    global _worker_app
+
+    os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    if str(project_root) not in sys.path:
+        sys.path.insert(0, str(project_root))
+
+    from PySide6.QtWidgets import QApplication
+
+    _worker_app = QApplication.instance() or QApplication([])
+    for module_name in CATALOG_MODULES:
+        importlib.import_module(module_name)
+
+
+def _run_shard(node_ids, pytest_args):
+    """Run one shard in a worker; returns (exit code, results, output, wall time)."""
+    results = _TestResults()
+    output = io.StringIO()
+    start_time = time.time()
+    with contextlib.redirect_stdout(output):
+        exit_code = pytest.main([*pytest_args, *node_ids], plugins=[results])
+    return int(exit_code), results.results, output.getvalue(), time.time() - start_time
+
+
+def run_sharded(test_files, workers, pytest_args, verbose=False):
+    """
+    Run the tests in the given files across worker processes and merge the results.
+
+    Every collected test must be reported by its shard; tests that are missing (e.g.
+    because a worker crashed) fail the run.
+
+    Returns:
+        True if every shard passed
+    """
+    node_ids = collect_test_ids(test_files)
+    if not node_ids:
+        print("❌ No tests collected")
+        return False
+
+    shards = shard_test_ids(node_ids, workers)
+    print(f"Running {len(node_ids)} tests in {len(shards)} shards")
+
+    merged = {}
+    exit_codes = []
+    # Qt does not survive fork, so workers are always spawned
+    with ProcessPoolExecutor(
+        max_workers=len(shards), mp_context=get_context("spawn"), initializer=_init_worker
+    ) as executor:
+        futures = [executor.submit(_run_shard, shard, pytest_args) for shard in shards]
+        for shard_number, future in enumerate(futures, 1):
+            try:
+                exit_code, results, output, elapsed = future.result()
+            except BrokenProcessPool as e:
+                print(f"  Shard {shard_number}: worker died ({e})")
+                exit_codes.append(None)
+                continue
+            exit_codes.append(exit_code)
+            merged.update(results)
+            print(f"  Shard {shard_number}: {len(results)} tests in {elapsed:.1f}s (exit code {exit_code})")
+            if verbose:
+                print(output)
+
+    outcomes = {}
+    for outcome, _duration, _text in merged.values():
+        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+    print("\n" + ", ".join(f"{count} {outcome}" for outcome, count in sorted(outcomes.items())))
+
+    failures = [(node_id, result) for node_id, result in merged.items() if result[0] in ("failed", "error")]
+    if failures:
+        print(f"\n❌ FAILURES ({len(failures)}):")
+        for node_id, (outcome, _duration, text) in failures:
+            print(f"\n_____ {node_id} ({outcome}) _____")
+            print(text)
+
+    missing = [node_id for node_id in node_ids if node_id not in merged]
+    if missing:
+        print(f"\n❌ NOT RUN ({len(missing)} of {len(node_ids)} collected tests have no result):")
+        for node_id in missing:
+            print(f"  {node_id}")
+
+    slowest = sorted(merged.items(), key=lambda item: item[1][1], reverse=True)[:10]
+    print("\n⏱️ Slowest tests:")
+    for node_id, (_outcome, duration, _text) in slowest:
+        print(f"  {duration:.2f}s {node_id}")
+
+    # Exit code 5 means the shard collected no tests
+    return not failures and not missing and all(code in (0, 5) for code in exit_codes)
+
+
+def run_e2e_tests(
+    test_categories=None,
+    verbose=False,
+    capture_output=True,
+    save_screenshots=True,
+    workers=None,
+):
+    """
+    Run E2E tests with specified options.
+
+    Args:
+        test_categories: List of test categories to run (default: all)
+        verbose: Enable verbose output
+        capture_output: Capture test output
+        save_screenshots: Save screenshots during visual tests
+        workers: Number of worker processes (default: CPU count; 1 runs serially)
+    """
+    print("🧪 Dragon Dice E2E Test Suite")
+    print("=" * 50)
+
+    if test_categories is None:
+        test_categories = ["all"]
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    # Build pytest arguments
+    pytest_args = get_test_files(test_categories)
+
+    if not pytest_args:
+        print("❌ No test files found to run")
+        return False
+
+    # Add pytest options
+    options = []
+    if verbose:
+        options.extend(["-v", "-s"])
+    else:
+        options.append("-v")
+
+    if not capture_output:
+        options.append("--capture=no")
+
+    # Add custom markers and options
+    options.append("--tb=short")  # Short traceback format
+    if workers <= 1:
+        # Stop after 5 failures (not when sharding: each shard would stop on its own and
+        # silently leave the rest of its tests unrun)
+        options.append("--maxfail=5")
+
+    # Set environment variables for tests
+    if save_screenshots:
+        os.environ["E2E_SAVE_SCREENSHOTS"] = "1"
+
+    print(f"Running tests: {', '.join(test_categories)}")
+    print()
+
+    # Run the tests
+    start_time = time.time()
+    if workers > 1:
+        success = run_sharded(pytest_args, workers, [*options, "-p", "no:cacheprovider"], verbose=verbose)
+    else:
+        result = pytest.main([*pytest_args, *options, "--durations=10"])  # Show 10 slowest tests
+        success = result == 0
+    end_time = time.time()
+
+    # Print summary
+    print("\n" + "=" * 50)
+    print("🏁 E2E Tests Completed")
+    print(f"⏱️ Total time: {end_time - start_time:.1f} seconds")
+
+    if success:
+        print("✅ All tests passed!")
+    else:
+        print("❌ Tests failed")
+
+    return success
+
+
+def main():
+    """Main entry point for the test runner."""
+    parser = argparse.ArgumentParser(description="Run Dragon Dice E2E tests")
+
+    parser.add_argument(
+        "--categories",
+        nargs="+",
+        choices=["complete", "visual", "performance", "existing", "all"],
+        default=["all"],
+        help="Test categories to run (all: every test_*.py file in test/e2e)",
+    )
+
+    parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose output")
+
+    parser.add_argument(
+        "--no-capture",
+        action="store_true",
+        help="Do not capture output (useful for debugging)",
+    )
+
+    parser.add_argument(
+        "--no-screenshots",
+        action="store_true",
+        help="Do not save screenshots during visual tests",
+    )
+
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="Run only essential tests (complete gameplay flow)",
+    )
+
+    parser.add_argument(
+        "--workers",
+        "-n",
+        type=int,
+        default=None,
+        help="Number of worker processes to shard tests across (default: CPU count; 1 runs serially)",
+    )
+
+    args = parser.parse_args()
+
+    # Handle special cases
+    if args.quick:
+        categories = ["complete"]
+    else:
+        categories = args.categories
+
+    # Run the tests
+    success = run_e2e_tests(
+        test_categories=categories,
+        verbose=args.verbose,
+        capture_output=not args.no_capture,
+        save_screenshots=not args.no_screenshots,
+        workers=args.workers,
+    )
+
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+"""
+Persistent, bounded cache for odds calculations.
+
+Odds requests repeat constantly: the same army compositions, the same roll type, the
+same modifiers and terrain state. An OddsCache stores calculated odds under a canonical
+hash of those inputs (see odds_key), evicts the least recently used entries beyond
+max_entries and persists to a JSON file, so answers survive app restarts. The file
+records a fingerprint of the sources the odds are derived from (die faces, unit
+definitions, the calculators), and is dropped when any of them changed.
+
+Values must be JSON-serializable; calculators store a dict form of their result and
+rebuild it on a hit. The cache is shared by every odds calculator (each key includes the
+calculator's name) and is safe to use from worker threads.
+"""
+
+import atexit
+import hashlib
+import importlib.util
+import json
+import os
+import sys
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, TypeVar, Union
+
+from config.paths import ProjectPaths
+from utils.field_access import strict_get_optional
+
+T = TypeVar("T")
+
+# Bump when the key or value layout changes, so stale files are ignored
+ODDS_CACHE_FORMAT_VERSION = 1
+
+DEFAULT_MAX_ENTRIES = 4096
+CACHE_PATH_ENV_VAR = "DRAGON_DICE_ODDS_CACHE"
+
+# Modules whose contents determine odds results: the die face catalog (including the SAI
+# descriptions maneuver values are parsed from), unit and species definitions and the calculators
+ODDS_SOURCE_MODULES = (
+    "models.die_face_model",
+    "models.unit_data",
+    "models.unit_model",
+    "models.species_model",
+    "game_logic.maneuver_odds",
+)
+
+# Unit dict keys that may name the unit's definition, in order of preference
+_UNIT_TYPE_KEYS = ("unit_type_id", "unit_type", "unit_id", "id")
+
+UnitSignature = Tuple[str, int, str, Tuple[str, ...]]
+
+
+def unit_signature(unit: Mapping[str, Any]) -> UnitSignature:
+    """(unit type, health, species name, face names) of a unit dict, as used in odds keys."""
+    unit_type = next((str(unit[key]) for key in _UNIT_TYPE_KEYS if unit.get(key)), "")
+    species = strict_get_optional(unit, "species", "")
+    if isinstance(species, Mapping):
+        species = strict_get_optional(species, "name", "")
+    elif species and not isinstance(species, str):
+        species = species.name
+    faces = tuple(
+        str(strict_get_optional(face, "name", "")) if isinstance(face, Mapping) else str(face)
+        for face in strict_get_optional(unit, "faces", None) or ()
+    )
+    return unit_type, int(strict_get_optional(unit, "health", 0)), species, faces
+
+
+@lru_cache(maxsize=1)
+def fingerprint_odds_sources() -> str:
+    """Hash the sources of ODDS_SOURCE_MODULES, this module and the Python version."""
+    digest = hashlib.sha256()
+    digest.update(sys.version.encode("utf-8"))
+    for module_name in (__name__, *ODDS_SOURCE_MODULES):
+        spec = importlib.util.find_spec(module_name)
+        if spec is None or spec.origin is None:
+            raise ValueError(f"Cannot locate source for odds module '{module_name}'")
+        path = Path(spec.origin)
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def odds_key(
+    calculator: str,
+    armies: Iterable[Iterable[Mapping[str, Any]]],
+    roll_type: str,
+    modifiers: Optional[Mapping[str, Any]] = None,
+    terrain_flags: Optional[Mapping[str, Any]] = None,
+    version: int = 1,
+) -> str:
+    """
+    Canonical hash of an odds request.
+
+    Units within an army are sorted, so the same composition always gives the same key;
+    the order of the armies is kept, since it carries their roles (e.g. the maneuvering
+    army first).
+
+    Args:
+        calculator: Name of the calculator (keeps different calculators' entries apart)
+        armies: Unit dicts of each army taking part
+        roll_type: Roll or combat type, e.g. "maneuver" or "melee"
+        modifiers: Active modifiers, e.g. from EffectManager.get_active_modifiers
+        terrain_flags: Terrain state affecting the roll (elements, eighth face control, ...)
+        version: Calculator version, bumped when its logic changes so old results are not reused
+    """
+    canonical = {
+        "calculator": calculator,
+        "version": version,
+        "armies": [sorted(unit_signature(unit) for unit in army) for army in armies],
+        "roll_type": roll_type,
+        "modifiers": dict(modifiers or {}),
+        "terrain": dict(terrain_flags or {}),
+    }
+    encoded = json.dumps(canonical, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class OddsCache:
+    """LRU cache of odds results, optionally persisted to a JSON file."""
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        sources_fingerprint: Optional[str] = None,
+    ):
+        """
+        Args:
+            path: JSON file to load from and save to (None keeps the cache in memory only)
+            max_entries: Entries kept before the least recently used ones are evicted
+            sources_fingerprint: Fingerprint a loaded file must match (fingerprint_odds_sources
+                by default)
+        """
+        self.path = Path(path) if path is not None else None
+        self.max_entries = max_entries
+        self._sources_fingerprint = sources_fingerprint
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Stored value for a key (marking it recently used), or None."""
+        with self._lock:
+            self._load()
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value, evicting least recently used entries if needed."""
+        with self._lock:
+            self._load()
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            self._dirty = True
+
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], T],
+        encode: Callable[[T], Any] = lambda value: value,
+        decode: Callable[[Any], T] = lambda value: value,
+    ) -> T:
+        """
+        Cached result for a key, computing and storing it on a miss.
+
+        Args:
+            key: Key from odds_key
+            compute: Calculates the result
+            encode: Converts the result to a JSON-serializable value for storage
+            decode: Rebuilds the result from its stored value
+        """
+        stored = self.get(key)
+        if stored is not None:
+            return decode(stored)
+        value = compute()
+        self.put(key, encode(value))
+        return value
+
+    def flush(self) -> None:
+        """Write the cache to its file if it changed since it was loaded or last saved."""
+        with self._lock:
+            if self.path is None or not self._dirty:
+                return
+            data = {
+                "format_version": ODDS_CACHE_FORMAT_VERSION,
+                "sources": self._get_sources_fingerprint(),
+                "entries": list(self._entries.items()),
+            }
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temporary_path = self.path.with_name(self.path.name + ".tmp")
+            with open(temporary_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(temporary_path, self.path)
+            self._dirty = False
+
+    def clear(self) -> None:
+        """Drop every entry (the file is emptied on the next flush)."""
+        with self._lock:
+            self._loaded = True
+            self._entries.clear()
+            self._dirty = True
+
+    def get_stats(self) -> Dict[str, Union[int, float]]:
+        """Hit/miss/eviction counters, the hit rate and the number of stored entries."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def _load(self) -> None:
+        # Loaded lazily on first use, so creating the shared cache costs nothing at startup
+        if self._loaded:
+            return
+        self._loaded = True
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"OddsCache: Ignoring unreadable cache file {self.path}: {e}")
+            return
+        if not isinstance(data, dict) or data.get("format_version") != ODDS_CACHE_FORMAT_VERSION:
+            return
+        if data.get("sources") != self._get_sources_fingerprint():
+            # Odds were calculated from other die faces, units or calculator logic
+            return
+        entries: List[Tuple[str, Any]] = [tuple(entry) for entry in data.get("entries", [])]
+        self._entries.update(entries[-self.max_entries :])
+
+    def _get_sources_fingerprint(self) -> str:
+        if self._sources_fingerprint is None:
+            self._sources_fingerprint = fingerprint_odds_sources()
+        return self._sources_fingerprint
+
+
+_shared_cache: Optional[OddsCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_odds_cache() -> OddsCache:
+    """
+    Odds cache shared by the app's odds calculators.
+
+    Stored at $DRAGON_DICE_ODDS_CACHE, or odds_cache.json in the per-user cache directory
+    (ProjectPaths.user_cache_dir) by default, and written back when the process exits.
+    Setting DRAGON_DICE_ODDS_CACHE to an empty string keeps the cache in memory only (as the
+    test suite does).
+    """
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            path_setting = os.environ.get(CACHE_PATH_ENV_VAR)
+            if path_setting is None:
+                _shared_cache = OddsCache(ProjectPaths().odds_cache_file)
+            else:
+                _shared_cache = OddsCache(path_setting or None)
+            atexit.register(_flush_shared_cache)
+        return _shared_cache
+
+
+def _flush_shared_cache() -> None:
+    if _shared_cache is None:
+        return
+    try:
+        _shared_cache.flush()
+    except OSError as e:
+        print(f"OddsCache: Could not save odds cache: {e}")
@@ -0,0 +1,44 @@
+"""
+Version-keyed memoization for derived read models.
+
+A read model (an army summary, formatted UI data, ...) is stored together with the
+versions of the state it was computed from. Asking for it again with the same versions
+returns the stored value; any other versions recompute it. Values are shared between
+callers and should be treated as read-only.
+"""
+
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class ReadModelCache:
+    """Memoizes read models by key, recomputing an entry only when its input versions change."""
+
+    def __init__(self):
+        self._entries: Dict[Hashable, Tuple[Hashable, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, versions: Hashable, compute: Callable[[], T]) -> T:
+        """Return the read model for key, computing it if versions differ from the stored ones."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == versions:
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        value = compute()
+        self._entries[key] = (versions, value)
+        return value
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop one stored read model, or all of them when no key is given."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Hit/miss counters and the number of stored read models."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
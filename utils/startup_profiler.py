@@ -0,0 +1,53 @@
+"""
+Startup timing for the Dragon Dice digital companion app.
+
+Records named milestones relative to process start (import of this module) so the
+application can report how long it took to reach first paint and catalog readiness.
+"""
+
+import time
+from typing import List, Optional, Tuple
+
+# Target time-to-first-paint for the welcome screen
+FIRST_PAINT_TARGET_MS = 1000.0
+
+
+class StartupProfiler:
+    """Collects startup milestones and formats a timing report."""
+
+    def __init__(self, start: Optional[float] = None):
+        self.start = start if start is not None else time.perf_counter()
+        self.milestones: List[Tuple[str, float]] = []
+
+    def mark(self, label: str) -> float:
+        """Record a milestone and return its offset from start in milliseconds."""
+        elapsed_ms = (time.perf_counter() - self.start) * 1000.0
+        self.milestones.append((label, elapsed_ms))
+        return elapsed_ms
+
+    def elapsed_ms(self, label: str) -> Optional[float]:
+        """Return the offset of the first milestone with this label, if recorded."""
+        for milestone_label, elapsed_ms in self.milestones:
+            if milestone_label == label:
+                return elapsed_ms
+        return None
+
+    def format_report(self) -> str:
+        """Format all milestones as a table, with the delta from the previous milestone."""
+        lines = ["⏱️  Startup timing report:"]
+        previous_ms = 0.0
+        for label, elapsed_ms in self.milestones:
+            lines.append(f"  {label:<32} {elapsed_ms:8.1f} ms  (+{elapsed_ms - previous_ms:.1f} ms)")
+            previous_ms = elapsed_ms
+
+        first_paint_ms = self.elapsed_ms("first paint")
+        if first_paint_ms is not None:
+            status = "✅" if first_paint_ms <= FIRST_PAINT_TARGET_MS else "⚠️ "
+            lines.append(
+                f"  {status} Time to first paint: {first_paint_ms:.1f} ms (target {FIRST_PAINT_TARGET_MS:.0f} ms)"
+            )
+        return "\n".join(lines)
+
+
+# Process-wide profiler, started as early as the first import of this module
+STARTUP_PROFILER = StartupProfiler()
@@ -8,9 +8,10 @@ from typing import Optional
 
 # Import all icon mappings from constants
 import constants
+from components.glyph_cache import get_terrain_glyph
 from models.action_model import get_action_icon
 from models.location_model import LOCATION_DATA
-from models.terrain_model import TERRAIN_DATA, get_clean_terrain_display_name, get_terrain_icon, resolve_terrain_name
+from models.terrain_model import TERRAIN_DATA, get_clean_terrain_display_name, resolve_terrain_name
 
 
 def format_terrain_type(terrain_type: str) -> str:
@@ -27,11 +28,11 @@ def format_terrain_type(terrain_type: str) -> str:
     # Convert display name format to key format if needed (e.g., "Coastland Castle" -> "COASTLAND_CASTLE")
     terrain_key = terrain_type.upper().replace(" ", "_")
     try:
-        icon = get_terrain_icon(terrain_key)
+        icon = get_terrain_glyph(terrain_key)
     except KeyError:
         # Try with original terrain_type in case it's already in key format
         try:
-            icon = get_terrain_icon(terrain_type)
+            icon = get_terrain_glyph(terrain_type)
         except KeyError:
             # Handle locations by returning empty string
             icon = ""
@@ -78,7 +79,7 @@ def format_terrain_name(terrain_name: str, terrain_type: Optional[str] = None) -
         terrain_type = clean_name
 
     try:
-        icon = get_terrain_icon(terrain_type)
+        icon = get_terrain_glyph(terrain_type)
     except KeyError:
         # Handle locations by returning empty string
         icon = ""
@@ -133,10 +134,10 @@ def format_terrain_summary(
     display_name = get_clean_terrain_display_name(terrain_name)
     terrain = resolve_terrain_name(terrain_name)
 
-    # For terrain types, get_terrain_icon returns color icons
+    # For terrain types, get_terrain_glyph returns color icons
     # For locations (HOME, FRONTIER), use empty string
     try:
-        location_icon = get_terrain_icon(terrain_type)
+        location_icon = get_terrain_glyph(terrain_type)
     except KeyError:
         # Handle locations by returning empty string
         location_icon = ""
@@ -175,10 +176,10 @@ def format_terrain_summary_with_description(
     display_name = get_clean_terrain_display_name(terrain_name)
     terrain = resolve_terrain_name(terrain_name)
 
-    # For terrain types, get_terrain_icon returns color icons
+    # For terrain types, get_terrain_glyph returns color icons
     # For locations (HOME, FRONTIER), use empty string
     try:
-        location_icon = get_terrain_icon(terrain_type)
+        location_icon = get_terrain_glyph(terrain_type)
     except KeyError:
         # Handle locations by returning empty string
         location_icon = ""
@@ -185,12 +185,15 @@ class DragonAttackDialog(QDialog):
         dragons_present: List[Dict[str, Any]],
         marching_army: Dict[str, Any],
         parent=None,
+        promotion_manager=None,
     ):
         super().__init__(parent)
         self.marching_player = marching_player
         self.terrain_name = terrain_name
         self.dragons_present = dragons_present
         self.marching_army = marching_army
+        self.promotion_manager = promotion_manager
+        self.promotion_plan: List[Any] = []
 
         # Attack state
         self.current_step = "show_dragons"  # show_dragons, targeting, rolling, breath_effects, army_response, damage_resolution, promotions
@@ -559,6 +562,9 @@ class DragonAttackDialog(QDialog):
                 "color: #2e7d32; padding: 15px; background-color: #e8f5e8; border-radius: 5px; margin-bottom: 15px;"
             )
             self.content_layout.addWidget(promotion_info)
+
+            if self.promotion_manager:
+                self._show_promotion_plan()
         else:
             self._add_message("No dragons were killed. No promotion opportunities available.")
 
@@ -577,6 +583,25 @@ class DragonAttackDialog(QDialog):
 
         self.next_button.setText("Complete Dragon Attack ✅")
 
+    def _show_promotion_plan(self):
+        """Show the best conflict-free set of promotions for the marching army."""
+        army_units = strict_get_optional(self.marching_army, "units", [])
+        self.promotion_plan = self.promotion_manager.plan_mass_promotion(army_units, self.marching_player)
+
+        if not self.promotion_plan:
+            plan_text = "No units in the DUA are available to promote your army's units."
+        else:
+            plan_lines = [
+                f"⬆️ {strict_get(option.source_unit, 'name')} → {strict_get(option.target_unit, 'name')}"
+                for option in self.promotion_plan
+            ]
+            plan_text = f"Best promotion plan ({len(self.promotion_plan)} unit(s)):\n" + "\n".join(plan_lines)
+
+        plan_label = QLabel(plan_text)
+        plan_label.setWordWrap(True)
+        plan_label.setStyleSheet("padding: 10px; background-color: #f1f8e9; border-radius: 5px; margin-bottom: 10px;")
+        self.content_layout.addWidget(plan_label)
+
     def _simulate_targeting(self) -> Dict[str, Any]:
         """Simulate dragon targeting for demonstration."""
         targeting = {}
@@ -9,7 +9,7 @@ This dialog handles the complete maneuver flow:
 5. Determine success and terrain direction changes
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import (
@@ -27,6 +27,10 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from controllers.analysis_task_service import AnalysisTaskService, get_analysis_service
+from game_logic.maneuver_odds import ManeuverOdds, ManeuverOddsCalculator
+from utils.odds_cache import get_odds_cache
+
 # Combat analysis handled through CombatAnalysisController
 
 
@@ -109,6 +113,8 @@ class EnhancedManeuverDialog(QDialog):
         current_terrain_face: int,
         opposing_players: Optional[List[str]] = None,
         opposing_armies: Optional[List[Dict[str, Any]]] = None,
+        analysis_service: Optional[AnalysisTaskService] = None,
+        eighth_face_controller: Optional[str] = None,
         parent=None,
     ):
         super().__init__(parent)
@@ -118,6 +124,7 @@ class EnhancedManeuverDialog(QDialog):
         self.current_terrain_face = current_terrain_face
         self.opposing_players = opposing_players or []
         self.opposing_armies = opposing_armies or []
+        self.eighth_face_controller = eighth_face_controller  # Player controlling the terrain's eighth face
 
         # Maneuver state
         self.current_step = (
@@ -133,6 +140,10 @@ class EnhancedManeuverDialog(QDialog):
         # Combat analysis delegated to controller
         self.combat_analysis_controller = None  # Should be injected
 
+        # Odds are calculated off the UI thread
+        self.analysis_service = analysis_service or get_analysis_service()
+        self.maneuver_odds_label: Optional[QLabel] = None
+
         self.setWindowTitle(f"🏃 Maneuver at {location}")
         self.setModal(True)
         self.setMinimumSize(800, 600)
@@ -302,6 +313,15 @@ class EnhancedManeuverDialog(QDialog):
         instructions.setStyleSheet("margin: 10px; padding: 10px; background-color: #fdf8e8;")
         self.content_layout.addWidget(instructions)
 
+        # Exact odds, so the decision isn't made blind
+        self.maneuver_odds_label = QLabel("🎯 Calculating maneuver odds...")
+        self.maneuver_odds_label.setWordWrap(True)
+        self.maneuver_odds_label.setStyleSheet(
+            "margin: 10px; padding: 10px; background-color: #f3f0ff; font-weight: bold;"
+        )
+        self.content_layout.addWidget(self.maneuver_odds_label)
+        self._request_maneuver_odds()
+
         # Decision buttons
         decision_layout = QHBoxLayout()
 
@@ -435,6 +455,57 @@ class EnhancedManeuverDialog(QDialog):
         direction_layout.addLayout(direction_buttons_layout)
         self.content_layout.addWidget(direction_group)
 
+    def calculate_maneuver_odds(self) -> ManeuverOdds:
+        """Exact odds that the maneuver succeeds if all opposing armies counter-maneuver."""
+        calculator = ManeuverOddsCalculator(self._get_terrain_elements(), cache=get_odds_cache())
+        return calculator.calculate(*self._maneuver_odds_arguments())
+
+    def _maneuver_odds_arguments(self) -> Tuple[List[Dict[str, Any]], List[List[Dict[str, Any]]], bool, List[bool]]:
+        """Maneuvering units, counter armies' units and their ID doubling for the odds calculator."""
+        # Snapshot the units on the UI thread: the odds may be calculated on a worker thread
+        # while the game state keeps changing the live units
+        maneuvering_units = [dict(unit) for unit in self.maneuvering_army.get("units", [])]
+        counter_armies_units = [[dict(unit) for unit in army.get("units", [])] for army in self.opposing_armies]
+
+        # ID results are doubled for the army whose player controls the eighth face
+        controller = self.eighth_face_controller if self.current_terrain_face == 8 else None
+        maneuvering_id_doubled = controller is not None and controller == self.maneuvering_player
+        counter_id_doubled = [
+            controller is not None and i < len(self.opposing_players) and self.opposing_players[i] == controller
+            for i in range(len(self.opposing_armies))
+        ]
+        return maneuvering_units, counter_armies_units, maneuvering_id_doubled, counter_id_doubled
+
+    def _request_maneuver_odds(self):
+        """Calculate the maneuver odds on the analysis service and show them when ready."""
+        calculator = ManeuverOddsCalculator(self._get_terrain_elements(), cache=get_odds_cache())
+        arguments = self._maneuver_odds_arguments()
+        self.analysis_service.submit(
+            calculator.cache_key(*arguments),
+            lambda: calculator.calculate(*arguments),
+            on_result=self._show_maneuver_odds,
+            on_error=self._show_maneuver_odds_error,
+            owner=self,
+        )
+
+    def _show_maneuver_odds(self, odds: ManeuverOdds):
+        if self.maneuver_odds_label is not None:
+            self.maneuver_odds_label.setText(self._format_maneuver_odds(odds))
+
+    def _show_maneuver_odds_error(self, error: str):
+        if self.maneuver_odds_label is not None:
+            self.maneuver_odds_label.setText(f"⚠️ Could not calculate maneuver odds: {error}")
+
+    def _format_maneuver_odds(self, odds: ManeuverOdds) -> str:
+        """Describe the maneuver odds for the counter-maneuver decision."""
+        text = (
+            f"🎯 If countered, the maneuver succeeds {odds.success_probability:.1%} of the time "
+            f"(expected maneuver results: {odds.maneuvering_expected:.1f} vs {odds.counter_expected:.1f})"
+        )
+        if odds.unresolved_units:
+            text += f"<br>⚠️ Die faces unknown for: {', '.join(odds.unresolved_units)} (not counted)"
+        return text
+
     def _choose_counter_maneuver(self):
         """Handle decision to counter-maneuver."""
         self.will_be_opposed = True
@@ -635,3 +706,8 @@ class EnhancedManeuverDialog(QDialog):
         """Handle cancel button."""
         self.maneuver_cancelled.emit()
         self.reject()
+
+    def done(self, result: int):
+        """Drop pending odds requests when the dialog closes (accept, reject or close)."""
+        self.analysis_service.cancel(self)
+        super().done(result)
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from PySide6.QtCore import Qt, Signal, Slot
 from PySide6.QtWidgets import (
@@ -23,23 +23,16 @@ from components.reserves_widget import ReservesWidget
 from components.summoning_pool_widget import SummoningPoolWidget
 from components.tabbed_view_widget import TabbedViewWidget
 from components.unit_areas_widget import UnitAreasWidget
-
-# No change, good comment
-from game_logic.game_orchestrator import GameOrchestrator as GameEngine
 from models.help_text_model import HelpTextModel
 from utils.field_access import strict_get, strict_get_optional, strict_get_with_fallback
-from views.action_dialog import ActionDialog
 from views.display_utils import (
     format_player_turn_label,
     format_terrain_summary_with_description,
 )
-from views.dragon_attack_dialog import DragonAttackDialog
-from views.magic_action_dialog import MagicActionDialog
-from views.maneuver_dialog import ManeuverDialog
-from views.melee_combat_dialog import MeleeCombatDialog
-from views.missile_combat_dialog import MissileCombatDialog
-from views.reserves_phase_dialog import ReservesPhaseDialog
-from views.species_abilities_phase_dialog import SpeciesAbilitiesPhaseDialog
+
+# Dialogs are imported where they are opened, so they load on first use rather than at startup
+if TYPE_CHECKING:
+    from game_logic.game_orchestrator import GameOrchestrator as GameEngine
 
 
 class MainGameplayView(QWidget):
@@ -63,7 +56,7 @@ class MainGameplayView(QWidget):
     reserves_phase_completed = Signal(dict)
     dragon_attack_phase_completed = Signal(dict)
 
-    def __init__(self, game_engine: GameEngine, parent=None):
+    def __init__(self, game_engine: "GameEngine", parent=None):
         super().__init__(parent)
         self.game_engine = game_engine
         self.help_model = HelpTextModel()
@@ -325,6 +318,8 @@ class MainGameplayView(QWidget):
             all_players_data = self.game_engine.get_all_players_data()
             terrain_data = self.game_engine.get_all_terrain_data()
 
+            from views.maneuver_dialog import ManeuverDialog
+
             # Create and show maneuver dialog with the acting army
             dialog = ManeuverDialog(
                 current_player_name=current_player,
@@ -399,6 +394,8 @@ class MainGameplayView(QWidget):
             all_players_data = self.game_engine.get_all_players_data()
             terrain_data = self.game_engine.get_all_terrain_data()
 
+            from views.action_dialog import ActionDialog
+
             # Create and show action dialog with the acting army
             dialog = ActionDialog(
                 action_type=action_type,
@@ -808,6 +805,8 @@ class MainGameplayView(QWidget):
         bua_manager = self.game_engine.bua_manager
         reserves_manager = self.game_engine.reserves_manager
 
+        from views.species_abilities_phase_dialog import SpeciesAbilitiesPhaseDialog
+
         dialog = SpeciesAbilitiesPhaseDialog(
             current_player, player_armies, opponent_reserves, dua_manager, bua_manager, reserves_manager, parent=self
         )
@@ -846,6 +845,8 @@ class MainGameplayView(QWidget):
         # Get available terrains
         available_terrains = list(all_terrain_data.keys())
 
+        from views.reserves_phase_dialog import ReservesPhaseDialog
+
         dialog = ReservesPhaseDialog(current_player, reserves_units, terrain_armies, available_terrains, parent=self)
 
         # Connect dialog signals
@@ -903,6 +904,8 @@ class MainGameplayView(QWidget):
         defender_army: Dict[str, Any] = {}  # This should come from game state
         location = "Unknown Location"  # This should come from current action
 
+        from views.melee_combat_dialog import MeleeCombatDialog
+
         dialog = MeleeCombatDialog(current_player, acting_army, defender_name, defender_army, location, parent=self)
 
         # Connect dialog completion signal
@@ -926,6 +929,8 @@ class MainGameplayView(QWidget):
         all_players_data = self.game_engine.get_all_player_summary_data()
         terrain_data = self.game_engine.get_all_terrain_data()
 
+        from views.missile_combat_dialog import MissileCombatDialog
+
         dialog = MissileCombatDialog(current_player, acting_army, all_players_data, terrain_data, parent=self)
 
         # Connect dialog completion signal
@@ -950,6 +955,8 @@ class MainGameplayView(QWidget):
         # TODO: Need to determine location for magic action
         location = "Unknown Location"  # This should come from current action
 
+        from views.magic_action_dialog import MagicActionDialog
+
         dialog = MagicActionDialog(current_player, acting_army, location, parent=self)
 
         # Connect dialog completion signal
@@ -1048,6 +1055,8 @@ class MainGameplayView(QWidget):
             self.game_engine.advance_phase()
             return
 
+        from views.dragon_attack_dialog import DragonAttackDialog
+
         # Create dragon attack dialog
         dialog = DragonAttackDialog(
             marching_player=current_player,
@@ -1055,6 +1064,7 @@ class MainGameplayView(QWidget):
             dragons_present=dragons_present,
             marching_army=marching_army,
             parent=self,
+            promotion_manager=getattr(self.game_engine, "promotion_manager", None),
         )
 
         # Connect dialog signals
@@ -26,7 +26,7 @@ from PySide6.QtWidgets import (
 )
 
 from components.carousel import CarouselInputWidget
-from models.element_model import get_element_icon
+from components.glyph_cache import get_element_glyph
 from models.minor_terrain_model import MinorTerrain, get_all_minor_terrain_objects, get_minor_terrain
 
 
@@ -70,7 +70,7 @@ class MinorTerrainFaceSelector(QGroupBox):
 
         # Elements display
         elements_layout = QHBoxLayout()
-        elements_text = "".join(get_element_icon(elem) for elem in self.minor_terrain.elements)
+        elements_text = "".join(get_element_glyph(elem) for elem in self.minor_terrain.elements)
         elements_label = QLabel(f"Elements: {elements_text}")
         elements_label.setStyleSheet("color: #87CEEB; font-size: 11px;")
         elements_layout.addWidget(elements_label)
@@ -201,7 +201,7 @@ class MinorTerrainPlacementSelector(QGroupBox):
         self.terrain_mapping = {}
 
         for terrain in get_all_minor_terrain_objects():
-            elements_text = "".join(get_element_icon(elem) for elem in terrain.elements)
+            elements_text = "".join(get_element_glyph(elem) for elem in terrain.elements)
             display_name = f"{elements_text} {terrain.name}"
             terrain_options.append(display_name)
 
@@ -11,7 +11,7 @@ Currently supported species abilities:
 - Frostwings: Winter's Fortitude (move units from BUA to DUA when at air terrains)
 """
 
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import (
@@ -30,7 +30,11 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-# Managers are received as parameters - no direct imports needed
+# Managers are received as parameters - only imported for type checking
+if TYPE_CHECKING:
+    from models.game_state.bua_manager import BUAManager
+    from models.game_state.dua_manager import DUAManager
+    from models.game_state.reserves_manager import ReservesManager
 
 
 class MutateAbilityWidget(QWidget):
@@ -662,9 +666,9 @@ class SpeciesAbilitiesPhaseDialog(QDialog):
         player_name: str,
         player_armies: List[Dict[str, Any]],
         opponent_reserves: Dict[str, List[Dict[str, Any]]],
-        dua_manager: DUAManager,
-        bua_manager: BUAManager,
-        reserves_manager: ReservesManager,
+        dua_manager: "DUAManager",
+        bua_manager: "BUAManager",
+        reserves_manager: "ReservesManager",
         game_points: int = 24,
         parent=None,
     ):
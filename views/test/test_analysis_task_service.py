@@ -0,0 +1,83 @@
+import threading
+
+import pytest
+from PySide6.QtCore import QThreadPool
+
+from controllers.analysis_task_service import AnalysisTaskService
+
+
+@pytest.fixture
+def single_thread_service(qtbot):
+    pool = QThreadPool()
+    pool.setMaxThreadCount(1)
+    service = AnalysisTaskService(pool)
+    yield service
+    service.wait_for_done()
+
+
+class TestAnalysisTaskService:
+    def test_results_are_delivered_on_the_ui_thread(self, qtbot, single_thread_service):
+        results = []
+        worker_threads = []
+
+        def compute():
+            worker_threads.append(threading.get_ident())
+            return 42
+
+        with qtbot.waitSignal(single_thread_service.task_completed) as blocker:
+            single_thread_service.submit(
+                "answer", compute, on_result=lambda result: results.append((result, threading.get_ident()))
+            )
+
+        assert blocker.args == ["answer", 42]
+        assert results == [(42, threading.get_ident())]
+        assert worker_threads != [threading.get_ident()]
+        assert not single_thread_service.is_pending("answer")
+
+    def test_duplicate_requests_are_coalesced(self, qtbot, single_thread_service):
+        release = threading.Event()
+        calls = []
+        results = []
+
+        def compute():
+            calls.append(1)
+            release.wait(5)
+            return "odds"
+
+        assert single_thread_service.submit("key", compute, on_result=results.append)
+        assert not single_thread_service.submit("key", compute, on_result=results.append)
+        release.set()
+
+        qtbot.waitUntil(lambda: len(results) == 2)
+        assert results == ["odds", "odds"]
+        assert len(calls) == 1
+
+    def test_cancelled_requests_get_no_results(self, qtbot, single_thread_service):
+        release = threading.Event()
+        dialog, other_dialog = object(), object()
+        queued_calls = []
+        results = []
+
+        single_thread_service.submit("running", lambda: release.wait(5), on_result=results.append, owner=dialog)
+        single_thread_service.submit("queued", lambda: queued_calls.append(1), owner=dialog)
+        single_thread_service.submit("shared", lambda: "shared", on_result=results.append, owner=dialog)
+        single_thread_service.submit("shared", lambda: "shared", on_result=results.append, owner=other_dialog)
+
+        assert single_thread_service.cancel(dialog) == 3
+        assert not single_thread_service.is_pending("queued")
+        release.set()
+
+        qtbot.waitUntil(lambda: results == ["shared"])
+        single_thread_service.wait_for_done()
+        assert queued_calls == []
+
+    def test_errors_are_reported(self, qtbot, single_thread_service):
+        errors = []
+
+        def compute():
+            raise ValueError("no faces")
+
+        with qtbot.waitSignal(single_thread_service.task_failed):
+            single_thread_service.submit("broken", compute, on_error=errors.append)
+
+        assert errors == ["ValueError: no faces"]
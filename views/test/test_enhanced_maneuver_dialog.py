@@ -0,0 +1,118 @@
+from PySide6.QtWidgets import QLabel
+
+from game_logic.game_orchestrator import GameOrchestrator as GameEngine
+from game_logic.maneuver_odds import ManeuverOddsCalculator
+from models.unit_data import UNIT_DATA, get_unit_by_id
+from views.enhanced_maneuver_dialog import EnhancedManeuverDialog
+
+
+def test_counter_decision_shows_maneuver_odds(qtbot):
+    maneuvering_army = {
+        "name": "Home Guard",
+        "units": [{"name": "Battle Rider", "unit_type_id": "amazon_battle_rider"}],
+    }
+    opposing_army = {"name": "Raiders", "units": [{"name": "Charioteer", "unit_type_id": "amazon_charioteer"}]}
+    dialog = EnhancedManeuverDialog("Player 1", maneuvering_army, "Highland", 3, ["Player 2"], [opposing_army])
+    qtbot.addWidget(dialog)
+
+    dialog._on_next()  # Announce -> counter-maneuver decision
+
+    assert dialog.current_step == "counter_decision"
+    odds = dialog.calculate_maneuver_odds()
+    assert 0.0 < odds.success_probability < 1.0
+
+    # Calculated on the analysis service, then shown
+    def odds_shown():
+        label_texts = [label.text() for label in dialog.content_widget.findChildren(QLabel)]
+        assert any(f"{odds.success_probability:.1%}" in text for text in label_texts)
+
+    qtbot.waitUntil(odds_shown)
+
+
+def _game_state_armies():
+    """Campaign armies of a game started from catalog units (Dwarves vs Amazons at the frontier)."""
+    setup = []
+    for player_name, species, home_terrain in [("Player 1", "Dwarf", "Highland"), ("Player 2", "Amazon", "Coastland")]:
+        unit_ids = [unit.unit_id for unit in UNIT_DATA if unit.species.name == species][:3]
+        armies = {}
+        for army_key, location in [
+            ("home", f"{player_name} {home_terrain}"),
+            ("campaign", "Flatland"),
+            ("horde", "Flatland"),
+        ]:
+            units = []
+            for number, unit_id in enumerate(unit_ids, 1):
+                unit = get_unit_by_id(unit_id).to_dict()
+                unit["unit_id"] = f"{player_name}_{army_key}_{number}"
+                units.append(unit)
+            armies[army_key] = {
+                "name": f"{player_name} {army_key}",
+                "location": location,
+                "allocated_points": sum(unit["max_health"] for unit in units),
+                "units": units,
+                "unique_id": f"{player_name.lower().replace(' ', '_')}_{army_key}",
+            }
+        setup.append(
+            {
+                "name": player_name,
+                "home_terrain": home_terrain,
+                "force_size": 24,
+                "selected_dragons": [],
+                "armies": armies,
+            }
+        )
+
+    engine = GameEngine(
+        player_setup_data=setup,
+        first_player_name="Player 1",
+        frontier_terrain="Flatland",
+        distance_rolls=[("Player 1", 3), ("Player 2", 5), ("__frontier__", 4)],
+    )
+    return [
+        engine.game_state_manager.get_player_data(player_name)["armies"]["campaign"]
+        for player_name in ["Player 1", "Player 2"]
+    ]
+
+
+def test_maneuver_odds_for_game_state_armies(qtbot):
+    maneuvering_army, opposing_army = _game_state_armies()
+    calculator = ManeuverOddsCalculator(["air", "earth"])
+    maneuvering_units, counter_units = maneuvering_army["units"], opposing_army["units"]
+
+    def dialog_odds(eighth_face_controller, terrain_face=8):
+        dialog = EnhancedManeuverDialog(
+            "Player 1",
+            maneuvering_army,
+            "Flatland",
+            terrain_face,
+            ["Player 2"],
+            [opposing_army],
+            eighth_face_controller=eighth_face_controller,
+        )
+        qtbot.addWidget(dialog)
+        return dialog.calculate_maneuver_odds()
+
+    odds = dialog_odds(None)
+    assert odds.unresolved_units == []
+    assert odds == calculator.calculate(maneuvering_units, [counter_units])
+    assert dialog_odds("Player 1") == calculator.calculate(maneuvering_units, [counter_units], True, [False])
+    assert dialog_odds("Player 2") == calculator.calculate(maneuvering_units, [counter_units], False, [True])
+    assert (
+        dialog_odds("Player 2").success_probability
+        < odds.success_probability
+        < dialog_odds("Player 1").success_probability
+    )
+    assert dialog_odds("Player 1", terrain_face=3) == odds
+
+
+def test_maneuver_odds_use_unit_snapshots(qtbot):
+    maneuvering_army, opposing_army = _game_state_armies()
+    dialog = EnhancedManeuverDialog("Player 1", maneuvering_army, "Flatland", 3, ["Player 2"], [opposing_army])
+    qtbot.addWidget(dialog)
+
+    maneuvering_units, counter_armies_units, _, _ = dialog._maneuver_odds_arguments()
+    health = maneuvering_units[0]["health"]
+    maneuvering_army["units"][0]["health"] = 0
+
+    assert maneuvering_units[0]["health"] == health
+    assert all(type(unit) is dict for unit in [*maneuvering_units, *counter_armies_units[0]])
@@ -0,0 +1,68 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from PySide6.QtWidgets import QApplication
+
+from main_window import MainWindow
+from views.welcome_view import WelcomeView
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+
+def _modules_loaded_after(statement: str, module_names):
+    """Run an import statement in a fresh interpreter and report which of the modules it loaded."""
+    script = (
+        f"import sys\n{statement}\n"
+        f"print('LOADED:' + ','.join(name for name in {list(module_names)!r} if name in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        cwd=PROJECT_ROOT,
+        env={**os.environ, "QT_QPA_PLATFORM": "offscreen"},
+        check=True,
+    )
+    loaded = result.stdout.strip().splitlines()[-1].split("LOADED:", 1)[1]
+    return [name for name in loaded.split(",") if name]
+
+
+class TestStartupLazyLoading:
+    """Startup should only load what the welcome screen needs."""
+
+    def test_main_window_import_defers_views_dialogs_and_game_logic(self):
+        deferred = [
+            "views.main_gameplay_view",
+            "views.magic_action_dialog",
+            "views.missile_combat_dialog",
+            "views.species_abilities_phase_dialog",
+            "views.reserves_phase_dialog",
+            "views.dragon_attack_dialog",
+            "game_logic.game_orchestrator",
+            "models.unit_data",
+        ]
+        assert _modules_loaded_after("import main_window", deferred) == []
+
+    def test_deferred_main_window_shows_welcome_before_catalogs(self, qtbot):
+        window = MainWindow(defer_catalogs=True)
+        qtbot.addWidget(window)
+
+        assert isinstance(window._current_view, WelcomeView)
+        assert not window.data_model.are_catalogs_loaded()
+
+        with qtbot.waitSignal(window.data_model.catalogs_ready, timeout=10000):
+            window.start_catalog_warmup()
+            # The warm-up thread hands validation back to the GUI thread via a queued signal
+            QApplication.processEvents()
+
+        assert window.data_model.are_catalogs_loaded()
+        assert window.data_model.get_all_terrains_list()
+
+    def test_catalog_data_loads_on_demand_without_warmup(self, qtbot):
+        window = MainWindow(defer_catalogs=True)
+        qtbot.addWidget(window)
+
+        assert window.data_model.get_terrain_display_options()
+        assert window.data_model.are_catalogs_loaded()
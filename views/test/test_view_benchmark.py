@@ -0,0 +1,33 @@
+import copy
+
+from scripts.benchmark_views import build_player_setup, find_regressions, run_benchmarks
+
+
+class TestViewBenchmark:
+    def test_forces_grow_with_game_size(self):
+        small = build_player_setup(2, 12)
+        large = build_player_setup(4, 60)
+
+        def unit_count(players):
+            return sum(len(army["units"]) for player in players for army in player["armies"].values())
+
+        assert len(large) == 4
+        assert unit_count(large) > unit_count(small) * 2
+        assert large[3]["armies"]["horde"]["location"] == "Player 1 Highland"
+
+    def test_report_and_regressions(self, qtbot):
+        views = ["MainGameplayView", "DamageAllocationDialog", "ReservesPhaseDialog"]
+        report = run_benchmarks(views=views, game_sizes=[(2, 12)], repeats=2)
+
+        results = report["results"]
+        assert [result["view"] for result in results] == views
+        for result in results:
+            assert "error" not in result
+            assert result["widget_count"] > 0
+            assert result["refresh_ms"]["max"] >= result["refresh_ms"]["median"] >= 0
+
+        assert find_regressions(report, report, tolerance=1.5) == []
+        faster = copy.deepcopy(report)
+        for result in faster["results"]:
+            result["construct_ms"] = result["construct_ms"] / 10 - 1
+        assert len(find_regressions(report, faster, tolerance=1.5)) == 3